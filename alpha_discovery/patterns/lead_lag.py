@@ -1,58 +1,244 @@
+from dataclasses import dataclass
 from datetime import timedelta
-from typing import List, Dict
+from typing import List, Dict, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
 from signals.core.models import Signal
 from signals.core.enums import Market, SignalCategory
 from alpha_discovery.core.models import AlphaHypothesis, AlphaPatternType
 from alpha_discovery.patterns.base import AlphaPatternDetector
 
+
+@dataclass
+class LeadLagMatches:
+    """
+    Columnar lead-lag matches. Row k pairs signals[us_index[k]] (leader)
+    with signals[in_index[k]] (follower), India trigger lag_hours later.
+    Rows are ordered by (us_index, in_index).
+    """
+    us_index: np.ndarray
+    in_index: np.ndarray
+    lag_hours: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.us_index)
+
+
 class LeadLagDetector(AlphaPatternDetector):
     """
     Detects if US Signals consistently precede India Signals.
-    Simplistic implementation:
-    - Matches on Sector/Category
-    - Checks for time delta in [0, 24 hours]
+    - Matches on Category & Direction
+    - India trigger lags the US trigger by [min_lag, max_lag] (default 4-24h)
+
+    Matching is a sort-merge interval join: signals are grouped by
+    (category, direction), India triggers are sorted once per group, and each
+    US trigger's lag window is located with searchsorted, so the cost is
+    O((N + M) log M + matches) instead of comparing every pair.
     """
-    
+
+    def __init__(
+        self,
+        min_lag: timedelta = timedelta(hours=4),
+        max_lag: timedelta = timedelta(hours=24),
+        aggregate: bool = False,
+        lag_bin_hours: float = 1.0,
+        min_evidence: int = 1
+    ):
+        """
+        Args:
+            min_lag: Shortest India-after-US delay that counts (inclusive).
+            max_lag: Longest delay that counts (inclusive).
+            aggregate: detect() returns one hypothesis per (US asset, India asset,
+                       category, direction) carrying lag statistics, instead of
+                       one hypothesis per matched signal pair.
+            lag_bin_hours: Histogram bin width for lag statistics.
+            min_evidence: In aggregate mode, drop asset pairs with fewer matches.
+        """
+        self.min_lag = min_lag
+        self.max_lag = max_lag
+        self.aggregate = aggregate
+        self.lag_bin_hours = lag_bin_hours
+        self.min_evidence = min_evidence
+
     def detect(self, signals: List[Signal]) -> List[AlphaHypothesis]:
-        # Split by market
-        us_signals = [s for s in signals if s.market == Market.US]
-        in_signals = [s for s in signals if s.market == Market.INDIA]
-        
+        matches = self.match(signals)
+        if self.aggregate:
+            return self._aggregated_hypotheses(signals, matches)
+        return self._pair_hypotheses(signals, matches)
+
+    def match(self, signals: Sequence[Signal]) -> LeadLagMatches:
+        """Finds every (US, India) pair with matching category/direction inside the lag window."""
+        cols = self._columns(signals)
+        trigger, group = cols['trigger'], cols['group']
+        is_us = cols['market'] == Market.US.value
+        is_in = cols['market'] == Market.INDIA.value
+
+        min_us = self.min_lag // timedelta(microseconds=1)
+        max_us = self.max_lag // timedelta(microseconds=1)
+
+        us_parts, in_parts = [], []
+        for g in np.unique(group):
+            us_idx = np.flatnonzero(is_us & (group == g))
+            in_idx = np.flatnonzero(is_in & (group == g))
+            if not len(us_idx) or not len(in_idx):
+                continue
+
+            in_idx = in_idx[np.argsort(trigger[in_idx], kind='stable')]
+            in_t = trigger[in_idx]
+            lo = np.searchsorted(in_t, trigger[us_idx] + min_us, side='left')
+            hi = np.searchsorted(in_t, trigger[us_idx] + max_us, side='right')
+            counts = np.maximum(hi - lo, 0)
+            total = int(counts.sum())
+            if not total:
+                continue
+
+            # Expand each [lo, hi) window into explicit positions
+            starts = np.repeat(lo, counts)
+            offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+            us_parts.append(np.repeat(us_idx, counts))
+            in_parts.append(in_idx[starts + offsets])
+
+        if not us_parts:
+            empty = np.empty(0, dtype=np.int64)
+            return LeadLagMatches(empty, empty.copy(), np.empty(0, dtype=float))
+
+        us_match = np.concatenate(us_parts)
+        in_match = np.concatenate(in_parts)
+        order = np.lexsort((in_match, us_match))
+        us_match, in_match = us_match[order], in_match[order]
+        # Same arithmetic as timedelta.total_seconds() / 3600
+        lag_hours = ((trigger[in_match] - trigger[us_match]) / 1e6) / 3600
+        return LeadLagMatches(us_match, in_match, lag_hours)
+
+    @staticmethod
+    def _columns(signals: Sequence[Signal]) -> Dict[str, np.ndarray]:
+        """Per-signal arrays; categorical fields as codes whose order follows the sorted labels."""
+        category_codes, categories = pd.factorize(
+            pd.Series([s.signal_category.value for s in signals], dtype=object), sort=True)
+        direction_codes, directions = pd.factorize(
+            pd.Series([s.direction.value for s in signals], dtype=object), sort=True)
+        asset_codes, assets = pd.factorize(pd.Series([s.asset_id for s in signals], dtype=object), sort=True)
+        return {
+            'market': np.array([s.market.value for s in signals], dtype=object),
+            'trigger': np.array([s.trigger_timestamp for s in signals], dtype='datetime64[us]').astype(np.int64),
+            'group': category_codes.astype(np.int64) * max(len(directions), 1) + direction_codes,
+            'categories': np.asarray(categories, dtype=object),
+            'directions': np.asarray(directions, dtype=object),
+            'asset_code': asset_codes.astype(np.int64),
+            'assets': np.asarray(assets, dtype=object),
+        }
+
+    def lag_bin_edges(self) -> np.ndarray:
+        lo = self.min_lag / timedelta(hours=1)
+        hi = self.max_lag / timedelta(hours=1)
+        edges = np.arange(lo, hi, self.lag_bin_hours)
+        return np.append(edges, hi)
+
+    def lag_statistics(self, signals: Sequence[Signal], matches: Optional[LeadLagMatches] = None) -> pd.DataFrame:
+        """
+        Lag distribution per (us_asset, in_asset, category, direction), sorted by
+        those keys: evidence_count, lag mean/median/min/max, first/last US
+        trigger and lag_histogram (counts per lag_bin_edges() bin, last bin closed).
+        """
+        if matches is None:
+            matches = self.match(signals)
+        columns = ['us_asset', 'in_asset', 'category', 'direction', 'evidence_count',
+                   'lag_hours_mean', 'lag_hours_median', 'lag_hours_min', 'lag_hours_max',
+                   'first_trigger_us', 'last_trigger_us', 'lag_histogram']
+        if not len(matches):
+            return pd.DataFrame(columns=columns)
+
+        cols = self._columns(signals)
+        n_assets = len(cols['assets'])
+        n_dirs = max(len(cols['directions']), 1)
+        n_groups = max(len(cols['categories']), 1) * n_dirs
+
+        us, ind, lag = matches.us_index, matches.in_index, matches.lag_hours
+        key = (cols['asset_code'][us] * n_assets + cols['asset_code'][ind]) * n_groups + cols['group'][us]
+        pair_keys, pair = np.unique(key, return_inverse=True)
+        count = np.bincount(pair)
+        starts = np.cumsum(count) - count
+
+        order = np.lexsort((lag, pair))
+        lag_sorted = lag[order]
+        mid = starts + (count - 1) // 2
+        median = np.where(count % 2 == 1, lag_sorted[mid], (lag_sorted[mid] + lag_sorted[np.minimum(mid + 1, len(lag) - 1)]) / 2)
+        trigger_sorted = cols['trigger'][us][order]
+
+        edges = self.lag_bin_edges()
+        n_bins = len(edges) - 1
+        bins = np.clip(np.searchsorted(edges, lag, side='right') - 1, 0, n_bins - 1)
+        hist = np.bincount(pair * n_bins + bins, minlength=len(pair_keys) * n_bins).reshape(len(pair_keys), n_bins)
+
+        group = pair_keys % n_groups
+        asset_pair = pair_keys // n_groups
+        stats = pd.DataFrame({
+            'us_asset': cols['assets'][asset_pair // n_assets],
+            'in_asset': cols['assets'][asset_pair % n_assets],
+            'category': cols['categories'][group // n_dirs],
+            'direction': cols['directions'][group % n_dirs],
+            'evidence_count': count,
+            'lag_hours_mean': np.bincount(pair, weights=lag) / count,
+            'lag_hours_median': median,
+            'lag_hours_min': lag_sorted[starts],
+            'lag_hours_max': lag_sorted[starts + count - 1],
+            'first_trigger_us': pd.to_datetime(np.minimum.reduceat(trigger_sorted, starts), unit='us'),
+            'last_trigger_us': pd.to_datetime(np.maximum.reduceat(trigger_sorted, starts), unit='us'),
+            'lag_histogram': list(hist),
+        })
+        return stats[columns]
+
+    def _pair_hypotheses(self, signals: Sequence[Signal], matches: LeadLagMatches) -> List[AlphaHypothesis]:
+        hypotheses = []
+        for us_i, in_i, lag in zip(matches.us_index, matches.in_index, matches.lag_hours):
+            us_sig, in_sig = signals[us_i], signals[in_i]
+            evidence = {
+                "trigger_us": us_sig.trigger_timestamp.isoformat(),
+                "trigger_in": in_sig.trigger_timestamp.isoformat(),
+                "time_lag_hours": float(lag),
+                "match_type": "Direct Category Match"
+            }
+
+            hypotheses.append(AlphaHypothesis.create(
+                title=f"US {us_sig.asset_id} leads India {in_sig.asset_id} ({us_sig.signal_category})",
+                pattern=AlphaPatternType.LEAD_LAG,
+                source=Market.US,
+                target=Market.INDIA,
+                assets=[us_sig.asset_id, in_sig.asset_id],
+                confidence=50.0, # Initial guess
+                evidence=evidence
+            ))
+        return hypotheses
+
+    def _aggregated_hypotheses(self, signals: Sequence[Signal], matches: LeadLagMatches) -> List[AlphaHypothesis]:
+        stats = self.lag_statistics(signals, matches)
+        stats = stats[stats['evidence_count'] >= self.min_evidence]
+        edges = [float(e) for e in self.lag_bin_edges()]
         hypotheses = []
-        
-        # Simple Pair Matching logic
-        # Ideally this uses statistical Granger Causality on time series.
-        # Here we do discrete event matching for the "Signal" layer.
-        
-        for us_sig in us_signals:
-            for in_sig in in_signals:
-                # 1. Check Causality Timeframe (US leads India by 0-24h)
-                delta = in_sig.trigger_timestamp - us_sig.trigger_timestamp
-                # US Close ~21:00 UTC. India Open ~03:45 UTC next day.
-                # Delta should be roughly 6-20 hours.
-                if timedelta(hours=4) <= delta <= timedelta(hours=24):
-                    
-                    # 2. Check Semantic Similarity
-                    # e.g., Same Category & Direction
-                    if (us_sig.signal_category == in_sig.signal_category and 
-                        us_sig.direction == in_sig.direction):
-                        
-                        # Proposed Alpha
-                        evidence = {
-                            "trigger_us": us_sig.trigger_timestamp.isoformat(),
-                            "trigger_in": in_sig.trigger_timestamp.isoformat(),
-                            "time_lag_hours": delta.total_seconds() / 3600,
-                            "match_type": "Direct Category Match"
-                        }
-                        
-                        hypotheses.append(AlphaHypothesis.create(
-                            title=f"US {us_sig.asset_id} leads India {in_sig.asset_id} ({us_sig.signal_category})",
-                            pattern=AlphaPatternType.LEAD_LAG,
-                            source=Market.US,
-                            target=Market.INDIA,
-                            assets=[us_sig.asset_id, in_sig.asset_id],
-                            confidence=50.0, # Initial guess
-                            evidence=evidence
-                        ))
-                        
+        for row in stats.itertuples(index=False):
+            category = SignalCategory(row.category)
+            evidence = {
+                "evidence_count": int(row.evidence_count),
+                "direction": row.direction,
+                "lag_hours_mean": float(row.lag_hours_mean),
+                "lag_hours_median": float(row.lag_hours_median),
+                "lag_hours_min": float(row.lag_hours_min),
+                "lag_hours_max": float(row.lag_hours_max),
+                "first_trigger_us": row.first_trigger_us.isoformat(),
+                "last_trigger_us": row.last_trigger_us.isoformat(),
+                "lag_histogram": {"bin_edges": edges, "counts": [int(c) for c in row.lag_histogram]},
+                "match_type": "Direct Category Match"
+            }
+
+            hypotheses.append(AlphaHypothesis.create(
+                title=f"US {row.us_asset} leads India {row.in_asset} ({category})",
+                pattern=AlphaPatternType.LEAD_LAG,
+                source=Market.US,
+                target=Market.INDIA,
+                assets=[row.us_asset, row.in_asset],
+                confidence=50.0, # Initial guess
+                evidence=evidence
+            ))
         return hypotheses
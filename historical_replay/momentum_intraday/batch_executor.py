@@ -0,0 +1,236 @@
+"""Batch Executor - Parallel Multi-Symbol, Multi-Day Historical Replay.
+
+Splits a batch replay into per-symbol jobs that run on a process pool. Each
+worker loads the symbol's candles once, slices them per replay date and
+writes its review CSVs into a private staging directory. Once all workers
+finish, the staged logs are merged into the regular ReplayLogger review files
+in a fixed (date, symbol) order, so the output does not depend on worker
+scheduling.
+"""
+
+import logging
+import os
+import shutil
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from ingestion.india_ingestion.candle_store import CandleStore
+from .replay_controller import ReplayController
+from .replay_logger import ReplayLogger
+from .replay_runner import generate_eod_report
+from .validation.replay_sanity_checks import run_all_sanity_checks
+
+logger = logging.getLogger(__name__)
+
+
+def replay_symbol_days(
+    symbol: str,
+    dates: List[str],
+    staging_dir: str,
+    interval_minutes: int = 1,
+    run_sanity_checks: bool = True,
+    vectorized: bool = False,
+    processed_data_path: str = "data/processed/candles/intraday",
+    exchange: str = "NSE"
+) -> List[Dict]:
+    """Replay one symbol over several dates, loading its candles once.
+
+    Runs inside a pool worker. Review CSVs are written under
+    ``staging_dir/<symbol>/<date>/`` and merged later by the parent.
+
+    Args:
+        symbol: Trading symbol.
+        dates: Dates to replay (YYYY-MM-DD).
+        staging_dir: Worker-private output root.
+        interval_minutes: Evaluation interval.
+        run_sanity_checks: Whether to run sanity checks per day.
+        vectorized: Use the single-pass vectorized replay mode.
+        processed_data_path: Path to processed candle files.
+        exchange: Exchange segment.
+
+    Returns:
+        One result dict per date, in the order of ``dates``.
+    """
+    store = CandleStore(processed_data_path)
+    if not store.exists(symbol, exchange):
+        error = f"No processed data found: {store.base_file(symbol, exchange)}"
+        return [{"symbol": symbol, "date": d, "error": error} for d in dates]
+
+    candles = store.read(symbol, exchange)
+    by_date = {
+        day: frame
+        for day, frame in candles.groupby(candles["timestamp"].dt.date.astype(str), sort=False)
+    }
+    output_base = str(Path(staging_dir) / symbol)
+
+    results = []
+    for replay_date in dates:
+        try:
+            if replay_date not in by_date:
+                raise ValueError(f"No data found for {symbol} on {replay_date}")
+            day_candles = by_date[replay_date]
+
+            controller = ReplayController(
+                symbol=symbol,
+                replay_date=replay_date,
+                interval_minutes=interval_minutes,
+                processed_data_path=processed_data_path,
+                exchange=exchange,
+                vectorized=vectorized,
+                output_base_dir=output_base,
+                candles=day_candles
+            )
+            result = controller.run()
+
+            if run_sanity_checks:
+                result["sanity_checks"] = run_all_sanity_checks(
+                    symbol,
+                    replay_date,
+                    base_dir=output_base,
+                    data_path=processed_data_path,
+                    candles=day_candles
+                )
+            results.append(result)
+        except Exception as e:
+            logger.error(f"Error replaying {symbol} on {replay_date}: {e}")
+            results.append({"symbol": symbol, "date": replay_date, "error": str(e)})
+
+    return results
+
+
+def merge_worker_logs(
+    symbols: List[str],
+    dates: List[str],
+    staging_dir: str,
+    base_dir: str = "observations/historical_replay"
+) -> Dict[str, Path]:
+    """Merge staged per-symbol review CSVs into the per-date review files.
+
+    Rows are appended date by date in the order of ``symbols``, matching the
+    order of a sequential batch replay. Worker bytes are copied verbatim
+    (header dropped), so the merge is deterministic.
+
+    Args:
+        symbols: Symbols in output order.
+        dates: Dates to merge.
+        staging_dir: Root of the worker staging directories.
+        base_dir: Base directory of the replay review files.
+
+    Returns:
+        Dict mapping date to the merged review file path.
+    """
+    merged = {}
+    for replay_date in dates:
+        dest = ReplayLogger(replay_date, base_dir=base_dir).get_review_file_path()
+        for symbol in symbols:
+            staged = Path(staging_dir) / symbol / replay_date / f"signals_for_review_{replay_date}.csv"
+            if not staged.exists():
+                continue
+
+            data = staged.read_bytes()
+            header_end = data.find(b"\n") + 1
+            if header_end == 0 or header_end == len(data):
+                continue
+
+            with open(dest, "ab") as f:
+                if f.tell() == 0:
+                    f.write(data[:header_end])
+                f.write(data[header_end:])
+
+        if dest.exists():
+            merged[replay_date] = dest
+    return merged
+
+
+def run_parallel_batch_replay(
+    symbols: List[str],
+    dates: List[str],
+    interval_minutes: int = 1,
+    run_sanity_checks: bool = True,
+    vectorized: bool = False,
+    max_workers: Optional[int] = None,
+    processed_data_path: str = "data/processed/candles/intraday",
+    base_dir: str = "observations/historical_replay"
+) -> dict:
+    """Run a batch replay across a process pool.
+
+    Same inputs and summary shape as ``run_batch_replay``.
+
+    Args:
+        symbols: List of symbols (or ['ALL'] to use watchlist).
+        dates: List of dates in YYYY-MM-DD format.
+        interval_minutes: Evaluation interval.
+        run_sanity_checks: Whether to run sanity checks.
+        vectorized: Use the single-pass vectorized replay mode.
+        max_workers: Pool size (defaults to the number of CPUs).
+        processed_data_path: Path to processed candle files.
+        base_dir: Base directory of the replay review files.
+
+    Returns:
+        Summary of batch results, ordered by (date, symbol).
+    """
+    if symbols == ['ALL'] or symbols == 'ALL':
+        from ingestion.api_ingestion.angel_smartapi.config import config as angel_config
+        symbols = angel_config.symbol_watchlist
+
+    max_workers = max_workers or os.cpu_count() or 1
+    logger.info(
+        f"Starting parallel batch replay for {len(symbols)} symbols over {len(dates)} dates "
+        f"({max_workers} workers)"
+    )
+
+    Path(base_dir).mkdir(parents=True, exist_ok=True)
+    staging_dir = tempfile.mkdtemp(prefix=".batch_staging_", dir=base_dir)
+
+    try:
+        by_symbol: Dict[str, List[Dict]] = {}
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            futures = {
+                symbol: pool.submit(
+                    replay_symbol_days,
+                    symbol,
+                    dates,
+                    staging_dir,
+                    interval_minutes,
+                    run_sanity_checks,
+                    vectorized,
+                    processed_data_path
+                )
+                for symbol in symbols
+            }
+            for symbol, future in futures.items():
+                try:
+                    by_symbol[symbol] = future.result()
+                except Exception as e:
+                    logger.error(f"Worker failed for {symbol}: {e}")
+                    by_symbol[symbol] = [{"symbol": symbol, "date": d, "error": str(e)} for d in dates]
+
+        merge_worker_logs(symbols, dates, staging_dir, base_dir)
+    finally:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+
+    batch_results = {
+        "dates_processed": len(dates),
+        "symbols_processed": len(symbols),
+        "total_signals": 0,
+        "results": []
+    }
+
+    for i, current_date in enumerate(dates):
+        for symbol in symbols:
+            result = by_symbol[symbol][i]
+            if "error" not in result:
+                result["output_file"] = str(ReplayLogger(current_date, base_dir=base_dir).get_review_file_path())
+            batch_results["total_signals"] += result.get("signals_generated", 0)
+            batch_results["results"].append(result)
+
+        generate_eod_report(current_date, base_dir)
+
+    logger.info(f"Parallel batch replay complete. Total signals generated: {batch_results['total_signals']}")
+    return batch_results
@@ -4,6 +4,7 @@ This module provides the CandleCursor class which is the KEY abstraction
 for preventing future data leakage during historical replay.
 """
 
+import numpy as np
 import pandas as pd
 from typing import List
 import logging
@@ -66,6 +67,35 @@ class CandleCursor:
         
         return filtered
     
+    def get_prefix_end_positions(self, timestamps: List[pd.Timestamp]) -> np.ndarray:
+        """Return, for each T, the position of the last candle with timestamp <= T.
+        
+        Uses exactly the same boundary as get_candles_up_to(T): the prefix
+        visible at T is rows [0, position]. A position of -1 means no candle
+        is visible yet.
+        
+        Args:
+            timestamps: Evaluation timestamps.
+            
+        Returns:
+            Array of row positions into the cursor's frame.
+        """
+        ts = pd.to_datetime(pd.Series(timestamps))
+        return self._full_df['timestamp'].searchsorted(ts, side='right') - 1
+    
+    def get_causal_frame(self) -> pd.DataFrame:
+        """Return the full sorted day for prefix-only (causal) computations.
+        
+        Callers may only apply operations whose value at row i depends on
+        rows <= i (cumsum, cummax, trailing rolling windows), and must only
+        read rows at positions from get_prefix_end_positions(). Anything else
+        should go through get_candles_up_to().
+        
+        Returns:
+            Copy of the sorted day frame.
+        """
+        return self._full_df.copy()
+    
     def get_candles_at(self, timestamp: pd.Timestamp, offset_minutes: int = 0) -> pd.DataFrame:
         """Return candles at a specific timestamp with optional offset.
         
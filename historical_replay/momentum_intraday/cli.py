@@ -14,7 +14,9 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from historical_replay.momentum_intraday.replay_runner import run_replay, run_batch_replay
+from historical_replay.momentum_intraday.batch_executor import run_parallel_batch_replay
 from ingestion.api_ingestion.angel_smartapi.config import config as angel_config
+from ingestion.india_ingestion.candle_store import CandleStore
 import pandas as pd
 
 # Configure logging
@@ -30,15 +32,14 @@ def get_dates_for_month(month_str: str, symbols: list) -> list:
         month_str: Format YYYY-MM
         symbols: List of symbols to check
     """
-    processed_path = Path("data/processed/candles/intraday")
+    store = CandleStore("data/processed/candles/intraday")
     available_dates = set()
     
     for symbol in symbols:
-        file_path = processed_path / f"NSE_{symbol}_1m.parquet"
-        if file_path.exists():
+        if store.exists(symbol, "NSE"):
             try:
                 # Read only timestamp column for speed
-                df = pd.read_parquet(file_path, columns=['timestamp'])
+                df = store.read(symbol, "NSE", columns=['timestamp'])
                 df['date_str'] = df['timestamp'].dt.strftime('%Y-%m-%d')
                 # Filter indices starting with month_str
                 month_dates = df[df['date_str'].str.startswith(month_str)]['date_str'].unique()
@@ -48,6 +49,18 @@ def get_dates_for_month(month_str: str, symbols: list) -> list:
                 
     return sorted(list(available_dates))
 
+def worker_count(value: str):
+    """argparse type for --workers: a positive process count, or 'all' (None) for every CPU."""
+    if value.lower() == "all":
+        return None
+    try:
+        workers = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected a positive integer or 'all', got {value!r}")
+    if workers < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {workers}")
+    return workers
+
 def main():
     parser = argparse.ArgumentParser(
         description="Historical Intraday Momentum Replay - Diagnostic Tool",
@@ -56,6 +69,8 @@ def main():
 Examples:
   python historical_replay/momentum_intraday/cli.py --symbol RELIANCE --date 2026-01-03
   python historical_replay/momentum_intraday/cli.py --symbol ALL --date 2025-12
+  python historical_replay/momentum_intraday/cli.py --symbol ALL --date 2025-12 --workers 8 --vectorized
+  python historical_replay/momentum_intraday/cli.py --symbol ALL --date 2025-12 --workers all
   python historical_replay/momentum_intraday/cli.py --symbol TCS --date 2025-12-15 --interval 5
 
 WARNING: This is a DIAGNOSTIC tool only. Do not use for trading decisions.
@@ -89,6 +104,19 @@ WARNING: This is a DIAGNOSTIC tool only. Do not use for trading decisions.
         help="Skip sanity checks after replay"
     )
     
+    parser.add_argument(
+        "--vectorized",
+        action="store_true",
+        help="Single-pass replay: compute causal indicators once per day (same signal log)"
+    )
+    
+    parser.add_argument(
+        "--workers",
+        type=worker_count,
+        default=1,
+        help="Worker processes for batch replay (default: 1 = sequential, 'all' = all CPUs)"
+    )
+    
     parser.add_argument(
         "--verbose",
         "-v",
@@ -123,6 +151,8 @@ WARNING: This is a DIAGNOSTIC tool only. Do not use for trading decisions.
     print(f"Symbols:  {', '.join(symbols)}")
     print(f"Dates:    {args.date} ({len(dates)} days found)")
     print(f"Interval: {args.interval}m")
+    if args.workers != 1:
+        print(f"Workers:  {args.workers or 'all CPUs'}")
     print("=" * 60)
     print()
     print("⚠️  WARNING: This is a DIAGNOSTIC tool only.")
@@ -132,12 +162,23 @@ WARNING: This is a DIAGNOSTIC tool only. Do not use for trading decisions.
     try:
         if len(symbols) > 1 or len(dates) > 1:
             # Run batch
-            results = run_batch_replay(
-                symbols=symbols,
-                dates=dates,
-                interval_minutes=args.interval,
-                run_sanity_checks=not args.no_sanity_checks
-            )
+            if args.workers != 1:
+                results = run_parallel_batch_replay(
+                    symbols=symbols,
+                    dates=dates,
+                    interval_minutes=args.interval,
+                    run_sanity_checks=not args.no_sanity_checks,
+                    vectorized=args.vectorized,
+                    max_workers=args.workers
+                )
+            else:
+                results = run_batch_replay(
+                    symbols=symbols,
+                    dates=dates,
+                    interval_minutes=args.interval,
+                    run_sanity_checks=not args.no_sanity_checks,
+                    vectorized=args.vectorized
+                )
             print()
             print("=" * 60)
             print("BATCH REPLAY RESULTS")
@@ -152,7 +193,8 @@ WARNING: This is a DIAGNOSTIC tool only. Do not use for trading decisions.
                 symbol=symbols[0],
                 replay_date=dates[0],
                 interval_minutes=args.interval,
-                run_sanity_checks=not args.no_sanity_checks
+                run_sanity_checks=not args.no_sanity_checks,
+                vectorized=args.vectorized
             )
             
             print()
@@ -14,6 +14,7 @@ from typing import List, Optional
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from src.core_modules.momentum_engine.momentum_engine import MomentumEngine
+from ingestion.india_ingestion.candle_store import CandleStore
 from .candle_cursor import CandleCursor
 from .replay_logger import ReplayLogger
 from .replay_validator import ReplayValidator
@@ -42,7 +43,11 @@ class ReplayController:
         replay_date: str,
         interval_minutes: int = 1,
         processed_data_path: str = "data/processed/candles/intraday",
-        exchange: str = "NSE"
+        exchange: str = "NSE",
+        vectorized: bool = False,
+        verify_lookahead: bool = True,
+        output_base_dir: str = "observations/historical_replay",
+        candles: Optional[pd.DataFrame] = None
     ):
         """Initialize the replay controller.
         
@@ -52,17 +57,30 @@ class ReplayController:
             interval_minutes: Evaluation interval (default: 1 minute).
             processed_data_path: Path to processed parquet files.
             exchange: Exchange segment.
+            vectorized: Compute causal indicators once over the day and
+                        evaluate every evaluation point in a single pass.
+            verify_lookahead: In vectorized mode, re-derive every emitted signal
+                              from CandleCursor.get_candles_up_to(T) and fail
+                              if it differs.
+            output_base_dir: Base directory for the review CSV.
+            candles: Optional preloaded candles for the symbol (any date
+                     range); sliced to the replay date instead of reading
+                     the store, so batch runs load each symbol once.
         """
         self.symbol = symbol
         self.replay_date = replay_date
         self.interval = interval_minutes
         self.exchange = exchange
+        self.vectorized = vectorized
+        self.verify_lookahead = verify_lookahead
         self.data_path = Path(processed_data_path)
+        self.candle_store = CandleStore(processed_data_path)
         
         # Initialize components
         self.engine = MomentumEngine()
-        self.replay_logger = ReplayLogger(replay_date)
-        self.replay_validator = ReplayValidator(replay_date)
+        self.replay_logger = ReplayLogger(replay_date, base_dir=output_base_dir)
+        self.replay_validator = ReplayValidator(replay_date, base_dir=output_base_dir)
+        self._preloaded = candles
         
         # Will be set during run()
         self._cursor: Optional[CandleCursor] = None
@@ -83,13 +101,13 @@ class ReplayController:
         Returns:
             DataFrame containing candles for the replay date only.
         """
-        file_path = self.data_path / f"{self.exchange}_{self.symbol}_1m.parquet"
-        
-        if not file_path.exists():
+        if self._preloaded is not None:
+            df = self._preloaded.copy()
+        elif not self.candle_store.exists(self.symbol, self.exchange):
+            file_path = self.candle_store.base_file(self.symbol, self.exchange)
             raise FileNotFoundError(f"No processed data found: {file_path}")
-        
-        df = pd.read_parquet(file_path)
-        df['timestamp'] = pd.to_datetime(df['timestamp'])
+        else:
+            df = self.candle_store.read(self.symbol, self.exchange)
         
         # Filter to the specific replay date
         df['date'] = df['timestamp'].dt.date.astype(str)
@@ -128,6 +146,28 @@ class ReplayController:
         logger.info(f"[{self.MODE}] Replaying {len(eval_timestamps)} evaluation points (interval={self.interval}m)")
         
         # 5. Main replay loop
+        if self.vectorized:
+            self._run_vectorized(eval_timestamps)
+        else:
+            self._run_stepwise(eval_timestamps)
+        
+        logger.info(f"[{self.MODE}] Replay complete. Generated {self._signals_generated} signals.")
+        
+        # 6. Run instant validation
+        logger.info(f"[{self.MODE}] Running T+5/T+15 validation...")
+        self.replay_validator.validate_signals()
+        
+        return {
+            "symbol": self.symbol,
+            "date": self.replay_date,
+            "total_candles": self._cursor.total_candles,
+            "evaluation_points": len(eval_timestamps),
+            "signals_generated": self._signals_generated,
+            "output_file": str(self.replay_logger.get_review_file_path())
+        }
+    
+    def _run_stepwise(self, eval_timestamps: List[pd.Timestamp]) -> None:
+        """Feed the engine the growing prefix at every evaluation point."""
         for idx, ts in enumerate(eval_timestamps):
             # Get candles up to this timestamp (NO LOOKAHEAD)
             candles_up_to_now = self._cursor.get_candles_up_to(ts)
@@ -148,21 +188,39 @@ class ReplayController:
             if (idx + 1) % max(1, len(eval_timestamps) // 10) == 0:
                 pct = (idx + 1) / len(eval_timestamps) * 100
                 logger.info(f"[{self.MODE}] Progress: {pct:.0f}% ({idx + 1}/{len(eval_timestamps)})")
+    
+    def _run_vectorized(self, eval_timestamps: List[pd.Timestamp]) -> None:
+        """Evaluate all evaluation points in one pass over causal indicators.
         
-        logger.info(f"[{self.MODE}] Replay complete. Generated {self._signals_generated} signals.")
-        
-        # 6. Run instant validation
-        logger.info(f"[{self.MODE}] Running T+5/T+15 validation...")
-        self.replay_validator.validate_signals()
-        
-        return {
-            "symbol": self.symbol,
-            "date": self.replay_date,
-            "total_candles": self._cursor.total_candles,
-            "evaluation_points": len(eval_timestamps),
-            "signals_generated": self._signals_generated,
-            "output_file": str(self.replay_logger.get_review_file_path())
-        }
+        Each evaluation point T is mapped to the end of the prefix that
+        get_candles_up_to(T) would return, so the engine only ever reads
+        indicator values derived from candles <= T.
+        """
+        positions = self._cursor.get_prefix_end_positions(eval_timestamps)
+        signals = self.engine.generate_signal_series(
+            self._cursor.get_causal_frame(),
+            self.symbol,
+            self.exchange,
+            positions=positions
+        )
+        
+        for sig in signals:
+            if self.verify_lookahead:
+                self._verify_against_cursor(sig)
+            self.replay_logger.log_signal(sig.to_dict())
+            self._signals_generated += 1
+        
+        logger.info(f"[{self.MODE}] Vectorized pass evaluated {len(eval_timestamps)} points")
+    
+    def _verify_against_cursor(self, sig) -> None:
+        """Re-derive a signal from the cursor-filtered prefix and compare."""
+        prefix = self._cursor.get_candles_up_to(pd.Timestamp(sig.timestamp))
+        expected = self.engine.generate_signals_from_df(prefix, self.symbol, self.exchange)
+        if [s.to_dict() for s in expected] != [sig.to_dict()]:
+            raise RuntimeError(
+                f"[{self.MODE}] Vectorized signal for {self.symbol} @ {sig.timestamp} "
+                f"does not match cursor-filtered evaluation (possible lookahead)"
+            )
     
     @property
     def signals_generated(self) -> int:
@@ -113,7 +113,8 @@ def run_replay(
     symbol: str,
     replay_date: str,
     interval_minutes: int = 1,
-    run_sanity_checks: bool = True
+    run_sanity_checks: bool = True,
+    vectorized: bool = False
 ) -> dict:
     """Run a complete historical replay session.
     
@@ -122,6 +123,7 @@ def run_replay(
         replay_date: Date to replay (YYYY-MM-DD format).
         interval_minutes: Evaluation interval in minutes.
         run_sanity_checks: Whether to run sanity checks after replay.
+        vectorized: Use the single-pass vectorized replay mode.
         
     Returns:
         Dict with replay results.
@@ -135,7 +137,8 @@ def run_replay(
     controller = ReplayController(
         symbol=symbol,
         replay_date=replay_date,
-        interval_minutes=interval_minutes
+        interval_minutes=interval_minutes,
+        vectorized=vectorized
     )
     
     results = controller.run()
@@ -161,7 +164,8 @@ def run_batch_replay(
     symbols: List[str],
     dates: List[str],
     interval_minutes: int = 1,
-    run_sanity_checks: bool = True
+    run_sanity_checks: bool = True,
+    vectorized: bool = False
 ) -> dict:
     """Run replay for multiple symbols and multiple dates.
     
@@ -170,6 +174,7 @@ def run_batch_replay(
         dates: List of dates in YYYY-MM-DD format.
         interval_minutes: Evaluation interval.
         run_sanity_checks: Whether to run sanity checks.
+        vectorized: Use the single-pass vectorized replay mode.
         
     Returns:
         Summary of batch results.
@@ -194,7 +199,8 @@ def run_batch_replay(
                     symbol=symbol,
                     replay_date=current_date,
                     interval_minutes=interval_minutes,
-                    run_sanity_checks=run_sanity_checks
+                    run_sanity_checks=run_sanity_checks,
+                    vectorized=vectorized
                 )
                 batch_results["total_signals"] += result.get("signals_generated", 0)
                 batch_results["results"].append(result)
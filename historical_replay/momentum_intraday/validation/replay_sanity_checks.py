@@ -8,7 +8,7 @@ import sys
 import pandas as pd
 import logging
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
 
@@ -49,7 +49,12 @@ def check_no_future_candles(symbol: str, replay_date: str, base_dir: str = "obse
     return {"check": "no_future_candles", "passed": True, "reason": "All signals on correct date"}
 
 
-def check_vwap_progression(symbol: str, replay_date: str, data_path: str = "data/processed/candles/intraday") -> Dict:
+def check_vwap_progression(
+    symbol: str,
+    replay_date: str,
+    data_path: str = "data/processed/candles/intraday",
+    candles: Optional[pd.DataFrame] = None
+) -> Dict:
     """Verify that VWAP evolves progressively throughout the day.
     
     VWAP should generally change over time, not be static.
@@ -59,14 +64,19 @@ def check_vwap_progression(symbol: str, replay_date: str, data_path: str = "data
     """
     from ..candle_cursor import CandleCursor
     from src.core_modules.momentum_engine.momentum_engine import MomentumEngine
+    from ingestion.india_ingestion.candle_store import CandleStore
     
-    file_path = Path(data_path) / f"NSE_{symbol}_1m.parquet"
-    
-    if not file_path.exists():
-        return {"check": "vwap_progression", "passed": False, "reason": f"Data file not found: {file_path}"}
+    if candles is not None:
+        df = candles.copy()
+    else:
+        store = CandleStore(data_path)
+        
+        if not store.exists(symbol, "NSE"):
+            file_path = store.base_file(symbol, "NSE")
+            return {"check": "vwap_progression", "passed": False, "reason": f"Data file not found: {file_path}"}
+        
+        df = store.read(symbol, "NSE")
     
-    df = pd.read_parquet(file_path)
-    df['timestamp'] = pd.to_datetime(df['timestamp'])
     df['date'] = df['timestamp'].dt.date.astype(str)
     df_day = df[df['date'] == replay_date].copy()
     
@@ -145,12 +155,21 @@ def check_determinism(symbol: str, replay_date: str) -> Dict:
     }
 
 
-def run_all_sanity_checks(symbol: str, replay_date: str) -> List[Dict]:
+def run_all_sanity_checks(
+    symbol: str,
+    replay_date: str,
+    base_dir: str = "observations/historical_replay",
+    data_path: str = "data/processed/candles/intraday",
+    candles: Optional[pd.DataFrame] = None
+) -> List[Dict]:
     """Run all sanity checks and return results.
     
     Args:
         symbol: Trading symbol.
         replay_date: Replay date (YYYY-MM-DD).
+        base_dir: Base directory holding the replay review CSV.
+        data_path: Path to processed candle files.
+        candles: Optional preloaded candles for the symbol.
         
     Returns:
         List of check result dicts.
@@ -160,17 +179,17 @@ def run_all_sanity_checks(symbol: str, replay_date: str) -> List[Dict]:
     logger.info("Running sanity checks...")
     
     # 1. No future candles
-    result = check_no_future_candles(symbol, replay_date)
+    result = check_no_future_candles(symbol, replay_date, base_dir)
     results.append(result)
     logger.info(f"  {result['check']}: {'PASS' if result['passed'] else 'FAIL'} - {result['reason']}")
     
     # 2. VWAP progression
-    result = check_vwap_progression(symbol, replay_date)
+    result = check_vwap_progression(symbol, replay_date, data_path, candles)
     results.append(result)
     logger.info(f"  {result['check']}: {'PASS' if result['passed'] else 'FAIL'} - {result['reason']}")
     
     # 3. Timestamp alignment
-    result = check_signal_timestamp_alignment(symbol, replay_date)
+    result = check_signal_timestamp_alignment(symbol, replay_date, base_dir)
     results.append(result)
     logger.info(f"  {result['check']}: {'PASS' if result['passed'] else 'FAIL'} - {result['reason']}")
     
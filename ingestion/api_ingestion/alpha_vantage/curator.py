@@ -1,10 +1,48 @@
 import pandas as pd
 from pathlib import Path
+from typing import Optional
 import logging
 from ingestion.api_ingestion.alpha_vantage import config
+from ingestion.core.daily_bar_store import read_staged_daily
 
 logger = logging.getLogger(__name__)
 
+REQUIRED_COLUMNS = ['open', 'high', 'low', 'close', 'volume']
+
+
+def curate_frame(symbol: str, df: pd.DataFrame) -> Optional[pd.DataFrame]:
+    """Applies the analytics contract to a staged frame; None if it fails schema checks."""
+    # 1. Deduplication
+    if not df.index.is_unique:
+        df = df[~df.index.duplicated(keep='last')]
+    
+    # 2. Schema Validation / Type Enforcement
+    if not all(col in df.columns for col in REQUIRED_COLUMNS):
+        logger.error(f"Schema Mismatch {symbol}: Missing columns")
+        return None
+        
+    # 3. Sanity Checks
+    # e.g. Negative prices
+    if (df[REQUIRED_COLUMNS].to_numpy() < 0).any():
+        logger.warning(f"Data Quality Warning {symbol}: Negative prices detected")
+    return df
+
+
+def write_curated(symbol: str, df: pd.DataFrame, analytics_dir: Path) -> bool:
+    df = curate_frame(symbol, df)
+    if df is None:
+        return False
+    
+    # 4. Partitioning Logic
+    # Analysis layer often partitioned by Symbol or Date. 
+    # For backtesting ease, 'By Symbol' single file is often best for mid-size data.
+    # Storing as single parquet file per symbol in analytics.
+    
+    out_path = analytics_dir / f"{symbol}.parquet"
+    df.to_parquet(out_path, compression='snappy')
+    return True
+
+
 class USCurator:
     """
     Promotes data from Staging -> Analytics.
@@ -22,30 +60,8 @@ class USCurator:
             return False
 
         try:
-            df = pd.read_parquet(staging_path)
-            
-            # 1. Deduplication
-            df = df[~df.index.duplicated(keep='last')]
-            
-            # 2. Schema Validation / Type Enforcement
-            required_cols = ['open', 'high', 'low', 'close', 'volume']
-            if not all(col in df.columns for col in required_cols):
-                logger.error(f"Schema Mismatch {symbol}: Missing columns")
-                return False
-                
-            # 3. Sanity Checks
-            # e.g. Negative prices
-            if (df[required_cols] < 0).any().any():
-                logger.warning(f"Data Quality Warning {symbol}: Negative prices detected")
-            
-            # 4. Partitioning Logic
-            # Analysis layer often partitioned by Symbol or Date. 
-            # For backtesting ease, 'By Symbol' single file is often best for mid-size data.
-            # Storing as single parquet file per symbol in analytics.
-            
-            out_path = self.analytics_dir / f"{symbol}.parquet"
-            df.to_parquet(out_path, compression='snappy')
-            return True
+            df = read_staged_daily(staging_path)
+            return write_curated(symbol, df, self.analytics_dir)
             
         except Exception as e:
             logger.error(f"Curate Failed {symbol}: {e}")
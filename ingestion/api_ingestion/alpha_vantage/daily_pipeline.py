@@ -0,0 +1,163 @@
+"""
+Combined Normalize + Curate Pipeline
+
+One pass per raw daily JSON: decode (orjson when installed), build typed
+columns directly, write the staging parquet and the curated analytics
+parquet from the same in-memory frame. Files run across a process pool,
+and inputs whose content hash matches the last successful run are skipped.
+
+Usage:
+    python -m ingestion.api_ingestion.alpha_vantage.daily_pipeline [--date YYYY-MM-DD] [--workers N] [--force]
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from ingestion.api_ingestion.alpha_vantage import config
+from ingestion.api_ingestion.alpha_vantage.curator import write_curated
+from ingestion.api_ingestion.alpha_vantage.normalizer import build_staged_frame, load_json_bytes, symbol_from_raw_path
+from ingestion.core.daily_bar_store import APPENDS_DIR, read_staged_daily
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = "_normalize_manifest.json"
+# Below this many changed files the pool start-up costs more than it saves
+MIN_FILES_FOR_POOL = 16
+
+
+def content_hash(raw: bytes) -> str:
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+
+def process_file(
+    json_path: str,
+    staging_dir: str,
+    analytics_dir: str,
+    previous_hash: Optional[str] = None
+) -> Tuple[str, str, Optional[str], str]:
+    """
+    Normalize and curate one raw file. Runs in a worker process.
+    Returns (symbol, status, content_hash, msg) with status OK | SKIPPED | FAILED.
+    """
+    path = Path(json_path)
+    symbol = symbol_from_raw_path(path)
+    try:
+        raw = path.read_bytes()
+        digest = content_hash(raw)
+        staged_path = Path(staging_dir) / f"{symbol}.parquet"
+        appended = (Path(staging_dir) / APPENDS_DIR / symbol).exists()
+        if (digest == previous_hash and not appended and staged_path.exists()
+                and (Path(analytics_dir) / f"{symbol}.parquet").exists()):
+            return symbol, "SKIPPED", digest, "unchanged"
+
+        df = build_staged_frame(symbol, load_json_bytes(raw))
+        df.to_parquet(staged_path, compression='snappy')
+
+        # Bars appended by the incremental updater after this history
+        # belong in the analytics view too
+        if appended:
+            df = read_staged_daily(staged_path)
+
+        if not write_curated(symbol, df, Path(analytics_dir)):
+            return symbol, "FAILED", None, "curation failed"
+        return symbol, "OK", digest, f"{len(df)} rows"
+
+    except Exception as e:
+        return symbol, "FAILED", None, str(e)
+
+
+def _process_batch(tasks: List[Tuple[str, str, str, Optional[str]]]) -> List[Tuple[str, str, Optional[str], str]]:
+    return [process_file(*task) for task in tasks]
+
+
+class DailyPipeline:
+    """Runs normalize + curate for a crawl date's raw files."""
+
+    def __init__(self, staging_dir: Optional[Path] = None, analytics_dir: Optional[Path] = None, workers: Optional[int] = None):
+        self.staging_dir = Path(staging_dir or config.STAGING_DIR / "daily")
+        self.analytics_dir = Path(analytics_dir or config.ANALYTICS_DIR / "prices" / "daily")
+        self.workers = workers or os.cpu_count() or 1
+        self.manifest_path = self.staging_dir / MANIFEST_NAME
+        self.staging_dir.mkdir(parents=True, exist_ok=True)
+        self.analytics_dir.mkdir(parents=True, exist_ok=True)
+
+    def _load_manifest(self) -> Dict[str, Any]:
+        if not self.manifest_path.exists():
+            return {}
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            logger.warning("Normalize manifest unreadable; reprocessing all inputs")
+            return {}
+
+    def _save_manifest(self, manifest: Dict[str, Any]) -> None:
+        tmp = self.manifest_path.with_name(MANIFEST_NAME + ".tmp")
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2, sort_keys=True)
+        os.replace(tmp, self.manifest_path)
+
+    def run_files(self, json_files: List[Path], force: bool = False) -> Dict[str, Any]:
+        manifest = self._load_manifest()
+        tasks = [
+            (str(f), str(self.staging_dir), str(self.analytics_dir),
+             None if force else manifest.get(symbol_from_raw_path(f), {}).get("hash"))
+            for f in sorted(json_files)
+        ]
+
+        if self.workers <= 1 or len(tasks) < MIN_FILES_FOR_POOL:
+            results = _process_batch(tasks)
+        else:
+            # A few chunks per worker keeps IPC overhead low while balancing load
+            n_chunks = self.workers * 4
+            chunks = [tasks[i::n_chunks] for i in range(n_chunks) if tasks[i::n_chunks]]
+            with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                results = [r for batch in pool.map(_process_batch, chunks) for r in batch]
+
+        stats = {"total": len(tasks), "ok": 0, "skipped": 0, "failed": 0}
+        for symbol, status, digest, msg in results:
+            stats[status.lower()] += 1
+            if status == "OK":
+                manifest[symbol] = {"hash": digest, "updated_at": datetime.utcnow().isoformat()}
+            elif status == "FAILED":
+                logger.error(f"Failed to normalize {symbol}: {msg}")
+                manifest.pop(symbol, None)
+        if stats["ok"] or stats["failed"]:
+            self._save_manifest(manifest)
+        return stats
+
+    def run(self, date_str: str, force: bool = False) -> Optional[Dict[str, Any]]:
+        raw_date_dir = config.RAW_BASE_DIR / date_str
+        if not raw_date_dir.exists():
+            logger.error(f"Raw directory not found: {raw_date_dir}")
+            return None
+
+        json_files = list(raw_date_dir.glob("*.json"))
+        logger.info(f"Found {len(json_files)} files to normalize for {date_str}")
+        stats = self.run_files(json_files, force=force)
+        logger.info(
+            f"Normalize+Curate Complete. Processed {stats['ok']}, unchanged {stats['skipped']}, "
+            f"failed {stats['failed']} of {stats['total']} files."
+        )
+        return stats
+
+
+def main():
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s | %(levelname)-7s | %(name)s | %(message)s")
+    parser = argparse.ArgumentParser(description="Normalize and curate Alpha Vantage daily JSON")
+    parser.add_argument("--date", default=datetime.utcnow().strftime('%Y-%m-%d'))
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--force", action="store_true", help="Reprocess unchanged inputs")
+    args = parser.parse_args()
+    DailyPipeline(workers=args.workers).run(args.date, force=args.force)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,319 @@
+"""
+Concurrent Alpha Vantage Fetch Scheduler
+
+Drives every key in the pool at once instead of fetching one symbol at a
+time behind a fixed sleep:
+
+* One worker thread per key, each with its own pooled requests.Session and
+  a token bucket sized to the per-key free tier limit (5/min, 500/day), so
+  throughput scales with the number of keys.
+* A shared priority queue of fetch jobs (lower priority value runs first,
+  FIFO within a priority).
+* "Note" (and rate-limit "Information") responses put the key into an
+  exponential cooldown and requeue the job for another key.
+
+Usage:
+    scheduler = AlphaVantageFetchScheduler()          # keys from KeyPoolManager
+    for result in scheduler.iter_daily(["AAPL", "MSFT"]):
+        ...
+"""
+
+import itertools
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future, as_completed
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+import requests
+
+from ingestion.api_ingestion.alpha_vantage import config
+from ingestion.api_ingestion.alpha_vantage.key_pool import KeyPoolManager
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class FetchResult:
+    """Outcome of one scheduled request."""
+    symbol: str
+    success: bool
+    status: str  # OK | RATE_LIMIT | API_ERROR | EMPTY | EXCEPTION | QUOTA_EXHAUSTED | CANCELLED
+    data: Optional[Dict[str, Any]] = None
+    msg: str = ""
+    attempts: int = 0
+    key_suffix: str = ""
+
+
+@dataclass(order=True)
+class _FetchJob:
+    priority: int
+    seq: int
+    symbol: str = field(compare=False)
+    params: Dict[str, Any] = field(compare=False)
+    expect_key: Optional[str] = field(compare=False)
+    future: Future = field(compare=False)
+    attempts: int = field(default=0, compare=False)
+
+
+class KeyBucket:
+    """Token bucket plus throttle cooldown for a single API key."""
+
+    def __init__(self, key: str, calls_per_minute: float, burst: int):
+        self.key = key
+        self.rate = calls_per_minute / 60.0  # tokens per second
+        self.capacity = float(burst)
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.cooldown_until = 0.0
+        self.strikes = 0
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, now: float) -> float:
+        """Seconds until this key may make its next call."""
+        self._refill(now)
+        token_wait = 0.0 if self.tokens >= 1.0 else (1.0 - self.tokens) / self.rate
+        return max(token_wait, self.cooldown_until - now)
+
+    def take(self, now: float) -> None:
+        self._refill(now)
+        self.tokens -= 1.0
+
+    def throttle(self, now: float, base_seconds: float, max_seconds: float) -> float:
+        """Back off after a throttle response; doubles with consecutive strikes."""
+        delay = min(max_seconds, base_seconds * (2 ** self.strikes))
+        self.strikes += 1
+        self.cooldown_until = now + delay
+        # Also drain the burst so the key restarts at its steady rate
+        self.tokens = min(self.tokens, 0.0)
+        return delay
+
+    def succeeded(self) -> None:
+        self.strikes = 0
+
+
+class AlphaVantageFetchScheduler:
+    """Rate-limit-aware concurrent fetcher over a pool of Alpha Vantage keys."""
+
+    def __init__(
+        self,
+        keys: Optional[Sequence[str]] = None,
+        key_pool: Optional[KeyPoolManager] = None,
+        base_url: str = config.BASE_URL,
+        calls_per_minute: float = config.MAX_CALLS_PER_MINUTE,
+        burst: int = config.BUCKET_CAPACITY,
+        note_backoff_seconds: float = 60.0,
+        max_backoff_seconds: float = 600.0,
+        max_attempts: int = 3,
+        timeout: float = 30.0
+    ):
+        """
+        Args:
+            keys: Explicit key list. Defaults to the KeyPoolManager's primary keys.
+            key_pool: Quota ledger; every call is recorded against its key's daily limit.
+            base_url: Query endpoint (point at a stub server in tests).
+            calls_per_minute: Steady per-key request rate.
+            burst: Token bucket capacity per key.
+            note_backoff_seconds: First cooldown after a throttle response.
+            max_backoff_seconds: Cooldown cap.
+            max_attempts: Throttled attempts per job before giving up with RATE_LIMIT.
+            timeout: HTTP timeout in seconds.
+        """
+        if keys is None:
+            key_pool = key_pool or KeyPoolManager()
+            keys = list(key_pool.primary_keys)
+        if not keys:
+            raise ValueError("No Alpha Vantage keys configured for the fetch scheduler")
+
+        self.keys = list(dict.fromkeys(keys))
+        self.key_pool = key_pool
+        self.base_url = base_url
+        self.note_backoff_seconds = note_backoff_seconds
+        self.max_backoff_seconds = max_backoff_seconds
+        self.max_attempts = max_attempts
+        self.timeout = timeout
+
+        self.buckets = {k: KeyBucket(k, calls_per_minute, burst) for k in self.keys}
+        self.sessions = {k: requests.Session() for k in self.keys}
+
+        self._queue: "queue.PriorityQueue[_FetchJob]" = queue.PriorityQueue()
+        self._seq = itertools.count()
+        self._stop = threading.Event()
+        self._threads: List[threading.Thread] = []
+        self._lock = threading.Lock()
+        self._live_workers = 0
+
+        # Statistics
+        self.calls_by_key: Dict[str, int] = {k: 0 for k in self.keys}
+        self.throttled = 0
+        self.completed = 0
+
+    # --- Submission ---
+
+    def submit(self, symbol: str, params: Dict[str, Any], priority: int = 0, expect_key: Optional[str] = None) -> Future:
+        """
+        Queue one request. `params` are the query parameters minus apikey;
+        `expect_key` names the payload key that marks a successful response.
+        """
+        future: Future = Future()
+        self._queue.put(_FetchJob(priority, next(self._seq), symbol, dict(params), expect_key, future))
+        if not self._threads:
+            self.start()
+        elif self._live_workers == 0:
+            self._fail_pending("All keys exhausted their daily quota")
+        return future
+
+    def submit_daily(self, symbol: str, outputsize: str = 'compact', priority: int = 0) -> Future:
+        params = {'function': 'TIME_SERIES_DAILY', 'symbol': symbol, 'outputsize': outputsize}
+        return self.submit(symbol, params, priority=priority, expect_key="Time Series (Daily)")
+
+    def iter_daily(self, symbols: Sequence[str], outputsize: str = 'compact', priority: int = 0) -> Iterator[FetchResult]:
+        """Fetch TIME_SERIES_DAILY for all symbols, yielding results as they complete."""
+        futures = [self.submit_daily(s, outputsize=outputsize, priority=priority) for s in symbols]
+        for future in as_completed(futures):
+            yield future.result()
+
+    def fetch_daily(self, symbols: Sequence[str], outputsize: str = 'compact', priority: int = 0) -> Dict[str, FetchResult]:
+        return {r.symbol: r for r in self.iter_daily(symbols, outputsize=outputsize, priority=priority)}
+
+    # --- Workers ---
+
+    def start(self) -> None:
+        if self._threads:
+            return
+        self._stop.clear()
+        self._live_workers = len(self.keys)
+        for i, key in enumerate(self.keys):
+            t = threading.Thread(target=self._worker, args=(key,), name=f"av-fetch-{i}", daemon=True)
+            self._threads.append(t)
+            t.start()
+        logger.info(f"Fetch scheduler started with {len(self.keys)} keys")
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Stop workers and release sessions; jobs still queued finish as CANCELLED."""
+        self._stop.set()
+        for t in self._threads:
+            t.join(timeout)
+        self._threads = []
+        self._fail_pending("Scheduler closed", status='CANCELLED')
+        for session in self.sessions.values():
+            session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _worker(self, key: str) -> None:
+        bucket = self.buckets[key]
+        try:
+            while not self._stop.is_set():
+                wait = bucket.wait_time(time.monotonic())
+                if wait > 0:
+                    self._stop.wait(min(wait, 0.5))
+                    continue
+                try:
+                    job = self._queue.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+
+                if self.key_pool is not None and not self.key_pool.record_call(key):
+                    logger.warning(f"Key ...{key[-4:]} reached its daily quota; retiring worker")
+                    self._queue.put(job)
+                    return
+
+                bucket.take(time.monotonic())
+                with self._lock:
+                    self.calls_by_key[key] += 1
+                try:
+                    self._execute(key, bucket, job)
+                except Exception as e:
+                    # Never leave a caller waiting on an unresolved future
+                    logger.error(f"Fetch for {job.symbol} failed unexpectedly: {e}")
+                    self._finish(job, FetchResult(job.symbol, False, 'EXCEPTION', msg=str(e), attempts=job.attempts, key_suffix=key[-4:]))
+        finally:
+            with self._lock:
+                self._live_workers -= 1
+                last = self._live_workers == 0
+            if last and not self._stop.is_set():
+                self._fail_pending("All keys exhausted their daily quota")
+
+    def _execute(self, key: str, bucket: KeyBucket, job: _FetchJob) -> None:
+        job.attempts += 1
+        params = dict(job.params, apikey=key)
+        try:
+            response = self.sessions[key].get(self.base_url, params=params, timeout=self.timeout)
+            response.raise_for_status()
+            data = response.json()
+        except Exception as e:
+            self._finish(job, FetchResult(job.symbol, False, 'EXCEPTION', msg=str(e), attempts=job.attempts, key_suffix=key[-4:]))
+            return
+        if not isinstance(data, dict):
+            msg = f"Unexpected response body of type {type(data).__name__}"
+            self._finish(job, FetchResult(job.symbol, False, 'API_ERROR', msg=msg, attempts=job.attempts, key_suffix=key[-4:]))
+            return
+
+        throttle_msg = self._throttle_message(data)
+        if throttle_msg is not None:
+            delay = bucket.throttle(time.monotonic(), self.note_backoff_seconds, self.max_backoff_seconds)
+            with self._lock:
+                self.throttled += 1
+            if self.key_pool is not None:
+                self.key_pool.mark_failure(key)
+            logger.warning(f"Throttled on key ...{key[-4:]} for {job.symbol}; cooling down {delay:.1f}s")
+            if job.attempts < self.max_attempts:
+                self._queue.put(job)
+            else:
+                self._finish(job, FetchResult(job.symbol, False, 'RATE_LIMIT', msg=throttle_msg, attempts=job.attempts, key_suffix=key[-4:]))
+            return
+
+        bucket.succeeded()
+        if "Error Message" in data:
+            result = FetchResult(job.symbol, False, 'API_ERROR', data=data, msg=data["Error Message"])
+        elif job.expect_key and job.expect_key not in data:
+            result = FetchResult(job.symbol, False, 'EMPTY', data=data, msg=f"Keys: {list(data.keys())}")
+        else:
+            result = FetchResult(job.symbol, True, 'OK', data=data, msg='OK')
+        result.attempts = job.attempts
+        result.key_suffix = key[-4:]
+        self._finish(job, result)
+
+    @staticmethod
+    def _throttle_message(data: Dict[str, Any]) -> Optional[str]:
+        if "Note" in data:
+            return str(data["Note"])
+        info = data.get("Information")
+        if info and any(s in str(info).lower() for s in ("rate limit", "call frequency", "requests per")):
+            return str(info)
+        return None
+
+    def _finish(self, job: _FetchJob, result: FetchResult) -> None:
+        with self._lock:
+            self.completed += 1
+        if not job.future.done():
+            job.future.set_result(result)
+
+    def _fail_pending(self, reason: str, status: str = 'QUOTA_EXHAUSTED') -> None:
+        while True:
+            try:
+                job = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            self._finish(job, FetchResult(job.symbol, False, status, msg=reason, attempts=job.attempts))
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "keys": len(self.keys),
+                "live_workers": self._live_workers,
+                "queued": self._queue.qsize(),
+                "completed": self.completed,
+                "throttled": self.throttled,
+                "calls_by_key": {f"...{k[-4:]}": n for k, n in self.calls_by_key.items()},
+            }
@@ -9,12 +9,12 @@ Usage:
 """
 
 import logging
-import time
 from datetime import datetime
 
 import pandas as pd
 
 from ingestion.api_ingestion.alpha_vantage import config
+from ingestion.api_ingestion.alpha_vantage.fetch_scheduler import AlphaVantageFetchScheduler
 from ingestion.api_ingestion.alpha_vantage.market_data_ingestor import USMarketIngestor
 from ingestion.api_ingestion.alpha_vantage.normalizer import USNormalizer
 
@@ -29,7 +29,7 @@ logger = logging.getLogger(__name__)
 # =============================================================================
 
 BOOTSTRAP_SYMBOLS = ["AAPL", "GOOGL", "MSFT"]
-DELAY_SECONDS = 13  # Respect rate limits: 5 calls/min
+# Rate limits (5 calls/min per key) are enforced by AlphaVantageFetchScheduler
 
 # Minimum trading days required (compact mode gives ~100 days)
 MIN_TRADING_DAYS = 60
@@ -57,12 +57,21 @@ def run_bootstrap():
     today_str = datetime.utcnow().strftime('%Y-%m-%d')
     
     results = {}
+    outputsize = 'full' if USE_FULL_HISTORY else 'compact'
+    
+    logger.info(f"Fetching {len(BOOTSTRAP_SYMBOLS)} symbols concurrently (compact={not USE_FULL_HISTORY})...")
+    with AlphaVantageFetchScheduler() as scheduler:
+        fetched = scheduler.fetch_daily(BOOTSTRAP_SYMBOLS, outputsize=outputsize)
     
     for idx, symbol in enumerate(BOOTSTRAP_SYMBOLS):
-        logger.info(f"[{idx + 1}/{len(BOOTSTRAP_SYMBOLS)}] Fetching {symbol} history (compact={not USE_FULL_HISTORY})...")
+        logger.info(f"[{idx + 1}/{len(BOOTSTRAP_SYMBOLS)}] Processing {symbol}...")
         
         # Fetch history (compact for free tier, full for premium)
-        result = ingestor.fetch_symbol_daily(symbol, full_history=USE_FULL_HISTORY)
+        response = fetched[symbol]
+        if response.success:
+            result = ingestor.save_daily_response(symbol, response.data)
+        else:
+            result = {'success': False, 'status': response.status, 'msg': response.msg}
         
         if result["success"]:
             logger.info(f"  ✓ {symbol}: Raw saved")
@@ -93,11 +102,6 @@ def run_bootstrap():
         else:
             logger.error(f"  ✗ {symbol}: {result['status']} - {result['msg']}")
             results[symbol] = {"status": "failed", "reason": result["status"]}
-        
-        # Rate limit delay (skip on last symbol)
-        if idx < len(BOOTSTRAP_SYMBOLS) - 1:
-            logger.info(f"  Waiting {DELAY_SECONDS}s for rate limit...")
-            time.sleep(DELAY_SECONDS)
     
     # Summary
     logger.info("=" * 60)
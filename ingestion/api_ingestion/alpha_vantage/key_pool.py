@@ -137,5 +137,29 @@ class KeyPoolManager:
                 # Let's set 'failed' = True if it's a hard error, but usually 429 is temporary.
                 # Just maxing counters ensures we rotate.
                 
+    def record_call(self, key: str) -> bool:
+        """
+        Count one call against a specific key (used by the concurrent fetch
+        scheduler, which paces each key itself). Returns False, without
+        counting, if the key's daily quota is already used up.
+        """
+        with self._lock:
+            if key not in self.usage_stats:
+                return True
+            self._reset_counters_if_needed(key)
+            stats = self.usage_stats[key]
+            if stats['day_calls'] >= self.MAX_CALLS_PER_DAY:
+                return False
+            stats['minute_calls'] += 1
+            stats['day_calls'] += 1
+            return True
+
+    def day_calls_remaining(self, key: str) -> int:
+        with self._lock:
+            if key not in self.usage_stats:
+                return self.MAX_CALLS_PER_DAY
+            self._reset_counters_if_needed(key)
+            return max(0, self.MAX_CALLS_PER_DAY - self.usage_stats[key]['day_calls'])
+
     def get_stats(self):
         return {k: v['day_calls'] for k, v in self.usage_stats.items()}
@@ -36,20 +36,26 @@ class USMarketIngestor:
         
         try:
             data = self.client.get_daily(symbol, outputsize=output_size)
-            
-            # Check for API Notes/Errors
-            if "Note" in data:
-                return {'success': False, 'status': 'RATE_LIMIT', 'msg': data['Note']}
-            if "Error Message" in data:
-                return {'success': False, 'status': 'API_ERROR', 'msg': data['Error Message']}
-            if "Time Series (Daily)" not in data:
-                # Could be empty symbol or unknown response
-                return {'success': False, 'status': 'EMPTY', 'msg': f"Keys: {list(data.keys())}"}
-
-            self._save_raw(symbol, 'daily', data)
-            raw_path = str(self.raw_dir / f"{symbol}_daily.json")
-            return {'success': True, 'status': 'OK', 'msg': 'Saved', 'raw_path': raw_path}
+            return self.save_daily_response(symbol, data)
 
         except Exception as e:
             logger.error(f"Ingest Error {symbol}: {e}")
             return {'success': False, 'status': 'EXCEPTION', 'msg': str(e)}
+
+    def save_daily_response(self, symbol: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Classifies a TIME_SERIES_DAILY response and saves it if usable.
+        Shared by fetch_symbol_daily and the concurrent fetch scheduler.
+        """
+        # Check for API Notes/Errors
+        if "Note" in data:
+            return {'success': False, 'status': 'RATE_LIMIT', 'msg': data['Note']}
+        if "Error Message" in data:
+            return {'success': False, 'status': 'API_ERROR', 'msg': data['Error Message']}
+        if "Time Series (Daily)" not in data:
+            # Could be empty symbol or unknown response
+            return {'success': False, 'status': 'EMPTY', 'msg': f"Keys: {list(data.keys())}"}
+
+        self._save_raw(symbol, 'daily', data)
+        raw_path = str(self.raw_dir / f"{symbol}_daily.json")
+        return {'success': True, 'status': 'OK', 'msg': 'Saved', 'raw_path': raw_path}
@@ -1,5 +1,6 @@
 import json
 import logging
+import numpy as np
 import pandas as pd
 from pathlib import Path
 from typing import Dict, Any, Optional
@@ -9,6 +10,78 @@ from ingestion.api_ingestion.alpha_vantage import config
 # Configure logging
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
+
+# Renaissance mapping
+# "1. open": "119.37", ...
+FIELD_MAP = [
+    ("1. open", "open"),
+    ("2. high", "high"),
+    ("3. low", "low"),
+    ("4. close", "close"),
+    ("5. volume", "volume"),
+]
+STAGED_COLUMNS = ['symbol', 'open', 'high', 'low', 'close', 'volume']
+
+
+def load_json_bytes(raw: bytes) -> Dict[str, Any]:
+    """Decode a raw API response, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _column(bars, field: str, dtype) -> np.ndarray:
+    try:
+        return np.fromiter((bar[field] for bar in bars), dtype=dtype, count=len(bars))
+    except (KeyError, TypeError, ValueError):
+        # Missing or malformed values: coerce like pd.to_numeric(errors='coerce')
+        values = pd.to_numeric(pd.Series([bar.get(field) for bar in bars], dtype=object), errors='coerce')
+        if dtype is np.int64:
+            return values.fillna(0).astype('int64').to_numpy()
+        return values.to_numpy(dtype=np.float64)
+
+
+def parse_daily_series(data: Dict[str, Any]) -> pd.DataFrame:
+    """
+    Builds the daily OHLCV frame straight from the "Time Series (Daily)"
+    mapping as typed column arrays, instead of DataFrame.from_dict(orient='index')
+    followed by per-column conversion. UTC 'timestamp' index, sorted ascending.
+    """
+    ts_key = "Time Series (Daily)"
+    if ts_key not in data:
+        raise ValueError(f"Key '{ts_key}' not found in data.")
+
+    series = data[ts_key]
+    dates = list(series.keys())
+    bars = list(series.values())
+    columns = {
+        dst: _column(bars, src, np.int64 if dst == 'volume' else np.float64)
+        for src, dst in FIELD_MAP
+    }
+
+    # Dates are treated as close-of-day UTC midnight
+    index = pd.DatetimeIndex(pd.to_datetime(dates, format='ISO8601', utc=True), name='timestamp')
+    df = pd.DataFrame(columns, index=index)
+    if not index.is_monotonic_increasing:
+        df = df.iloc[np.argsort(index.asi8, kind='stable')]
+    return df
+
+
+def build_staged_frame(symbol: str, data: Dict[str, Any]) -> pd.DataFrame:
+    """Parsed series in the staging schema (symbol column first)."""
+    df = parse_daily_series(data)
+    df.insert(0, 'symbol', symbol)
+    return df[STAGED_COLUMNS]
+
+
+def symbol_from_raw_path(json_path: Path) -> str:
+    return Path(json_path).stem.split('_')[0]
+
+
 class USNormalizer:
     def __init__(self):
         self.staging_dir = config.STAGING_DIR / "daily"
@@ -18,66 +91,20 @@ class USNormalizer:
         """
         Converts Alpha Vantage Daily Adjusted JSON to DataFrame.
         """
-        ts_key = "Time Series (Daily)"
-        if ts_key not in data:
-            raise ValueError(f"Key '{ts_key}' not found in data.")
-
-        # Load into DataFrame (Orientation: index is date string, columns are fields)
-        df = pd.DataFrame.from_dict(data[ts_key], orient='index')
-        
-        # Renaissance mapping
-        # "1. open": "119.37", ...
-        rename_map = {
-            "1. open": "open",
-            "2. high": "high",
-            "3. low": "low",
-            "4. close": "close",
-            "5. volume": "volume"
-        }
-        df.rename(columns=rename_map, inplace=True)
-        
-        # Type Conversion
-        float_cols = ['open', 'high', 'low', 'close']
-        for col in float_cols:
-            df[col] = pd.to_numeric(df[col], errors='coerce')
-            
-        df['volume'] = pd.to_numeric(df['volume'], errors='coerce').fillna(0).astype('int64')
-
-        # Index Handling
-        df.index = pd.to_datetime(df.index)
-        df.index.name = 'timestamp'
-        df.sort_index(inplace=True)
-        
-        # Localize to UTC (Assuming AV daily dates are market close dates, usually timezone naive in JSON)
-        # We implicitly treat them as close-of-day UTC for simplicity or market-local. 
-        # For strict correctness we might assign US/Eastern closing time, but let's stick to UTC midnight for daily dates
-        # or just timezone aware UTC.
-        if df.index.tz is None:
-            df.index = df.index.tz_localize('UTC')
-        else:
-            df.index = df.index.tz_convert('UTC')
-            
-        return df
+        return parse_daily_series(data)
 
     def normalize_file(self, json_path: Path):
         """
         Reads a raw JSON file and writes a parquet file to staging.
         """
         try:
-            with open(json_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(json_path, 'rb') as f:
+                data = load_json_bytes(f.read())
             
             # Extract symbol from filename or metadata
             # Filename format: SYMBOL_daily_adjusted.json
-            filename_stem = json_path.stem
-            symbol = filename_stem.split('_')[0]
-            
-            df = self._parse_daily_json(data)
-            df['symbol'] = symbol
-            
-            # Reorder columns
-            cols = ['symbol', 'open', 'high', 'low', 'close', 'volume']
-            df = df[cols]
+            symbol = symbol_from_raw_path(json_path)
+            df = build_staged_frame(symbol, data)
             
             # Save to Parquet
             output_path = self.staging_dir / f"{symbol}.parquet"
@@ -97,24 +124,14 @@ class USNormalizer:
             return str(self.staging_dir / f"{symbol}.parquet")
         return None
 
-    def run_normalization_batch(self, date_str: str):
+    def run_normalization_batch(self, date_str: str, workers: Optional[int] = None, force: bool = False):
         """
-        Normalizes all files for a specific crawl date.
+        Normalizes all files for a specific crawl date and promotes them to
+        the analytics layer in the same pass (process pool, unchanged inputs
+        skipped by content hash).
         """
-        raw_date_dir = config.RAW_BASE_DIR / date_str
-        if not raw_date_dir.exists():
-            logger.error(f"Raw directory not found: {raw_date_dir}")
-            return
-
-        json_files = list(raw_date_dir.glob("*.json"))
-        logger.info(f"Found {len(json_files)} files to normalize for {date_str}")
-        
-        count = 0
-        for f in json_files:
-            if self.normalize_file(f):
-                count += 1
-                
-        logger.info(f"Normalization Complete. Processed {count}/{len(json_files)} files.")
+        from ingestion.api_ingestion.alpha_vantage.daily_pipeline import DailyPipeline
+        return DailyPipeline(staging_dir=self.staging_dir, workers=workers).run(date_str, force=force)
 
 if __name__ == "__main__":
     # Dry run
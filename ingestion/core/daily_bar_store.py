@@ -0,0 +1,215 @@
+"""
+Append-friendly storage for staged daily bars.
+
+Staged prices live in one parquet file per symbol (`<root>/<SYMBOL>.parquet`,
+written in full by the normalizer). Daily updates add one bar at a time, and
+rewriting the whole file for each bar makes a universe update cost
+O(history) I/O per symbol. DailyBarStore keeps that base file untouched and
+writes new bars as small part files:
+
+    <root>/<SYMBOL>.parquet                     base history (normalizer / compaction)
+    <root>/_appends/<SYMBOL>/part-<date>.parquet new bars since the base
+    <root>/_appends/<SYMBOL>/_manifest.json      base stamp, parts, last date
+
+"Last stored date" comes from the manifest, or from the base file's parquet
+footer statistics when there is none, so no bar data is loaded. Parts are
+folded into the base every `compact_every` appends. Readers must go through
+read_staged_daily() to see uncompacted bars.
+"""
+
+import json
+import logging
+import os
+import shutil
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import pandas as pd
+import pyarrow.parquet as pq
+
+logger = logging.getLogger(__name__)
+
+APPENDS_DIR = "_appends"
+MANIFEST_NAME = "_manifest.json"
+DEFAULT_COMPACT_EVERY = 20
+
+
+def _as_date_str(value: Any) -> Optional[str]:
+    if value is None:
+        return None
+    try:
+        return str(pd.Timestamp(value).date())
+    except (TypeError, ValueError):
+        return None
+
+
+def footer_last_date(path: Path) -> Optional[str]:
+    """Latest index date of a pandas-written parquet file, from row-group statistics."""
+    pf = pq.ParquetFile(path)
+    pandas_meta = pf.schema_arrow.pandas_metadata or {}
+    index_cols = [c for c in pandas_meta.get("index_columns", []) if isinstance(c, str)]
+    column = index_cols[0] if index_cols else ("timestamp" if "timestamp" in pf.schema_arrow.names else None)
+    if column is None:
+        return None
+
+    latest = None
+    metadata = pf.metadata
+    for i in range(metadata.num_row_groups):
+        row_group = metadata.row_group(i)
+        for j in range(row_group.num_columns):
+            chunk = row_group.column(j)
+            if chunk.path_in_schema != column:
+                continue
+            stats = chunk.statistics
+            if stats is None or not stats.has_min_max:
+                # No statistics written: fall back to reading just this column
+                values = pf.read(columns=[column]).column(column).to_pandas()
+                return _as_date_str(values.max()) if len(values) else None
+            candidate = pd.Timestamp(stats.max)
+            if latest is None or candidate > latest:
+                latest = candidate
+    return _as_date_str(latest)
+
+
+def _stamp(path: Path) -> Optional[List[int]]:
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+class DailyBarStore:
+    """Per-symbol daily bars as base parquet + appended part files."""
+
+    def __init__(self, root: Path, compact_every: int = DEFAULT_COMPACT_EVERY):
+        self.root = Path(root)
+        self.compact_every = compact_every
+
+    def base_path(self, symbol: str) -> Path:
+        return self.root / f"{symbol}.parquet"
+
+    def append_dir(self, symbol: str) -> Path:
+        return self.root / APPENDS_DIR / symbol
+
+    # --- Manifest ---
+
+    def _read_manifest(self, symbol: str) -> Optional[Dict[str, Any]]:
+        path = self.append_dir(symbol) / MANIFEST_NAME
+        if not path.exists():
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+
+    def _write_manifest(self, symbol: str, manifest: Dict[str, Any]) -> None:
+        directory = self.append_dir(symbol)
+        directory.mkdir(parents=True, exist_ok=True)
+        tmp = directory / (MANIFEST_NAME + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(manifest, f)
+        os.replace(tmp, directory / MANIFEST_NAME)
+
+    def _manifest(self, symbol: str) -> Dict[str, Any]:
+        """
+        Manifest reconciled against the base file. If the base was rewritten
+        (e.g. re-normalized from a fresh full history), parts it already
+        covers are dropped.
+        """
+        base = self.base_path(symbol)
+        stamp = _stamp(base)
+        manifest = self._read_manifest(symbol)
+        if manifest is not None and manifest.get("base_stamp") == stamp:
+            return manifest
+
+        base_last = footer_last_date(base) if stamp is not None else None
+        parts = (manifest or {}).get("parts", [])
+        kept = [p for p in parts if base_last is None or p["last_date"] > base_last]
+        for p in parts:
+            if p not in kept:
+                (self.append_dir(symbol) / p["file"]).unlink(missing_ok=True)
+        last_date = max([base_last or ""] + [p["last_date"] for p in kept]) or None
+        manifest = {"base_stamp": stamp, "base_last_date": base_last, "parts": kept, "last_date": last_date}
+        if manifest.get("parts") or self.append_dir(symbol).exists():
+            self._write_manifest(symbol, manifest)
+        return manifest
+
+    # --- Queries ---
+
+    def last_date(self, symbol: str) -> Optional[str]:
+        """Last stored bar date (YYYY-MM-DD) without reading bar data."""
+        if not self.append_dir(symbol).exists():
+            base = self.base_path(symbol)
+            return footer_last_date(base) if base.exists() else None
+        return self._manifest(symbol)["last_date"]
+
+    def read(self, symbol: str) -> Optional[pd.DataFrame]:
+        """Full history: base plus uncompacted parts, sorted and de-duplicated."""
+        base = self.base_path(symbol)
+        if not self.append_dir(symbol).exists():
+            return pd.read_parquet(base) if base.exists() else None
+
+        manifest = self._manifest(symbol)
+        frames = [pd.read_parquet(base)] if base.exists() else []
+        frames += [pd.read_parquet(self.append_dir(symbol) / p["file"]) for p in manifest["parts"]]
+        if not frames:
+            return None
+        df = pd.concat(frames).sort_index() if len(frames) > 1 else frames[0]
+        return df[~df.index.duplicated(keep="last")]
+
+    # --- Writes ---
+
+    def append(self, symbol: str, bars: pd.DataFrame) -> int:
+        """
+        Store bars newer than the last stored date as a new part.
+        Returns the number of bars written.
+        """
+        manifest = self._manifest(symbol)
+        last = manifest["last_date"]
+        if last is not None:
+            bars = bars[bars.index.strftime("%Y-%m-%d") > last]
+        if bars.empty:
+            return 0
+
+        bars = bars.sort_index()
+        first_date = str(bars.index[0].date())
+        last_date = str(bars.index[-1].date())
+        directory = self.append_dir(symbol)
+        directory.mkdir(parents=True, exist_ok=True)
+        filename = f"part-{last_date}.parquet"
+        bars.to_parquet(directory / filename, compression="snappy")
+
+        manifest["parts"].append({"file": filename, "first_date": first_date, "last_date": last_date, "rows": len(bars)})
+        manifest["last_date"] = last_date
+        self._write_manifest(symbol, manifest)
+
+        if len(manifest["parts"]) >= self.compact_every:
+            self.compact(symbol)
+        return len(bars)
+
+    def compact(self, symbol: str) -> None:
+        """Fold appended parts into the base file."""
+        directory = self.append_dir(symbol)
+        if not directory.exists():
+            return
+        df = self.read(symbol)
+        if df is not None:
+            base = self.base_path(symbol)
+            tmp = base.with_name(base.name + ".tmp")
+            df.to_parquet(tmp, compression="snappy")
+            os.replace(tmp, base)
+        shutil.rmtree(directory, ignore_errors=True)
+        logger.debug(f"Compacted appended bars for {symbol}")
+
+
+def read_staged_daily(path: Path) -> pd.DataFrame:
+    """pd.read_parquet() for a staged `<root>/<SYMBOL>.parquet` that includes appended bars."""
+    path = Path(path)
+    if not (path.parent / APPENDS_DIR / path.stem).exists():
+        return pd.read_parquet(path)
+    df = DailyBarStore(path.parent).read(path.stem)
+    if df is None:
+        raise FileNotFoundError(path)
+    return df
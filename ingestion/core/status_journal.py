@@ -0,0 +1,164 @@
+"""
+Append-only status journal with periodic parquet checkpoints.
+
+Trackers used to rewrite their whole parquet file after every symbol,
+which is quadratic over a large universe. A StatusJournal instead appends
+one JSON line per status change (O(1)) next to the tracker file and only
+rewrites the parquet snapshot every `checkpoint_every` updates. Loading
+reads the snapshot and replays the journal, so a killed run resumes with
+every status it recorded.
+
+Layout:
+    <tracker>.parquet                 last checkpoint (atomically replaced)
+    <tracker>.parquet.journal.jsonl   updates since that checkpoint
+"""
+
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHECKPOINT_EVERY = 500
+
+
+def _json_default(value: Any):
+    # numpy scalars coming back from a parquet snapshot
+    if hasattr(value, "item"):
+        return value.item()
+    return str(value)
+
+
+def _clean(value: Any) -> Any:
+    """Parquet round-trips None as NaN in object columns; restore None."""
+    if isinstance(value, float) and value != value:
+        return None
+    if hasattr(value, "item") and not isinstance(value, (str, bytes)):
+        value = value.item()
+        if isinstance(value, float) and value != value:
+            return None
+    return value
+
+
+def journal_path_for(snapshot_path: Path) -> Path:
+    snapshot_path = Path(snapshot_path)
+    return snapshot_path.with_name(snapshot_path.name + ".journal.jsonl")
+
+
+class StatusJournal:
+    """Keyed status records persisted as snapshot + append-only journal."""
+
+    def __init__(
+        self,
+        snapshot_path: Path,
+        key: str = "symbol",
+        checkpoint_every: int = DEFAULT_CHECKPOINT_EVERY,
+        fsync: bool = False
+    ):
+        """
+        Args:
+            snapshot_path: Parquet tracker file.
+            key: Record field that identifies a row.
+            checkpoint_every: Journal appends between snapshot rewrites.
+            fsync: fsync every append (survives OS crashes, not just killed processes).
+        """
+        self.snapshot_path = Path(snapshot_path)
+        self.journal_path = journal_path_for(self.snapshot_path)
+        self.key = key
+        self.checkpoint_every = checkpoint_every
+        self.fsync = fsync
+        self.records: Dict[str, Dict[str, Any]] = {}
+        self.pending = 0
+        self._handle = None
+
+    def load(self) -> Dict[str, Dict[str, Any]]:
+        """Read the last checkpoint and replay the journal on top of it."""
+        self.records = {}
+        if self.snapshot_path.exists():
+            df = pd.read_parquet(self.snapshot_path)
+            for row in df.to_dict("records"):
+                self.records[row[self.key]] = {k: _clean(v) for k, v in row.items()}
+
+        replayed = 0
+        if self.journal_path.exists():
+            with open(self.journal_path, "r", encoding="utf-8") as f:
+                for line_no, line in enumerate(f, 1):
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        # A run killed mid-write leaves a torn final line
+                        logger.warning(f"Skipping unreadable journal line {line_no} in {self.journal_path.name}")
+                        continue
+                    self.records[record[self.key]] = record
+                    replayed += 1
+        self.pending = replayed
+        if replayed:
+            logger.info(f"Replayed {replayed} journal entries from {self.journal_path.name}")
+        return self.records
+
+    def append(self, record: Dict[str, Any]) -> None:
+        """Record one status change; checkpoints when enough have accumulated."""
+        self.records[record[self.key]] = record
+        if self._handle is None:
+            self.journal_path.parent.mkdir(parents=True, exist_ok=True)
+            self._handle = open(self.journal_path, "a", encoding="utf-8")
+            if self._torn_tail():
+                # Start on a fresh line after a crash mid-write
+                self._handle.write("\n")
+        self._handle.write(json.dumps(record, default=_json_default) + "\n")
+        self._handle.flush()
+        if self.fsync:
+            os.fsync(self._handle.fileno())
+        self.pending += 1
+        if self.pending >= self.checkpoint_every:
+            self.checkpoint()
+
+    def _torn_tail(self) -> bool:
+        if not self.journal_path.exists() or self.journal_path.stat().st_size == 0:
+            return False
+        with open(self.journal_path, "rb") as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) != b"\n"
+
+    def checkpoint(self) -> None:
+        """Rewrite the snapshot from memory and truncate the journal."""
+        if self.pending == 0:
+            return
+        self.snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.snapshot_path.with_name(self.snapshot_path.name + ".tmp")
+        pd.DataFrame(list(self.records.values())).to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, self.snapshot_path)
+
+        # Crashing before this point is safe: replaying the journal over the
+        # new snapshot reapplies identical records.
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+        if self.journal_path.exists():
+            self.journal_path.unlink()
+        self.pending = 0
+
+    def close(self) -> None:
+        self.checkpoint()
+
+    def to_frame(self) -> pd.DataFrame:
+        return pd.DataFrame(list(self.records.values()))
+
+    def values(self) -> List[Dict[str, Any]]:
+        return list(self.records.values())
+
+
+def read_tracker(snapshot_path: Path, key: str = "symbol") -> Optional[pd.DataFrame]:
+    """Journal-aware read of a tracker file; None if neither file exists."""
+    journal = StatusJournal(snapshot_path, key=key)
+    if not journal.snapshot_path.exists() and not journal.journal_path.exists():
+        return None
+    journal.load()
+    return journal.to_frame()
@@ -20,4 +20,7 @@ RAW_PATH = DATA_ROOT / "raw" / "us"
 # History requirements
 MIN_HISTORY_DAYS = 60
 
+# Tracker journal: status updates between full parquet rewrites
+CHECKPOINT_EVERY = 200
+
 VERSION = "1.0.0"
@@ -1,7 +1,7 @@
 """Historical Backfill - Fetcher (uses existing ingestor)"""
 import logging
 import time
-from typing import Optional, Tuple
+from typing import Dict, Iterator, Optional, Sequence, Tuple
 import pandas as pd
 from . import config
 
@@ -20,37 +20,69 @@ class HistoricalFetcher:
         """
         try:
             from ingestion.api_ingestion.alpha_vantage.market_data_ingestor import USMarketIngestor
-            from ingestion.api_ingestion.alpha_vantage.normalizer import USNormalizer
             
             ingestor = USMarketIngestor()
-            normalizer = USNormalizer()
             
             # Fetch raw data
             result = ingestor.fetch_symbol_daily(symbol, full_history=False)
-            
-            if not result.get("success"):
-                return False, None, result.get("error", "Unknown error")
-            
-            raw_path = result.get("raw_path")
-            if not raw_path:
-                return False, None, "No raw path returned"
-            
-            # Normalize to parquet
-            staged_path = normalizer.normalize_daily(symbol, raw_path)
-            if not staged_path:
-                return False, None, "Normalization failed"
-            
-            # Count depth
-            df = pd.read_parquet(staged_path)
-            depth = len(df)
-            start_date = str(df.index.min().date()) if hasattr(df.index, 'min') else "unknown"
-            end_date = str(df.index.max().date()) if hasattr(df.index, 'max') else "unknown"
-            
-            return True, depth, f"{start_date} to {end_date}"
+            return self._stage(symbol, result)
             
         except Exception as e:
             return False, None, str(e)
     
+    def fetch_symbols(self, symbols: Sequence[str], scheduler=None) -> Iterator[Tuple[str, bool, Optional[int], str]]:
+        """
+        Fetch many symbols concurrently across the key pool.
+        Yields (symbol, success, depth_days, error_or_info) as each completes,
+        in completion order. Order of `symbols` is used as fetch priority.
+        """
+        from ingestion.api_ingestion.alpha_vantage.fetch_scheduler import AlphaVantageFetchScheduler
+        from ingestion.api_ingestion.alpha_vantage.market_data_ingestor import USMarketIngestor
+        from concurrent.futures import as_completed
+        
+        ingestor = USMarketIngestor()
+        owned = scheduler is None
+        scheduler = scheduler or AlphaVantageFetchScheduler()
+        try:
+            futures = {scheduler.submit_daily(s, priority=i): s for i, s in enumerate(symbols)}
+            for future in as_completed(futures):
+                fetched = future.result()
+                try:
+                    if fetched.success:
+                        result = ingestor.save_daily_response(fetched.symbol, fetched.data)
+                    else:
+                        result = {'success': False, 'status': fetched.status, 'msg': fetched.msg}
+                    yield (fetched.symbol,) + self._stage(fetched.symbol, result)
+                except Exception as e:
+                    yield fetched.symbol, False, None, str(e)
+        finally:
+            if owned:
+                scheduler.close()
+    
+    def _stage(self, symbol: str, result: Dict) -> Tuple[bool, Optional[int], str]:
+        """Normalize a saved raw response and report its depth."""
+        from ingestion.api_ingestion.alpha_vantage.normalizer import USNormalizer
+        
+        if not result.get("success"):
+            return False, None, result.get("error") or result.get("msg", "Unknown error")
+        
+        raw_path = result.get("raw_path")
+        if not raw_path:
+            return False, None, "No raw path returned"
+        
+        # Normalize to parquet
+        staged_path = USNormalizer().normalize_daily(symbol, raw_path)
+        if not staged_path:
+            return False, None, "Normalization failed"
+        
+        # Count depth
+        df = pd.read_parquet(staged_path)
+        depth = len(df)
+        start_date = str(df.index.min().date()) if hasattr(df.index, 'min') else "unknown"
+        end_date = str(df.index.max().date()) if hasattr(df.index, 'max') else "unknown"
+        
+        return True, depth, f"{start_date} to {end_date}"
+    
     def wait_rate_limit(self):
         """Wait between API calls."""
         time.sleep(self.delay)
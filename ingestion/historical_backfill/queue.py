@@ -1,7 +1,8 @@
 """Historical Backfill - Priority Queue"""
 import logging
-from typing import List, Dict
+from typing import List, Dict, Optional
 import pandas as pd
+from ingestion.core.status_journal import StatusJournal
 from . import config
 from .models import BackfillStatus
 
@@ -10,31 +11,33 @@ logger = logging.getLogger(__name__)
 class BackfillQueue:
     """Manages prioritized backfill queue."""
     
-    def __init__(self):
+    def __init__(self, checkpoint_every: Optional[int] = None):
         self.tracker: Dict[str, BackfillStatus] = {}
+        self.journal = StatusJournal(config.TRACKER_PATH, checkpoint_every=checkpoint_every or config.CHECKPOINT_EVERY)
         self._load_tracker()
     
     def _load_tracker(self):
-        """Load existing tracker state."""
-        if config.TRACKER_PATH.exists():
-            df = pd.read_parquet(config.TRACKER_PATH)
-            for _, row in df.iterrows():
-                self.tracker[row["symbol"]] = BackfillStatus(
-                    symbol=row["symbol"],
-                    status=row["status"],
-                    history_depth_days=row["history_depth_days"],
-                    history_start_date=row.get("history_start_date"),
-                    history_end_date=row.get("history_end_date"),
-                    last_attempt=row["last_attempt"],
-                    error_reason=row.get("error_reason"),
-                )
+        """Load existing tracker state (last checkpoint + journal replay)."""
+        for symbol, row in self.journal.load().items():
+            self.tracker[symbol] = BackfillStatus(
+                symbol=row["symbol"],
+                status=row["status"],
+                history_depth_days=row["history_depth_days"],
+                history_start_date=row.get("history_start_date"),
+                history_end_date=row.get("history_end_date"),
+                last_attempt=row["last_attempt"],
+                error_reason=row.get("error_reason"),
+            )
+        if self.tracker:
             logger.info(f"Loaded {len(self.tracker)} tracked symbols")
     
-    def _save_tracker(self):
-        """Persist tracker state."""
-        config.TRACKER_PATH.parent.mkdir(parents=True, exist_ok=True)
-        records = [s.to_dict() for s in self.tracker.values()]
-        pd.DataFrame(records).to_parquet(config.TRACKER_PATH, index=False)
+    def _record(self, status: BackfillStatus):
+        self.tracker[status.symbol] = status
+        self.journal.append(status.to_dict())
+    
+    def checkpoint(self):
+        """Persist tracker state to the parquet snapshot."""
+        self.journal.checkpoint()
     
     def get_pending_symbols(self, limit: int = None) -> List[str]:
         """Get symbols needing backfill, prioritized."""
@@ -66,13 +69,11 @@ class BackfillQueue:
     
     def mark_success(self, symbol: str, depth: int, start: str, end: str):
         """Mark symbol as successfully backfilled."""
-        self.tracker[symbol] = BackfillStatus.success(symbol, depth, start, end)
-        self._save_tracker()
+        self._record(BackfillStatus.success(symbol, depth, start, end))
     
     def mark_failed(self, symbol: str, error: str):
         """Mark symbol as failed."""
-        self.tracker[symbol] = BackfillStatus.failed(symbol, error)
-        self._save_tracker()
+        self._record(BackfillStatus.failed(symbol, error))
     
     def get_stats(self) -> Dict:
         """Get queue statistics."""
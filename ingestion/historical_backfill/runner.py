@@ -7,7 +7,21 @@ from .fetcher import HistoricalFetcher
 logging.basicConfig(level=logging.INFO, format="%(asctime)s | %(levelname)-7s | %(name)s | %(message)s")
 logger = logging.getLogger(__name__)
 
-def run_backfill(budget: int = None, dry_run: bool = False):
+def _record_result(queue: BackfillQueue, symbol: str, success: bool, depth, info: str) -> bool:
+    if success:
+        # Parse dates from info
+        parts = info.split(" to ")
+        start_date = parts[0] if len(parts) == 2 else None
+        end_date = parts[1] if len(parts) == 2 else None
+        
+        queue.mark_success(symbol, depth, start_date, end_date)
+        logger.info(f"  → {symbol} SUCCESS: {depth} days ({info})")
+    else:
+        queue.mark_failed(symbol, info)
+        logger.warning(f"  → {symbol} FAILED: {info}")
+    return success
+
+def run_backfill(budget: int = None, dry_run: bool = False, concurrent: bool = True):
     logger.info("=" * 60)
     logger.info("HISTORICAL DAILY BACKFILL - Starting")
     logger.info("=" * 60)
@@ -27,32 +41,34 @@ def run_backfill(budget: int = None, dry_run: bool = False):
     success_count = 0
     fail_count = 0
     
-    for i, symbol in enumerate(pending):
-        logger.info(f"[{i+1}/{len(pending)}] Backfilling {symbol}...")
-        
+    try:
         if dry_run:
-            logger.info(f"  → DRY RUN: Would fetch {symbol}")
-            continue
-        
-        success, depth, info = fetcher.fetch_symbol(symbol)
-        
-        if success:
-            # Parse dates from info
-            parts = info.split(" to ")
-            start_date = parts[0] if len(parts) == 2 else None
-            end_date = parts[1] if len(parts) == 2 else None
-            
-            queue.mark_success(symbol, depth, start_date, end_date)
-            logger.info(f"  → SUCCESS: {depth} days ({info})")
-            success_count += 1
+            for symbol in pending:
+                logger.info(f"  → DRY RUN: Would fetch {symbol}")
+        elif concurrent:
+            # All keys in the pool fetch in parallel, each paced by its own token bucket
+            for i, (symbol, success, depth, info) in enumerate(fetcher.fetch_symbols(pending)):
+                logger.info(f"[{i+1}/{len(pending)}] Backfilled {symbol}")
+                if _record_result(queue, symbol, success, depth, info):
+                    success_count += 1
+                else:
+                    fail_count += 1
         else:
-            queue.mark_failed(symbol, info)
-            logger.warning(f"  → FAILED: {info}")
-            fail_count += 1
-        
-        # Rate limit (except last)
-        if i < len(pending) - 1:
-            fetcher.wait_rate_limit()
+            for i, symbol in enumerate(pending):
+                logger.info(f"[{i+1}/{len(pending)}] Backfilling {symbol}...")
+            
+                success, depth, info = fetcher.fetch_symbol(symbol)
+                if _record_result(queue, symbol, success, depth, info):
+                    success_count += 1
+                else:
+                    fail_count += 1
+            
+                # Rate limit (except last)
+                if i < len(pending) - 1:
+                    fetcher.wait_rate_limit()
+    finally:
+        # Statuses are journaled as they land; fold them into the tracker file
+        queue.checkpoint()
     
     # Summary
     logger.info("=" * 60)
@@ -69,6 +85,7 @@ def main():
     parser.add_argument("--budget", type=int, default=25, help="Max symbols")
     parser.add_argument("--dry-run", action="store_true", help="Show what would be done")
     parser.add_argument("--status", action="store_true", help="Show queue status")
+    parser.add_argument("--sequential", action="store_true", help="Fetch one symbol at a time with a fixed delay")
     args = parser.parse_args()
     
     if args.status:
@@ -80,7 +97,7 @@ def main():
         parser.print_help()
         sys.exit(0)
     
-    run_backfill(args.budget, args.dry_run)
+    run_backfill(args.budget, args.dry_run, concurrent=not args.sequential)
 
 if __name__ == "__main__":
     main()
@@ -12,4 +12,10 @@ STAGING_PATH = DATA_ROOT / "staging" / "us" / "daily"
 BACKFILL_TRACKER = DATA_ROOT / "backfill" / "us" / "backfill_tracker.parquet"
 UPDATE_TRACKER = DATA_ROOT / "update" / "us" / "update_tracker.parquet"
 
+# Tracker journal: status updates between full parquet rewrites
+CHECKPOINT_EVERY = 200
+
+# Appended daily bars are folded into each symbol's staged parquet every N updates
+COMPACT_EVERY = 20
+
 VERSION = "1.0.0"
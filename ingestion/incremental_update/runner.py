@@ -6,7 +6,17 @@ from .updater import IncrementalUpdater
 logging.basicConfig(level=logging.INFO, format="%(asctime)s | %(levelname)-7s | %(name)s | %(message)s")
 logger = logging.getLogger(__name__)
 
-def run_incremental_update(budget: int = None, dry_run: bool = False):
+def _log_status(status, stats):
+    stats[status.status] = stats.get(status.status, 0) + 1
+    
+    if status.status == "success":
+        logger.info(f"  → SUCCESS")
+    elif status.status == "up_to_date":
+        logger.info(f"  → UP TO DATE")
+    else:
+        logger.warning(f"  → FAILED: {status.error_reason}")
+
+def run_incremental_update(budget: int = None, dry_run: bool = False, concurrent: bool = True):
     logger.info("=" * 60)
     logger.info("INCREMENTAL DAILY UPDATE - Starting")
     logger.info("=" * 60)
@@ -24,26 +34,24 @@ def run_incremental_update(budget: int = None, dry_run: bool = False):
     
     stats = {"success": 0, "up_to_date": 0, "failed": 0}
     
-    for i, symbol in enumerate(eligible):
-        logger.info(f"[{i+1}/{len(eligible)}] Updating {symbol}...")
-        
+    try:
         if dry_run:
-            last = updater.get_last_stored_date(symbol)
-            logger.info(f"  → DRY RUN: Last stored = {last}")
-            continue
-        
-        status = updater.update_symbol(symbol)
-        stats[status.status] = stats.get(status.status, 0) + 1
-        
-        if status.status == "success":
-            logger.info(f"  → SUCCESS")
-        elif status.status == "up_to_date":
-            logger.info(f"  → UP TO DATE")
+            for symbol in eligible:
+                last = updater.get_last_stored_date(symbol)
+                logger.info(f"  → DRY RUN: {symbol} last stored = {last}")
+        elif concurrent:
+            for i, status in enumerate(updater.update_symbols(eligible)):
+                logger.info(f"[{i+1}/{len(eligible)}] Updated {status.symbol}")
+                _log_status(status, stats)
         else:
-            logger.warning(f"  → FAILED: {status.error_reason}")
-        
-        if i < len(eligible) - 1:
-            updater.wait_rate_limit()
+            for i, symbol in enumerate(eligible):
+                logger.info(f"[{i+1}/{len(eligible)}] Updating {symbol}...")
+                _log_status(updater.update_symbol(symbol), stats)
+            
+                if i < len(eligible) - 1:
+                    updater.wait_rate_limit()
+    finally:
+        updater.checkpoint()
     
     logger.info("=" * 60)
     logger.info("=" * 60)
@@ -59,13 +67,14 @@ def main():
     parser.add_argument("--update", action="store_true")
     parser.add_argument("--budget", type=int, default=50)
     parser.add_argument("--dry-run", action="store_true")
+    parser.add_argument("--sequential", action="store_true", help="Fetch one symbol at a time with a fixed delay")
     args = parser.parse_args()
     
     if not args.update:
         parser.print_help()
         sys.exit(0)
     
-    run_incremental_update(args.budget, args.dry_run)
+    run_incremental_update(args.budget, args.dry_run, concurrent=not args.sequential)
 
 if __name__ == "__main__":
     main()
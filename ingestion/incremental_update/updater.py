@@ -1,9 +1,11 @@
 """Incremental Update - Updater"""
 import logging
 import time
-from typing import List, Tuple, Optional, Dict
+from typing import Iterator, List, Tuple, Optional, Dict
 from datetime import datetime
 import pandas as pd
+from ingestion.core.daily_bar_store import DailyBarStore
+from ingestion.core.status_journal import StatusJournal, read_tracker
 from . import config
 from .models import UpdateStatus
 
@@ -12,34 +14,34 @@ logger = logging.getLogger(__name__)
 class IncrementalUpdater:
     """Handles incremental daily updates."""
     
-    def __init__(self):
+    def __init__(self, checkpoint_every: Optional[int] = None):
         self.delay = config.DELAY_SECONDS
         self.tracker: Dict[str, UpdateStatus] = {}
+        self.journal = StatusJournal(config.UPDATE_TRACKER, checkpoint_every=checkpoint_every or config.CHECKPOINT_EVERY)
+        self.store = DailyBarStore(config.STAGING_PATH, compact_every=config.COMPACT_EVERY)
         self._load_tracker()
     
     def _load_tracker(self):
-        if config.UPDATE_TRACKER.exists():
-            df = pd.read_parquet(config.UPDATE_TRACKER)
-            for _, row in df.iterrows():
-                self.tracker[row["symbol"]] = UpdateStatus(
-                    symbol=row["symbol"],
-                    last_attempt=row["last_attempt"],
-                    last_success=row.get("last_success"),
-                    status=row["status"],
-                    error_reason=row.get("error_reason"),
-                )
+        for symbol, row in self.journal.load().items():
+            self.tracker[symbol] = UpdateStatus(
+                symbol=row["symbol"],
+                last_attempt=row["last_attempt"],
+                last_success=row.get("last_success"),
+                status=row["status"],
+                error_reason=row.get("error_reason"),
+            )
     
-    def _save_tracker(self):
-        config.UPDATE_TRACKER.parent.mkdir(parents=True, exist_ok=True)
-        records = [s.to_dict() for s in self.tracker.values()]
-        pd.DataFrame(records).to_parquet(config.UPDATE_TRACKER, index=False)
+    def checkpoint(self):
+        """Persist tracker state to the parquet snapshot."""
+        self.journal.checkpoint()
     
     def get_eligible_symbols(self, limit: int = None) -> List[str]:
         """Get symbols eligible for incremental update (not already updated today)."""
-        if not config.BACKFILL_TRACKER.exists():
+        # Includes statuses still in the backfill journal
+        backfill = read_tracker(config.BACKFILL_TRACKER)
+        if backfill is None or backfill.empty:
             return []
         
-        backfill = pd.read_parquet(config.BACKFILL_TRACKER)
         eligible_master = set(backfill[backfill["status"] == "success"]["symbol"].tolist())
         
         # Filter out those already attempted today
@@ -58,12 +60,9 @@ class IncrementalUpdater:
     
     def get_last_stored_date(self, symbol: str) -> Optional[str]:
         """Get last date in staged data."""
-        path = config.STAGING_PATH / f"{symbol}.parquet"
-        if not path.exists():
-            return None
         try:
-            df = pd.read_parquet(path)
-            return str(df.index.max().date())
+            # Manifest / parquet footer lookup, no bar data is read
+            return self.store.last_date(symbol)
         except:
             return None
     
@@ -74,7 +73,14 @@ class IncrementalUpdater:
             
             client = AlphaVantageClient()
             data = client.get_daily(symbol, outputsize="compact")
+            return self.apply_daily_response(symbol, data)
             
+        except Exception as e:
+            return False, str(e)
+    
+    def apply_daily_response(self, symbol: str, data: Dict) -> Tuple[bool, str]:
+        """Append the latest candle from a TIME_SERIES_DAILY response if newer."""
+        try:
             if "Time Series (Daily)" not in data:
                 return False, data.get("Note", "No data returned")
             
@@ -85,21 +91,21 @@ class IncrementalUpdater:
             if last_stored and latest_date <= last_stored:
                 return True, f"Up to date ({last_stored})"
             
-            # Append new data
-            path = config.STAGING_PATH / f"{symbol}.parquet"
-            if path.exists():
-                df = pd.read_parquet(path)
-                new_row = {
-                    "open": float(ts[latest_date]["1. open"]),
-                    "high": float(ts[latest_date]["2. high"]),
-                    "low": float(ts[latest_date]["3. low"]),
-                    "close": float(ts[latest_date]["4. close"]),
-                    "volume": int(ts[latest_date]["5. volume"]),
-                }
-                new_df = pd.DataFrame([new_row], index=pd.to_datetime([latest_date], utc=True))
-                df = pd.concat([df, new_df]).sort_index()
-                df = df[~df.index.duplicated(keep='last')]
-                df.to_parquet(path)
+            # Append only the bars newer than what is stored (fills missed days too)
+            if self.store.base_path(symbol).exists():
+                new_dates = sorted(d for d in ts if not last_stored or d > last_stored)
+                new_df = pd.DataFrame(
+                    {
+                        "symbol": symbol,
+                        "open": [float(ts[d]["1. open"]) for d in new_dates],
+                        "high": [float(ts[d]["2. high"]) for d in new_dates],
+                        "low": [float(ts[d]["3. low"]) for d in new_dates],
+                        "close": [float(ts[d]["4. close"]) for d in new_dates],
+                        "volume": [int(ts[d]["5. volume"]) for d in new_dates],
+                    },
+                    index=pd.DatetimeIndex(pd.to_datetime(new_dates, utc=True), name="timestamp"),
+                )
+                self.store.append(symbol, new_df)
                 
             return True, f"Updated to {latest_date}"
             
@@ -109,7 +115,29 @@ class IncrementalUpdater:
     def update_symbol(self, symbol: str) -> UpdateStatus:
         """Update a single symbol."""
         success, info = self.fetch_latest(symbol)
+        return self._record(symbol, success, info)
+    
+    def update_symbols(self, symbols: List[str], scheduler=None) -> Iterator[UpdateStatus]:
+        """
+        Update many symbols concurrently across the Alpha Vantage key pool.
+        Yields each UpdateStatus as its fetch completes.
+        """
+        from ingestion.api_ingestion.alpha_vantage.fetch_scheduler import AlphaVantageFetchScheduler
         
+        owned = scheduler is None
+        scheduler = scheduler or AlphaVantageFetchScheduler()
+        try:
+            for fetched in scheduler.iter_daily(symbols):
+                if fetched.success:
+                    success, info = self.apply_daily_response(fetched.symbol, fetched.data)
+                else:
+                    success, info = False, fetched.msg or fetched.status
+                yield self._record(fetched.symbol, success, info)
+        finally:
+            if owned:
+                scheduler.close()
+    
+    def _record(self, symbol: str, success: bool, info: str) -> UpdateStatus:
         if success:
             if "Up to date" in info:
                 status = UpdateStatus.up_to_date(symbol)
@@ -119,7 +147,7 @@ class IncrementalUpdater:
             status = UpdateStatus.failed(symbol, info)
         
         self.tracker[symbol] = status
-        self._save_tracker()
+        self.journal.append(status.to_dict())
         return status
     
     def wait_rate_limit(self):
@@ -1,16 +1,20 @@
 """Candle Aggregator for WebSocket Ingestion.
 
 Aggregates real-time ticks into 1-minute candles and persists them to Parquet
-in the same schema as the existing processed data layer.
+in the same schema as the existing processed data layer. Persistence goes
+through an append-only CandleStore so each finalization costs O(new rows).
+With a CandleBus and CandlePersister attached, finalized candles are
+published in memory first and written to disk off the critical path.
 """
 
 import logging
 import threading
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Callable
-import pandas as pd
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 
+from .candle_bus import CandleBus, CandlePersister
+from .candle_store import CandleStore
 from .symbol_state import SymbolState
 
 logger = logging.getLogger(__name__)
@@ -27,7 +31,12 @@ class CandleAggregator:
     def __init__(
         self,
         processed_base_path: str = "data/processed/candles/intraday",
-        on_candle_callback: Optional[Callable[[List[Dict]], None]] = None
+        on_candle_callback: Optional[Callable[[List[Dict]], None]] = None,
+        candle_store: Optional[CandleStore] = None,
+        candle_bus: Optional[CandleBus] = None,
+        persister: Optional[CandlePersister] = None,
+        pre_finalize: Optional[Callable[[datetime], object]] = None,
+        on_boundary_scheduled: Optional[Callable[[datetime], object]] = None
     ):
         """Initialize the candle aggregator.
         
@@ -35,9 +44,29 @@ class CandleAggregator:
             processed_base_path: Path to save processed Parquet files.
             on_candle_callback: Optional callback function called when candles are finalized.
                                 Receives list of candle dicts.
+            candle_store: Optional store to persist through. Defaults to a
+                          CandleStore rooted at processed_base_path.
+            candle_bus: Optional in-memory bus that finalized candles are
+                        published to before the callback runs.
+            persister: Optional background writer. When set, candles are
+                       queued to it instead of written synchronously.
+            pre_finalize: Optional hook called by the minute timer with the
+                          boundary before finalizing, e.g.
+                          TickBatchQueue.drain_until, so ticks of the closing
+                          minute still queued upstream land in its candle.
+            on_boundary_scheduled: Optional hook called with each minute
+                                   boundary the timer is set for, e.g.
+                                   TickBatchQueue.hold_from, so ticks past it
+                                   are held back until its candles are
+                                   finalized.
         """
         self.processed_base_path = Path(processed_base_path)
         self.on_candle_callback = on_candle_callback
+        self.candle_store = candle_store or CandleStore(str(self.processed_base_path))
+        self.candle_bus = candle_bus
+        self.persister = persister
+        self.pre_finalize = pre_finalize
+        self.on_boundary_scheduled = on_boundary_scheduled
         
         # Symbol states: {symbol: SymbolState}
         self.states: Dict[str, SymbolState] = {}
@@ -97,7 +126,33 @@ class CandleAggregator:
             
             self.states[symbol].update_tick(price, volume, timestamp)
             self.total_ticks_received += 1
-    
+
+    def update_ticks(self, ticks: Iterable[Tuple[str, float, int, datetime]]) -> int:
+        """Apply a batch of ticks under a single lock acquisition.
+
+        Args:
+            ticks: Iterable of (symbol, price, volume, timestamp), in arrival order.
+
+        Returns:
+            Number of ticks applied (ticks for untracked symbols are skipped).
+        """
+        applied = 0
+        untracked = set()
+        with self._lock:
+            states = self.states
+            for symbol, price, volume, timestamp in ticks:
+                state = states.get(symbol)
+                if state is None:
+                    untracked.add(symbol)
+                    continue
+                state.update_tick(price, volume, timestamp)
+                applied += 1
+            self.total_ticks_received += applied
+
+        if untracked:
+            logger.warning(f"Received ticks for untracked symbols: {sorted(untracked)}")
+        return applied
+
     def finalize_candles(self) -> List[Dict]:
         """Finalize all current candles and return them.
         
@@ -118,8 +173,15 @@ class CandleAggregator:
         if candles:
             logger.info(f"Finalized {len(candles)} candles")
             
+            # Consumers read from the bus; disk writes can happen later
+            if self.candle_bus is not None:
+                self.candle_bus.publish(candles)
+            
             # Persist to Parquet
-            self._persist_candles(candles)
+            if self.persister is not None:
+                self.persister.submit(candles)
+            else:
+                self._persist_candles(candles)
             
             # Call callback if provided
             if self.on_candle_callback:
@@ -147,32 +209,13 @@ class CandleAggregator:
             symbol = candle["symbol"]
             grouped.setdefault(symbol, []).append(candle)
         
-        # Persist each symbol
+        # Persist each symbol as an appended segment (no read-modify-write)
         for symbol, symbol_candles in grouped.items():
             exchange = symbol_candles[0]["exchange"]
-            file_path = self.processed_base_path / f"{exchange}_{symbol}_1m.parquet"
             
             try:
-                # Convert to DataFrame
-                df_new = pd.DataFrame(symbol_candles)
-                df_new["timestamp"] = pd.to_datetime(df_new["timestamp"])
-                
-                # Load existing data if file exists
-                if file_path.exists():
-                    df_existing = pd.read_parquet(file_path)
-                    
-                    # Append new candles
-                    df_combined = pd.concat([df_existing, df_new], ignore_index=True)
-                    
-                    # Deduplicate (keep last for each timestamp)
-                    df_combined = df_combined.sort_values("timestamp")
-                    df_combined = df_combined.drop_duplicates(subset=["symbol", "timestamp"], keep="last")
-                else:
-                    df_combined = df_new
-                
-                # Save to Parquet
-                df_combined.to_parquet(file_path, engine="pyarrow", index=False)
-                logger.debug(f"Persisted {len(symbol_candles)} candles for {symbol} to {file_path}")
+                seg_path = self.candle_store.append(symbol, symbol_candles, exchange)
+                logger.debug(f"Persisted {len(symbol_candles)} candles for {symbol} to {seg_path}")
                 
             except Exception as e:
                 logger.exception(f"Failed to persist candles for {symbol}: {e}")
@@ -186,15 +229,23 @@ class CandleAggregator:
         next_minute = (now + timedelta(minutes=1)).replace(second=0, microsecond=0)
         delay = (next_minute - now).total_seconds()
         
-        self._timer = threading.Timer(delay, self._on_timer_tick)
+        if self.on_boundary_scheduled is not None:
+            self.on_boundary_scheduled(next_minute)
+        self._timer = threading.Timer(delay, self._on_timer_tick, args=(next_minute,))
         self._timer.daemon = True
         self._timer.start()
         
         logger.debug(f"Scheduled next finalization in {delay:.1f}s at {next_minute}")
     
-    def _on_timer_tick(self) -> None:
-        """Timer callback to finalize candles."""
+    def _on_timer_tick(self, boundary: Optional[datetime] = None) -> None:
+        """Timer callback to finalize candles.
+
+        Args:
+            boundary: The minute boundary this tick was scheduled for.
+        """
         try:
+            if self.pre_finalize is not None:
+                self.pre_finalize(boundary or datetime.now().replace(second=0, microsecond=0))
             self.finalize_candles()
         except Exception as e:
             logger.exception(f"Error during candle finalization: {e}")
@@ -223,6 +274,16 @@ class CandleAggregator:
         # Finalize any remaining candles
         self.finalize_candles()
         
+        # Drain queued writes before compacting
+        if self.persister is not None:
+            self.persister.stop()
+        
+        # Fold the day's segments into the base files
+        try:
+            self.candle_store.compact_all()
+        except Exception as e:
+            logger.exception(f"Error compacting candle store: {e}")
+        
         logger.info("Candle aggregator stopped")
     
     def reset_all_symbols(self) -> None:
@@ -0,0 +1,310 @@
+"""In-process Candle Bus for Live Intraday Consumers.
+
+The aggregator publishes each minute's finalized candles here, and the
+momentum engine, regime guard and signal validator read them back from
+memory instead of re-reading every symbol's Parquet from disk. Disk writes
+move to a background ``CandlePersister`` so the minute-boundary critical
+path does no file I/O.
+
+Each symbol has a columnar ring buffer (one NumPy array per field). The
+buffer is laid out linearly with 2x headroom: appends write at the tail and,
+when the tail reaches the end, the newest ``capacity`` rows are moved back
+to the front (amortized O(1)). The latest ``n`` rows are therefore always
+contiguous, so views are plain slices without copying.
+
+Views share memory with the buffer and are read-only. They stay valid until
+about ``capacity`` more candles are appended for that symbol; copy them if
+they must be kept longer.
+"""
+
+import logging
+import queue
+import threading
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# ~8 NSE sessions of 1-minute candles (375 per day)
+DEFAULT_CAPACITY = 3000
+
+PRICE_FIELDS = ("open", "high", "low", "close", "volume")
+
+
+class CandleView(NamedTuple):
+    """Read-only, zero-copy column views of a symbol's latest candles."""
+
+    timestamp: np.ndarray  # datetime64[ns] (UTC wall time if tz is set)
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+    tz: Optional[str] = None
+
+    def __len__(self) -> int:
+        return len(self.timestamp)
+
+
+def _readonly(arr: np.ndarray) -> np.ndarray:
+    view = arr.view()
+    view.flags.writeable = False
+    return view
+
+
+class CandleRing:
+    """Columnar ring buffer of 1-minute candles for one symbol."""
+
+    def __init__(self, symbol: str, exchange: str = "NSE", capacity: int = DEFAULT_CAPACITY):
+        self.symbol = symbol
+        self.exchange = exchange
+        self.capacity = capacity
+        self.tz: Optional[str] = None
+
+        size = 2 * capacity
+        self._ts = np.empty(size, dtype="datetime64[ns]")
+        self._cols = {name: np.empty(size, dtype=np.float64) for name in PRICE_FIELDS}
+        self._start = 0
+        self._end = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    @property
+    def last_timestamp(self) -> Optional[pd.Timestamp]:
+        if self._end == self._start:
+            return None
+        return self._to_timestamp(self._ts[self._end - 1])
+
+    def _to_timestamp(self, value: np.datetime64) -> pd.Timestamp:
+        ts = pd.Timestamp(value)
+        return ts.tz_localize("UTC").tz_convert(self.tz) if self.tz else ts
+
+    def _encode(self, timestamp) -> np.datetime64:
+        ts = pd.Timestamp(timestamp)
+        if ts.tzinfo is not None:
+            if self.tz is None and self._end == self._start:
+                self.tz = str(ts.tz)
+            ts = ts.tz_convert("UTC").tz_localize(None)
+        return np.datetime64(ts.value, "ns")
+
+    def _make_room(self) -> None:
+        if self._end < len(self._ts):
+            return
+        keep = min(len(self), self.capacity - 1)
+        src = slice(self._end - keep, self._end)
+        self._ts[:keep] = self._ts[src]
+        for col in self._cols.values():
+            col[:keep] = col[src]
+        self._start, self._end = 0, keep
+
+    def append(self, candle: Dict) -> bool:
+        """Append one candle. A repeat of the last minute overwrites it; older candles are dropped."""
+        with self._lock:
+            ts = self._encode(candle["timestamp"])
+            if self._end > self._start and ts <= self._ts[self._end - 1]:
+                if ts == self._ts[self._end - 1]:
+                    # Re-finalized minute: latest write wins, as in CandleStore
+                    for name in PRICE_FIELDS:
+                        self._cols[name][self._end - 1] = candle[name]
+                    return True
+                return False
+
+            self._make_room()
+            i = self._end
+            self._ts[i] = ts
+            for name in PRICE_FIELDS:
+                self._cols[name][i] = candle[name]
+            self._end += 1
+            if len(self) > self.capacity:
+                self._start = self._end - self.capacity
+            return True
+
+    def extend_from_frame(self, df: pd.DataFrame) -> int:
+        """Bulk-load history (e.g. from CandleStore.read) in timestamp order."""
+        if df.empty:
+            return 0
+        df = df.sort_values("timestamp", kind="stable").tail(self.capacity)
+        applied = 0
+        for candle in df[["timestamp", *PRICE_FIELDS]].to_dict("records"):
+            applied += self.append(candle)
+        return applied
+
+    def view(self, n: Optional[int] = None) -> CandleView:
+        """Zero-copy read-only views of the latest n candles (all buffered if None)."""
+        with self._lock:
+            end = self._end
+            start = self._start if n is None else max(self._start, end - n)
+            return CandleView(
+                _readonly(self._ts[start:end]),
+                *(_readonly(self._cols[name][start:end]) for name in PRICE_FIELDS),
+                tz=self.tz,
+            )
+
+    def frame(self, n: Optional[int] = None) -> pd.DataFrame:
+        """Latest candles as a DataFrame in the CandleStore.read schema."""
+        v = self.view(n)
+        ts = pd.to_datetime(v.timestamp)
+        if v.tz:
+            ts = ts.tz_localize("UTC").tz_convert(v.tz)
+        return pd.DataFrame({
+            "symbol": self.symbol,
+            "exchange": self.exchange,
+            "timestamp": ts,
+            "open": v.open,
+            "high": v.high,
+            "low": v.low,
+            "close": v.close,
+            "volume": v.volume,
+        })
+
+
+class CandleBus:
+    """Process-local registry of per-symbol candle rings."""
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        self.capacity = capacity
+        self._rings: Dict[str, CandleRing] = {}
+        self._guard = threading.Lock()
+        self.published = 0
+
+    def ring(self, symbol: str, exchange: str = "NSE", create: bool = True) -> Optional[CandleRing]:
+        key = f"{exchange}_{symbol}"
+        ring = self._rings.get(key)
+        if ring is None and create:
+            with self._guard:
+                ring = self._rings.setdefault(key, CandleRing(symbol, exchange, self.capacity))
+        return ring
+
+    def has(self, symbol: str, exchange: str = "NSE") -> bool:
+        ring = self._rings.get(f"{exchange}_{symbol}")
+        return ring is not None and len(ring) > 0
+
+    def publish(self, candles: Iterable[Dict]) -> int:
+        """Append finalized candles (aggregator schema). Returns how many were applied."""
+        applied = 0
+        for candle in candles:
+            applied += self.ring(candle["symbol"], candle.get("exchange", "NSE")).append(candle)
+        self.published += applied
+        return applied
+
+    def warm_up(self, store, symbols: Iterable[str], exchange: str = "NSE") -> int:
+        """Seed rings from a CandleStore once, before the live loop starts."""
+        loaded = 0
+        for symbol in symbols:
+            if store.exists(symbol, exchange):
+                loaded += self.ring(symbol, exchange).extend_from_frame(store.read(symbol, exchange))
+        return loaded
+
+    def view(self, symbol: str, exchange: str = "NSE", n: Optional[int] = None) -> Optional[CandleView]:
+        ring = self.ring(symbol, exchange, create=False)
+        return ring.view(n) if ring is not None else None
+
+    def frame(self, symbol: str, exchange: str = "NSE", n: Optional[int] = None) -> pd.DataFrame:
+        ring = self.ring(symbol, exchange, create=False)
+        return ring.frame(n) if ring is not None else pd.DataFrame()
+
+    def get_stats(self) -> Dict:
+        return {
+            "symbols": len(self._rings),
+            "capacity": self.capacity,
+            "published": self.published,
+            "buffered": sum(len(r) for r in self._rings.values()),
+        }
+
+
+class CandlePersister:
+    """Background writer that drains finalized candles into a CandleStore.
+
+    Jobs run strictly in submission order on one thread, so a task submitted
+    after some candles (e.g. a report generator) sees them on disk.
+    """
+
+    _STOP = object()
+
+    def __init__(self, candle_store, max_queue: int = 10000):
+        self.candle_store = candle_store
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max_queue)
+        self._thread: Optional[threading.Thread] = None
+        self.batches_written = 0
+        self.candles_written = 0
+        self.errors = 0
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="candle-persister", daemon=True)
+        self._thread.start()
+
+    def submit(self, candles: List[Dict]) -> None:
+        if candles:
+            self._queue.put(("candles", list(candles)))
+            if self._thread is None:
+                self.start()
+
+    def submit_task(self, fn: Callable[[], None]) -> None:
+        """Run fn on the persister thread after everything queued before it."""
+        self._queue.put(("task", fn))
+        if self._thread is None:
+            self.start()
+
+    def flush(self, timeout: Optional[float] = None) -> None:
+        """Block until every job queued so far has been processed."""
+        if self._thread is None:
+            self._drain_inline()
+            return
+        done = threading.Event()
+        self._queue.put(("task", done.set))
+        done.wait(timeout)
+
+    def stop(self, timeout: float = 30.0) -> None:
+        if self._thread is None:
+            self._drain_inline()
+            return
+        self._queue.put(self._STOP)
+        self._thread.join(timeout)
+        self._thread = None
+
+    def _drain_inline(self) -> None:
+        while True:
+            try:
+                job = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            if job is not self._STOP:
+                self._process(job)
+
+    def _run(self) -> None:
+        while True:
+            job = self._queue.get()
+            if job is self._STOP:
+                return
+            self._process(job)
+
+    def _process(self, job) -> None:
+        kind, payload = job
+        try:
+            if kind == "task":
+                payload()
+                return
+            grouped: Dict[tuple, List[Dict]] = {}
+            for candle in payload:
+                grouped.setdefault((candle["symbol"], candle.get("exchange", "NSE")), []).append(candle)
+            for (symbol, exchange), symbol_candles in grouped.items():
+                self.candle_store.append(symbol, symbol_candles, exchange)
+            self.batches_written += 1
+            self.candles_written += len(payload)
+        except Exception as e:
+            self.errors += 1
+            logger.exception(f"Candle persister {kind} failed: {e}")
+
+    def get_stats(self) -> Dict:
+        return {
+            "pending": self._queue.qsize(),
+            "batches_written": self.batches_written,
+            "candles_written": self.candles_written,
+            "errors": self.errors,
+        }
@@ -0,0 +1,244 @@
+"""Append-only Candle Store for Intraday Persistence.
+
+Stores 1-minute candles per symbol as a compacted base Parquet file plus a
+directory of small, immutable segment files. Each finalization appends one
+segment (cost proportional to the new rows only); periodic compaction folds
+the segments back into the base file.
+
+Layout (under ``base_path``)::
+
+    {exchange}_{symbol}_1m.parquet            # compacted base (legacy path)
+    {exchange}_{symbol}_1m.segments/
+        00001736912100000000001.parquet       # one segment per append
+
+Readers should go through ``CandleStore.read`` to see the base file and all
+pending segments as one logical, deduplicated table.
+"""
+
+import itertools
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+class CandleStore:
+    """Append-only, per-symbol candle store with periodic compaction.
+
+    Segment file names are monotonically increasing so that lexical order is
+    write order; on read, duplicates on (symbol, timestamp) resolve to the
+    most recently written row, matching the previous read-modify-write
+    behaviour of ``CandleAggregator``.
+    """
+
+    DEDUP_KEYS = ["symbol", "timestamp"]
+
+    def __init__(
+        self,
+        base_path: str = "data/processed/candles/intraday",
+        compact_threshold: int = 120
+    ):
+        """Initialize the candle store.
+
+        Args:
+            base_path: Directory holding the per-symbol Parquet files.
+            compact_threshold: Number of pending segments for a symbol after
+                               which an append triggers compaction. Use 0 to
+                               disable automatic compaction.
+        """
+        self.base_path = Path(base_path)
+        self.compact_threshold = compact_threshold
+
+        # Per-symbol locks so compaction never races an append
+        self._locks: Dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+        self._seq = itertools.count()
+
+    # ------------------------------------------------------------------
+    # Paths
+    # ------------------------------------------------------------------
+
+    def base_file(self, symbol: str, exchange: str = "NSE") -> Path:
+        """Path of the compacted base file for a symbol."""
+        return self.base_path / f"{exchange}_{symbol}_1m.parquet"
+
+    def segment_dir(self, symbol: str, exchange: str = "NSE") -> Path:
+        """Directory of pending (uncompacted) segments for a symbol."""
+        return self.base_path / f"{exchange}_{symbol}_1m.segments"
+
+    def list_segments(self, symbol: str, exchange: str = "NSE") -> List[Path]:
+        """Return pending segment files in write order."""
+        seg_dir = self.segment_dir(symbol, exchange)
+        if not seg_dir.exists():
+            return []
+        return sorted(seg_dir.glob("*.parquet"))
+
+    def exists(self, symbol: str, exchange: str = "NSE") -> bool:
+        """Return True if any data (base or segments) exists for the symbol."""
+        return self.base_file(symbol, exchange).exists() or bool(self.list_segments(symbol, exchange))
+
+    def _lock_for(self, symbol: str, exchange: str) -> threading.Lock:
+        key = f"{exchange}_{symbol}"
+        with self._locks_guard:
+            if key not in self._locks:
+                self._locks[key] = threading.Lock()
+            return self._locks[key]
+
+    def _next_segment_name(self) -> str:
+        # time_ns keeps order across restarts, the counter breaks ties in-process
+        return f"{time.time_ns():020d}{next(self._seq) % 1000:03d}.parquet"
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def append(self, symbol: str, candles: List[Dict], exchange: str = "NSE") -> Optional[Path]:
+        """Append candles for a symbol as a new immutable segment.
+
+        Args:
+            symbol: Trading symbol.
+            candles: List of candle dicts (schema of ``SymbolState.finalize_candle``).
+            exchange: Exchange segment.
+
+        Returns:
+            Path of the written segment, or None if there was nothing to write.
+        """
+        if not candles:
+            return None
+
+        df_new = pd.DataFrame(candles)
+        df_new["timestamp"] = pd.to_datetime(df_new["timestamp"])
+
+        with self._lock_for(symbol, exchange):
+            seg_dir = self.segment_dir(symbol, exchange)
+            seg_dir.mkdir(parents=True, exist_ok=True)
+            seg_path = seg_dir / self._next_segment_name()
+            self._atomic_write(df_new, seg_path)
+            pending = len(self.list_segments(symbol, exchange)) if self.compact_threshold else 0
+
+        logger.debug(f"Appended {len(df_new)} candles for {exchange}:{symbol} to {seg_path.name}")
+
+        if self.compact_threshold and pending >= self.compact_threshold:
+            self.compact(symbol, exchange)
+
+        return seg_path
+
+    def compact(self, symbol: str, exchange: str = "NSE") -> int:
+        """Fold all pending segments for a symbol into its base file.
+
+        Safe against crashes: the new base file is written atomically before
+        the merged segments are removed, and replaying a segment that was
+        already merged is idempotent thanks to deduplication on read.
+
+        Returns:
+            Number of segments compacted.
+        """
+        with self._lock_for(symbol, exchange):
+            segments = self.list_segments(symbol, exchange)
+            if not segments:
+                return 0
+
+            base = self.base_file(symbol, exchange)
+            df = self._merge(base, segments)
+            self._atomic_write(df, base)
+
+            for seg in segments:
+                try:
+                    seg.unlink()
+                except OSError as e:
+                    logger.warning(f"Could not remove compacted segment {seg}: {e}")
+
+            try:
+                self.segment_dir(symbol, exchange).rmdir()
+            except OSError:
+                # Not empty (a concurrent writer from another process) or already gone
+                pass
+
+        logger.info(f"Compacted {len(segments)} segments for {exchange}:{symbol}")
+        return len(segments)
+
+    def compact_all(self) -> Dict[str, int]:
+        """Compact every symbol that has pending segments.
+
+        Returns:
+            Dict mapping '{exchange}_{symbol}' to the number of segments compacted.
+        """
+        results = {}
+        if not self.base_path.exists():
+            return results
+
+        for seg_dir in sorted(self.base_path.glob("*_1m.segments")):
+            exchange, symbol = seg_dir.name[: -len("_1m.segments")].split("_", 1)
+            results[f"{exchange}_{symbol}"] = self.compact(symbol, exchange)
+        return results
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def read(self, symbol: str, exchange: str = "NSE", columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """Read the logical candle table for a symbol.
+
+        Combines the base file with all pending segments, sorted by timestamp
+        and deduplicated on (symbol, timestamp) keeping the latest write.
+
+        Args:
+            symbol: Trading symbol.
+            exchange: Exchange segment.
+            columns: Optional column projection.
+
+        Returns:
+            DataFrame of candles, empty if no data exists.
+        """
+        try:
+            return self._read(symbol, exchange, columns)
+        except FileNotFoundError:
+            # A compaction (possibly in another process) removed segments
+            # between listing and reading them; the base now holds their rows
+            logger.debug(f"Segments for {exchange}:{symbol} compacted during read, retrying")
+            return self._read(symbol, exchange, columns)
+
+    def _read(self, symbol: str, exchange: str, columns: Optional[List[str]]) -> pd.DataFrame:
+        base = self.base_file(symbol, exchange)
+        segments = self.list_segments(symbol, exchange)
+        if not base.exists() and not segments:
+            return pd.DataFrame()
+
+        if not segments:
+            # Fast path: base file is already compacted (sorted and unique).
+            # timestamp is always loaded for the conversion below.
+            load = columns if not columns or "timestamp" in columns else list(columns) + ["timestamp"]
+            df = pd.read_parquet(base, columns=load)
+            df["timestamp"] = pd.to_datetime(df["timestamp"])
+        else:
+            df = self._merge(base, segments)
+        if columns:
+            df = df[columns]
+        return df
+
+    def _merge(self, base: Path, segments: List[Path]) -> pd.DataFrame:
+        frames = []
+        if base.exists():
+            frames.append(pd.read_parquet(base))
+        for seg in segments:
+            frames.append(pd.read_parquet(seg))
+
+        df = pd.concat(frames, ignore_index=True)
+        df["timestamp"] = pd.to_datetime(df["timestamp"])
+
+        # Stable sort so 'keep=last' keeps the most recently written row
+        df = df.sort_values("timestamp", kind="stable")
+        df = df.drop_duplicates(subset=self.DEDUP_KEYS, keep="last")
+        return df.reset_index(drop=True)
+
+    @staticmethod
+    def _atomic_write(df: pd.DataFrame, path: Path) -> None:
+        tmp_path = path.with_name(f".{path.name}.tmp")
+        df.to_parquet(tmp_path, engine="pyarrow", index=False)
+        os.replace(tmp_path, path)
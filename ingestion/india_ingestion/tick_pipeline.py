@@ -0,0 +1,271 @@
+"""Tick Decode and Batch Dispatch for WebSocket Ingestion.
+
+Hot-path helpers shared by IndiaWebSocketClient and CandleAggregator:
+
+* TickDecoder parses SmartAPI binary frames with a precompiled struct and
+  looks up symbols by the raw token bytes, so no per-message string decode.
+* TickBatchQueue decouples the WebSocket thread from aggregation. Producers
+  append without locking; a drain thread hands many ticks at a time to
+  CandleAggregator.update_ticks (one lock acquisition per batch).
+* StageLatency keeps cheap count/total/max counters per pipeline stage.
+"""
+
+import logging
+import struct
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# A decoded tick: (symbol, ltp, volume, timestamp)
+Tick = Tuple[str, float, int, datetime]
+
+
+@dataclass
+class StageLatency:
+    """Running latency counters for one pipeline stage (nanoseconds)."""
+
+    count: int = 0
+    total_ns: int = 0
+    max_ns: int = 0
+
+    def record(self, elapsed_ns: int, n: int = 1) -> None:
+        """Record elapsed time covering n items."""
+        self.count += n
+        self.total_ns += elapsed_ns
+        if elapsed_ns > self.max_ns:
+            self.max_ns = elapsed_ns
+
+    def to_dict(self) -> Dict:
+        mean_us = (self.total_ns / self.count / 1000.0) if self.count else 0.0
+        return {
+            "count": self.count,
+            "mean_us": round(mean_us, 3),
+            "max_us": round(self.max_ns / 1000.0, 3),
+        }
+
+
+class TickDecoder:
+    """Decodes SmartAPI v2 binary tick frames.
+
+    Field offsets (big endian): token at bytes 1-26 (null padded), ltp
+    double at 34-42, volume uint64 at 42-50. LTP/QUOTE/SNAP_QUOTE frames share this header,
+    so one decoder serves every mode.
+    """
+
+    TOKEN_OFFSET = 1
+    TOKEN_LENGTH = 25
+    PRICE_OFFSET = 34
+    MIN_LENGTH = 50
+
+    _PRICE_VOLUME = struct.Struct(">dQ")
+
+    def __init__(self):
+        # Raw 25-byte token field -> symbol
+        self._symbols: Dict[bytes, str] = {}
+        self.unknown_tokens = 0
+        self.short_messages = 0
+
+    @classmethod
+    def token_key(cls, token: str) -> bytes:
+        """Token as it appears on the wire (null padded to the field width)."""
+        return token.encode("ascii").ljust(cls.TOKEN_LENGTH, b"\x00")
+
+    def register(self, token: str, symbol: str) -> None:
+        self._symbols[self.token_key(token)] = symbol
+
+    def unregister(self, token: str) -> None:
+        self._symbols.pop(self.token_key(token), None)
+
+    def clear(self) -> None:
+        self._symbols.clear()
+
+    def decode(self, message) -> Optional[Tuple[str, float, int]]:
+        """Return (symbol, ltp, volume), or None for short/unknown frames."""
+        if len(message) < self.MIN_LENGTH:
+            self.short_messages += 1
+            return None
+
+        view = memoryview(message)
+        field = view[self.TOKEN_OFFSET:self.TOKEN_OFFSET + self.TOKEN_LENGTH]
+        try:
+            # Read-only byte views hash and compare like bytes: no copy
+            symbol = self._symbols.get(field)
+        except ValueError:
+            # Writable buffers (bytearray) are unhashable as views
+            symbol = self._symbols.get(field.tobytes())
+        if symbol is None:
+            self.unknown_tokens += 1
+            return None
+
+        ltp, volume = self._PRICE_VOLUME.unpack_from(view, self.PRICE_OFFSET)
+        return symbol, ltp, volume
+
+
+class TickBatchQueue:
+    """Lock-free producer side, batched consumer side tick queue.
+
+    put() is a single deque append (atomic under the GIL), so the WebSocket
+    thread never waits on the aggregator. A daemon thread drains up to
+    max_batch ticks at a time into the sink, typically
+    CandleAggregator.update_ticks. The queue is unbounded: ticks are never
+    dropped, and depth_high_water shows how far the consumer fell behind.
+    """
+
+    def __init__(
+        self,
+        sink: Callable[[List[Tick]], object],
+        max_batch: int = 5000,
+        poll_interval: float = 0.002
+    ):
+        """Initialize the queue.
+
+        Args:
+            sink: Called with each drained batch (list of ticks).
+            max_batch: Upper bound on ticks handed to the sink at once.
+            poll_interval: Seconds the drain thread sleeps when idle.
+        """
+        self.sink = sink
+        self.max_batch = max_batch
+        self.poll_interval = poll_interval
+
+        self._queue: Deque[Tuple[str, float, int, datetime, int]] = deque()
+        # Serializes dispatch so batches from the drain thread and from
+        # drain()/drain_until() reach the sink in arrival order
+        self._dispatch_lock = threading.Lock()
+        # Minute boundary whose candles are not finalized yet; the drain
+        # thread holds back ticks stamped at or after it
+        self._pending_boundary: Optional[datetime] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        # Statistics
+        self.ticks_enqueued = 0
+        self.ticks_dispatched = 0
+        self.batches_dispatched = 0
+        self.depth_high_water = 0
+        self.queue_wait = StageLatency()
+        self.dispatch = StageLatency()
+
+    def put(self, symbol: str, price: float, volume: int, timestamp: datetime) -> None:
+        """Enqueue one tick (on_tick_callback compatible)."""
+        self._queue.append((symbol, price, volume, timestamp, time.perf_counter_ns()))
+        self.ticks_enqueued += 1
+
+    def drain(self) -> int:
+        """Dispatch everything queued right now. Returns ticks dispatched."""
+        dispatched = 0
+        while self._queue:
+            dispatched += self._drain_batch()
+        return dispatched
+
+    def drain_until(self, boundary: datetime) -> int:
+        """Dispatch queued ticks stamped before boundary, leaving later ones queued.
+
+        Used as the aggregator's pre-finalize hook so every tick of the
+        closing minute is applied before its candle is finalized.
+        """
+        dispatched = 0
+        while True:
+            n = self._drain_batch(boundary)
+            if not n:
+                return dispatched
+            dispatched += n
+
+    def hold_from(self, boundary: Optional[datetime]) -> None:
+        """Keep the drain thread from dispatching ticks stamped at or after boundary.
+
+        Used as the aggregator's boundary-scheduled hook: a tick of the next
+        minute dispatched before the closing minute is finalized would roll
+        the symbol's candle over and drop the unfinalized one. Setting the
+        next boundary releases the held ticks; None removes the hold.
+        """
+        self._pending_boundary = boundary
+
+    def _drain_batch(self, boundary: Optional[datetime] = None) -> int:
+        with self._dispatch_lock:
+            return self._drain_batch_locked(boundary)
+
+    def _drain_batch_locked(self, boundary: Optional[datetime]) -> int:
+        queue = self._queue
+        depth = len(queue)
+        if depth > self.depth_high_water:
+            self.depth_high_water = depth
+
+        batch: List[Tick] = []
+        oldest_ns = None
+        popleft = queue.popleft
+        for _ in range(min(depth, self.max_batch)):
+            if boundary is not None and queue[0][3] >= boundary:
+                break
+            symbol, price, volume, timestamp, enqueued_ns = popleft()
+            if oldest_ns is None:
+                oldest_ns = enqueued_ns
+            batch.append((symbol, price, volume, timestamp))
+
+        if not batch:
+            return 0
+
+        start = time.perf_counter_ns()
+        self.queue_wait.record(start - oldest_ns, len(batch))
+        try:
+            self.sink(batch)
+        except Exception as e:
+            logger.exception(f"Error dispatching tick batch: {e}")
+        self.dispatch.record(time.perf_counter_ns() - start, len(batch))
+
+        self.ticks_dispatched += len(batch)
+        self.batches_dispatched += 1
+        return len(batch)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            if not self._queue or not self._drain_batch(self._pending_boundary):
+                # Idle, or only ticks past the pending boundary are queued
+                self._stop.wait(self.poll_interval)
+        # Flush whatever arrived before stop
+        self.drain()
+
+    def start(self) -> None:
+        """Start the drain thread."""
+        if self._thread and self._thread.is_alive():
+            logger.warning("Tick queue already running")
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="tick-batch-queue", daemon=True)
+        self._thread.start()
+        logger.info("Tick batch queue started")
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop the drain thread after flushing queued ticks."""
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+        self.drain()
+        logger.info("Tick batch queue stopped")
+
+    def depth(self) -> int:
+        return len(self._queue)
+
+    def get_stats(self) -> Dict:
+        """Get queue statistics.
+
+        Returns:
+            Dict with throughput counters and per-stage latency.
+        """
+        return {
+            "ticks_enqueued": self.ticks_enqueued,
+            "ticks_dispatched": self.ticks_dispatched,
+            "batches_dispatched": self.batches_dispatched,
+            "depth": len(self._queue),
+            "depth_high_water": self.depth_high_water,
+            "latency": {
+                "queue_wait": self.queue_wait.to_dict(),
+                "dispatch": self.dispatch.to_dict(),
+            },
+        }
@@ -9,13 +9,13 @@ import time
 import threading
 from typing import List, Optional, Callable, Dict, Set
 from datetime import datetime
-import struct
 
 from SmartApi import SmartConnect
 from SmartApi.smartWebSocketV2 import SmartWebSocketV2
 
 from ingestion.api_ingestion.angel_smartapi.auth import AngelAuthManager
 from ingestion.api_ingestion.angel_smartapi.instrument_master import InstrumentMaster
+from ingestion.india_ingestion.tick_pipeline import StageLatency, TickDecoder
 
 logger = logging.getLogger(__name__)
 
@@ -65,11 +65,16 @@ class IndiaWebSocketClient:
         self._connected = False
         self._subscribed_tokens: Set[str] = set()
         self._token_to_symbol: Dict[str, str] = {}  # token -> symbol mapping
+        self.decoder = TickDecoder()  # wire token bytes -> symbol
         
         # Statistics
         self.ticks_received = 0
         self.connection_attempts = 0
         self.last_tick_time: Optional[datetime] = None
+        self.latency: Dict[str, StageLatency] = {
+            "decode": StageLatency(),
+            "callback": StageLatency(),
+        }
         
         # Thread safety
         self._lock = threading.Lock()
@@ -95,45 +100,38 @@ class IndiaWebSocketClient:
     def _on_data(self, ws_app, message):
         """WebSocket data callback.
         
-        Parses binary tick data and invokes the tick callback.
+        Parses binary tick data and invokes the tick callback. Runs on the
+        WebSocket thread for every frame, so it avoids locks and string
+        decoding; pair it with a TickBatchQueue to keep aggregation off
+        this thread.
         """
         try:
             # SmartAPI v2 sends binary data
             # Format: [exchange_type(1), token(25), sequence(8), timestamp(8), 
             #          ltp(8), volume(8), ...]
+            start = time.perf_counter_ns()
+            tick = self.decoder.decode(message)
+            decoded = time.perf_counter_ns()
+            self.latency["decode"].record(decoded - start)
             
-            # Parse binary message (simplified - actual format may vary)
-            # For LTP mode, we primarily need: token, ltp, volume, timestamp
-            
-            if len(message) < 50:
-                logger.warning(f"Received short message: {len(message)} bytes")
+            if tick is None:
+                if len(message) < TickDecoder.MIN_LENGTH:
+                    logger.warning(f"Received short message: {len(message)} bytes")
+                else:
+                    token = bytes(message[1:26]).decode('utf-8', 'replace').rstrip('\x00')
+                    logger.warning(f"Received tick for unknown token: {token}")
                 return
             
-            # Parse token (bytes 1-26, null-terminated string)
-            token = message[1:26].decode('utf-8').rstrip('\x00')
-            
-            # Parse LTP (bytes 34-42, double)
-            ltp = struct.unpack('>d', message[34:42])[0]
-            
-            # Parse volume (bytes 42-50, long)
-            volume = struct.unpack('>Q', message[42:50])[0]
-            
-            # Timestamp
+            symbol, ltp, volume = tick
             timestamp = datetime.now()
             
-            # Lookup symbol
-            symbol = self._token_to_symbol.get(token)
-            if not symbol:
-                logger.warning(f"Received tick for unknown token: {token}")
-                return
-            
-            # Update statistics
-            with self._lock:
-                self.ticks_received += 1
-                self.last_tick_time = timestamp
+            # Statistics are written only from the WebSocket thread
+            self.ticks_received += 1
+            self.last_tick_time = timestamp
             
             # Invoke callback
             self.on_tick_callback(symbol, ltp, volume, timestamp)
+            self.latency["callback"].record(time.perf_counter_ns() - decoded)
             
         except Exception as e:
             logger.exception(f"Error parsing tick data: {e}")
@@ -234,6 +232,7 @@ class IndiaWebSocketClient:
                 
                 # Store mapping
                 self._token_to_symbol[token] = symbol
+                self.decoder.register(token, symbol)
                 self._subscribed_tokens.add(token)
             
             if not subscription_list:
@@ -280,6 +279,7 @@ class IndiaWebSocketClient:
                 
                 # Remove mapping
                 self._token_to_symbol.pop(token, None)
+                self.decoder.unregister(token)
                 self._subscribed_tokens.discard(token)
             
             if unsubscription_list:
@@ -305,6 +305,7 @@ class IndiaWebSocketClient:
                     self._connected = False
                     self._subscribed_tokens.clear()
                     self._token_to_symbol.clear()
+                    self.decoder.clear()
     
     def is_connected(self) -> bool:
         """Check if WebSocket is connected.
@@ -337,6 +338,9 @@ class IndiaWebSocketClient:
                 "ticks_received": self.ticks_received,
                 "connection_attempts": self.connection_attempts,
                 "last_tick_time": self.last_tick_time.isoformat() if self.last_tick_time else None,
+                "unknown_tokens": self.decoder.unknown_tokens,
+                "short_messages": self.decoder.short_messages,
+                "latency": {stage: counter.to_dict() for stage, counter in self.latency.items()},
             }
     
     def _get_exchange_type(self, exchange: str) -> int:
@@ -95,6 +95,8 @@ class IndiaHealthMonitor:
             
             # Find most recently modified file
             parquet_files = list(processed_path.glob("NSE_*_1m.parquet"))
+            # Live candles land as append-only segments until compaction
+            parquet_files += list(processed_path.glob("NSE_*_1m.segments/*.parquet"))
             if not parquet_files:
                 return {
                     "status": "no_files",
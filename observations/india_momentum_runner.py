@@ -13,20 +13,25 @@ import time
 import logging
 import argparse
 import signal
+from concurrent.futures import Executor, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Optional
 
 # Add project root to sys.path
 sys.path.append(str(Path(__file__).parent.parent))
 
 from ingestion.india_ingestion.websocket_client import IndiaWebSocketClient
 from ingestion.india_ingestion.candle_aggregator import CandleAggregator
+from ingestion.india_ingestion.candle_bus import CandleBus, CandlePersister
+from ingestion.india_ingestion.candle_store import CandleStore
+from ingestion.india_ingestion.tick_pipeline import TickBatchQueue
 from ingestion.api_ingestion.angel_smartapi.auth import AngelAuthManager
 from ingestion.api_ingestion.angel_smartapi.instrument_master import InstrumentMaster
 from ingestion.api_ingestion.angel_smartapi.config import AngelConfig
 from src.core_modules.momentum_engine.momentum_engine import MomentumEngine
 from observations.signal_logger import ObservationLogger
+from observations.signal_validator import SignalValidator
 from traderfund.regime.integration_guards import MomentumRegimeGuard
 
 # Configure logging
@@ -82,9 +87,36 @@ def load_watchlist(config: AngelConfig) -> List[str]:
     return watchlist
 
 
+def update_executive_dashboard() -> None:
+    """Regenerate executive dashboard data (subprocess, up to 30s)."""
+    try:
+        import subprocess
+        result = subprocess.run(
+            [sys.executable, "observations/executive_data_generator.py"],
+            capture_output=True,
+            text=True,
+            timeout=30
+        )
+        if result.returncode == 0:
+            logger.debug("Executive dashboard data updated")
+        else:
+            logger.warning(f"Executive dashboard update failed: {result.stderr}")
+    except Exception as e:
+        logger.warning(f"Failed to update executive dashboard: {e}")
+
+
+def _run_post_task(task) -> None:
+    try:
+        task()
+    except Exception as e:
+        logger.exception(f"Post-minute task {getattr(task, '__name__', task)} failed: {e}")
+
+
 def on_candles_finalized(candles: List[Dict], engine: MomentumEngine, 
                          obs_logger: ObservationLogger, watchlist: List[str],
-                         regime_guard: MomentumRegimeGuard) -> None:
+                         regime_guard: MomentumRegimeGuard,
+                         post_executor: Optional[Executor] = None,
+                         validator: Optional[SignalValidator] = None) -> None:
     """Callback when candles are finalized.
     
     Runs momentum engine on latest candles and logs signals.
@@ -95,10 +127,19 @@ def on_candles_finalized(candles: List[Dict], engine: MomentumEngine,
         obs_logger: ObservationLogger instance.
         watchlist: List of symbols to evaluate.
         regime_guard: MomentumRegimeGuard instance (Phase 7 Integration).
+        post_executor: Executor for the post-minute validation and
+                       dashboard refresh, so neither the minute boundary nor
+                       the candle persister waits on them. None runs them
+                       inline.
+        validator: Optional in-process SignalValidator (reads the candle bus).
     """
     try:
         logger.info(f"Running momentum evaluation on {len(watchlist)} symbols...")
         
+        # Incremental mode: fold the new candles into running indicator state
+        if engine.incremental:
+            engine.update_candles(candles)
+        
         # Run momentum engine
         signals = engine.run_on_all(watchlist)
         
@@ -130,21 +171,13 @@ def on_candles_finalized(candles: List[Dict], engine: MomentumEngine,
         else:
             logger.debug("No momentum signals generated in this cycle")
         
-        # Generate executive dashboard data
-        try:
-            import subprocess
-            result = subprocess.run(
-                [sys.executable, "observations/executive_data_generator.py"],
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
-            if result.returncode == 0:
-                logger.debug("Executive dashboard data updated")
+        # Post-minute work: validation, then executive dashboard data
+        post_tasks = ([validator.validate_signals] if validator is not None else []) + [update_executive_dashboard]
+        for task in post_tasks:
+            if post_executor is not None:
+                post_executor.submit(_run_post_task, task)
             else:
-                logger.warning(f"Executive dashboard update failed: {result.stderr}")
-        except Exception as e:
-            logger.warning(f"Failed to update executive dashboard: {e}")
+                task()
             
     except Exception as e:
         logger.exception(f"Error in candle finalization callback: {e}")
@@ -159,6 +192,13 @@ def main():
     parser.add_argument("--hod-dist", type=float, default=0.5, help="HOD proximity percentage")
     parser.add_argument("--vol-mult", type=float, default=2.0, help="Volume multiplier")
     parser.add_argument("--symbols", type=str, help="Comma-separated symbols (overrides config)")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Evaluate from running indicator state instead of reloading parquet each minute")
+    parser.add_argument("--no-candle-bus", action="store_true",
+                        help="Read candles back from parquet and persist synchronously (legacy path)")
+    parser.add_argument("--inline-validator", action="store_true",
+                        help="Validate logged signals in-process from the candle bus "
+                             "(instead of running signal_validator.py separately)")
     args = parser.parse_args()
     
     # Register signal handlers
@@ -185,32 +225,63 @@ def main():
     
     logger.info(f"Watchlist: {len(watchlist)} symbols")
     
+    # Candle bus: finalized candles are shared in memory and written to
+    # parquet by a background persister, so the minute boundary does no I/O
+    candle_bus = None
+    persister = None
+    if not args.no_candle_bus:
+        candle_bus = CandleBus()
+        candle_store = CandleStore("data/processed/candles/intraday")
+        seeded = candle_bus.warm_up(candle_store, watchlist, exchange="NSE")
+        logger.info(f"Candle bus seeded with {seeded} stored candles")
+        persister = CandlePersister(candle_store)
+        persister.start()
+    
     # Initialize momentum engine
     engine = MomentumEngine(
         hod_proximity_pct=args.hod_dist,
-        vol_multiplier=args.vol_mult
+        vol_multiplier=args.vol_mult,
+        incremental=args.incremental,
+        candle_bus=candle_bus
     )
     obs_logger = ObservationLogger()
-    regime_guard = MomentumRegimeGuard()
+    regime_guard = MomentumRegimeGuard(candle_bus=candle_bus)
+    validator = SignalValidator(candle_bus=candle_bus) if args.inline_validator else None
     
     # Initialize candle aggregator with callback
+    # One worker: validation and the dashboard subprocess run in minute order,
+    # away from the candle persister's write thread
+    post_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="post-minute")
+
     def candle_callback(candles: List[Dict]):
-        on_candles_finalized(candles, engine, obs_logger, watchlist, regime_guard)
+        on_candles_finalized(candles, engine, obs_logger, watchlist, regime_guard,
+                             post_executor=post_executor, validator=validator)
     
-    aggregator = CandleAggregator(on_candle_callback=candle_callback)
+    aggregator = CandleAggregator(
+        on_candle_callback=candle_callback,
+        candle_store=persister.candle_store if persister else None,
+        candle_bus=candle_bus,
+        persister=persister
+    )
     
     # Add all symbols to aggregator
     for symbol in watchlist:
         aggregator.add_symbol(symbol, exchange="NSE")
     
-    # Initialize WebSocket client
-    def tick_callback(symbol: str, price: float, volume: int, timestamp: datetime):
-        aggregator.update_tick(symbol, price, volume, timestamp)
+    # Ticks are queued on the WebSocket thread and applied to the aggregator
+    # in batches (one aggregator lock per batch)
+    tick_queue = TickBatchQueue(aggregator.update_ticks)
+    # Apply the closing minute's queued ticks before each finalization and
+    # hold back the next minute's until then
+    aggregator.pre_finalize = tick_queue.drain_until
+    aggregator.on_boundary_scheduled = tick_queue.hold_from
+    tick_queue.start()
     
+    # Initialize WebSocket client
     ws_client = IndiaWebSocketClient(
         auth_manager=auth_manager,
         instrument_master=instrument_master,
-        on_tick_callback=tick_callback,
+        on_tick_callback=tick_queue.put,
         mode=IndiaWebSocketClient.MODE_LTP
     )
     
@@ -218,6 +289,10 @@ def main():
     logger.info("Connecting to WebSocket...")
     if not ws_client.connect():
         logger.error("Failed to connect to WebSocket. Exiting.")
+        tick_queue.stop()
+        post_executor.shutdown()
+        if persister:
+            persister.stop()
         return
     
     # Subscribe to symbols
@@ -225,6 +300,10 @@ def main():
     if not ws_client.subscribe(watchlist, exchange="NSE"):
         logger.error("Failed to subscribe to symbols. Exiting.")
         ws_client.disconnect()
+        tick_queue.stop()
+        post_executor.shutdown()
+        if persister:
+            persister.stop()
         return
     
     logger.info(f"Successfully subscribed to {ws_client.get_subscribed_count()} symbols")
@@ -257,8 +336,11 @@ def main():
             time.sleep(300)
             ws_stats = ws_client.get_stats()
             agg_stats = aggregator.get_stats()
+            queue_stats = tick_queue.get_stats()
             logger.info(f"WebSocket: {ws_stats['ticks_received']} ticks, "
-                       f"Aggregator: {agg_stats['total_candles_generated']} candles")
+                       f"Aggregator: {agg_stats['total_candles_generated']} candles, "
+                       f"Queue: depth {queue_stats['depth']} (max {queue_stats['depth_high_water']})")
+            logger.info(f"Latency: ws={ws_stats['latency']}, queue={queue_stats['latency']}")
     
     except KeyboardInterrupt:
         logger.info("Keyboard interrupt received")
@@ -267,8 +349,10 @@ def main():
         # Graceful shutdown
         logger.info("Shutting down India Momentum Runner...")
         
-        # Stop aggregator
+        # Flush queued ticks, then stop aggregator
+        tick_queue.stop()
         aggregator.stop()
+        post_executor.shutdown(wait=True)
         logger.info("Candle aggregator stopped")
         
         # Unsubscribe and disconnect
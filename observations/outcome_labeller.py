@@ -0,0 +1,200 @@
+"""Batched Forward-Outcome Labeller.
+
+Fills T+k price columns (``price_t5``, ``price_t15``, ... ) of a signal review
+frame. Pending signals are grouped by symbol, each symbol's candles are loaded
+once, and every (signal, horizon) lookup is resolved with a single
+``np.searchsorted`` over the candle timestamps: the answer for T+k is the
+first candle at or after T+k, exactly as the per-row scan did.
+
+Timestamps are compared as int64 nanoseconds. Timezone-aware candle data is
+compared in UTC, with naive signal timestamps read as IST; naive candle data
+is compared on wall-clock time.
+"""
+
+import logging
+from typing import Callable, Iterable, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HORIZONS = (5, 15)
+SIGNAL_TZ = "Asia/Kolkata"
+MINUTE_NS = 60 * 1_000_000_000
+
+# (timestamps int64 ns, close, volume, tz-aware?) for one symbol, sorted
+CandleArrays = Tuple[np.ndarray, np.ndarray, np.ndarray, bool]
+CandleLoader = Callable[[str, pd.Timestamp], Optional[CandleArrays]]
+
+
+def price_column(horizon: int) -> str:
+    return f"price_t{horizon}"
+
+
+def candle_arrays(df: pd.DataFrame) -> Optional[CandleArrays]:
+    """Sorted lookup arrays from a CandleStore-style frame (None if empty)."""
+    if df is None or df.empty:
+        return None
+    ts = pd.to_datetime(df["timestamp"])
+    aware = ts.dt.tz is not None
+    if aware:
+        ts = ts.dt.tz_convert("UTC").dt.tz_localize(None)
+    ts_ns = ts.to_numpy(dtype="datetime64[ns]").view(np.int64)
+    order = np.argsort(ts_ns, kind="stable")
+    return (
+        ts_ns[order],
+        df["close"].to_numpy(dtype=float)[order],
+        df["volume"].to_numpy(dtype=float)[order],
+        aware,
+    )
+
+
+def to_epoch_ns(timestamp: pd.Timestamp, aware: bool) -> int:
+    """Express a signal timestamp in the candle data's convention."""
+    if aware:
+        if timestamp.tzinfo is None:
+            timestamp = timestamp.tz_localize(SIGNAL_TZ)
+        return timestamp.value
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.tz_localize(None)
+    return timestamp.value
+
+
+def lookup_forward(
+    candle_ts: np.ndarray,
+    base_ns: np.ndarray,
+    horizons: Sequence[int],
+) -> np.ndarray:
+    """Positions of the first candle at or after base + k minutes.
+
+    Args:
+        candle_ts: Sorted candle timestamps (int64 ns).
+        base_ns: Signal timestamps (int64 ns), shape (n,).
+        horizons: Offsets in minutes, shape (h,).
+
+    Returns:
+        int64 array of shape (n, h); ``len(candle_ts)`` marks "no candle yet".
+    """
+    offsets = np.asarray(horizons, dtype=np.int64) * MINUTE_NS
+    targets = np.asarray(base_ns, dtype=np.int64)[:, None] + offsets[None, :]
+    return np.searchsorted(candle_ts, targets.ravel(), side="left").reshape(targets.shape)
+
+
+def _is_missing(series: pd.Series) -> np.ndarray:
+    return (series.isna() | (series.astype(str) == "")).to_numpy()
+
+
+class OutcomeLabeller:
+    """Resolves forward price outcomes for many signals at once."""
+
+    def __init__(self, load_candles: CandleLoader, horizons: Iterable[int] = DEFAULT_HORIZONS):
+        """
+        Args:
+            load_candles: ``(symbol, earliest_target) -> CandleArrays`` or
+                          None, where earliest_target is the first T+k the
+                          pass needs. Called at most once per symbol.
+            horizons: Minutes after the signal to label, e.g. range(1, 61).
+        """
+        self.load_candles = load_candles
+        self.horizons = sorted({int(h) for h in horizons})
+
+    def label(self, df: pd.DataFrame, now: Optional[pd.Timestamp] = None) -> int:
+        """Fill due, missing horizon columns of df in place.
+
+        A horizon is due once ``now`` is at least T+k (wall clock now if
+        None). Also derives ``volume_t5_change``, ``outcome`` and
+        ``volume_continuation`` when the 5/15 minute horizons are filled.
+
+        Returns:
+            Number of cells filled.
+        """
+        if df.empty:
+            return 0
+
+        for h in self.horizons:
+            col = price_column(h)
+            if col not in df.columns:
+                df[col] = np.nan
+        for col in ("outcome", "volume_continuation", "classification"):
+            if col in df.columns:
+                df[col] = df[col].astype(object)
+
+        missing = np.column_stack([_is_missing(df[price_column(h)]) for h in self.horizons])
+        pending = missing.any(axis=1)
+        if not pending.any():
+            return 0
+
+        sig_times = [pd.Timestamp(t) for t in df["timestamp"]]
+        elapsed_min = self._elapsed_minutes(sig_times, now)
+        due = missing & (elapsed_min[:, None] >= np.asarray(self.horizons)[None, :])
+
+        prices = np.full(missing.shape, np.nan)
+        volumes = np.full(missing.shape, np.nan)
+        rows = np.flatnonzero(due.any(axis=1))
+        symbols = df["symbol"].to_numpy()[rows]
+
+        for symbol in pd.unique(symbols):
+            sym_rows = rows[symbols == symbol]
+            first = min(sig_times[i] for i in sym_rows)
+            arrays = self.load_candles(symbol, first + pd.Timedelta(minutes=self.horizons[0]))
+            if arrays is None:
+                continue
+            candle_ts, close, volume, aware = arrays
+            base = np.array([to_epoch_ns(sig_times[i], aware) for i in sym_rows], dtype=np.int64)
+
+            pos = lookup_forward(candle_ts, base, self.horizons)
+            found = pos < len(candle_ts)
+            safe = np.where(found, pos, 0)
+            prices[sym_rows] = np.where(found, close[safe], np.nan)
+            volumes[sym_rows] = np.where(found, volume[safe], np.nan)
+
+        fill = due & ~np.isnan(prices)
+        filled = int(fill.sum())
+        if filled:
+            self._write_back(df, fill, prices, volumes)
+        return filled
+
+    @staticmethod
+    def _elapsed_minutes(sig_times, now: Optional[pd.Timestamp]) -> np.ndarray:
+        if now is None:
+            now_naive, now_utc = pd.Timestamp.now(), pd.Timestamp.now(tz="UTC")
+        elif now.tzinfo is None:
+            now_naive, now_utc = now, now.tz_localize(SIGNAL_TZ)
+        else:
+            now_naive, now_utc = now.tz_convert(SIGNAL_TZ).tz_localize(None), now
+        return np.array([
+            ((now_utc - t) if t.tzinfo is not None else (now_naive - t)).total_seconds() / 60
+            for t in sig_times
+        ])
+
+    def _write_back(self, df: pd.DataFrame, fill: np.ndarray, prices: np.ndarray, volumes: np.ndarray) -> None:
+        index = df.index
+        for j, h in enumerate(self.horizons):
+            rows = fill[:, j]
+            if rows.any():
+                df.loc[index[rows], price_column(h)] = prices[rows, j]
+
+        if 5 in self.horizons and "volume_t5_change" in df.columns:
+            j = self.horizons.index(5)
+            rows = fill[:, j]
+            if rows.any():
+                v5 = volumes[rows, j]
+                v0 = pd.to_numeric(df.loc[index[rows], "volume_t0"], errors="coerce").to_numpy()
+                v0 = np.where(np.isnan(v0), v5, v0)
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    change = np.where(v0 > 0, np.round((v5 - v0) / v0 * 100, 2), 0)
+                df.loc[index[rows], "volume_t5_change"] = change
+
+        if 15 in self.horizons and "outcome" in df.columns:
+            rows = fill[:, self.horizons.index(15)]
+            if rows.any():
+                p15 = prices[rows, self.horizons.index(15)]
+                p0 = pd.to_numeric(df.loc[index[rows], "price_t0"], errors="coerce").to_numpy()
+                change_15m = (p15 - p0) / p0 * 100
+                df.loc[index[rows], "outcome"] = np.where(
+                    change_15m > 0.3, "Clean", np.where(change_15m < -0.1, "False", "Choppy")
+                )
+                if "volume_continuation" in df.columns:
+                    vol_change = pd.to_numeric(df.loc[index[rows], "volume_t5_change"], errors="coerce").to_numpy()
+                    df.loc[index[rows], "volume_continuation"] = np.where(vol_change > 50, "Surge", "Steady")
@@ -7,6 +7,7 @@ and store them in a reviewer-ready CSV format.
 import csv
 import os
 import logging
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, Optional
@@ -15,6 +16,10 @@ from typing import Dict, Any, Optional
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Held while a review CSV is appended to or rewritten in this process, so an
+# in-process SignalValidator rewrite cannot drop rows logged meanwhile
+REVIEW_FILE_LOCK = threading.Lock()
+
 class ObservationLogger:
     """Logs signals for Phase 4 live observation."""
 
@@ -52,7 +57,7 @@ class ObservationLogger:
         file_exists = file_path.exists()
 
         try:
-            with open(file_path, "a", newline="", encoding="utf-8") as f:
+            with REVIEW_FILE_LOCK, open(file_path, "a", newline="", encoding="utf-8") as f:
                 writer = csv.DictWriter(f, fieldnames=self.header)
                 if not file_exists:
                     writer.writeheader()
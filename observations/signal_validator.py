@@ -1,132 +1,108 @@
 """Signal Post-Validation Utility.
 
 This script monitors the signal log and validates price action 5-15 minutes
-after a signal was generated.
+after a signal was generated. Lookups are batched per symbol (see
+observations/outcome_labeller.py), so any horizon list, e.g. T+1..T+60, can
+be labelled in one pass over the review file.
+
+Usage:
+    python observations/signal_validator.py                      # poll today's file
+    python observations/signal_validator.py --once --date 2026-01-14 --horizons 1-60
 """
 
+import argparse
 import pandas as pd
 import numpy as np
 import time
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, List, Optional
+
+from ingestion.india_ingestion.candle_bus import CandleBus
+from ingestion.india_ingestion.candle_store import CandleStore
+from observations.outcome_labeller import (
+    DEFAULT_HORIZONS,
+    CandleArrays,
+    OutcomeLabeller,
+    candle_arrays,
+    lookup_forward,
+    to_epoch_ns,
+)
+from observations.signal_logger import REVIEW_FILE_LOCK
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger("SignalValidator")
 
 class SignalValidator:
-    def __init__(self, review_dir: str = "observations/signal_reviews"):
+    def __init__(
+        self,
+        review_dir: str = "observations/signal_reviews",
+        candle_bus: Optional[CandleBus] = None,
+        horizons: Iterable[int] = DEFAULT_HORIZONS
+    ):
         self.review_dir = Path(review_dir)
         self.processed_data_path = Path("data/processed/candles/intraday")
+        self.candle_store = CandleStore(str(self.processed_data_path))
+        # When run inside the live process, lookups hit memory instead of Parquet
+        self.candle_bus = candle_bus
+        self.labeller = OutcomeLabeller(self._load_candles, horizons)
 
-    def _get_latest_review_file(self) -> Optional[Path]:
-        date_str = datetime.now().strftime("%Y-%m-%d")
+    def _get_latest_review_file(self, date_str: Optional[str] = None) -> Optional[Path]:
+        date_str = date_str or datetime.now().strftime("%Y-%m-%d")
         file_path = self.review_dir / f"signals_for_review_{date_str}.csv"
         return file_path if file_path.exists() else None
 
-    def _get_price_at_timestamp(self, symbol: str, timestamp_str: str, offset_mins: int = 0) -> Optional[tuple]:
-        """Fetch price and volume for a symbol at T + offset_mins."""
-        file_path = self.processed_data_path / f"NSE_{symbol}_1m.parquet"
-        if not file_path.exists():
+    def _load_candles(self, symbol: str, earliest_target: pd.Timestamp) -> Optional[CandleArrays]:
+        """Lookup arrays for a symbol: the bus if it covers earliest_target, else disk."""
+        if self.candle_bus is not None and self.candle_bus.has(symbol, "NSE"):
+            view = self.candle_bus.view(symbol, "NSE")
+            aware = view.tz is not None
+            ts_ns = view.timestamp.view(np.int64)
+            if to_epoch_ns(earliest_target, aware) >= ts_ns[0]:
+                return ts_ns, view.close, view.volume, aware
+
+        if not self.candle_store.exists(symbol, "NSE"):
             return None
-        
         try:
-            df = pd.read_parquet(file_path)
-            target_time = pd.to_datetime(timestamp_str) + timedelta(minutes=offset_mins)
-            
-            # Ensure target_time matches df['timestamp'] timezone awareness
-            if df['timestamp'].dt.tz is not None:
-                if target_time.tzinfo is None:
-                    target_time = target_time.tz_localize('Asia/Kolkata')
-                else:
-                    target_time = target_time.tz_convert(df['timestamp'].dt.tz)
-            else:
-                if target_time.tzinfo is not None:
-                    target_time = target_time.tz_localize(None)
-
-            # Find the closest candle at or after target_time
-            mask = df['timestamp'] >= target_time
-            matches = df[mask]
-            
-            if not matches.empty:
-                latest = matches.iloc[0]
-                return float(latest['close']), float(latest['volume'])
+            return candle_arrays(self.candle_store.read(symbol, "NSE"))
         except Exception as e:
             logger.error(f"Error reading data for {symbol}: {e}")
-        
-        return None
+            return None
 
-    def validate_signals(self):
-        file_path = self._get_latest_review_file()
+    def _get_price_at_timestamp(self, symbol: str, timestamp_str: str, offset_mins: int = 0) -> Optional[tuple]:
+        """Fetch price and volume for a symbol at T + offset_mins."""
+        sig_time = pd.to_datetime(timestamp_str)
+        arrays = self._load_candles(symbol, sig_time + pd.Timedelta(minutes=offset_mins))
+        if arrays is None:
+            return None
+
+        candle_ts, close, volume, aware = arrays
+        pos = int(lookup_forward(candle_ts, [to_epoch_ns(sig_time, aware)], [offset_mins])[0, 0])
+        if pos == len(candle_ts):
+            return None
+        return float(close[pos]), float(volume[pos])
+
+    def validate_signals(self, date_str: Optional[str] = None, now: Optional[pd.Timestamp] = None):
+        """Label every due horizon of the day's review file and write it back once."""
+        file_path = self._get_latest_review_file(date_str)
         if not file_path:
             logger.info("No review file found for today.")
             return
 
-        df = pd.read_csv(file_path)
-        if df.empty:
-            return
+        # Rows appended by ObservationLogger while we label would be lost on
+        # write-back, so the read-label-write runs under the shared file lock
+        with REVIEW_FILE_LOCK:
+            df = pd.read_csv(file_path)
+            if df.empty:
+                return
 
-        # Ensure columns that might store strings are object type to avoid warnings
-        for col in ['outcome', 'volume_continuation', 'classification']:
-            if col in df.columns:
-                df[col] = df[col].astype(object)
-
-        updated = False
-        
-        for idx, row in df.iterrows():
-            # Skip if already fully validated
-            if pd.notna(row['price_t15']) and row['price_t15'] != "":
-                continue
-
-            sig_time = pd.to_datetime(row['timestamp'])
-            
-            # Ensure 'now' matches sig_time's awareness
-            if sig_time.tzinfo is not None:
-                now = pd.Timestamp.now(tz=sig_time.tzinfo)
-            else:
-                now = pd.Timestamp.now()
-
-            # 5-minute validation
-            if pd.isna(row['price_t5']) or row['price_t5'] == "":
-                if now >= sig_time + timedelta(minutes=5):
-                    result = self._get_price_at_timestamp(row['symbol'], row['timestamp'], 5)
-                    if result:
-                        p5, v5 = result
-                        df.at[idx, 'price_t5'] = p5
-                        # Volume change relative to T0
-                        p0 = float(row['price_t0']) if pd.notna(row['price_t0']) else p5
-                        v0 = float(row['volume_t0']) if pd.notna(row['volume_t0']) else v5
-                        df.at[idx, 'volume_t5_change'] = round(((v5 - v0) / v0 * 100), 2) if v0 > 0 else 0
-                        updated = True
-
-            # 15-minute validation
-            if pd.isna(row['price_t15']) or row['price_t15'] == "":
-                if now >= sig_time + timedelta(minutes=15):
-                    result = self._get_price_at_timestamp(row['symbol'], row['timestamp'], 15)
-                    if result:
-                        p15, v15 = result
-                        df.at[idx, 'price_t15'] = p15
-                        
-                        # Apply naive outcome classification
-                        p0 = float(row['price_t0'])
-                        p5 = float(df.at[idx, 'price_t5'])
-                        
-                        change_15m = (p15 - p0) / p0 * 100
-                        if change_15m > 0.3:
-                            df.at[idx, 'outcome'] = "Clean"
-                        elif change_15m < -0.1:
-                            df.at[idx, 'outcome'] = "False"
-                        else:
-                            df.at[idx, 'outcome'] = "Choppy"
-                            
-                        df.at[idx, 'volume_continuation'] = "Surge" if float(df.at[idx, 'volume_t5_change']) > 50 else "Steady"
-                        updated = True
-
-        if updated:
-            df.to_csv(file_path, index=False)
-            logger.info(f"Updated {file_path} with new validation data.")
+            filled = self.labeller.label(df, now=now)
+            if filled:
+                df.to_csv(file_path, index=False)
+        if filled:
+            logger.info(f"Updated {file_path} with {filled} new validation values.")
 
     def run_continually(self, interval_sec: int = 60):
         logger.info(f"Starting Signal Validator (Poll interval: {interval_sec}s)")
@@ -134,6 +110,31 @@ class SignalValidator:
             self.validate_signals()
             time.sleep(interval_sec)
 
+
+def parse_horizons(spec: str) -> List[int]:
+    """Parse '5,15' or '1-60' (or a mix, '1-10,15,30') into minutes."""
+    horizons = []
+    for part in spec.split(","):
+        part = part.strip()
+        if "-" in part:
+            lo, hi = part.split("-", 1)
+            horizons.extend(range(int(lo), int(hi) + 1))
+        elif part:
+            horizons.append(int(part))
+    return horizons
+
+
 if __name__ == "__main__":
-    validator = SignalValidator()
-    validator.run_continually()
+    parser = argparse.ArgumentParser(description="Label signal review files with forward price outcomes")
+    parser.add_argument("--horizons", default=",".join(str(h) for h in DEFAULT_HORIZONS),
+                        help="Minutes after the signal, e.g. '5,15' or '1-60'")
+    parser.add_argument("--date", default=None, help="Review file date (YYYY-MM-DD), default today")
+    parser.add_argument("--once", action="store_true", help="Label once and exit (end-of-day mode)")
+    parser.add_argument("--interval", type=int, default=60)
+    args = parser.parse_args()
+
+    validator = SignalValidator(horizons=parse_horizons(args.horizons))
+    if args.once:
+        validator.validate_signals(date_str=args.date)
+    else:
+        validator.run_continually(args.interval)
@@ -22,11 +22,13 @@ from .metrics import (
     calculate_avg_r,
 )
 from .runner import BacktestRunner
+from .sweep import ParameterSweep
 
 __all__ = [
     "BacktestEngine",
     "HistoricalDataAdapter",
     "BacktestRunner",
+    "ParameterSweep",
     "calculate_win_rate",
     "calculate_expectancy",
     "calculate_max_drawdown",
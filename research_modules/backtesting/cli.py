@@ -56,6 +56,12 @@ def main(argv=None):
         action="store_true",
         help="REQUIRED: Explicitly acknowledge this is research-only",
     )
+    parser.add_argument(
+        "--engine-mode",
+        choices=["event", "fast"],
+        default="event",
+        help="Engine loop: 'event' (iterrows reference) or 'fast' (column arrays) (default: event)",
+    )
     parser.add_argument(
         "--strategy",
         default="example",
@@ -118,6 +124,7 @@ def main(argv=None):
         data_path=args.data_path,
         data_file=args.data_file,
         initial_capital=args.initial_capital,
+        engine_mode=args.engine_mode,
     )
 
     runner = BacktestRunner(config)
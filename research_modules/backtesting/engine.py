@@ -5,15 +5,22 @@
 Backtesting Engine Core
 
 Event-driven backtesting engine for historical strategy validation.
+
+Three execution modes share the same fill/PnL rules:
+- run():            row-by-row over DataFrame.iterrows() (reference mode)
+- run_fast():       row-by-row over column arrays with a reusable CandleView
+- run_vectorized(): whole entry/exit signal arrays from a VectorizedStrategyBase
 ##############################################################################
 """
 
 import os
 import logging
+from collections.abc import Mapping
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional, Callable
+from typing import List, Dict, Any, Optional, Callable, Iterator, Tuple, Union
 from datetime import datetime
 
+import numpy as np
 import pandas as pd
 
 logger = logging.getLogger(__name__)
@@ -83,6 +90,57 @@ class StrategyBase:
         raise NotImplementedError("Subclasses must implement on_candle")
 
 
+class VectorizedStrategyBase:
+    """Abstract base class for strategies that emit whole signal arrays.
+
+    Used with BacktestEngine.run_vectorized(). On each bar, an entry signal
+    opens a LONG when flat and an exit signal closes it when in a position,
+    exactly as a StrategyBase returning BUY/SELL on the same bars would.
+    """
+
+    def generate_signals(
+        self, data: pd.DataFrame
+    ) -> Tuple[np.ndarray, np.ndarray, Union[int, np.ndarray]]:
+        """Compute signals for every bar at once.
+
+        Args:
+            data: Timestamp-sorted OHLCV DataFrame.
+
+        Returns:
+            Tuple of (entries, exits, quantity): boolean arrays of len(data)
+            and either a scalar quantity or a per-bar quantity array.
+        """
+        raise NotImplementedError("Subclasses must implement generate_signals")
+
+
+class CandleView(Mapping):
+    """Read-only, reusable dict-like view of one row of column arrays.
+
+    run_fast() passes the same instance to every on_candle() call and only
+    moves its row position, so strategies must copy (``to_dict()``) any
+    candle they want to keep beyond the current call.
+    """
+
+    __slots__ = ("_columns", "_pos")
+
+    def __init__(self, columns: Dict[str, list]):
+        self._columns = columns
+        self._pos = 0
+
+    def __getitem__(self, key: str) -> Any:
+        return self._columns[key][self._pos]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._columns)
+
+    def __len__(self) -> int:
+        return len(self._columns)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return a detached copy of the current candle."""
+        return {key: values[self._pos] for key, values in self._columns.items()}
+
+
 # ---------------------------------------------------------------------------
 # Backtest Engine
 # ---------------------------------------------------------------------------
@@ -149,39 +207,11 @@ class BacktestEngine:
             if action is None:
                 pass
             elif action.get("action") == "BUY" and state["position"] is None:
-                # Open a LONG position
-                entry_price = candle["close"] * (1 + self.slippage_pct / 100)
-                quantity = action.get("quantity", 1)
-                trade = Trade(
-                    entry_time=candle["timestamp"],
-                    exit_time=None,
-                    symbol=candle.get("symbol", "UNKNOWN"),
-                    side="LONG",
-                    entry_price=entry_price,
-                    quantity=quantity,
-                )
-                state["position"] = trade
-                state["capital"] -= self.commission_per_trade
-                logger.debug(f"Opened LONG at {entry_price} on {candle['timestamp']}")
+                self._open_long(state, candle["timestamp"], candle.get("symbol", "UNKNOWN"),
+                                candle["close"], action.get("quantity", 1))
 
             elif action.get("action") == "SELL" and state["position"] is not None:
-                # Close the LONG position
-                trade = state["position"]
-                exit_price = candle["close"] * (1 - self.slippage_pct / 100)
-                trade.exit_price = exit_price
-                trade.exit_time = candle["timestamp"]
-                trade.pnl = (exit_price - trade.entry_price) * trade.quantity - self.commission_per_trade
-                
-                # Calculate R-multiple
-                risk_amount = self.initial_capital * (risk_per_trade_pct / 100)
-                if risk_amount > 0:
-                    trade.r_multiple = trade.pnl / risk_amount
-                
-                trade.is_closed = True
-                result.trades.append(trade)
-                state["capital"] += trade.pnl
-                state["position"] = None
-                logger.debug(f"Closed LONG at {exit_price}, PnL: {trade.pnl:.2f}")
+                self._close_long(state, result, candle["timestamp"], candle["close"], risk_per_trade_pct)
 
             # Update equity curve
             current_equity = state["capital"]
@@ -193,3 +223,216 @@ class BacktestEngine:
 
         result.final_capital = state["capital"]
         return result
+
+    def run_fast(
+        self,
+        strategy: StrategyBase,
+        data: pd.DataFrame,
+        risk_per_trade_pct: float = 1.0,
+    ) -> BacktestResult:
+        """Execute a backtest over column arrays instead of iterrows().
+
+        Same semantics and results as run(), trade for trade. The strategy
+        receives a reusable CandleView rather than a fresh dict per row, and
+        the equity curve is filled into a preallocated array.
+
+        Args:
+            strategy: A StrategyBase implementation.
+            data: DataFrame with columns: timestamp, open, high, low, close, volume.
+            risk_per_trade_pct: Percentage of capital risked per trade for R calculation.
+
+        Returns:
+            BacktestResult with trade log and equity curve.
+        """
+        if data.empty:
+            logger.warning("Empty data provided to backtest engine.")
+            return BacktestResult(initial_capital=self.initial_capital)
+
+        data = data.sort_values("timestamp").reset_index(drop=True)
+        n = len(data)
+
+        result = BacktestResult(
+            initial_capital=self.initial_capital,
+            start_time=data["timestamp"].iloc[0],
+            end_time=data["timestamp"].iloc[-1],
+        )
+
+        # Python lists give the cheapest per-element access in the loop
+        columns = {col: data[col].tolist() for col in data.columns}
+        close = columns["close"]
+        timestamps = columns["timestamp"]
+        symbols = columns.get("symbol")
+        candle = CandleView(columns)
+
+        equity = np.empty(n + 1, dtype=float)
+        equity[0] = self.initial_capital
+
+        state: Dict[str, Any] = {
+            "position": None,
+            "capital": self.initial_capital,
+        }
+
+        for i in range(n):
+            candle._pos = i
+            action = strategy.on_candle(candle, state)
+
+            if action is not None:
+                kind = action.get("action")
+                if kind == "BUY" and state["position"] is None:
+                    symbol = symbols[i] if symbols is not None else "UNKNOWN"
+                    self._open_long(state, timestamps[i], symbol, close[i], action.get("quantity", 1))
+                elif kind == "SELL" and state["position"] is not None:
+                    self._close_long(state, result, timestamps[i], close[i], risk_per_trade_pct)
+
+            current_equity = state["capital"]
+            position = state["position"]
+            if position is not None:
+                current_equity += (close[i] - position.entry_price) * position.quantity
+            equity[i + 1] = current_equity
+
+        result.equity_curve = equity.tolist()
+        result.final_capital = state["capital"]
+        return result
+
+    def run_vectorized(
+        self,
+        strategy: VectorizedStrategyBase,
+        data: pd.DataFrame,
+        risk_per_trade_pct: float = 1.0,
+    ) -> BacktestResult:
+        """Execute a backtest from whole entry/exit signal arrays.
+
+        Only bars carrying a signal are visited in Python; the equity curve
+        is assembled with array operations. Results match run() for a
+        StrategyBase that returns BUY/SELL on the same bars.
+
+        Args:
+            strategy: A VectorizedStrategyBase implementation.
+            data: DataFrame with columns: timestamp, open, high, low, close, volume.
+            risk_per_trade_pct: Percentage of capital risked per trade for R calculation.
+
+        Returns:
+            BacktestResult with trade log and equity curve.
+        """
+        if data.empty:
+            logger.warning("Empty data provided to backtest engine.")
+            return BacktestResult(initial_capital=self.initial_capital)
+
+        data = data.sort_values("timestamp").reset_index(drop=True)
+        n = len(data)
+
+        result = BacktestResult(
+            initial_capital=self.initial_capital,
+            start_time=data["timestamp"].iloc[0],
+            end_time=data["timestamp"].iloc[-1],
+        )
+
+        entries, exits, quantity = strategy.generate_signals(data)
+        entries = np.asarray(entries, dtype=bool)
+        exits = np.asarray(exits, dtype=bool)
+        if entries.shape != (n,) or exits.shape != (n,):
+            raise ValueError(f"Signal arrays must have length {n}")
+        quantities = np.broadcast_to(np.asarray(quantity), (n,)).tolist()
+
+        close_arr = data["close"].to_numpy(dtype=float)
+        close = data["close"].tolist()
+        timestamps = data["timestamp"].tolist()
+        symbols = data["symbol"].tolist() if "symbol" in data.columns else None
+
+        state: Dict[str, Any] = {
+            "position": None,
+            "capital": self.initial_capital,
+        }
+
+        # Realized capital and open position after each bar
+        capital = np.empty(n, dtype=float)
+        entry_price = np.full(n, np.nan)
+        position_qty = np.zeros(n, dtype=float)
+
+        last = 0
+        for i in np.flatnonzero(entries | exits).tolist():
+            # Carry state forward over bars without signals
+            self._fill_state(state, capital, entry_price, position_qty, last, i)
+
+            if entries[i] and state["position"] is None:
+                symbol = symbols[i] if symbols is not None else "UNKNOWN"
+                self._open_long(state, timestamps[i], symbol, close[i], quantities[i])
+            elif exits[i] and state["position"] is not None:
+                self._close_long(state, result, timestamps[i], close[i], risk_per_trade_pct)
+            last = i
+        self._fill_state(state, capital, entry_price, position_qty, last, n)
+
+        equity = np.empty(n + 1, dtype=float)
+        equity[0] = self.initial_capital
+        in_position = ~np.isnan(entry_price)
+        equity[1:] = capital
+        equity[1:][in_position] += (close_arr[in_position] - entry_price[in_position]) * position_qty[in_position]
+
+        result.equity_curve = equity.tolist()
+        result.final_capital = state["capital"]
+        return result
+
+    # ------------------------------------------------------------------
+    # Shared fill/PnL rules
+    # ------------------------------------------------------------------
+    def _open_long(
+        self, state: Dict[str, Any], timestamp: Any, symbol: str, close: float, quantity: int
+    ) -> None:
+        """Open a LONG position at the slipped close."""
+        entry_price = close * (1 + self.slippage_pct / 100)
+        trade = Trade(
+            entry_time=timestamp,
+            exit_time=None,
+            symbol=symbol,
+            side="LONG",
+            entry_price=entry_price,
+            quantity=quantity,
+        )
+        state["position"] = trade
+        state["capital"] -= self.commission_per_trade
+        logger.debug(f"Opened LONG at {entry_price} on {timestamp}")
+
+    def _close_long(
+        self,
+        state: Dict[str, Any],
+        result: BacktestResult,
+        timestamp: Any,
+        close: float,
+        risk_per_trade_pct: float,
+    ) -> None:
+        """Close the open LONG position at the slipped close."""
+        trade = state["position"]
+        exit_price = close * (1 - self.slippage_pct / 100)
+        trade.exit_price = exit_price
+        trade.exit_time = timestamp
+        trade.pnl = (exit_price - trade.entry_price) * trade.quantity - self.commission_per_trade
+
+        # Calculate R-multiple
+        risk_amount = self.initial_capital * (risk_per_trade_pct / 100)
+        if risk_amount > 0:
+            trade.r_multiple = trade.pnl / risk_amount
+
+        trade.is_closed = True
+        result.trades.append(trade)
+        state["capital"] += trade.pnl
+        state["position"] = None
+        logger.debug(f"Closed LONG at {exit_price}, PnL: {trade.pnl:.2f}")
+
+    @staticmethod
+    def _fill_state(
+        state: Dict[str, Any],
+        capital: np.ndarray,
+        entry_price: np.ndarray,
+        position_qty: np.ndarray,
+        start: int,
+        stop: int,
+    ) -> None:
+        """Record the current capital/position for bars [start, stop)."""
+        capital[start:stop] = state["capital"]
+        position = state["position"]
+        if position is not None:
+            entry_price[start:stop] = position.entry_price
+            position_qty[start:stop] = position.quantity
+        else:
+            entry_price[start:stop] = np.nan
+            position_qty[start:stop] = 0.0
@@ -11,12 +11,12 @@ execution, and metrics calculation.
 
 import logging
 from dataclasses import dataclass, field
-from typing import Dict, Any, Optional, Type
+from typing import Dict, Any, Optional, Type, Union
 from pathlib import Path
 
 import pandas as pd
 
-from .engine import BacktestEngine, BacktestResult, StrategyBase
+from .engine import BacktestEngine, BacktestResult, StrategyBase, VectorizedStrategyBase
 from .data_adapter import HistoricalDataAdapter
 from .metrics import (
     calculate_win_rate,
@@ -39,6 +39,10 @@ class RunnerConfig:
     slippage_pct: float = 0.05
     commission_per_trade: float = 20.0
     risk_per_trade_pct: float = 1.0
+    engine_mode: str = "event"  # "event" (iterrows) or "fast" (column arrays)
+
+
+ENGINE_MODES = ("event", "fast")
 
 
 @dataclass
@@ -62,6 +66,8 @@ class BacktestRunner:
         Args:
             config: RunnerConfig with data path and engine settings.
         """
+        if config.engine_mode not in ENGINE_MODES:
+            raise ValueError(f"Unknown engine_mode '{config.engine_mode}'. Expected one of {ENGINE_MODES}.")
         self.config = config
         self.adapter = HistoricalDataAdapter(config.data_path)
         self.engine = BacktestEngine(
@@ -70,25 +76,49 @@ class BacktestRunner:
             commission_per_trade=config.commission_per_trade,
         )
 
-    def run(self, strategy: StrategyBase) -> RunnerReport:
+    def run(self, strategy: Union[StrategyBase, VectorizedStrategyBase]) -> RunnerReport:
         """Execute a full backtest run.
 
+        Vectorized strategies always use the vectorized engine path; other
+        strategies use the path selected by ``config.engine_mode``.
+
         Args:
-            strategy: A StrategyBase implementation to test.
+            strategy: A StrategyBase or VectorizedStrategyBase implementation to test.
 
         Returns:
             RunnerReport with results and calculated metrics.
         """
         logger.info(f"Starting backtest with data: {self.config.data_file}")
 
-        # Load data
+        return self.run_on_data(strategy, self.load_data())
+
+    def load_data(self) -> pd.DataFrame:
+        """Load the configured data file through the historical adapter."""
         if self.config.data_file.endswith(".parquet"):
-            data = self.adapter.load_parquet(self.config.data_file)
-        else:
-            data = self.adapter.load_csv(self.config.data_file)
+            return self.adapter.load_parquet(self.config.data_file)
+        return self.adapter.load_csv(self.config.data_file)
+
+    def run_on_data(
+        self, strategy: Union[StrategyBase, VectorizedStrategyBase], data: pd.DataFrame
+    ) -> RunnerReport:
+        """Run the engine and metrics on already-loaded data.
 
+        Args:
+            strategy: A StrategyBase or VectorizedStrategyBase implementation to test.
+            data: Historical OHLCV DataFrame.
+
+        Returns:
+            RunnerReport with results and calculated metrics.
+        """
         # Run engine
-        result = self.engine.run(
+        if isinstance(strategy, VectorizedStrategyBase):
+            run = self.engine.run_vectorized
+        elif self.config.engine_mode == "fast":
+            run = self.engine.run_fast
+        else:
+            run = self.engine.run
+
+        result = run(
             strategy=strategy,
             data=data,
             risk_per_trade_pct=self.config.risk_per_trade_pct,
@@ -0,0 +1,76 @@
+"""
+##############################################################################
+## RESEARCH ONLY - NOT FOR LIVE TRADING
+##############################################################################
+Backtest Strategies
+
+Reference strategies for research backtests and parameter sweeps.
+##############################################################################
+"""
+
+from typing import Any, Dict, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .engine import VectorizedStrategyBase
+
+
+class MomentumThresholdStrategy(VectorizedStrategyBase):
+    """Momentum v0 entries with a fixed holding period.
+
+    Entries use the live MomentumEngine criteria (price > VWAP, near HOD,
+    relative volume surge) with the thresholds under study; each position is
+    closed ``hold_bars`` candles after entry. Entries that fire while a
+    position is open are ignored, as in the event-driven engine.
+    """
+
+    def __init__(
+        self,
+        vol_multiplier: float = 2.0,
+        hod_proximity_pct: float = 0.5,
+        vol_ma_window: int = 20,
+        hold_bars: int = 15,
+        quantity: int = 1,
+    ):
+        self.vol_multiplier = vol_multiplier
+        self.hod_proximity_pct = hod_proximity_pct
+        self.vol_ma_window = vol_ma_window
+        self.hold_bars = hold_bars
+        self.quantity = quantity
+
+    @classmethod
+    def from_params(cls, params: Dict[str, Any]) -> "MomentumThresholdStrategy":
+        """Strategy factory for ParameterSweep (picklable, top-level)."""
+        return cls(**params)
+
+    def generate_signals(self, data: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray, int]:
+        """Compute accepted entries and their time-based exits."""
+        # Imported lazily: research modules only read the engine's criteria
+        from src.core_modules.momentum_engine.momentum_engine import MomentumEngine
+
+        engine = MomentumEngine(
+            vol_ma_window=self.vol_ma_window,
+            hod_proximity_pct=self.hod_proximity_pct,
+            vol_multiplier=self.vol_multiplier,
+        )
+        if not pd.api.types.is_datetime64_any_dtype(data["timestamp"]):
+            data = data.assign(timestamp=pd.to_datetime(data["timestamp"]))
+        raw_entries = engine.signal_mask(data)
+
+        n = len(data)
+        entries = np.zeros(n, dtype=bool)
+        exits = np.zeros(n, dtype=bool)
+
+        # Walk candidate entries only; skip those inside an open holding period
+        free_from = 0
+        for i in np.flatnonzero(raw_entries).tolist():
+            if i < free_from:
+                continue
+            exit_idx = i + self.hold_bars
+            entries[i] = True
+            if exit_idx < n:
+                exits[exit_idx] = True
+            free_from = exit_idx + 1
+
+        return entries, exits, self.quantity
@@ -0,0 +1,326 @@
+"""
+##############################################################################
+## RESEARCH ONLY - NOT FOR LIVE TRADING
+##############################################################################
+Parameter Sweep
+
+Grid search on top of BacktestRunner. The dataset is loaded once and
+published to worker processes through shared memory; each grid point runs
+on a process pool and its RunnerReport metrics are appended to a results
+log as soon as it finishes. Completed points are keyed by a hash of the
+effective engine configuration, the strategy parameters and the data, so an
+interrupted sweep resumes where it stopped and unchanged points are never
+recomputed. A point that raises is logged and left out of the results, so
+the next run retries it.
+##############################################################################
+"""
+
+import hashlib
+import itertools
+import json
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import fields, replace
+from multiprocessing import shared_memory
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .runner import BacktestRunner, RunnerConfig
+
+logger = logging.getLogger(__name__)
+
+# Grid keys that configure the engine rather than the strategy
+CONFIG_PARAMS = {f.name for f in fields(RunnerConfig)} - {"data_path", "data_file"}
+
+StrategyFactory = Callable[[Dict[str, Any]], Any]
+
+
+# ---------------------------------------------------------------------------
+# Shared-memory dataset
+# ---------------------------------------------------------------------------
+class SharedFrame:
+    """A DataFrame published once into a shared memory block.
+
+    Numeric and boolean columns are stored as raw arrays, datetimes as int64
+    nanoseconds (timezone kept in the spec) and everything else as
+    categorical codes. Workers rebuild a DataFrame over the shared buffer
+    without copying the data through a pipe.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        columns = []
+        arrays = []
+        offset = 0
+        for name in df.columns:
+            series = df[name]
+            extra: Dict[str, Any] = {}
+            if pd.api.types.is_datetime64_any_dtype(series):
+                tz = getattr(series.dt, "tz", None)
+                extra["tz"] = str(tz) if tz is not None else None
+                kind = "datetime"
+                values = series.dt.tz_convert("UTC").dt.tz_localize(None) if tz is not None else series
+                array = values.to_numpy(dtype="datetime64[ns]").view(np.int64)
+            elif pd.api.types.is_bool_dtype(series) or pd.api.types.is_numeric_dtype(series):
+                kind = "numeric"
+                array = series.to_numpy()
+            else:
+                kind = "category"
+                categorical = pd.Categorical(series)
+                extra["categories"] = list(categorical.categories)
+                array = categorical.codes.astype(np.int32)
+
+            array = np.ascontiguousarray(array)
+            columns.append({
+                "name": name,
+                "kind": kind,
+                "dtype": array.dtype.str,
+                "offset": offset,
+                **extra,
+            })
+            arrays.append(array)
+            # Keep every column 8-byte aligned
+            offset += -(-array.nbytes // 8) * 8
+
+        self._shm = shared_memory.SharedMemory(create=True, size=max(offset, 1))
+        for spec, array in zip(columns, arrays):
+            target = np.ndarray(array.shape, dtype=array.dtype, buffer=self._shm.buf, offset=spec["offset"])
+            target[:] = array
+
+        self.spec = {"shm_name": self._shm.name, "n_rows": len(df), "columns": columns}
+
+    @staticmethod
+    def attach(spec: Dict[str, Any]) -> Tuple[shared_memory.SharedMemory, pd.DataFrame]:
+        """Open a published frame. Keep the returned handle alive while in use."""
+        shm = shared_memory.SharedMemory(name=spec["shm_name"])
+        n = spec["n_rows"]
+        data = {}
+        for col in spec["columns"]:
+            array = np.ndarray((n,), dtype=np.dtype(col["dtype"]), buffer=shm.buf, offset=col["offset"])
+            if col["kind"] == "datetime":
+                values = pd.to_datetime(array.view("datetime64[ns]"))
+                if col["tz"] is not None:
+                    values = values.tz_localize("UTC").tz_convert(col["tz"])
+                data[col["name"]] = values
+            elif col["kind"] == "category":
+                data[col["name"]] = pd.Categorical.from_codes(array, col["categories"]).astype(object)
+            else:
+                data[col["name"]] = array
+        return shm, pd.DataFrame(data, copy=False)
+
+    def close(self) -> None:
+        """Release and unlink the shared block (owner only)."""
+        self._shm.close()
+        try:
+            self._shm.unlink()
+        except FileNotFoundError:
+            pass
+
+
+# Worker-process globals, set by _init_worker
+_WORKER_SHM: Optional[shared_memory.SharedMemory] = None
+_WORKER_DATA: Optional[pd.DataFrame] = None
+
+
+def _init_worker(spec: Dict[str, Any]) -> None:
+    global _WORKER_SHM, _WORKER_DATA
+    _WORKER_SHM, _WORKER_DATA = SharedFrame.attach(spec)
+
+
+def split_params(base_config: RunnerConfig, params: Dict[str, Any]) -> Tuple[RunnerConfig, Dict[str, Any]]:
+    """Effective RunnerConfig of a grid point and its strategy parameters."""
+    config_overrides = {k: v for k, v in params.items() if k in CONFIG_PARAMS}
+    strategy_params = {k: v for k, v in params.items() if k not in CONFIG_PARAMS}
+    return replace(base_config, **config_overrides), strategy_params
+
+
+def _run_point(
+    base_config: RunnerConfig,
+    params: Dict[str, Any],
+    strategy_factory: StrategyFactory,
+    data: Optional[pd.DataFrame] = None,
+) -> Dict[str, Any]:
+    """Run one grid point and return its metrics."""
+    config, strategy_params = split_params(base_config, params)
+
+    runner = BacktestRunner(config)
+    strategy = strategy_factory(strategy_params)
+    report = runner.run_on_data(strategy, _WORKER_DATA if data is None else data)
+    return report.metrics
+
+
+# ---------------------------------------------------------------------------
+# Sweep
+# ---------------------------------------------------------------------------
+def expand_grid(param_grid: Dict[str, List[Any]]) -> List[Dict[str, Any]]:
+    """Cartesian product of a parameter grid, in key order."""
+    keys = list(param_grid)
+    return [dict(zip(keys, values)) for values in itertools.product(*(param_grid[k] for k in keys))]
+
+
+def hash_dataframe(df: pd.DataFrame) -> str:
+    """Content hash of a DataFrame (values, index and column names)."""
+    digest = hashlib.sha256()
+    digest.update(json.dumps([str(c) for c in df.columns]).encode())
+    digest.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def point_key(base_config: RunnerConfig, params: Dict[str, Any], data_hash: str, strategy_name: str) -> str:
+    """Cache key for one grid point.
+
+    Covers every engine setting in effect (base config plus grid overrides),
+    so changing e.g. the base slippage or capital does not reuse old results.
+    The data location is left out; the data hash stands in for it.
+    """
+    config, strategy_params = split_params(base_config, params)
+    engine = {name: getattr(config, name) for name in sorted(CONFIG_PARAMS)}
+    payload = json.dumps({"config": engine, "params": strategy_params, "data": data_hash,
+                          "strategy": strategy_name}, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()[:24]
+
+
+class ParameterSweep:
+    """Resumable grid search over BacktestRunner configurations.
+
+    Grid keys named like RunnerConfig fields (``slippage_pct``,
+    ``commission_per_trade``, ``risk_per_trade_pct``, ``engine_mode``, ...)
+    override the engine configuration; all other keys are passed to
+    ``strategy_factory`` to build the strategy for that point.
+
+    Results are appended to ``<results_dir>/results.jsonl``, one line per
+    completed point, so they stream while the sweep runs.
+    """
+
+    RESULTS_FILE = "results.jsonl"
+
+    def __init__(
+        self,
+        config: RunnerConfig,
+        strategy_factory: StrategyFactory,
+        param_grid: Dict[str, List[Any]],
+        results_dir: str,
+        max_workers: Optional[int] = None,
+    ):
+        """Initialize the sweep.
+
+        Args:
+            config: Base RunnerConfig (data location and engine defaults).
+            strategy_factory: Picklable callable mapping strategy params to a
+                              StrategyBase or VectorizedStrategyBase.
+            param_grid: Mapping of parameter name to candidate values.
+            results_dir: Explicit directory for the results log and cache.
+            max_workers: Pool size; 1 runs in-process (defaults to CPU count).
+        """
+        if not results_dir:
+            raise ValueError("results_dir cannot be empty. Explicit path required.")
+        self.config = config
+        self.strategy_factory = strategy_factory
+        self.param_grid = param_grid
+        self.results_dir = Path(results_dir)
+        self.max_workers = max_workers or os.cpu_count() or 1
+
+    @property
+    def results_path(self) -> Path:
+        return self.results_dir / self.RESULTS_FILE
+
+    def _strategy_name(self) -> str:
+        factory = self.strategy_factory
+        return f"{getattr(factory, '__module__', '')}.{getattr(factory, '__qualname__', repr(factory))}"
+
+    def load_completed(self) -> Dict[str, Dict[str, Any]]:
+        """Read completed points from the results log, keyed by point key."""
+        completed: Dict[str, Dict[str, Any]] = {}
+        if not self.results_path.exists():
+            return completed
+        with open(self.results_path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # A run killed mid-write leaves a partial last line
+                    logger.warning("Skipping malformed line in sweep results log")
+                    continue
+                completed[record["key"]] = record
+        return completed
+
+    def _append(self, record: Dict[str, Any]) -> None:
+        with open(self.results_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, default=str) + "\n")
+            f.flush()
+
+    def run(self) -> pd.DataFrame:
+        """Run all grid points not already in the results log.
+
+        Returns:
+            Results table with one row per grid point (parameters + metrics),
+            in grid order.
+        """
+        self.results_dir.mkdir(parents=True, exist_ok=True)
+
+        data = BacktestRunner(self.config).load_data()
+        data_hash = hash_dataframe(data)
+        strategy_name = self._strategy_name()
+
+        points = expand_grid(self.param_grid)
+        keys = [point_key(self.config, p, data_hash, strategy_name) for p in points]
+        completed = self.load_completed()
+        pending = [(k, p) for k, p in zip(keys, points) if k not in completed]
+
+        logger.info(
+            f"Sweep: {len(points)} points, {len(points) - len(pending)} cached, "
+            f"{len(pending)} to run on {self.max_workers} workers"
+        )
+
+        def record(key: str, params: Dict[str, Any], metrics: Dict[str, Any]) -> None:
+            entry = {"key": key, "data_hash": data_hash, "strategy": strategy_name,
+                     "params": params, "metrics": metrics}
+            self._append(entry)
+            completed[key] = entry
+
+        def failed(params: Dict[str, Any], error: Exception) -> None:
+            # Not recorded, so the point is retried on the next run
+            logger.error(f"Sweep point {params} failed: {error}")
+
+        if pending and self.max_workers == 1:
+            for key, params in pending:
+                try:
+                    metrics = _run_point(self.config, params, self.strategy_factory, data)
+                except Exception as e:
+                    failed(params, e)
+                    continue
+                record(key, params, metrics)
+        elif pending:
+            shared = SharedFrame(data)
+            try:
+                with ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    initializer=_init_worker,
+                    initargs=(shared.spec,),
+                ) as pool:
+                    futures = {
+                        pool.submit(_run_point, self.config, params, self.strategy_factory): (key, params)
+                        for key, params in pending
+                    }
+                    for future in as_completed(futures):
+                        key, params = futures[future]
+                        try:
+                            metrics = future.result()
+                        except Exception as e:
+                            failed(params, e)
+                            continue
+                        record(key, params, metrics)
+            finally:
+                shared.close()
+
+        rows = []
+        for key, params in zip(keys, points):
+            if key in completed:
+                rows.append({"key": key, **params, **completed[key]["metrics"]})
+        return pd.DataFrame(rows)
@@ -104,3 +104,124 @@ class TestBacktestEngine:
             result = engine.run(SimpleBuySell(), sample_data)
             assert len(result.trades) == 1
             assert result.trades[0].is_closed
+
+
+class TestEngineModeParity:
+    """run_fast() and run_vectorized() must match run() trade for trade."""
+
+    @pytest.fixture
+    def engine_module(self):
+        with patch.dict(os.environ, {"TRADERFUND_ACTIVE_PHASE": "6"}):
+            import importlib
+            import research_modules.backtesting.engine as engine_module
+            importlib.reload(engine_module)
+            yield engine_module
+
+    @pytest.fixture
+    def random_data(self):
+        """Random-walk OHLCV data, shuffled so the engine must sort it."""
+        import numpy as np
+
+        rng = np.random.default_rng(42)
+        n = 500
+        close = 100 + np.cumsum(rng.normal(0, 0.5, n))
+        data = pd.DataFrame({
+            "timestamp": [datetime(2026, 1, 3, 9, 15) + timedelta(minutes=i) for i in range(n)],
+            "symbol": "TEST",
+            "open": close,
+            "high": close + 0.3,
+            "low": close - 0.3,
+            "close": close,
+            "volume": rng.integers(500, 3000, n),
+        })
+        return data.sample(frac=1.0, random_state=1)
+
+    @staticmethod
+    def _trades(result):
+        from dataclasses import asdict
+        return [asdict(t) for t in result.trades]
+
+    def test_run_fast_matches_run(self, engine_module, random_data):
+        class VolumeBreakout(engine_module.StrategyBase):
+            def __init__(self):
+                self.held = 0
+
+            def on_candle(self, candle, state):
+                if state["position"] is None and candle["volume"] > 2500:
+                    self.held = 0
+                    return {"action": "BUY", "quantity": 7}
+                if state["position"] is not None:
+                    self.held += 1
+                    if self.held >= 4 or candle.get("close", 0) < state["position"].entry_price - 1:
+                        return {"action": "SELL"}
+                return None
+
+        engine = engine_module.BacktestEngine(initial_capital=100000)
+        expected = engine.run(VolumeBreakout(), random_data)
+        actual = engine.run_fast(VolumeBreakout(), random_data)
+
+        assert len(expected.trades) > 5
+        assert self._trades(actual) == self._trades(expected)
+        assert actual.equity_curve == expected.equity_curve
+        assert actual.final_capital == expected.final_capital
+
+    def test_run_vectorized_matches_run(self, engine_module, random_data):
+        import numpy as np
+
+        sorted_data = random_data.sort_values("timestamp").reset_index(drop=True)
+        entries = (sorted_data["volume"] > 2400).to_numpy()
+        exits = (sorted_data["close"].diff() < -0.4).to_numpy()
+
+        class ArrayStrategy(engine_module.VectorizedStrategyBase):
+            def generate_signals(self, data):
+                return entries, exits, 3
+
+        class EventStrategy(engine_module.StrategyBase):
+            def __init__(self):
+                self.i = -1
+
+            def on_candle(self, candle, state):
+                self.i += 1
+                if entries[self.i] and state["position"] is None:
+                    return {"action": "BUY", "quantity": 3}
+                if exits[self.i] and state["position"] is not None:
+                    return {"action": "SELL"}
+                return None
+
+        engine = engine_module.BacktestEngine(initial_capital=50000)
+        expected = engine.run(EventStrategy(), random_data)
+        actual = engine.run_vectorized(ArrayStrategy(), random_data)
+
+        assert len(expected.trades) > 5
+        assert self._trades(actual) == self._trades(expected)
+        assert np.array_equal(actual.equity_curve, expected.equity_curve)
+        assert actual.final_capital == expected.final_capital
+
+    def test_run_vectorized_rejects_misaligned_signals(self, engine_module, random_data):
+        import numpy as np
+
+        class ShortSignals(engine_module.VectorizedStrategyBase):
+            def generate_signals(self, data):
+                return np.zeros(3, dtype=bool), np.zeros(3, dtype=bool), 1
+
+        engine = engine_module.BacktestEngine()
+        with pytest.raises(ValueError, match="length"):
+            engine.run_vectorized(ShortSignals(), random_data)
+
+    def test_candle_view_is_reused_and_detachable(self, engine_module, random_data):
+        class Recorder(engine_module.StrategyBase):
+            def __init__(self):
+                self.views = set()
+                self.first = None
+
+            def on_candle(self, candle, state):
+                self.views.add(id(candle))
+                if self.first is None:
+                    self.first = candle.to_dict()
+                return None
+
+        strategy = Recorder()
+        engine_module.BacktestEngine().run_fast(strategy, random_data)
+
+        assert len(strategy.views) == 1
+        assert strategy.first["timestamp"] == random_data["timestamp"].min()
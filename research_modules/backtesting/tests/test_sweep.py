@@ -0,0 +1,179 @@
+"""
+##############################################################################
+## RESEARCH ONLY - NOT FOR LIVE TRADING
+##############################################################################
+Unit tests for the parameter sweep runner.
+##############################################################################
+"""
+
+import json
+import sys
+from dataclasses import replace
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from research_modules.backtesting.runner import BacktestRunner, RunnerConfig
+from research_modules.backtesting.strategies import MomentumThresholdStrategy
+from research_modules.backtesting.sweep import ParameterSweep, SharedFrame, expand_grid
+
+GRID = {
+    "vol_multiplier": [1.5, 2.5],
+    "hold_bars": [5, 10],
+    "slippage_pct": [0.0, 0.1],
+}
+
+
+def _write_data(data_dir, seed: int = 7) -> None:
+    rng = np.random.default_rng(seed)
+    rows = []
+    price = 200.0
+    for day in range(3):
+        start = datetime(2026, 1, 5 + day, 9, 15)
+        for i in range(150):
+            price = max(1.0, price + rng.normal(0.05, 0.4))
+            volume = int(rng.integers(900, 1100)) * (int(rng.integers(2, 5)) if rng.random() < 0.2 else 1)
+            rows.append({
+                "timestamp": start + timedelta(minutes=i),
+                "symbol": "TEST",
+                "open": round(price, 2),
+                "high": round(price + abs(rng.normal(0, 0.3)), 2),
+                "low": round(price - abs(rng.normal(0, 0.3)), 2),
+                "close": round(price, 2),
+                "volume": volume,
+            })
+    data_dir.mkdir(parents=True, exist_ok=True)
+    pd.DataFrame(rows).to_csv(data_dir / "candles.csv", index=False)
+
+
+def _failing_factory(params):
+    """Strategy factory that rejects one grid value."""
+    if params["hold_bars"] == 10:
+        raise ValueError("bad point")
+    return MomentumThresholdStrategy.from_params(params)
+
+
+@pytest.fixture
+def phase_6(monkeypatch):
+    """Unlock the engine in this process and in forked pool workers."""
+    monkeypatch.setenv("TRADERFUND_ACTIVE_PHASE", "6")
+    monkeypatch.setattr(sys.modules["research_modules.backtesting.engine"], "ACTIVE_PHASE", 6)
+
+
+@pytest.fixture
+def config(tmp_path):
+    _write_data(tmp_path / "data")
+    return RunnerConfig(data_path=str(tmp_path / "data"), data_file="candles.csv")
+
+
+class TestSharedFrame:
+    """Round trip of a DataFrame through shared memory."""
+
+    def test_attach_reproduces_frame(self):
+        df = pd.DataFrame({
+            "timestamp": pd.date_range("2026-01-05 09:15", periods=5, freq="min"),
+            "symbol": ["A", "B", "A", "C", "B"],
+            "close": [1.0, 2.5, 3.0, np.nan, 5.0],
+            "volume": [10, 20, 30, 40, 50],
+            "flag": [True, False, True, False, True],
+        })
+        shared = SharedFrame(df)
+        try:
+            shm, attached = SharedFrame.attach(shared.spec)
+            pd.testing.assert_frame_equal(attached, df)
+            del attached
+            shm.close()
+        finally:
+            shared.close()
+
+
+class TestParameterSweep:
+    """Sweep results match direct runs and are cached across invocations."""
+
+    def test_results_match_direct_runs(self, phase_6, config, tmp_path):
+        sweep = ParameterSweep(
+            config, MomentumThresholdStrategy.from_params, GRID,
+            results_dir=str(tmp_path / "sweep"), max_workers=2,
+        )
+        table = sweep.run()
+
+        points = expand_grid(GRID)
+        assert len(table) == len(points)
+        assert table["trade_count"].sum() > 0
+
+        for row, params in zip(table.to_dict("records"), points):
+            strategy_params = {k: v for k, v in params.items() if k != "slippage_pct"}
+            runner = BacktestRunner(RunnerConfig(
+                data_path=config.data_path, data_file=config.data_file,
+                slippage_pct=params["slippage_pct"],
+            ))
+            expected = runner.run(MomentumThresholdStrategy(**strategy_params)).metrics
+            for name, value in expected.items():
+                assert row[name] == pytest.approx(value), (params, name)
+
+    def test_resume_skips_completed_points(self, phase_6, config, tmp_path):
+        results_dir = str(tmp_path / "sweep")
+        first = ParameterSweep(
+            config, MomentumThresholdStrategy.from_params, {"vol_multiplier": [1.5], "hold_bars": [5]},
+            results_dir=results_dir, max_workers=1,
+        ).run()
+
+        grown = ParameterSweep(
+            config, MomentumThresholdStrategy.from_params, {"vol_multiplier": [1.5, 2.5], "hold_bars": [5]},
+            results_dir=results_dir, max_workers=1,
+        )
+        table = grown.run()
+
+        lines = grown.results_path.read_text().splitlines()
+        assert len(lines) == 2
+        assert len(table) == 2
+        assert table.iloc[0]["key"] == first.iloc[0]["key"]
+
+        # A third run finds every point cached and writes nothing
+        grown.run()
+        assert len(grown.results_path.read_text().splitlines()) == 2
+
+    def test_data_change_invalidates_cache(self, phase_6, config, tmp_path):
+        results_dir = str(tmp_path / "sweep")
+        grid = {"vol_multiplier": [1.5]}
+        before = ParameterSweep(
+            config, MomentumThresholdStrategy.from_params, grid, results_dir=results_dir, max_workers=1
+        ).run()
+
+        _write_data(tmp_path / "data", seed=8)
+        sweep = ParameterSweep(
+            config, MomentumThresholdStrategy.from_params, grid, results_dir=results_dir, max_workers=1
+        )
+        after = sweep.run()
+
+        assert after.iloc[0]["key"] != before.iloc[0]["key"]
+        records = [json.loads(line) for line in sweep.results_path.read_text().splitlines()]
+        assert len({r["data_hash"] for r in records}) == 2
+
+    def test_base_config_change_invalidates_cache(self, phase_6, config, tmp_path):
+        results_dir = str(tmp_path / "sweep")
+        grid = {"vol_multiplier": [1.5]}
+        keys = set()
+        for base in (config, replace(config, slippage_pct=0.2), replace(config, initial_capital=50000.0),
+                     replace(config, engine_mode="fast")):
+            keys.add(ParameterSweep(
+                base, MomentumThresholdStrategy.from_params, grid, results_dir=results_dir, max_workers=1
+            ).run().iloc[0]["key"])
+        assert len(keys) == 4
+
+    @pytest.mark.parametrize("max_workers", [1, 2])
+    def test_failed_points_are_skipped_and_retried(self, phase_6, config, tmp_path, max_workers):
+        sweep = ParameterSweep(
+            config, _failing_factory, {"vol_multiplier": [1.5], "hold_bars": [5, 10]},
+            results_dir=str(tmp_path / "sweep"), max_workers=max_workers,
+        )
+        table = sweep.run()
+
+        assert table["hold_bars"].tolist() == [5]
+        assert len(sweep.results_path.read_text().splitlines()) == 1
+
+    def test_requires_results_dir(self, config):
+        with pytest.raises(ValueError):
+            ParameterSweep(config, MomentumThresholdStrategy.from_params, GRID, results_dir="")
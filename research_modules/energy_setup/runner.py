@@ -14,6 +14,7 @@ from typing import List, Optional
 
 import pandas as pd
 
+from ingestion.core.daily_bar_store import read_staged_daily
 from . import config
 from .aggregator import EnergyAggregator
 from .models import EnergySetup
@@ -50,7 +51,7 @@ def load_price_data(symbol: str) -> Optional[pd.DataFrame]:
         return None
     
     try:
-        df = pd.read_parquet(path).reset_index()
+        df = read_staged_daily(path).reset_index()
         if "index" in df.columns:
             df.rename(columns={"index": "timestamp"}, inplace=True)
         return df
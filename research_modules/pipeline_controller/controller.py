@@ -100,9 +100,10 @@ class PipelineController:
         last_s1 = self._get_last_run(symbol, 1)
         # S1 runs if history is loaded (Layer 2 requirement)
         from ingestion.historical_backfill.config import TRACKER_PATH
+        from ingestion.core.status_journal import read_tracker
         history_ready = False
-        if TRACKER_PATH.exists():
-            bt = pd.read_parquet(TRACKER_PATH)
+        bt = read_tracker(TRACKER_PATH)
+        if bt is not None and not bt.empty:
             if symbol in bt[bt['status'] == 'success']['symbol'].values:
                 history_ready = True
 
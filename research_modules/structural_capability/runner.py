@@ -14,6 +14,7 @@ from typing import List, Optional
 
 import pandas as pd
 
+from ingestion.core.daily_bar_store import read_staged_daily
 from . import config
 from .aggregator import StructuralAggregator
 from .models import StructuralCapability
@@ -47,7 +48,7 @@ def load_price_data(symbol: str) -> Optional[pd.DataFrame]:
         return None
     
     try:
-        df = pd.read_parquet(path)
+        df = read_staged_daily(path)
         df = df.reset_index()  # Ensure timestamp is a column
         
         # Rename if needed
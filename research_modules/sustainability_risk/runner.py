@@ -3,6 +3,7 @@ import argparse, json, logging, sys
 from datetime import datetime
 from typing import List, Optional
 import pandas as pd
+from ingestion.core.daily_bar_store import read_staged_daily
 from . import config
 from .aggregator import SustainabilityAggregator
 from .models import SustainabilityRisk
@@ -25,7 +26,7 @@ def load_price_data(symbol: str) -> Optional[pd.DataFrame]:
     if not path.exists():
         return None
     try:
-        return pd.read_parquet(path).reset_index()
+        return read_staged_daily(path).reset_index()
     except:
         return None
 
@@ -15,6 +15,7 @@ from typing import Optional
 
 import pandas as pd
 
+from ingestion.core.daily_bar_store import read_staged_daily
 from . import config
 from .eligibility_filter import EligibilityFilter
 from .models import EligibilityRecord
@@ -94,7 +95,7 @@ def create_price_data_loader():
             return None
         
         try:
-            df = pd.read_parquet(parquet_path)
+            df = read_staged_daily(parquet_path)
             
             # Ensure timestamp column exists (or is index)
             if "timestamp" not in df.columns:
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+import httpx
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+for path in (PROJECT_ROOT, PROJECT_ROOT / "src"):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+from dashboard.backend.utils.load_test import DEFAULT_PATHS, in_process_client, run_load_test
+
+
+async def _run(args: argparse.Namespace) -> dict:
+    if args.url:
+        client = httpx.AsyncClient(base_url=args.url, timeout=args.timeout)
+    else:
+        # In-process: exercises the ASGI app, lifespan included (so the
+        # background validation runs), without a server or network hop
+        from dashboard.backend.app import app
+
+        client = in_process_client(app, timeout=args.timeout)
+    async with client as session:
+        return await run_load_test(session, args.path or DEFAULT_PATHS, args.concurrency, args.requests)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Load test the dashboard API and report p50/p99 latency")
+    parser.add_argument("--url", default="", help="Base URL of a running API (default: in-process app)")
+    parser.add_argument("--path", action="append", help="Endpoint path to hit (repeatable)")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    args = parser.parse_args(argv)
+
+    report = asyncio.run(_run(args))
+    print(json.dumps(report, indent=2))
+    return 1 if report["overall"]["errors"] else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -2,14 +2,20 @@ from __future__ import annotations
 
 import json
 import sqlite3
+import sys
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 import pandas as pd
 
-
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from ingestion.core.daily_bar_store import DailyBarStore, read_staged_daily
+
+
+US_STAGING_DAILY = PROJECT_ROOT / "data" / "staging" / "us" / "daily"
 REPORT_PATH = PROJECT_ROOT / "docs" / "verification_runs" / "RUN_001_INGESTION.md"
 RUN_TS = datetime.now().astimezone()
 RUN_EPOCH = RUN_TS.isoformat()
@@ -35,6 +41,13 @@ def latest_by_mtime(paths: list[Path], count: int) -> list[Path]:
     return sorted(paths, key=lambda p: p.stat().st_mtime)[-count:]
 
 
+def latest_by_last_bar(root: Path, count: int) -> list[Path]:
+    """Staged daily files with the newest stored bars; appended parts leave the base mtime untouched."""
+    store = DailyBarStore(root)
+    paths = sorted(root.glob("*.parquet"))
+    return sorted(paths, key=lambda p: (store.last_date(p.stem) or "", p.name))[-count:]
+
+
 def latest_by_name(paths: list[Path], count: int) -> list[Path]:
     return sorted(paths)[-count:]
 
@@ -110,6 +123,16 @@ def read_parquet_dataset(path: Path) -> pd.DataFrame:
     return df
 
 
+def read_staged_parquet_dataset(path: Path) -> pd.DataFrame:
+    df = read_staged_daily(path)
+    if df.index.name and df.index.name not in df.columns:
+        df = df.reset_index()
+    for col in ("timestamp", "Date", "date"):
+        if col in df.columns:
+            df[col] = pd.to_datetime(df[col], errors="coerce")
+    return df
+
+
 def schema_signature(df: pd.DataFrame) -> list[tuple[str, str]]:
     return [(column, str(df[column].dtype)) for column in df.columns]
 
@@ -283,6 +306,13 @@ def timestamp_summary(
     }
 
 
+def latest_staged_observed() -> str:
+    latest = latest_by_last_bar(US_STAGING_DAILY, 1)
+    if not latest:
+        return ""
+    return f"{latest[0].name} / latest bar {DailyBarStore(US_STAGING_DAILY).last_date(latest[0].stem)}"
+
+
 def inventory_rows() -> list[dict[str, Any]]:
     db_tables = []
     db_path = PROJECT_ROOT / "nse_data.db"
@@ -304,8 +334,8 @@ def inventory_rows() -> list[dict[str, Any]]:
             "family": "US staging daily",
             "format": "Parquet",
             "path": "data/staging/us/daily/{symbol}.parquet",
-            "count": len(list((PROJECT_ROOT / "data" / "staging" / "us" / "daily").glob("*.parquet"))),
-            "latest_observed": latest_by_mtime(list((PROJECT_ROOT / "data" / "staging" / "us" / "daily").glob("*.parquet")), 1)[0].name,
+            "count": len(list(US_STAGING_DAILY.glob("*.parquet"))),
+            "latest_observed": latest_staged_observed(),
             "canonical": "silver",
         },
         {
@@ -379,7 +409,7 @@ def inventory_rows() -> list[dict[str, Any]]:
 def canonical_schema_rows() -> list[dict[str, Any]]:
     samples = [
         ("US raw daily", PROJECT_ROOT / "data" / "raw" / "us" / "2026-02-20" / "SPY_daily.json", read_us_raw_daily, "timestamp, open, high, low, close, volume"),
-        ("US staging daily", PROJECT_ROOT / "data" / "staging" / "us" / "daily" / "AAPL.parquet", read_parquet_dataset, "timestamp, symbol, open, high, low, close, volume"),
+        ("US staging daily", US_STAGING_DAILY / "AAPL.parquet", read_staged_parquet_dataset, "timestamp, symbol, open, high, low, close, volume"),
         ("US analytics daily", PROJECT_ROOT / "data" / "analytics" / "us" / "prices" / "daily" / "AAPL.parquet", read_parquet_dataset, "timestamp, symbol, open, high, low, close, volume"),
         ("US direct proxy daily", PROJECT_ROOT / "data" / "us_market" / "SPY_daily.csv", read_csv_dataset, "timestamp, open, high, low, close, volume"),
         ("India raw intraday", PROJECT_ROOT / "data" / "raw" / "api_based" / "angel" / "intraday_ohlc" / "NSE_RELIANCE_2026-01-12.jsonl", read_jsonl, "symbol, exchange, interval, timestamp, open, high, low, close, volume, source, ingestion_ts"),
@@ -616,8 +646,8 @@ def build_report() -> str:
         run_schema_family(
             family_id="us_staging_daily_latest_7_files",
             description="US staging daily parquet, latest 7 retained symbol files",
-            artifacts=latest_by_mtime(list((PROJECT_ROOT / "data" / "staging" / "us" / "daily").glob("*.parquet")), 7),
-            loader=read_parquet_dataset,
+            artifacts=latest_by_last_bar(US_STAGING_DAILY, 7),
+            loader=read_staged_parquet_dataset,
             expected_columns=["timestamp", "symbol", "open", "high", "low", "close", "volume"],
             required_artifacts=7,
         ),
@@ -643,7 +673,7 @@ def build_report() -> str:
         compute_null_metrics("us_raw_spy_latest", PROJECT_ROOT / "data" / "raw" / "us" / "2026-02-20" / "SPY_daily.json", read_us_raw_daily, "timestamp", ["timestamp", "open", "high", "low", "close", "volume"], ["timestamp"]),
         compute_null_metrics("us_direct_spy_daily", PROJECT_ROOT / "data" / "us_market" / "SPY_daily.csv", read_csv_dataset, "timestamp", ["timestamp", "open", "high", "low", "close", "volume"], ["timestamp"]),
         compute_null_metrics("us_rates_anchor", PROJECT_ROOT / "data" / "regime" / "raw" / "^TNX.csv", read_csv_dataset, "date", ["date", "open", "high", "low", "close", "volume"], ["date"]),
-        compute_null_metrics("us_staging_aapl", PROJECT_ROOT / "data" / "staging" / "us" / "daily" / "AAPL.parquet", read_parquet_dataset, "timestamp", ["timestamp", "symbol", "open", "high", "low", "close", "volume"], ["timestamp"]),
+        compute_null_metrics("us_staging_aapl", US_STAGING_DAILY / "AAPL.parquet", read_staged_parquet_dataset, "timestamp", ["timestamp", "symbol", "open", "high", "low", "close", "volume"], ["timestamp"]),
         compute_null_metrics("us_analytics_aapl", PROJECT_ROOT / "data" / "analytics" / "us" / "prices" / "daily" / "AAPL.parquet", read_parquet_dataset, "timestamp", ["timestamp", "symbol", "open", "high", "low", "close", "volume"], ["timestamp"]),
         compute_null_metrics("india_raw_intraday_reliance_latest", PROJECT_ROOT / "data" / "raw" / "api_based" / "angel" / "intraday_ohlc" / "NSE_RELIANCE_2026-01-12.jsonl", read_jsonl, "timestamp", ["symbol", "exchange", "interval", "timestamp", "open", "high", "low", "close", "volume", "source", "ingestion_ts"], ["symbol", "timestamp"]),
         compute_null_metrics("india_raw_ltp_latest", latest_valid_ltp_snapshot(1)[0], read_jsonl, "timestamp", ["symbol", "exchange", "ltp", "open", "high", "low", "close", "timestamp", "source", "ingestion_ts"], ["symbol", "timestamp"]),
@@ -658,7 +688,7 @@ def build_report() -> str:
         timestamp_summary("us_raw_spy_latest", PROJECT_ROOT / "data" / "raw" / "us" / "2026-02-20" / "SPY_daily.json", read_us_raw_daily, "timestamp", "DATE_ONLY", "daily"),
         timestamp_summary("us_direct_spy_daily", PROJECT_ROOT / "data" / "us_market" / "SPY_daily.csv", read_csv_dataset, "timestamp", "DATE_ONLY", "daily"),
         timestamp_summary("us_rates_anchor", PROJECT_ROOT / "data" / "regime" / "raw" / "^TNX.csv", read_csv_dataset, "date", "DATE_ONLY", "daily"),
-        timestamp_summary("us_staging_aapl", PROJECT_ROOT / "data" / "staging" / "us" / "daily" / "AAPL.parquet", read_parquet_dataset, "timestamp", "+00:00", "daily"),
+        timestamp_summary("us_staging_aapl", US_STAGING_DAILY / "AAPL.parquet", read_staged_parquet_dataset, "timestamp", "+00:00", "daily"),
         timestamp_summary("us_analytics_aapl", PROJECT_ROOT / "data" / "analytics" / "us" / "prices" / "daily" / "AAPL.parquet", read_parquet_dataset, "timestamp", "+00:00", "daily"),
         timestamp_summary("india_raw_intraday_reliance_latest", PROJECT_ROOT / "data" / "raw" / "api_based" / "angel" / "intraday_ohlc" / "NSE_RELIANCE_2026-01-12.jsonl", read_jsonl, "timestamp", "+05:30", "intraday_ist"),
         timestamp_summary("india_raw_ltp_latest", latest_valid_ltp_snapshot(1)[0], read_jsonl, "timestamp", "+05:30", "intraday_ist"),
@@ -32,6 +32,7 @@ def print_result(check: str, status: str, details: str = ""):
 try:
     from traderfund.regime.integration_guards import MomentumRegimeGuard, GuardDecision
     from traderfund.regime.types import RegimeState, MarketBehavior
+    from ingestion.india_ingestion.candle_store import CandleStore
 except ImportError:
     print("Error: Could not import Regime modules. Run from repo root.")
     sys.exit(1)
@@ -42,17 +43,17 @@ def run_verification():
     
     # 1. DATA INGESTION CHECK
     print_header("1. DATA INGESTION CHECK")
-    data_dir = Path("data/processed/candles/intraday")
+    candle_store = CandleStore("data/processed/candles/intraday")
     symbols = ["RELIANCE", "INFY", "TCS"]
     
     for sym in symbols:
-        file = data_dir / f"NSE_{sym}_1m.parquet"
-        if not file.exists():
-            print_result(f"File Check ({sym})", "FAIL", "Missing parquet file")
+        if not candle_store.exists(sym, "NSE"):
+            print_result(f"File Check ({sym})", "FAIL", "No base file or segments")
             continue
         
         try:
-            df = pd.read_parquet(file)
+            # Base file plus pending segments, so the latest minutes are seen
+            df = candle_store.read(sym, "NSE")
             last_ts = pd.to_datetime(df['timestamp'].iloc[-1])
             now = datetime.now()
             # Assuming India Time in parquet or close to it
@@ -1,5 +1,8 @@
 from datetime import datetime, timedelta
 import math
+from typing import Sequence
+
+import numpy as np
 
 class DecayCalculator:
     """
@@ -42,3 +45,29 @@ class DecayCalculator:
         
         # Floor at 0, Clamp ceiling (though decay shouldn't increase)
         return max(0.0, min(initial_score, decayed_score))
+
+    def half_lives_seconds(self, horizons: Sequence[str]) -> np.ndarray:
+        """Half-life (seconds) per row: one dict lookup per distinct horizon."""
+        unique, inverse = np.unique(np.asarray(horizons, dtype=object).astype(str), return_inverse=True)
+        table = np.array([self.HORIZON_MAP_MINUTES.get(h, self.DEFAULT_HALF_LIFE) for h in unique], dtype=float)
+        return table[inverse] * 60.0
+
+    def calculate_decayed_scores(self,
+                                 initial_scores: np.ndarray,
+                                 elapsed_seconds: np.ndarray,
+                                 horizons: Sequence[str]) -> np.ndarray:
+        """
+        Column form of calculate_decayed_score(); row i matches the scalar
+        call up to the last bit of pow() rounding.
+        """
+        initial = np.asarray(initial_scores, dtype=float)
+        elapsed = np.asarray(elapsed_seconds, dtype=float)
+        if len(initial) == 0:
+            return initial.copy()
+
+        ratio = elapsed / self.half_lives_seconds(horizons)
+        decayed = initial * np.power(0.5, ratio)
+        decayed = np.maximum(0.0, np.minimum(initial, decayed))
+
+        decayed = np.where(elapsed < 0, initial, decayed)
+        return np.where(initial <= 0, 0.0, decayed)
@@ -1,4 +1,6 @@
 from typing import Tuple, Dict, Any
+
+import numpy as np
 from signals.core.models import Signal
 from signals.core.enums import SignalDirection
 from .inputs import ConfidenceContext
@@ -87,3 +89,67 @@ class ConfidenceScorer:
         breakdown["context_used"] = context.to_dict()
         
         return final_score, breakdown
+
+    def compute_scores(self,
+                       directions: np.ndarray,
+                       volume_ratio: np.ndarray,
+                       volatility_z_score: np.ndarray,
+                       indicator_agreement_count: np.ndarray,
+                       market_trend_score: np.ndarray) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+        """
+        Column form of compute_score() for a batch of signals.
+        directions holds SignalDirection values (e.g. "BULLISH"); the other
+        arrays are the ConfidenceContext fields. Returns final scores and the per-row
+        adjustments (same additions in the same order, so row i matches the
+        scalar call exactly).
+        """
+        directions = np.asarray(directions, dtype=str)
+        volume_ratio = np.asarray(volume_ratio, dtype=float)
+        volatility_z_score = np.asarray(volatility_z_score, dtype=float)
+        agreement = np.asarray(indicator_agreement_count)
+        trend = np.asarray(market_trend_score, dtype=float)
+
+        # 1. Volume Logic
+        vol_score = np.where(volume_ratio > 2.0, self.BONUS_VOLUME_EXTREME,
+                             np.where(volume_ratio > 1.2, self.BONUS_VOLUME_HIGH, 0.0))
+
+        # 2. Volatility Logic
+        vola_score = np.where(volatility_z_score > 4.0, self.PENALTY_VOLATILITY_EXTREME,
+                              np.where(volatility_z_score > 2.0, self.PENALTY_VOLATILITY_HIGH, 0.0))
+
+        # 3. Agreement Logic
+        agree_score = np.minimum(agreement * self.BONUS_PER_AGREEMENT, self.MAX_AGREEMENT_BONUS)
+
+        # 4. Regime Logic
+        is_bullish = directions == SignalDirection.BULLISH.value
+        is_bearish = directions == SignalDirection.BEARISH.value
+        aligned = (is_bullish & (trend > 0.2)) | (is_bearish & (trend < -0.2))
+        conflict = (is_bullish & (trend < -0.2)) | (is_bearish & (trend > 0.2))
+        regime_score = np.where(aligned, self.BONUS_REGIME_ALIGNMENT,
+                                np.where(conflict, self.PENALTY_REGIME_CONFLICT, 0.0))
+
+        score = self.BASE_SCORE + vol_score
+        score = score + vola_score
+        score = score + agree_score
+        score = score + regime_score
+
+        # Clamping
+        final_scores = np.maximum(0.0, np.minimum(100.0, score))
+
+        adjustments = {
+            "volume_adjustment": vol_score,
+            "volatility_adjustment": vola_score,
+            "agreement_adjustment": agree_score,
+            "regime_adjustment": regime_score,
+        }
+        return final_scores, adjustments
+
+    def build_explanation(self, final_score: float, adjustments: Dict[str, float], context: ConfidenceContext) -> Dict[str, Any]:
+        """Explanation payload for one row of compute_scores(), shaped like compute_score()'s."""
+        breakdown = {"base": self.BASE_SCORE}
+        for key, value in adjustments.items():
+            if value != 0:
+                breakdown[key] = value
+        breakdown["final_score"] = final_score
+        breakdown["context_used"] = context.to_dict()
+        return breakdown
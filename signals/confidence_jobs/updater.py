@@ -3,6 +3,9 @@ import random
 from datetime import datetime
 from typing import List
 from pathlib import Path
+
+import numpy as np
+
 from signals.core.models import Signal
 from signals.core.enums import Market, SignalState
 from signals.repository.base import SignalRepository
@@ -26,20 +29,105 @@ class MockContextProvider:
         )
 
 class ConfidenceUpdaterJob:
-    def __init__(self, repo: SignalRepository):
+    # Minimum score change that produces a new signal version
+    CHANGE_THRESHOLD = 0.1
+
+    def __init__(self, repo: SignalRepository, batch: bool = True):
+        """
+        Args:
+            repo: Signal repository to read active signals from and write versions to.
+            batch: Score and decay the active set as NumPy columns and persist all
+                   changes with one save_signals() call. False runs the per-signal
+                   loop (useful when debugging a single signal's score).
+        """
         self.repo = repo
+        self.batch = batch
         self.scorer = ConfidenceScorer()
         self.decay = DecayCalculator()
         self.context_provider = MockContextProvider()
 
-    def run(self, market: Market):
+    def run(self, market: Market) -> int:
         logger.info(f"Starting Confidence Update Job for {market.value}")
         
         active_signals = self.repo.get_active_signals(market)
         logger.info(f"Found {len(active_signals)} active signals.")
         
-        updated_count = 0
         now = datetime.utcnow()
+        if self.batch:
+            updated_count = self.run_batch(active_signals, now)
+        else:
+            updated_count = self.run_per_signal(active_signals, now)
+        
+        logger.info(f"Job Complete. Updated {updated_count} signals.")
+        return updated_count
+
+    def run_batch(self, active_signals: List[Signal], now: datetime) -> int:
+        """Columnar scoring and decay; same results as run_per_signal().
+
+        A signal whose inputs cannot be gathered, or whose new version cannot
+        be built, is logged and skipped without affecting the rest.
+        """
+        signals, contexts, rows = [], [], []
+        for sig in active_signals:
+            try:
+                context = self.context_provider.get_context(sig)
+                trigger = np.datetime64(sig.trigger_timestamp, 'us')
+                if np.isnat(trigger):
+                    raise ValueError("missing trigger timestamp")
+                rows.append((
+                    sig.direction.value,
+                    float(context.volume_ratio),
+                    float(context.volatility_z_score),
+                    int(context.indicator_agreement_count),
+                    float(context.market_trend_score),
+                    trigger,
+                    sig.confidence_score if sig.confidence_score is not None else -1.0,
+                ))
+            except Exception as e:
+                logger.error(f"Failed to update signal {sig.signal_id}: {e}")
+                continue
+            signals.append(sig)
+            contexts.append(context)
+        if not signals:
+            return 0
+
+        directions, volume_ratio, volatility_z, agreement, trend, trigger, old_conf = zip(*rows)
+        raw_conf, adjustments = self.scorer.compute_scores(
+            directions=np.array(directions),
+            volume_ratio=np.array(volume_ratio, dtype=float),
+            volatility_z_score=np.array(volatility_z, dtype=float),
+            indicator_agreement_count=np.array(agreement),
+            market_trend_score=np.array(trend, dtype=float),
+        )
+
+        elapsed = (np.datetime64(now, 'us') - np.array(trigger, dtype='datetime64[us]')).astype(np.int64) / 1e6
+        final_conf = self.decay.calculate_decayed_scores(
+            raw_conf, elapsed, [sig.expected_horizon for sig in signals]
+        )
+
+        changed = np.flatnonzero(np.abs(final_conf - np.array(old_conf, dtype=float)) > self.CHANGE_THRESHOLD)
+
+        calculated_at = now.isoformat()
+        new_versions = []
+        for i in changed:
+            try:
+                explanation = self.scorer.build_explanation(
+                    float(raw_conf[i]), {k: float(v[i]) for k, v in adjustments.items()}, contexts[i]
+                )
+                explanation['raw_confidence'] = float(raw_conf[i])
+                explanation['decay_applied'] = float(raw_conf[i] - final_conf[i])
+                explanation['calculated_at'] = calculated_at
+                new_versions.append(signals[i].update_confidence(float(final_conf[i]), explanation))
+            except Exception as e:
+                logger.error(f"Failed to update signal {signals[i].signal_id}: {e}")
+
+        if new_versions:
+            self.repo.save_signals(new_versions)
+        return len(new_versions)
+
+    def run_per_signal(self, active_signals: List[Signal], now: datetime) -> int:
+        """Scores, decays and saves one signal at a time."""
+        updated_count = 0
         
         for sig in active_signals:
             try:
@@ -70,7 +158,7 @@ class ConfidenceUpdaterJob:
                 # Optimization: Only save if changed significantly (> 1.0) or never scored
                 old_conf = sig.confidence_score if sig.confidence_score is not None else -1.0
                 
-                if abs(final_conf - old_conf) > 0.1:
+                if abs(final_conf - old_conf) > self.CHANGE_THRESHOLD:
                     new_sig = sig.update_confidence(final_conf, explanation)
                     self.repo.save_signal(new_sig)
                     updated_count += 1
@@ -78,7 +166,7 @@ class ConfidenceUpdaterJob:
             except Exception as e:
                 logger.error(f"Failed to update signal {sig.signal_id}: {e}")
                 
-        logger.info(f"Job Complete. Updated {updated_count} signals.")
+        return updated_count
 
 if __name__ == "__main__":
     # Example standalone run
@@ -6,6 +6,7 @@ from pathlib import Path
 from datetime import datetime
 from typing import List
 
+from ingestion.core.daily_bar_store import read_staged_daily
 from signals.core.models import Signal
 from signals.core.enums import Market, SignalCategory, SignalDirection, SignalState
 from signals.repository.parquet_repo import ParquetSignalRepository
@@ -97,7 +98,8 @@ def run_discovery(market_str: str, symbols: List[str] = None):
     for f in parquet_files:
         symbol = f.stem
         try:
-            df = pd.read_parquet(f)
+            # Includes bars appended since the last compaction
+            df = read_staged_daily(f)
             if 'timestamp' in df.columns:
                 df['timestamp'] = pd.to_datetime(df['timestamp'])
                 df.set_index('timestamp', inplace=True)
@@ -10,6 +10,11 @@ class SignalRepository(ABC):
         """Persist a signal object (new version)."""
         pass
 
+    def save_signals(self, signals: List[Signal]) -> None:
+        """Persist many signal versions. Backends override this to write in one batch."""
+        for signal in signals:
+            self.save_signal(signal)
+
     @abstractmethod
     def get_signal_history(self, signal_id: str) -> List[Signal]:
         """Retrieve all versions of a signal by ID."""
@@ -1,97 +1,513 @@
-import pandas as pd
-import uuid
+import itertools
 import json
 import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from pathlib import Path
 from datetime import datetime
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Iterable, Tuple
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
 from signals.core.models import Signal
 from signals.core.enums import Market, SignalState
 from .base import SignalRepository
 
 logger = logging.getLogger(__name__)
 
+# Column layout of every segment and latest-state view (Signal.to_dict order)
+SIGNAL_SCHEMA = pa.schema([
+    ('signal_id', pa.string()),
+    ('signal_name', pa.string()),
+    ('market', pa.string()),
+    ('asset_id', pa.string()),
+    ('signal_category', pa.string()),
+    ('direction', pa.string()),
+    ('trigger_timestamp', pa.string()),
+    ('expected_horizon', pa.string()),
+    ('expiry_timestamp', pa.string()),
+    ('lifecycle_state', pa.string()),
+    ('version', pa.int64()),
+    ('created_at', pa.string()),
+    ('raw_strength', pa.float64()),
+    ('explainability_payload', pa.string()),
+    ('confidence_score', pa.float64()),
+    ('invalidation_reason', pa.string()),
+])
+
+# signal_id, version -> row `row` of segment file `segment`
+INDEX_SCHEMA = pa.schema([
+    ('signal_id', pa.string()),
+    ('version', pa.int64()),
+    ('segment', pa.string()),
+    ('row', pa.int64()),
+])
+
+
+@dataclass
+class _MarketView:
+    """Cached decode of one market's latest-state view."""
+    active: Dict[str, Signal] = field(default_factory=dict)
+    # View version of signals looked up so far (-1 when absent from the view)
+    versions: Dict[str, int] = field(default_factory=dict)
+
+
 class ParquetSignalRepository(SignalRepository):
-    def __init__(self, base_dir: Path):
-        self.base_dir = base_dir
+    """
+    Log-structured signal store.
+
+    Layout under base_dir:
+        {MARKET}/{YYYY-MM-DD}/*.parquet   immutable segments of signal versions
+        _index/manifest.json              segments already folded into the index files
+        _index/versions.parquet           signal_id, version -> (segment, row)
+        _index/latest_{MARKET}.parquet    latest version of every signal, sorted by signal_id
+        _index/active_{MARKET}.parquet    the ACTIVE rows of the latest view
+
+    Each save appends one segment per (market, day). Segments written since the
+    last compaction form the in-memory tail, overlaid on the index files at read
+    time. compact() merges each day's segments into one file and folds the tail
+    into the index files; it runs on a background thread once compact_threshold
+    segments are pending. Partitions written by the previous one-file-per-version
+    layout are read as ordinary segments and merged by the first compaction.
+
+    One writer process per base_dir. Long-lived readers in other processes
+    call refresh() to pick up new segments.
+    """
+
+    INDEX_DIR = "_index"
+    ROW_GROUP_SIZE = 4096
+
+    def __init__(
+        self,
+        base_dir: Path,
+        compact_threshold: int = 64,
+        background_compaction: bool = True
+    ):
+        """
+        Args:
+            base_dir: Root directory of the store.
+            compact_threshold: Pending tail segments that trigger compaction (0 disables).
+            background_compaction: Compact on a daemon thread instead of inline.
+        """
+        self.base_dir = Path(base_dir)
+        self.compact_threshold = compact_threshold
+        self.background_compaction = background_compaction
+
+        self._lock = threading.RLock()
+        self._compact_lock = threading.Lock()
+        self._compact_thread: Optional[threading.Thread] = None
+        self._seq = itertools.count()
+        self._batch: Optional[List[Signal]] = None
+
+        self._load()
+
+    # ------------------------------------------------------------------
+    # Paths
+    # ------------------------------------------------------------------
 
     def _get_partition_path(self, market: Market, date: datetime) -> Path:
         date_str = date.strftime('%Y-%m-%d')
         return self.base_dir / market.value / date_str
 
-    def save_signal(self, signal: Signal) -> None:
-        """Writes signal as a single-row parquet file."""
-        path = self._get_partition_path(signal.market, signal.created_at)
-        path.mkdir(parents=True, exist_ok=True)
-        
-        filename = f"{signal.signal_id}_v{signal.version}_{uuid.uuid4().hex[:8]}.parquet"
-        file_path = path / filename
-        
+    def _index_path(self, name: str) -> Path:
+        return self.base_dir / self.INDEX_DIR / name
+
+    def _latest_path(self, market: Market) -> Path:
+        return self._index_path(f"latest_{market.value}.parquet")
+
+    def _active_path(self, market: Market) -> Path:
+        return self._index_path(f"active_{market.value}.parquet")
+
+    def _next_segment_name(self) -> str:
+        # time_ns keeps order across restarts, the counter breaks ties in-process
+        return f"{time.time_ns():020d}{next(self._seq) % 1000:03d}.parquet"
+
+    def _list_segments(self) -> List[str]:
+        segments = []
+        for market in Market:
+            market_dir = self.base_dir / market.value
+            if market_dir.exists():
+                segments.extend(p.relative_to(self.base_dir).as_posix() for p in sorted(market_dir.glob("*/*.parquet")))
+        return segments
+
+    # ------------------------------------------------------------------
+    # State
+    # ------------------------------------------------------------------
+
+    def _load(self) -> None:
+        self._covered = set()
+        self._tail: Dict[str, List[Dict]] = {}
+        self._tail_latest: Dict[str, Dict[str, Signal]] = {}
+        self._tail_locations: Dict[str, List[Tuple[int, str, int]]] = {}
+        self._views: Dict[str, _MarketView] = {}
+
+        manifest = self._index_path("manifest.json")
+        if manifest.exists():
+            with open(manifest, 'r') as f:
+                self._covered = set(json.load(f).get("segments", []))
+
+        for segment in self._list_segments():
+            if segment in self._covered:
+                continue
+            try:
+                records = self._read_segment(segment).to_pylist()
+            except Exception as e:
+                logger.warning(f"Skipping unreadable signal segment {segment}: {e}")
+                continue
+            self._add_tail(segment, records)
+
+    def refresh(self) -> None:
+        """Re-read the manifest and pick up segments written by another process."""
+        with self._lock:
+            self._load()
+
+    def _add_tail(self, segment: str, records: List[Dict], signals: Optional[List[Signal]] = None) -> None:
+        self._tail[segment] = records
+        for row, rec in enumerate(records):
+            signal_id, version = rec['signal_id'], rec['version']
+            self._tail_locations.setdefault(signal_id, []).append((version, segment, row))
+
+            latest = self._tail_latest.setdefault(rec['market'], {})
+            current = latest.get(signal_id)
+            if current is None or version >= current.version:
+                latest[signal_id] = signals[row] if signals else self._to_signal(rec)
+
+    # ------------------------------------------------------------------
+    # Serialization
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _to_record(signal: Signal) -> Dict:
         data = signal.to_dict()
         # Serialize dict/complex types to JSON string for Parquet compatibility
-        if isinstance(data.get('explainability_payload'), dict):
-            data['explainability_payload'] = json.dumps(data['explainability_payload'])
-            
-        df = pd.DataFrame([data])
-        df.to_parquet(file_path, index=False)
+        payload = data.get('explainability_payload')
+        if payload is not None and not isinstance(payload, str):
+            data['explainability_payload'] = json.dumps(payload)
+        return data
+
+    @staticmethod
+    def _to_signal(record: Dict) -> Signal:
+        data = dict(record)
+        if isinstance(data.get('explainability_payload'), str):
+            data['explainability_payload'] = json.loads(data['explainability_payload'])
+        return Signal.from_dict(data)
+
+    def _read_segment(self, segment: str) -> pa.Table:
+        """Read a segment coerced to SIGNAL_SCHEMA (older files may have null-typed columns)."""
+        table = pq.read_table(self.base_dir / segment)
+        columns = [
+            table.column(f.name).cast(f.type) if f.name in table.column_names else pa.nulls(len(table), f.type)
+            for f in SIGNAL_SCHEMA
+        ]
+        return pa.Table.from_arrays(columns, schema=SIGNAL_SCHEMA)
+
+    def _read_rows(self, segment: str, rows: Iterable[int]) -> List[Dict]:
+        """Read selected rows, decoding only the row groups that hold them."""
+        wanted = sorted(set(rows))
+        pf = pq.ParquetFile(self.base_dir / segment)
+        out = []
+        start = 0
+        for rg in range(pf.num_row_groups):
+            n = pf.metadata.row_group(rg).num_rows
+            local = [r - start for r in wanted if start <= r < start + n]
+            if local:
+                out.extend(pf.read_row_group(rg).take(local).to_pylist())
+            start += n
+        return out
+
+    def _write_table(self, table: pa.Table, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.parent / f"{path.name}.tmp"
+        pq.write_table(table, tmp_path, row_group_size=self.ROW_GROUP_SIZE)
+        os.replace(tmp_path, path)
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def save_signal(self, signal: Signal) -> None:
+        """Appends the signal version (buffered while inside batch())."""
+        with self._lock:
+            if self._batch is not None:
+                self._batch.append(signal)
+                return
+        self.save_signals([signal])
+
+    def save_signals(self, signals: List[Signal]) -> None:
+        """Appends many signal versions as one segment per (market, day)."""
+        groups: Dict[str, List[Signal]] = {}
+        for signal in signals:
+            partition = self._get_partition_path(signal.market, signal.created_at).relative_to(self.base_dir)
+            groups.setdefault(partition.as_posix(), []).append(signal)
+
+        pending = 0
+        for partition, group in groups.items():
+            records = [self._to_record(s) for s in group]
+            table = pa.Table.from_pylist(records, schema=SIGNAL_SCHEMA)
+            with self._lock:
+                segment = f"{partition}/{self._next_segment_name()}"
+                self._write_table(table, self.base_dir / segment)
+                self._add_tail(segment, records, group)
+                pending = len(self._tail)
+
+        self._maybe_compact(pending)
+
+    @contextmanager
+    def batch(self):
+        """Buffers save_signal() calls and writes them as one append on exit."""
+        with self._lock:
+            outermost = self._batch is None
+            if outermost:
+                self._batch = []
+        try:
+            yield self
+        finally:
+            if outermost:
+                with self._lock:
+                    buffered, self._batch = self._batch, None
+                if buffered:
+                    self.save_signals(buffered)
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
 
     def get_signal_history(self, signal_id: str) -> List[Signal]:
-        """Scans all parquet files to rebuild history for a signal ID."""
-        all_signals = []
-        files = list(self.base_dir.rglob("*.parquet"))
-        
-        for f in files:
-            try:
-                df = pd.read_parquet(f)
-                matched = df[df['signal_id'] == signal_id]
-                
-                if not matched.empty:
-                    for _, row in matched.iterrows():
-                        row_dict = row.to_dict()
-                        # Deserialize payload
-                        if isinstance(row_dict.get('explainability_payload'), str):
-                            row_dict['explainability_payload'] = json.loads(row_dict['explainability_payload'])
-                        
-                        all_signals.append(Signal.from_dict(row_dict))
-            except Exception:
-                continue
-                
-        all_signals.sort(key=lambda s: s.version)
-        return all_signals
+        """All versions of a signal, located through the versions index."""
+        with self._lock:
+            locations = list(self._tail_locations.get(signal_id, []))
+            versions_path = self._index_path("versions.parquet")
+            if versions_path.exists():
+                hits = pq.read_table(versions_path, filters=[('signal_id', '=', signal_id)])
+                locations.extend(zip(
+                    hits['version'].to_pylist(), hits['segment'].to_pylist(), hits['row'].to_pylist()
+                ))
+
+            by_segment: Dict[str, List[int]] = {}
+            for _, segment, row in locations:
+                by_segment.setdefault(segment, []).append(row)
+
+            versions: Dict[int, Signal] = {}
+            for segment, rows in by_segment.items():
+                if segment in self._tail:
+                    records = [self._tail[segment][r] for r in rows]
+                else:
+                    records = self._read_rows(segment, rows)
+                for rec in records:
+                    versions[rec['version']] = self._to_signal(rec)
+
+        return [versions[v] for v in sorted(versions)]
 
     def get_latest_signal(self, signal_id: str) -> Optional[Signal]:
-        history = self.get_signal_history(signal_id)
-        return history[-1] if history else None
+        """Latest version from the latest-state views and the tail."""
+        with self._lock:
+            best = None
+            for latest in self._tail_latest.values():
+                sig = latest.get(signal_id)
+                if sig is not None and (best is None or sig.version > best.version):
+                    best = sig
+
+            for market in Market:
+                path = self._latest_path(market)
+                if not path.exists():
+                    continue
+                for rec in pq.read_table(path, filters=[('signal_id', '=', signal_id)]).to_pylist():
+                    if best is None or rec['version'] > best.version:
+                        best = self._to_signal(rec)
+            return best
 
     def get_active_signals(self, market: Market) -> List[Signal]:
         """Retrieves latest version of all signals that are currently ACTIVE."""
-        market_dir = self.base_dir / market.value
-        if not market_dir.exists():
-            return []
-            
-        signal_map: Dict[str, Signal] = {}
-        
-        # Optimization: Scan recursively
-        files = list(market_dir.rglob("*.parquet"))
-        
-        for f in files:
-            try:
-                df = pd.read_parquet(f)
-                for _, row in df.iterrows():
-                    row_dict = row.to_dict()
-                    # Deserialize
-                    if isinstance(row_dict.get('explainability_payload'), str):
-                        row_dict['explainability_payload'] = json.loads(row_dict['explainability_payload'])
-                        
-                    sig = Signal.from_dict(row_dict)
-                    
-                    # Keep latest version
-                    if sig.signal_id not in signal_map:
-                        signal_map[sig.signal_id] = sig
+        with self._lock:
+            view = self._market_view(market)
+            result = dict(view.active)
+
+            tail = self._tail_latest.get(market.value, {})
+            if tail:
+                view_versions = self._view_versions(market, view, tail)
+                for signal_id, sig in tail.items():
+                    if view_versions[signal_id] > sig.version:
+                        continue
+                    if sig.lifecycle_state == SignalState.ACTIVE:
+                        result[signal_id] = sig
                     else:
-                        if sig.version > signal_map[sig.signal_id].version:
-                            signal_map[sig.signal_id] = sig
-            except Exception:
-                continue
-        
-        return [s for s in signal_map.values() if s.lifecycle_state == SignalState.ACTIVE]
+                        result.pop(signal_id, None)
+
+        return list(result.values())
+
+    def _market_view(self, market: Market) -> _MarketView:
+        view = self._views.get(market.value)
+        if view is not None:
+            return view
+
+        view = _MarketView()
+        path = self._active_path(market)
+        if path.exists():
+            view.active = {rec['signal_id']: self._to_signal(rec) for rec in pq.read_table(path).to_pylist()}
+
+        self._views[market.value] = view
+        return view
+
+    def _view_versions(self, market: Market, view: _MarketView, signal_ids: Iterable[str]) -> Dict[str, int]:
+        """View versions for tail signals; ids not seen before are fetched in one filtered read."""
+        missing = [sid for sid in signal_ids if sid not in view.versions]
+        if missing:
+            found = {}
+            path = self._latest_path(market)
+            if path.exists():
+                hits = pq.read_table(path, columns=['signal_id', 'version'], filters=[('signal_id', 'in', missing)])
+                found = dict(zip(hits['signal_id'].to_pylist(), hits['version'].to_pylist()))
+            for sid in missing:
+                view.versions[sid] = found.get(sid, -1)
+        return view.versions
+
+    # ------------------------------------------------------------------
+    # Compaction
+    # ------------------------------------------------------------------
+
+    def _maybe_compact(self, pending: int) -> None:
+        if not self.compact_threshold or pending < self.compact_threshold:
+            return
+        if not self.background_compaction:
+            self.compact()
+            return
+        with self._lock:
+            if self._compact_thread is not None and self._compact_thread.is_alive():
+                return
+            self._compact_thread = threading.Thread(
+                target=self._compact_in_background, name="signal-compaction", daemon=True
+            )
+            self._compact_thread.start()
+
+    def _compact_in_background(self) -> None:
+        try:
+            self.compact()
+        except Exception as e:
+            logger.exception(f"Signal store compaction failed: {e}")
+
+    def wait_for_compaction(self, timeout: Optional[float] = None) -> None:
+        """Block until a running background compaction finishes."""
+        thread = self._compact_thread
+        if thread is not None:
+            thread.join(timeout)
+
+    def compact(self) -> int:
+        """
+        Merges each day's segments into one file and folds the tail into the
+        versions index and latest-state views.
+
+        Crash safe: new files are written atomically before the manifest, and
+        merged segments are removed last. Segments left behind by a crash are
+        read back as tail and deduplicated on (signal_id, version).
+
+        Returns:
+            Number of segments merged away.
+        """
+        with self._compact_lock:
+            with self._lock:
+                tail = dict(self._tail)
+                covered = set(self._covered)
+            if not tail:
+                return 0
+
+            partitions: Dict[str, List[str]] = {}
+            for segment in covered | set(tail):
+                if (self.base_dir / segment).exists():
+                    partitions.setdefault(segment.rsplit('/', 1)[0], []).append(segment)
+
+            merged: Dict[str, str] = {}
+            new_locations: List[pa.Table] = []
+            for partition, segments in sorted(partitions.items()):
+                if len(segments) < 2:
+                    continue
+                segments.sort()
+                table = pa.concat_tables([
+                    pa.Table.from_pylist(tail[s], schema=SIGNAL_SCHEMA) if s in tail else self._read_segment(s)
+                    for s in segments
+                ])
+                keys = table.select(['signal_id', 'version']).to_pandas()
+                table = table.filter(pa.array(~keys.duplicated(keep='last').to_numpy()))
+
+                new_segment = f"{partition}/{self._next_segment_name()}"
+                self._write_table(table, self.base_dir / new_segment)
+                for s in segments:
+                    merged[s] = new_segment
+                new_locations.append(self._locations_table(table, new_segment))
+
+            # Versions index: drop rows of merged segments, add tail and merged rows
+            versions_path = self._index_path("versions.parquet")
+            parts = []
+            if versions_path.exists():
+                old = pq.read_table(versions_path)
+                if merged:
+                    old = old.filter(pc.invert(pc.is_in(old['segment'], value_set=pa.array(list(merged)))))
+                parts.append(old)
+            for segment, records in tail.items():
+                if segment not in merged:
+                    parts.append(self._locations_table(pa.Table.from_pylist(records, schema=SIGNAL_SCHEMA), segment))
+            parts.extend(new_locations)
+            versions = pa.concat_tables(parts).sort_by([('signal_id', 'ascending'), ('version', 'ascending')])
+            self._write_table(versions, versions_path)
+
+            # Latest-state view (and its ACTIVE slice) per market
+            for market in Market:
+                records = [rec for recs in tail.values() for rec in recs if rec['market'] == market.value]
+                if records:
+                    latest = self._merge_latest(market, records)
+                    self._write_table(latest, self._latest_path(market))
+                    active = latest.filter(pc.equal(latest['lifecycle_state'], SignalState.ACTIVE.value))
+                    self._write_table(active, self._active_path(market))
+
+            new_covered = ((covered | set(tail)) - set(merged)) | set(merged.values())
+            manifest = self._index_path("manifest.json")
+            tmp_path = manifest.parent / f"{manifest.name}.tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump({"updated_at": datetime.utcnow().isoformat(), "segments": sorted(new_covered)}, f)
+            os.replace(tmp_path, manifest)
+
+            with self._lock:
+                for segment in merged:
+                    try:
+                        (self.base_dir / segment).unlink()
+                    except OSError as e:
+                        logger.warning(f"Could not remove compacted segment {segment}: {e}")
+
+                # Keep only segments appended while compaction ran
+                remaining = {s: r for s, r in self._tail.items() if s not in tail}
+                self._covered = new_covered
+                self._tail, self._tail_latest, self._tail_locations = {}, {}, {}
+                for segment, records in remaining.items():
+                    self._add_tail(segment, records)
+                self._views.clear()
+
+        logger.info(f"Compacted signal store: folded {len(tail)} tail segments, merged {len(merged)} segments")
+        return len(merged)
+
+    @staticmethod
+    def _locations_table(table: pa.Table, segment: str) -> pa.Table:
+        n = len(table)
+        return pa.Table.from_arrays([
+            table['signal_id'],
+            table['version'],
+            pa.array([segment] * n, pa.string()),
+            pa.array(range(n), pa.int64()),
+        ], schema=INDEX_SCHEMA)
+
+    def _merge_latest(self, market: Market, records: List[Dict]) -> pa.Table:
+        """Latest-state view with the tail records applied, sorted by signal_id."""
+        parts = []
+        path = self._latest_path(market)
+        if path.exists():
+            parts.append(pq.read_table(path).cast(SIGNAL_SCHEMA))
+        parts.append(pa.Table.from_pylist(records, schema=SIGNAL_SCHEMA))
+        combined = pa.concat_tables(parts)
+
+        keys = combined.select(['signal_id', 'version']).to_pandas()
+        ordered = keys.sort_values(['signal_id', 'version'], kind='stable')
+        keep = ordered.index[~ordered['signal_id'].duplicated(keep='last').to_numpy()]
+        return combined.take(pa.array(keep.to_numpy()))
@@ -1,3 +1,4 @@
 """Momentum Engine module."""
 from .momentum_engine import MomentumEngine
 from .signal_models import MomentumSignal
+from .indicator_state import SymbolIndicatorState
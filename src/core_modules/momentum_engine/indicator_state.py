@@ -0,0 +1,131 @@
+"""Incremental indicator state for Momentum Engine.
+
+Maintains the same indicators as ``MomentumEngine._compute_indicators``
+(intraday VWAP, HOD and the rolling volume mean) as running values updated
+one candle at a time, so live evaluation is O(1) per symbol instead of a
+full reload and recompute of the history.
+"""
+
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Any, Deque, Dict, Optional
+
+import pandas as pd
+
+
+def _divide(numerator: float, denominator: float) -> float:
+    """Float division with pandas semantics for a zero denominator."""
+    if denominator == 0:
+        if numerator == 0 or numerator != numerator:
+            return float("nan")
+        return float("inf") if numerator > 0 else float("-inf")
+    return numerator / denominator
+
+
+def _kahan_add(total: float, compensation: float, value: float):
+    """One step of compensated summation, in the same order as pandas' cumsum."""
+    y = value - compensation
+    t = total + y
+    return t, (t - total) - y
+
+
+@dataclass
+class SymbolIndicatorState:
+    """Running indicator state for a single symbol.
+
+    Mirrors the batch computation exactly: VWAP and HOD reset on each new
+    calendar date, while the volume moving average is a plain rolling window
+    across the whole candle history (it does not reset at the day boundary).
+    """
+
+    symbol: str
+    vol_ma_window: int = 20
+
+    # Intraday aggregates (reset on date change)
+    current_date: Optional[date] = None
+    cum_tpv: float = 0.0
+    cum_vol: float = 0.0
+    # Kahan compensation terms; pandas' groupby cumsum is compensated, so
+    # plain float accumulation would drift from the batch VWAP in the last ulp
+    _tpv_comp: float = 0.0
+    _vol_comp: float = 0.0
+    hod: float = float("-inf")
+
+    # Rolling volume window (spans days)
+    volume_window: Deque[float] = field(default_factory=deque)
+
+    # Latest candle
+    candle_count: int = 0
+    last_timestamp: Optional[pd.Timestamp] = None
+    last_high: float = 0.0
+    last_close: float = 0.0
+    last_volume: float = 0.0
+
+    def update(self, candle: Dict[str, Any]) -> bool:
+        """Fold one finalized candle into the running state.
+
+        Candles at or before the last seen timestamp are ignored, which makes
+        it safe to warm up from disk and then receive the same candle again
+        from the aggregator callback.
+
+        Args:
+            candle: Dict with timestamp, high, low, close and volume.
+
+        Returns:
+            True if the candle was applied, False if it was stale.
+        """
+        ts = pd.Timestamp(candle["timestamp"])
+        if self.last_timestamp is not None and ts <= self.last_timestamp:
+            return False
+
+        high = float(candle["high"])
+        low = float(candle["low"])
+        close = float(candle["close"])
+        volume = float(candle["volume"])
+
+        candle_date = ts.date()
+        if candle_date != self.current_date:
+            self.current_date = candle_date
+            self.cum_tpv = 0.0
+            self.cum_vol = 0.0
+            self._tpv_comp = 0.0
+            self._vol_comp = 0.0
+            self.hod = float("-inf")
+
+        tp = (high + low + close) / 3
+        self.cum_tpv, self._tpv_comp = _kahan_add(self.cum_tpv, self._tpv_comp, tp * volume)
+        self.cum_vol, self._vol_comp = _kahan_add(self.cum_vol, self._vol_comp, volume)
+        if high > self.hod:
+            self.hod = high
+
+        self.volume_window.append(volume)
+        if len(self.volume_window) > self.vol_ma_window:
+            self.volume_window.popleft()
+
+        self.candle_count += 1
+        self.last_timestamp = ts
+        self.last_high = high
+        self.last_close = close
+        self.last_volume = volume
+        return True
+
+    @property
+    def ready(self) -> bool:
+        """True once enough candles have been seen to fill the volume window."""
+        return self.candle_count >= self.vol_ma_window
+
+    @property
+    def vwap(self) -> float:
+        return _divide(self.cum_tpv, self.cum_vol)
+
+    @property
+    def vol_ma(self) -> float:
+        if len(self.volume_window) < self.vol_ma_window:
+            return float("nan")
+        # Window is bounded by vol_ma_window, so this stays O(1) per candle
+        return sum(self.volume_window) / self.vol_ma_window
+
+    @property
+    def rel_vol(self) -> float:
+        return _divide(self.last_volume, self.vol_ma)
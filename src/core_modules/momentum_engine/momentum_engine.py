@@ -11,6 +11,9 @@ import pandas as pd
 import numpy as np
 from pathlib import Path
 from typing import List, Optional, Dict
+from ingestion.india_ingestion.candle_bus import CandleBus
+from ingestion.india_ingestion.candle_store import CandleStore
+from .indicator_state import SymbolIndicatorState
 from .signal_models import MomentumSignal
 
 logger = logging.getLogger(__name__)
@@ -23,7 +26,9 @@ class MomentumEngine:
         processed_data_path: str = "data/processed/candles/intraday",
         vol_ma_window: int = 20,
         hod_proximity_pct: float = 0.5,  # 0.5% from HOD
-        vol_multiplier: float = 2.0      # 2x relative volume
+        vol_multiplier: float = 2.0,     # 2x relative volume
+        incremental: bool = False,
+        candle_bus: Optional[CandleBus] = None
     ):
         """Initialize the engine.
 
@@ -32,22 +37,32 @@ class MomentumEngine:
             vol_ma_window: Window for average volume calculation.
             hod_proximity_pct: Tolerance for HOD proximity.
             vol_multiplier: Threshold for volume expansion.
+            incremental: Evaluate from running per-symbol indicator state fed
+                         by update_candles() instead of reloading history.
+            candle_bus: Optional in-memory candle bus. Symbols it holds are
+                        read from memory instead of Parquet.
         """
         self.data_path = Path(processed_data_path)
+        self.candle_store = CandleStore(processed_data_path)
         self.vol_ma_window = vol_ma_window
         self.hod_proximity_pct = hod_proximity_pct
         self.vol_multiplier = vol_multiplier
+        self.incremental = incremental
+        self.candle_bus = candle_bus
+        
+        # Running indicator state per symbol (incremental mode)
+        self._states: Dict[str, SymbolIndicatorState] = {}
 
     def _load_data(self, symbol: str, exchange: str = "NSE") -> pd.DataFrame:
-        """Load processed Parquet data for a symbol."""
-        file_path = self.data_path / f"{exchange}_{symbol}_1m.parquet"
-        if not file_path.exists():
+        """Load processed candle data for a symbol (bus if live, else base file + pending segments)."""
+        if self.candle_bus is not None and self.candle_bus.has(symbol, exchange):
+            return self.candle_bus.frame(symbol, exchange)
+
+        if not self.candle_store.exists(symbol, exchange):
             logger.warning(f"No processed data found for {exchange}:{symbol}")
             return pd.DataFrame()
         
-        df = pd.read_parquet(file_path)
-        df["timestamp"] = pd.to_datetime(df["timestamp"])
-        return df
+        return self.candle_store.read(symbol, exchange)
 
     def _compute_indicators(self, df: pd.DataFrame) -> pd.DataFrame:
         """Compute internal indicators: VWAP, HOD, RelVol."""
@@ -80,57 +95,98 @@ class MomentumEngine:
         
         return df
 
-    def generate_signals(self, symbol: str, exchange: str = "NSE") -> List[MomentumSignal]:
-        """Analyze data and generate signals."""
-        df = self._load_data(symbol, exchange)
-        if df.empty:
-            return []
-            
-        df = self._compute_indicators(df)
-        if len(df) < self.vol_ma_window:
-            return []
+    def _evaluate_latest(
+        self,
+        symbol: str,
+        timestamp: pd.Timestamp,
+        high: float,
+        close: float,
+        volume: float,
+        vwap: float,
+        hod: float,
+        rel_vol: float
+    ) -> List[MomentumSignal]:
+        """Apply the v0 signal criteria to the latest candle's indicators.
 
+        Shared by the batch and incremental paths so both produce identical
+        signals for identical indicator values.
+        """
         signals = []
         
-        # Analyze the latest candle
-        latest = df.iloc[-1]
-        
         # Criteria:
         # 1. Price > VWAP
         # 2. Near HOD
         # 3. Volume Expansion
         
-        above_vwap = latest['close'] > latest['vwap']
+        above_vwap = close > vwap
         
-        hod_dist = (latest['hod'] - latest['close']) / latest['hod'] * 100
+        hod_dist = (hod - close) / hod * 100
         near_hod = hod_dist <= self.hod_proximity_pct
         
-        vol_surge = latest['rel_vol'] >= self.vol_multiplier
+        vol_surge = rel_vol >= self.vol_multiplier
         
         if above_vwap and near_hod and vol_surge:
             reason = (
-                f"Price ({latest['close']:.2f}) > VWAP ({latest['vwap']:.2f}); "
-                f"Near HOD ({latest['hod']:.2f}, dist {hod_dist:.2f}%); "
-                f"Vol surge (x{latest['rel_vol']:.1f})"
+                f"Price ({close:.2f}) > VWAP ({vwap:.2f}); "
+                f"Near HOD ({hod:.2f}, dist {hod_dist:.2f}%); "
+                f"Vol surge (x{rel_vol:.1f})"
             )
             
             # Confidence calculation (simple heuristic for v0)
-            confidence = min(1.0, (latest['rel_vol'] / (self.vol_multiplier * 2)) + 0.5)
+            confidence = min(1.0, (rel_vol / (self.vol_multiplier * 2)) + 0.5)
             
             signal = MomentumSignal(
                 symbol=symbol,
-                timestamp=latest['timestamp'].isoformat(),
+                timestamp=timestamp.isoformat(),
                 confidence=round(confidence, 2),
-                entry_hint=f"Above {latest['high']:.2f}",
-                stop_hint=f"Below {latest['vwap']:.2f}",
+                entry_hint=f"Above {high:.2f}",
+                stop_hint=f"Below {vwap:.2f}",
                 reason=reason,
-                price_t0=float(latest['close']),
-                volume_t0=float(latest['volume'])
+                price_t0=float(close),
+                volume_t0=float(volume)
             )
             signals.append(signal)
             
         return signals
 
+    def _evaluate_row(self, row: pd.Series, symbol: str) -> List[MomentumSignal]:
+        """Evaluate one row of an indicator frame."""
+        return self._evaluate_latest(
+            symbol,
+            row['timestamp'],
+            row['high'],
+            row['close'],
+            row['volume'],
+            row['vwap'],
+            row['hod'],
+            row['rel_vol']
+        )
+
+    def _evaluate_df(self, df: pd.DataFrame, symbol: str) -> List[MomentumSignal]:
+        """Compute indicators over a candle frame and evaluate its latest row."""
+        df = self._compute_indicators(df)
+        if len(df) < self.vol_ma_window:
+            return []
+
+        # Analyze the latest candle
+        return self._evaluate_row(df.iloc[-1], symbol)
+
+    def generate_signals(self, symbol: str, exchange: str = "NSE") -> List[MomentumSignal]:
+        """Analyze data and generate signals.
+
+        In incremental mode the latest running indicator state is evaluated
+        (warming it up from disk on first use); otherwise the full history is
+        reloaded and recomputed.
+        """
+        if self.incremental:
+            return self.generate_signals_incremental(symbol, exchange)
+
+        df = self._load_data(symbol, exchange)
+        if df.empty:
+            return []
+            
+        return self._evaluate_df(df, symbol)
+
     def generate_signals_from_df(self, df: pd.DataFrame, symbol: str, exchange: str = "NSE") -> List[MomentumSignal]:
         """Analyze data from a provided DataFrame and generate signals.
         
@@ -148,51 +204,148 @@ class MomentumEngine:
         if df.empty:
             return []
             
-        df = self._compute_indicators(df)
-        if len(df) < self.vol_ma_window:
+        return self._evaluate_df(df, symbol)
+
+    def _signal_mask(self, df: pd.DataFrame) -> np.ndarray:
+        """Vectorized signal criteria over an indicator frame.
+
+        Row i is True iff the prefix ending at row i would signal.
+        """
+        close = df['close'].to_numpy(dtype=float)
+        vwap = df['vwap'].to_numpy(dtype=float)
+        hod = df['hod'].to_numpy(dtype=float)
+        rel_vol = df['rel_vol'].to_numpy(dtype=float)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            hod_dist = (hod - close) / hod * 100
+            mask = (close > vwap) & (hod_dist <= self.hod_proximity_pct) & (rel_vol >= self.vol_multiplier)
+
+        # Prefixes shorter than the volume window never signal
+        mask[: self.vol_ma_window - 1] = False
+        return mask
+
+    def signal_mask(self, df: pd.DataFrame) -> np.ndarray:
+        """Return a boolean array marking the candles that would signal.
+
+        Args:
+            df: Candle frame sorted by timestamp (OHLCV columns).
+
+        Returns:
+            Boolean array aligned with the rows of df.
+        """
+        if df.empty:
+            return np.zeros(0, dtype=bool)
+        return self._signal_mask(self._compute_indicators(df.reset_index(drop=True)))
+
+    def generate_signal_series(
+        self,
+        df: pd.DataFrame,
+        symbol: str,
+        exchange: str = "NSE",
+        positions: Optional[np.ndarray] = None
+    ) -> List[MomentumSignal]:
+        """Evaluate the signal criteria at many rows of a candle frame in one pass.
+
+        Every indicator is prefix-only (grouped cumsum/cummax and a trailing
+        rolling mean), so the indicator values at row i of the full frame equal
+        those of the last row of ``df.iloc[:i + 1]``. This is therefore
+        equivalent to calling ``generate_signals_from_df`` on each prefix, in
+        O(n) instead of O(n^2).
+
+        Args:
+            df: Candle frame sorted by timestamp.
+            symbol: Trading symbol for signal labeling.
+            exchange: Exchange for signal labeling.
+            positions: Row positions to evaluate, each standing for the prefix
+                       ending at that row. Defaults to every row.
+
+        Returns:
+            List of MomentumSignal objects in row order.
+
+        Raises:
+            ValueError: If a position is outside ``[0, len(df))``. Negative
+                        positions would otherwise wrap to the end of the
+                        frame and read future rows.
+        """
+        if positions is not None:
+            positions = np.asarray(positions, dtype=np.int64)
+            if positions.size and (positions.min() < 0 or positions.max() >= len(df)):
+                raise ValueError(f"positions must lie in [0, {len(df)}) for {symbol}")
+        if df.empty:
             return []
 
+        df = self._compute_indicators(df.reset_index(drop=True))
+        if positions is None:
+            positions = np.arange(len(df))
+
+        candidate = self._signal_mask(df)
+
         signals = []
-        
-        # Analyze the latest candle
-        latest = df.iloc[-1]
-        
-        # Criteria:
-        # 1. Price > VWAP
-        # 2. Near HOD
-        # 3. Volume Expansion
-        
-        above_vwap = latest['close'] > latest['vwap']
-        
-        hod_dist = (latest['hod'] - latest['close']) / latest['hod'] * 100
-        near_hod = hod_dist <= self.hod_proximity_pct
-        
-        vol_surge = latest['rel_vol'] >= self.vol_multiplier
-        
-        if above_vwap and near_hod and vol_surge:
-            reason = (
-                f"Price ({latest['close']:.2f}) > VWAP ({latest['vwap']:.2f}); "
-                f"Near HOD ({latest['hod']:.2f}, dist {hod_dist:.2f}%); "
-                f"Vol surge (x{latest['rel_vol']:.1f})"
-            )
-            
-            # Confidence calculation (simple heuristic for v0)
-            confidence = min(1.0, (latest['rel_vol'] / (self.vol_multiplier * 2)) + 0.5)
-            
-            signal = MomentumSignal(
-                symbol=symbol,
-                timestamp=latest['timestamp'].isoformat(),
-                confidence=round(confidence, 2),
-                entry_hint=f"Above {latest['high']:.2f}",
-                stop_hint=f"Below {latest['vwap']:.2f}",
-                reason=reason,
-                price_t0=float(latest['close']),
-                volume_t0=float(latest['volume'])
-            )
-            signals.append(signal)
-            
+        for pos in positions[candidate[positions]]:
+            signals.extend(self._evaluate_row(df.iloc[pos], symbol))
         return signals
 
+    # ------------------------------------------------------------------
+    # Incremental (live) mode
+    # ------------------------------------------------------------------
+
+    def warm_up(self, symbol: str, exchange: str = "NSE") -> SymbolIndicatorState:
+        """Seed the running indicator state for a symbol from stored candles.
+
+        Args:
+            symbol: Trading symbol.
+            exchange: Exchange segment.
+
+        Returns:
+            The (re)initialized SymbolIndicatorState.
+        """
+        state = SymbolIndicatorState(symbol=symbol, vol_ma_window=self.vol_ma_window)
+        df = self._load_data(symbol, exchange)
+        if not df.empty:
+            df = df.sort_values("timestamp", kind="stable")
+            for candle in df[["timestamp", "high", "low", "close", "volume"]].to_dict("records"):
+                state.update(candle)
+        self._states[symbol] = state
+        return state
+
+    def update_candles(self, candles: List[Dict]) -> None:
+        """Fold newly finalized candles into the running indicator state.
+
+        Designed to be called from ``CandleAggregator.on_candle_callback``.
+        Symbols without state are warmed up from the bus or disk first; either
+        may already contain the finalized candle at that point, and stale
+        candles are ignored by the state, so nothing is double-counted.
+
+        Args:
+            candles: List of candle dicts as produced by the aggregator.
+        """
+        for candle in candles:
+            symbol = candle["symbol"]
+            state = self._states.get(symbol)
+            if state is None:
+                state = self.warm_up(symbol, candle.get("exchange", "NSE"))
+            state.update(candle)
+
+    def generate_signals_incremental(self, symbol: str, exchange: str = "NSE") -> List[MomentumSignal]:
+        """Evaluate the latest running indicator state for a symbol (O(1))."""
+        state = self._states.get(symbol)
+        if state is None:
+            state = self.warm_up(symbol, exchange)
+
+        if not state.ready:
+            return []
+
+        return self._evaluate_latest(
+            symbol,
+            state.last_timestamp,
+            state.last_high,
+            state.last_close,
+            state.last_volume,
+            state.vwap,
+            state.hod,
+            state.rel_vol
+        )
+
     def run_on_all(self, watchlist: List[str]) -> List[MomentumSignal]:
         """Run engine on all watchlist symbols."""
         all_signals = []
@@ -19,6 +19,8 @@ TICKS_DIR = EV_DIR / "ticks"
 LEDGER_DIR = DOCS_DIR / "epistemic" / "ledger"
 META_DIR = EV_DIR / "meta_analysis"
 
+from src.evolution.tick_store import get_tick_store
+
 app = FastAPI(title="TraderFund Market Intelligence Dashboard", version="1.0.0")
 
 # Allow CORS for local frontend
@@ -36,14 +38,14 @@ def _get_sorted_tick_dirs(limit: int = 100) -> List[Path]:
     if not TICKS_DIR.exists():
         print(f"DEBUG: TICKS_DIR does not exist: {TICKS_DIR}")
         return []
-    # Sort by timestamp (descending)
+    # Sorted by timestamp (descending) from the shared, incrementally maintained index
     # Assumes folder format: tick_{timestamp}
-    dirs = sorted([d for d in TICKS_DIR.iterdir() if d.is_dir()], key=lambda x: x.name, reverse=True)
+    dirs = get_tick_store(TICKS_DIR).index.latest(limit)
     if dirs:
         print(f"DEBUG: Found {len(dirs)} ticks. Latest: {dirs[0]}")
     else:
         print("DEBUG: No ticks found in TICKS_DIR")
-    return dirs[:limit]
+    return dirs
 
 def _get_latest_tick_dir() -> Optional[Path]:
     dirs = _get_sorted_tick_dirs(limit=1)
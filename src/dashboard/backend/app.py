@@ -1,6 +1,5 @@
 import sys
-import threading
-import time
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 from fastapi import FastAPI
@@ -20,12 +19,26 @@ from dashboard.backend.loaders.narrative import load_system_narrative, load_syst
 from dashboard.backend.loaders.capital import load_capital_readiness, load_capital_history
 from dashboard.backend.loaders.suppression import load_suppression_status
 from traderfund.validation.validation_runner import ValidationRunner
+from dashboard.backend.utils.concurrency import CoalescingExecutor, ValidationRefresher
 
-app = FastAPI(title="TraderFund Market Intelligence Dashboard", version="1.0.0")
 VALIDATION_RUNNER = ValidationRunner(str(PROJECT_ROOT))
-VALIDATION_LOCK = threading.Lock()
-LAST_DASHBOARD_VALIDATION_AT = 0.0
 VALIDATION_TTL_SECONDS = 60.0
+VALIDATION_REFRESHER = ValidationRefresher(VALIDATION_RUNNER, ttl_seconds=VALIDATION_TTL_SECONDS)
+# Loaders are synchronous and file-heavy: run them off the event loop
+LOADERS = CoalescingExecutor()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    VALIDATION_REFRESHER.start()
+    try:
+        yield
+    finally:
+        VALIDATION_REFRESHER.stop()
+        LOADERS.shutdown()
+
+
+app = FastAPI(title="TraderFund Market Intelligence Dashboard", version="1.0.0", lifespan=lifespan)
 
 # Allow CORS for local frontend
 app.add_middleware(
@@ -37,68 +50,62 @@ app.add_middleware(
 )
 
 
-def _run_pre_refresh_validation_if_due(market: str) -> None:
-    global LAST_DASHBOARD_VALIDATION_AT
-    now = time.monotonic()
-    if now - LAST_DASHBOARD_VALIDATION_AT < VALIDATION_TTL_SECONDS:
-        return
-    with VALIDATION_LOCK:
-        now = time.monotonic()
-        if now - LAST_DASHBOARD_VALIDATION_AT < VALIDATION_TTL_SECONDS:
-            return
-        VALIDATION_RUNNER.run_pre_dashboard_refresh(
-            {
-                "market": market,
-                "source": "src.dashboard.backend.app",
-            }
-        )
-        LAST_DASHBOARD_VALIDATION_AT = now
-
-
 @app.middleware("http")
-async def validation_pre_refresh_middleware(request, call_next):
+async def validation_request_middleware(request, call_next):
+    # Validation runs on the background refresher; requests only mark the market as viewed
     if request.method == "GET" and request.url.path.startswith("/api/"):
-        _run_pre_refresh_validation_if_due(request.query_params.get("market", "US"))
+        VALIDATION_REFRESHER.note_request(request.query_params.get("market", "US"))
     return await call_next(request)
 
+@app.get("/api/system/validation")
+async def get_validation_status(market: str = "US"):
+    """
+    Latest background pre-dashboard-refresh validation result for a market.
+    """
+    return VALIDATION_REFRESHER.status(market)
+
+@app.get("/api/system/loaders")
+async def get_loader_stats():
+    return LOADERS.get_stats()
+
 @app.get("/api/system/status")
 async def get_system_status(market: str = "US"):
-    return load_system_status(market)
+    return await LOADERS.run(load_system_status, market)
 
 @app.get("/api/layers/health")
 async def get_layer_health(market: str = "US"):
-    return load_layer_health(market)
+    return await LOADERS.run(load_layer_health, market)
 
 @app.get("/api/market/snapshot")
 async def get_market_snapshot(market: str = "US"):
-    return load_market_snapshot(market)
+    return await LOADERS.run(load_market_snapshot, market)
 
 @app.get("/api/watchers/timeline")
 async def get_watcher_timeline(market: str = "US", limit: int = 10):
-    return load_watcher_timeline(market, limit)
+    return await LOADERS.run(load_watcher_timeline, market, limit)
 
 @app.get("/api/strategies/eligibility")
 async def get_strategy_eligibility(market: str = "US"):
-    return load_strategy_eligibility(market)
+    return await LOADERS.run(load_strategy_eligibility, market)
 
 @app.get("/api/meta/summary")
 async def get_meta_summary():
-    return load_meta_summary()
+    return await LOADERS.run(load_meta_summary)
 
 @app.get("/api/system/narrative")
 async def get_system_narrative(market: str = "US"):
-    return load_system_narrative(market)
+    return await LOADERS.run(load_system_narrative, market)
 
 @app.get("/api/system/blockers")
 async def get_system_blockers(market: str = "US"):
-    return load_system_blockers(market)
+    return await LOADERS.run(load_system_blockers, market)
 
 @app.get("/api/intelligence/suppression/{market}")
 async def get_suppression_status(market: str = "US"):
     """
     Returns explicit F5 suppression state and reason registry for a market.
     """
-    return load_suppression_status(market)
+    return await LOADERS.run(load_suppression_status, market)
 
 @app.get("/api/system/activation_conditions")
 async def get_activation_conditions():
@@ -115,16 +122,16 @@ async def get_activation_conditions():
 
 @app.get("/api/capital/readiness")
 async def get_capital_readiness(market: str = "US"):
-    return load_capital_readiness(market)
+    return await LOADERS.run(load_capital_readiness, market)
 
 @app.get("/api/capital/history")
 async def get_capital_history(market: str = "US"):
-    return load_capital_history(market)
+    return await LOADERS.run(load_capital_history, market)
 
 from dashboard.backend.loaders.macro import load_macro_context
 @app.get("/api/macro/context")
 async def get_macro_context(market: str = "US"):
-    return load_macro_context(market)
+    return await LOADERS.run(load_macro_context, market)
 
 from dashboard.backend.loaders.intelligence import load_intelligence_snapshot, load_decision_policy, load_fragility_context, load_execution_gate, load_stress_posture, load_constraint_posture, load_evaluation_scope, load_market_parity
 @app.get("/api/intelligence/gate")
@@ -132,41 +139,41 @@ async def get_execution_gate():
     """
     Returns the canonical Execution Gate Status (A1.2).
     """
-    return load_execution_gate()
+    return await LOADERS.run(load_execution_gate)
 
 @app.get("/api/intelligence/parity/{market}")
 async def get_market_parity(market: str = "US"):
-    return load_market_parity(market)
+    return await LOADERS.run(load_market_parity, market)
 
 @app.get("/api/meta/evaluation/scope")
 async def get_evaluation_scope():
-    return load_evaluation_scope()
+    return await LOADERS.run(load_evaluation_scope)
 
 @app.get("/api/intelligence/stress_posture")
 async def get_stress_posture():
-    return load_stress_posture()
+    return await LOADERS.run(load_stress_posture)
 
 @app.get("/api/intelligence/constraint_posture")
 async def get_constraint_posture():
-    return load_constraint_posture()
+    return await LOADERS.run(load_constraint_posture)
 
 @app.get("/api/intelligence/snapshot")
 async def get_intelligence_snapshot(market: str = "US"):
-    return load_intelligence_snapshot(market)
+    return await LOADERS.run(load_intelligence_snapshot, market)
 
 @app.get("/api/intelligence/policy/{market}")
 async def get_policy_decision(market: str = "US"):
     """
     Returns the Governance Decision Policy for the market.
     """
-    return load_decision_policy(market)
+    return await LOADERS.run(load_decision_policy, market)
 
 @app.get("/api/intelligence/fragility/{market}")
 async def get_fragility_context(market: str = "US"):
     """
     Returns the Systemic Fragility/Stress context for the market.
     """
-    return load_fragility_context(market)
+    return await LOADERS.run(load_fragility_context, market)
 
 from dashboard.backend.loaders.data_anchor import load_data_anchor
 @app.get("/api/data_anchor")
@@ -175,7 +182,7 @@ async def get_data_anchor(market: str = "US"):
     EPISTEMIC RESTORATION: Data Anchor endpoint.
     Returns Truth Epoch, Data Provenance, and Confidence for the specified market.
     """
-    return load_data_anchor(market)
+    return await LOADERS.run(load_data_anchor, market)
 
 from dashboard.backend.loaders.inspection import load_stress_scenarios
 
@@ -185,7 +192,7 @@ async def get_stress_scenarios():
     INSPECTION MODE: Returns parsed stress scenarios from the static audit report.
     Strictly read-only and isolated from live truth.
     """
-    return load_stress_scenarios()
+    return await LOADERS.run(load_stress_scenarios)
 
 from dashboard.backend.loaders.temporal import load_temporal_status
 @app.get("/api/intelligence/temporal/status")
@@ -193,7 +200,7 @@ async def get_temporal_status(market: str = "US"):
     """
     Returns the Temporal Truth Orchestration status (RDT, CTT, TE, Drift) for a market.
     """
-    return load_temporal_status(market)
+    return await LOADERS.run(load_temporal_status, market)
 
 from src.dashboard.backend.loaders.portfolio import (
     load_combined_portfolio_view,
@@ -216,67 +223,71 @@ from src.dashboard.backend.loaders.portfolio import (
 
 @app.get("/api/portfolio/overview/{market}")
 async def get_portfolio_overview(market: str):
-    return load_portfolio_overview(market)
+    return await LOADERS.run(load_portfolio_overview, market)
 
 @app.get("/api/portfolio/holdings/{market}/{portfolio_id}")
 async def get_portfolio_holdings(market: str, portfolio_id: str):
-    return load_portfolio_holdings(market, portfolio_id)
+    return await LOADERS.run(load_portfolio_holdings, market, portfolio_id)
 
 @app.get("/api/portfolio/diversification/{market}/{portfolio_id}")
 async def get_portfolio_diversification(market: str, portfolio_id: str):
-    return load_portfolio_diversification(market, portfolio_id)
+    return await LOADERS.run(load_portfolio_diversification, market, portfolio_id)
 
 @app.get("/api/portfolio/risk/{market}/{portfolio_id}")
 async def get_portfolio_risk(market: str, portfolio_id: str):
-    return load_portfolio_risk(market, portfolio_id)
+    return await LOADERS.run(load_portfolio_risk, market, portfolio_id)
 
 @app.get("/api/portfolio/structure/{market}/{portfolio_id}")
 async def get_portfolio_structure(market: str, portfolio_id: str):
-    return load_portfolio_structure(market, portfolio_id)
+    return await LOADERS.run(load_portfolio_structure, market, portfolio_id)
 
 @app.get("/api/portfolio/performance/{market}/{portfolio_id}")
 async def get_portfolio_performance(market: str, portfolio_id: str):
-    return load_portfolio_performance(market, portfolio_id)
+    return await LOADERS.run(load_portfolio_performance, market, portfolio_id)
 
 @app.get("/api/portfolio/insights/{market}/{portfolio_id}")
 async def get_portfolio_insights(market: str, portfolio_id: str):
-    return load_portfolio_insights(market, portfolio_id)
+    return await LOADERS.run(load_portfolio_insights, market, portfolio_id)
 
 @app.get("/api/portfolio/resilience/{market}/{portfolio_id}")
 async def get_portfolio_resilience(market: str, portfolio_id: str):
-    return load_portfolio_resilience(market, portfolio_id)
+    return await LOADERS.run(load_portfolio_resilience, market, portfolio_id)
 
 @app.get("/api/portfolio/exposure/{market}/{portfolio_id}")
 async def get_portfolio_exposure(market: str, portfolio_id: str):
-    return load_portfolio_exposure(market, portfolio_id)
+    return await LOADERS.run(load_portfolio_exposure, market, portfolio_id)
 
 @app.get("/api/portfolio/macro-alignment/{market}/{portfolio_id}")
 async def get_portfolio_macro_alignment(market: str, portfolio_id: str):
-    return load_portfolio_macro_alignment(market, portfolio_id)
+    return await LOADERS.run(load_portfolio_macro_alignment, market, portfolio_id)
 
 @app.get("/api/portfolio/research/{market}/{portfolio_id}")
 async def get_portfolio_research(market: str, portfolio_id: str):
-    return load_portfolio_research(market, portfolio_id)
+    return await LOADERS.run(load_portfolio_research, market, portfolio_id)
 
 @app.get("/api/portfolio/advisory/{market}/{portfolio_id}")
 async def get_portfolio_advisory(market: str, portfolio_id: str):
-    return load_portfolio_advisory(market, portfolio_id)
+    return await LOADERS.run(load_portfolio_advisory, market, portfolio_id)
 
 @app.get("/api/portfolio/refresh-status/{market}/{portfolio_id}")
 async def get_portfolio_refresh_status(market: str, portfolio_id: str):
-    return load_portfolio_refresh_status(market, portfolio_id)
+    return await LOADERS.run(load_portfolio_refresh_status, market, portfolio_id)
 
 @app.get("/api/portfolio/trend/{market}/{portfolio_id}")
 async def get_portfolio_trend(market: str, portfolio_id: str, limit: int = 20):
-    return load_portfolio_trend(market, portfolio_id, limit=limit)
+    return await LOADERS.run(load_portfolio_trend, market, portfolio_id, limit=limit)
 
 @app.post("/api/portfolio/refresh/{market}/{portfolio_id}")
 async def post_portfolio_refresh(market: str, portfolio_id: str, account_name: str | None = None, headless_auth: bool = False):
-    return trigger_portfolio_refresh(market, portfolio_id, account_name=account_name, headless_auth=headless_auth)
+    # Refreshes have side effects: never share one between requests
+    return await LOADERS.run(
+        trigger_portfolio_refresh, market, portfolio_id,
+        account_name=account_name, headless_auth=headless_auth, coalesce=False,
+    )
 
 @app.get("/api/portfolio/combined")
 async def get_combined_portfolio():
-    return load_combined_portfolio_view()
+    return await LOADERS.run(load_combined_portfolio_view)
 
 if __name__ == "__main__":
     import uvicorn
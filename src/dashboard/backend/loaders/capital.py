@@ -3,6 +3,7 @@ from pathlib import Path
 from typing import Dict, Any, List, Optional
 import os
 from dashboard.backend.loaders.provenance import attach_provenance
+from dashboard.backend.utils.filesystem import get_latest_tick_dir
 
 PROJECT_ROOT = Path(__file__).parent.parent.parent.parent.parent # c:\GIT\TraderFund
 
@@ -15,15 +16,8 @@ def _read_json_safe(path: Path) -> Dict[str, Any]:
     except Exception:
         return {}
 
-def _get_latest_tick_dir() -> Optional[Path]:
-    ticks_dir = PROJECT_ROOT / "docs" / "evolution" / "ticks"
-    if not ticks_dir.exists():
-        return None
-    dirs = sorted([d for d in ticks_dir.iterdir() if d.is_dir()], key=lambda x: x.name, reverse=True)
-    return dirs[0] if dirs else None
-
 def load_capital_readiness(market: str = "US") -> Dict[str, Any]:
-    latest_tick = _get_latest_tick_dir()
+    latest_tick = get_latest_tick_dir()
     if not latest_tick:
         return attach_provenance({"status": "UNKNOWN", "error": "No tick data found"}, "docs/evolution/ticks/<latest>/{market}/capital_readiness.json")
         
@@ -1,6 +1,9 @@
-from dashboard.backend.utils.filesystem import get_latest_tick_dir, read_json_safe, get_ticks_history
-from typing import Dict, Any, List
+from dashboard.backend.utils.filesystem import (
+    TickIndex, get_latest_tick_dir, get_tick_index, get_ticks_history, read_json_cached, read_json_safe,
+)
+from typing import Dict, Any, List, Optional, Tuple
 import datetime
+import threading
 from pathlib import Path
 from dashboard.backend.loaders.provenance import attach_provenance
 
@@ -34,63 +37,147 @@ def _derive_regime_display(regime_ctx: Dict[str, Any]) -> Dict[str, Any]:
         "regime_reason": regime_reason or ("Partial canonical inputs" if degraded else "Canonical-complete regime evaluation."),
     }
 
+# Mapping from UI Factor Name to JSON filename / payload key / state field
+FILE_MAP = {
+    "Regime": "regime_context.json",
+    "Liquidity": "liquidity_compression.json",
+    "Momentum": "momentum_emergence.json",
+    "Dispersion": "dispersion_breakout.json",
+    "Expansion": "expansion_transition.json"
+}
+
+JSON_KEY_MAP = {
+    "Regime": "regime_context",
+    "Liquidity": "liquidity_compression",
+    "Momentum": "momentum_emergence",
+    "Dispersion": "dispersion_breakout",
+    "Expansion": "expansion_transition"
+}
+
+STATE_KEY_MAP = {
+    "Regime": "regime",
+    "Liquidity": "state",
+    "Momentum": "state",
+    "Dispersion": "state",
+    "Expansion": "state"
+}
+
+DURATION_LOOKBACK_TICKS = 50
+# Newest ticks may still be being written, so their states are re-read on every query
+UNSETTLED_TICKS = 2
+
+
+def _factor_state(market_d: Path, factor: str) -> str:
+    data = read_json_cached(market_d / FILE_MAP[factor]).get(JSON_KEY_MAP[factor], {})
+    if factor == "Regime":
+        return _derive_regime_display(data).get("regime_value", "UNKNOWN")
+    return data.get(STATE_KEY_MAP[factor], "UNKNOWN")
+
+
+class FactorRunIndex:
+    """
+    Per-market state runs for every factor over the newest ticks.
+
+    states[factor][i] / runs[factor][i] describe tick names[offset + i]: its
+    state and how many consecutive ticks ending there share it. Durations are
+    capped at `lookback`, so only the last `lookback` ticks ever need reading;
+    new ticks extend the runs incrementally and a lookup is O(1).
+    """
+
+    def __init__(self, tick_index: TickIndex, market: str, lookback: int = DURATION_LOOKBACK_TICKS):
+        self.tick_index = tick_index
+        self.market = market
+        self.lookback = lookback
+        self.names: List[str] = []
+        self.offset = 0
+        self.states: Dict[str, List[str]] = {f: [] for f in FILE_MAP}
+        self.runs: Dict[str, List[int]] = {f: [] for f in FILE_MAP}
+        self._generation = -1
+        self._lock = threading.Lock()
+
+    def _reset(self, offset: int) -> None:
+        self.offset = offset
+        for factor in FILE_MAP:
+            self.states[factor] = []
+            self.runs[factor] = []
+
+    def update(self) -> None:
+        with self._lock:
+            generation, names = self.tick_index.snapshot()
+            if generation != self._generation:
+                k = len(self.names)
+                if names[:k] != self.names:
+                    # Ticks removed or back-filled: start over
+                    self._reset(0)
+                self.names = names
+                self._generation = generation
+
+            computed = self.offset + len(self.states["Regime"])
+            window_start = max(0, len(names) - self.lookback)
+            if computed < window_start:
+                # Everything computed so far is outside the window
+                self._reset(window_start)
+                computed = window_start
+
+            start = max(self.offset, min(computed, len(names) - UNSETTLED_TICKS))
+            for factor in FILE_MAP:
+                del self.states[factor][start - self.offset:]
+                del self.runs[factor][start - self.offset:]
+
+            for name in names[start:]:
+                market_d = self.tick_index.root / name / self.market
+                for factor in FILE_MAP:
+                    state = _factor_state(market_d, factor)
+                    states, runs = self.states[factor], self.runs[factor]
+                    runs.append(runs[-1] + 1 if states and states[-1] == state else 1)
+                    states.append(state)
+
+            # Keep memory bounded to about two windows
+            excess = len(self.states["Regime"]) - 2 * self.lookback
+            if excess > 0:
+                for factor in FILE_MAP:
+                    del self.states[factor][:excess]
+                    del self.runs[factor][:excess]
+                self.offset += excess
+
+    def duration(self, factor: str, current_state: str) -> Tuple[int, Optional[str]]:
+        """(consecutive ticks in current_state, capped at lookback; first tick name of that run)."""
+        states = self.states.get(factor)
+        if not states or states[-1] != current_state:
+            return 0, None
+        count = min(self.runs[factor][-1], self.lookback)
+        return count, self.names[self.offset + len(states) - count]
+
+
+_RUN_INDEXES: Dict[Tuple[Path, str], FactorRunIndex] = {}
+_RUN_INDEXES_LOCK = threading.Lock()
+
+
+def get_factor_run_index(market: str) -> FactorRunIndex:
+    tick_index = get_tick_index()
+    key = (tick_index.root, market)
+    with _RUN_INDEXES_LOCK:
+        run_index = _RUN_INDEXES.get(key)
+        if run_index is None:
+            run_index = _RUN_INDEXES[key] = FactorRunIndex(tick_index, market)
+    run_index.update()
+    return run_index
+
+
 def _calculate_state_durations(current_states: Dict[str, str], latest_ts: datetime.datetime, market: str) -> Dict[str, Any]:
     """
-    Scans history to see how long each factor has been in its current state.
+    Looks up how long each factor has been in its current state (up to
+    DURATION_LOOKBACK_TICKS ticks) from the precomputed run index.
     """
-    history_dirs = get_ticks_history(limit=50) # Look back up to 50 ticks
+    run_index = get_factor_run_index(market)
     durations = {}
-    
+
     for factor, current_state in current_states.items():
-        count = 0
-        first_tick_ts = latest_ts
-        
-        # Mapping from UI Factor Name to JSON filename
-        FILE_MAP = {
-            "Regime": "regime_context.json",
-            "Liquidity": "liquidity_compression.json",
-            "Momentum": "momentum_emergence.json",
-            "Dispersion": "dispersion_breakout.json",
-            "Expansion": "expansion_transition.json"
-        }
-        
-        JSON_KEY_MAP = {
-            "Regime": "regime_context",
-            "Liquidity": "liquidity_compression",
-            "Momentum": "momentum_emergence",
-            "Dispersion": "dispersion_breakout",
-            "Expansion": "expansion_transition"
-        }
-        
-        STATE_KEY_MAP = {
-            "Regime": "regime",
-            "Liquidity": "state",
-            "Momentum": "state",
-            "Dispersion": "state",
-            "Expansion": "state"
-        }
-        
-        filename = FILE_MAP.get(factor)
-        json_key = JSON_KEY_MAP.get(factor)
-        state_key = STATE_KEY_MAP.get(factor)
-        
-        if not filename: continue
-        
-        for d in history_dirs:
-            # FIX: Ensure we read from market specific path in history too
-            market_d = d / market
-            data = read_json_safe(market_d / filename).get(json_key, {})
-            if factor == "Regime":
-                state = _derive_regime_display(data).get("regime_value", "UNKNOWN")
-            else:
-                state = data.get(state_key, "UNKNOWN")
-            
-            if state == current_state:
-                count += 1
-                first_tick_ts = _parse_timestamp(d.name)
-            else:
-                break
-        
+        if factor not in FILE_MAP: continue
+
+        count, first_tick = run_index.duration(factor, current_state)
+        first_tick_ts = _parse_timestamp(first_tick) if first_tick else latest_ts
+
         durations[factor.upper()] = {
             "ticks": count,
             "duration": f"{count} ticks",
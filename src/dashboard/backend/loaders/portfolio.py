@@ -2,12 +2,13 @@ from __future__ import annotations
 
 import os
 import re
-from typing import Any, Dict
+from typing import Any, Callable, Dict, Optional, Tuple
 
 from src.dashboard.backend.loaders.provenance import attach_provenance
+from src.dashboard.backend.utils.snapshot_cache import Snapshot, SnapshotCache
 from src.portfolio_intelligence.exposure_engine import PortfolioExposureEngine
 from src.portfolio_intelligence.mutual_fund_research_engine import MutualFundResearchEngine
-from src.portfolio_intelligence.news_event_intelligence import PortfolioEventIntelligenceBuilder
+from src.portfolio_intelligence.news_event_intelligence import EventIntelligenceResult, PortfolioEventIntelligenceBuilder
 from src.portfolio_intelligence.portfolio_intelligence_engine import PortfolioIntelligenceEngine
 from src.portfolio_intelligence.portfolio_strategy_engine import PortfolioStrategyEngine
 from src.portfolio_intelligence.refresh_runtime import PortfolioRefreshRuntime
@@ -25,6 +26,11 @@ _PORTFOLIO_INTELLIGENCE_ENGINE = PortfolioIntelligenceEngine()
 _PORTFOLIO_STRATEGY_ENGINE = PortfolioStrategyEngine()
 _SYNTHESIS = PortfolioNarrativeSynthesizer()
 
+# Bump when the derived analytics logic changes so cached views are rebuilt
+ANALYTICS_SNAPSHOT_VERSION = 1
+# Event-derived views read the news feed/cache, which changes between portfolio refreshes
+ANALYTICS_SNAPSHOT_MAX_AGE_SECONDS = 300.0
+
 
 def _ensure_exposure(payload: Dict[str, Any]) -> Dict[str, Any]:
     """Return exposure_analysis from payload or compute it on-the-fly."""
@@ -43,8 +49,13 @@ def _ensure_exposure(payload: Dict[str, Any]) -> Dict[str, Any]:
     )
 
 
-def _ensure_intelligence(payload: Dict[str, Any]) -> Dict[str, Any]:
-    event_intelligence = payload.get("portfolio_event_alerts")
+def _ensure_intelligence(
+    payload: Dict[str, Any],
+    *,
+    exposure_analysis: Optional[Dict[str, Any]] = None,
+    mutual_fund_intelligence: Optional[Dict[str, Any]] = None,
+    build_events: Optional[Callable[[], EventIntelligenceResult]] = None,
+) -> Dict[str, Any]:
     event_map = {}
     if payload.get("portfolio_event_timeline") or payload.get("news_adapter_status"):
         for profile in payload.get("stock_research_profiles", []):
@@ -52,7 +63,7 @@ def _ensure_intelligence(payload: Dict[str, Any]) -> Dict[str, Any]:
             if event_payload:
                 event_map[profile.get("ticker")] = event_payload
     if not event_map:
-        built_event_intelligence = _EVENT_INTELLIGENCE_BUILDER.build(holdings=payload.get("holdings", []), market=payload.get("market", ""))
+        built_event_intelligence = build_events() if build_events else _build_event_intelligence(payload)
         event_map = built_event_intelligence.stock_event_map
     existing_profiles = payload.get("stock_research_profiles") or []
     needs_profile_rebuild = not existing_profiles or any("event_intelligence" not in item for item in existing_profiles)
@@ -63,7 +74,8 @@ def _ensure_intelligence(payload: Dict[str, Any]) -> Dict[str, Any]:
         regime_gate_state=payload.get("regime_gate_state", "BLOCKED"),
         event_intelligence_map=event_map,
     )
-    exposure_analysis = _ensure_exposure(payload)
+    if exposure_analysis is None:
+        exposure_analysis = _ensure_exposure(payload)
     intelligence_bundle = {
         "stock_research_profiles": research_profiles,
         "stock_intelligence_summaries": payload.get("stock_intelligence_summaries"),
@@ -79,7 +91,8 @@ def _ensure_intelligence(payload: Dict[str, Any]) -> Dict[str, Any]:
         )
         intelligence_bundle["stock_intelligence_summaries"] = recomputed_intelligence.get("stock_intelligence_summaries", [])
         intelligence_bundle["valuation_overview"] = recomputed_intelligence.get("valuation_overview", {})
-    mutual_fund_intelligence = _ensure_mutual_fund_intelligence(payload)
+    if mutual_fund_intelligence is None:
+        mutual_fund_intelligence = _ensure_mutual_fund_intelligence(payload)
     strategy_bundle = _PORTFOLIO_STRATEGY_ENGINE.build_strategy_package(
         research_profiles=research_profiles,
         mutual_fund_intelligence=mutual_fund_intelligence,
@@ -113,14 +126,22 @@ def _ensure_mutual_fund_intelligence(payload: Dict[str, Any]) -> Dict[str, Any]:
     )
 
 
-def _ensure_portfolio_event_intelligence(payload: Dict[str, Any]) -> Dict[str, Any]:
+def _build_event_intelligence(payload: Dict[str, Any]) -> EventIntelligenceResult:
+    return _EVENT_INTELLIGENCE_BUILDER.build(holdings=payload.get("holdings", []), market=payload.get("market", ""))
+
+
+def _ensure_portfolio_event_intelligence(
+    payload: Dict[str, Any],
+    *,
+    build_events: Optional[Callable[[], EventIntelligenceResult]] = None,
+) -> Dict[str, Any]:
     if payload.get("portfolio_event_alerts") is not None and payload.get("news_adapter_status") is not None:
         return {
             "news_adapter_status": payload.get("news_adapter_status", {}),
             "portfolio_event_alerts": payload.get("portfolio_event_alerts", []),
             "portfolio_event_timeline": payload.get("portfolio_event_timeline", []),
         }
-    built = _EVENT_INTELLIGENCE_BUILDER.build(holdings=payload.get("holdings", []), market=payload.get("market", ""))
+    built = build_events() if build_events else _build_event_intelligence(payload)
     return {
         "news_adapter_status": built.adapter_status,
         "portfolio_event_alerts": built.portfolio_event_alerts,
@@ -128,6 +149,56 @@ def _ensure_portfolio_event_intelligence(payload: Dict[str, Any]) -> Dict[str, A
     }
 
 
+# Derived views, each built on first use and cached with the stored payload.
+# Endpoints that only reshape the stored payload never build any of them.
+_ANALYTICS_VIEWS = {
+    # The news build is shared by the stock and portfolio event views
+    "events": lambda payload, view: _build_event_intelligence(payload),
+    "exposure": lambda payload, view: _ensure_exposure(payload),
+    "mutual_fund_intelligence": lambda payload, view: _ensure_mutual_fund_intelligence(payload),
+    "intelligence": lambda payload, view: _ensure_intelligence(
+        payload,
+        exposure_analysis=view("exposure"),
+        mutual_fund_intelligence=view("mutual_fund_intelligence"),
+        build_events=lambda: view("events"),
+    ),
+    "event_intelligence": lambda payload, view: _ensure_portfolio_event_intelligence(
+        payload, build_events=lambda: view("events")
+    ),
+    "mutual_fund_holdings": lambda payload, view: _ensure_mutual_fund_metadata(payload),
+}
+
+_SNAPSHOTS = SnapshotCache(
+    _ANALYTICS_VIEWS,
+    version=ANALYTICS_SNAPSHOT_VERSION,
+    view_max_age={
+        name: ANALYTICS_SNAPSHOT_MAX_AGE_SECONDS for name in ("events", "intelligence", "event_intelligence")
+    },
+)
+
+
+def _analytics_stamp(market: str, portfolio_id: str) -> Optional[Tuple[int, int]]:
+    path = SERVICE.store.config.analytics_dir / market / portfolio_id / "latest.json"
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _load_snapshot(market: str, portfolio_id: str) -> Snapshot:
+    """Stored analytics payload, shared by every portfolio endpoint."""
+    return _SNAPSHOTS.get(
+        (market, portfolio_id),
+        _analytics_stamp(market, portfolio_id),
+        lambda: SERVICE.load_portfolio(market, portfolio_id),
+    )
+
+
+def _view(snapshot: Snapshot, name: str) -> Any:
+    return _SNAPSHOTS.view(snapshot, name)
+
+
 def _ensure_mutual_fund_metadata(payload: Dict[str, Any]) -> list[Dict[str, Any]]:
     funds = []
     for fund in payload.get("mutual_fund_holdings", []):
@@ -167,14 +238,18 @@ def load_portfolio_overview(market: str) -> Dict[str, Any]:
 
 
 def load_portfolio_holdings(market: str, portfolio_id: str) -> Dict[str, Any]:
-    payload = SERVICE.load_portfolio(market, portfolio_id)
+    snapshot = _load_snapshot(market, portfolio_id)
+    payload = snapshot.payload
     payload = dict(payload)
-    payload["mutual_fund_holdings"] = _ensure_mutual_fund_metadata(payload)
+    payload["mutual_fund_holdings"] = _view(snapshot, "mutual_fund_holdings")
+    # The stored payload is shared between requests: provenance gets its own trace
+    payload["trace"] = dict(payload.get("trace") or {})
     return attach_provenance(payload, f"data/portfolio_intelligence/analytics/{market}/{portfolio_id}/latest.json")
 
 
 def load_portfolio_diversification(market: str, portfolio_id: str) -> Dict[str, Any]:
-    payload = SERVICE.load_portfolio(market, portfolio_id)
+    snapshot = _load_snapshot(market, portfolio_id)
+    payload = snapshot.payload
     body = {
         "portfolio_id": portfolio_id,
         "market": market,
@@ -187,7 +262,8 @@ def load_portfolio_diversification(market: str, portfolio_id: str) -> Dict[str,
 
 
 def load_portfolio_risk(market: str, portfolio_id: str) -> Dict[str, Any]:
-    payload = SERVICE.load_portfolio(market, portfolio_id)
+    snapshot = _load_snapshot(market, portfolio_id)
+    payload = snapshot.payload
     body = {
         "portfolio_id": portfolio_id,
         "market": market,
@@ -200,7 +276,8 @@ def load_portfolio_risk(market: str, portfolio_id: str) -> Dict[str, Any]:
 
 
 def load_portfolio_structure(market: str, portfolio_id: str) -> Dict[str, Any]:
-    payload = SERVICE.load_portfolio(market, portfolio_id)
+    snapshot = _load_snapshot(market, portfolio_id)
+    payload = snapshot.payload
     holdings = payload.get("holdings", [])
     top_holdings = sorted(holdings, key=lambda item: item.get("weight_pct", 0), reverse=True)
     structure = {
@@ -220,7 +297,8 @@ def load_portfolio_structure(market: str, portfolio_id: str) -> Dict[str, Any]:
 
 
 def load_portfolio_performance(market: str, portfolio_id: str) -> Dict[str, Any]:
-    payload = SERVICE.load_portfolio(market, portfolio_id)
+    snapshot = _load_snapshot(market, portfolio_id)
+    payload = snapshot.payload
     body = {
         "portfolio_id": portfolio_id,
         "market": market,
@@ -233,7 +311,8 @@ def load_portfolio_performance(market: str, portfolio_id: str) -> Dict[str, Any]
 
 
 def load_portfolio_insights(market: str, portfolio_id: str) -> Dict[str, Any]:
-    payload = SERVICE.load_portfolio(market, portfolio_id)
+    snapshot = _load_snapshot(market, portfolio_id)
+    payload = snapshot.payload
     body = {
         "portfolio_id": portfolio_id,
         "market": market,
@@ -246,7 +325,8 @@ def load_portfolio_insights(market: str, portfolio_id: str) -> Dict[str, Any]:
 
 
 def load_portfolio_resilience(market: str, portfolio_id: str) -> Dict[str, Any]:
-    payload = SERVICE.load_portfolio(market, portfolio_id)
+    snapshot = _load_snapshot(market, portfolio_id)
+    payload = snapshot.payload
     body = {
         "portfolio_id": portfolio_id,
         "market": market,
@@ -264,8 +344,9 @@ def load_combined_portfolio_view() -> Dict[str, Any]:
 
 
 def load_portfolio_exposure(market: str, portfolio_id: str) -> Dict[str, Any]:
-    payload = SERVICE.load_portfolio(market, portfolio_id)
-    exposure = _ensure_exposure(payload)
+    snapshot = _load_snapshot(market, portfolio_id)
+    payload = snapshot.payload
+    exposure = _view(snapshot, "exposure")
     body = {
         "portfolio_id": portfolio_id,
         "market": market,
@@ -285,8 +366,9 @@ def load_portfolio_exposure(market: str, portfolio_id: str) -> Dict[str, Any]:
 
 
 def load_portfolio_macro_alignment(market: str, portfolio_id: str) -> Dict[str, Any]:
-    payload = SERVICE.load_portfolio(market, portfolio_id)
-    exposure = _ensure_exposure(payload)
+    snapshot = _load_snapshot(market, portfolio_id)
+    payload = snapshot.payload
+    exposure = _view(snapshot, "exposure")
     body = {
         "portfolio_id": portfolio_id,
         "market": market,
@@ -300,9 +382,10 @@ def load_portfolio_macro_alignment(market: str, portfolio_id: str) -> Dict[str,
 
 
 def load_portfolio_research(market: str, portfolio_id: str) -> Dict[str, Any]:
-    payload = SERVICE.load_portfolio(market, portfolio_id)
-    intelligence = _ensure_intelligence(payload)
-    event_intelligence = _ensure_portfolio_event_intelligence(payload)
+    snapshot = _load_snapshot(market, portfolio_id)
+    payload = snapshot.payload
+    intelligence = _view(snapshot, "intelligence")
+    event_intelligence = _view(snapshot, "event_intelligence")
     body = {
         "portfolio_id": portfolio_id,
         "market": market,
@@ -312,7 +395,7 @@ def load_portfolio_research(market: str, portfolio_id: str) -> Dict[str, Any]:
         "stock_research_profiles": intelligence.get("stock_research_profiles", []),
         "stock_intelligence_summaries": intelligence.get("stock_intelligence_summaries", []),
         "valuation_overview": intelligence.get("valuation_overview", {}),
-        "mutual_fund_intelligence": _ensure_mutual_fund_intelligence(payload),
+        "mutual_fund_intelligence": _view(snapshot, "mutual_fund_intelligence"),
         "news_adapter_status": event_intelligence.get("news_adapter_status", {}),
         "portfolio_event_alerts": event_intelligence.get("portfolio_event_alerts", []),
         "portfolio_event_timeline": event_intelligence.get("portfolio_event_timeline", []),
@@ -322,9 +405,10 @@ def load_portfolio_research(market: str, portfolio_id: str) -> Dict[str, Any]:
 
 
 def load_portfolio_advisory(market: str, portfolio_id: str) -> Dict[str, Any]:
-    payload = SERVICE.load_portfolio(market, portfolio_id)
-    intelligence = _ensure_intelligence(payload)
-    event_intelligence = _ensure_portfolio_event_intelligence(payload)
+    snapshot = _load_snapshot(market, portfolio_id)
+    payload = snapshot.payload
+    intelligence = _view(snapshot, "intelligence")
+    event_intelligence = _view(snapshot, "event_intelligence")
     body = {
         "portfolio_id": portfolio_id,
         "market": market,
@@ -344,7 +428,8 @@ def load_portfolio_advisory(market: str, portfolio_id: str) -> Dict[str, Any]:
 
 
 def load_portfolio_refresh_status(market: str, portfolio_id: str) -> Dict[str, Any]:
-    payload = SERVICE.load_portfolio(market, portfolio_id)
+    snapshot = _load_snapshot(market, portfolio_id)
+    payload = snapshot.payload
     diagnostics = payload.get("refresh_diagnostics", {})
     runtime = PortfolioRefreshRuntime.snapshot(market, portfolio_id)
     return attach_provenance(
@@ -405,6 +490,7 @@ def trigger_portfolio_refresh(
                 os.environ.pop("KITE_HEADLESS_AUTH", None)
             else:
                 os.environ["KITE_HEADLESS_AUTH"] = previous
+    _SNAPSHOTS.invalidate(market, portfolio_id)
     return attach_provenance(
         {
             "status": "REFRESH_OK",
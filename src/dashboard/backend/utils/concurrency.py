@@ -0,0 +1,162 @@
+import asyncio
+import functools
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LOADER_WORKERS = int(os.environ.get("DASHBOARD_LOADER_WORKERS", "8"))
+
+
+class CoalescingExecutor:
+    """
+    Runs synchronous loaders on a bounded thread pool so the event loop never
+    blocks on file I/O. Concurrent calls with the same loader and arguments
+    share one in-flight computation instead of each reading the same files.
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_LOADER_WORKERS):
+        self.max_workers = max_workers
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._pool_lock = threading.Lock()
+        # Only touched from event loop threads
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        self.calls = 0
+        self.coalesced = 0
+
+    async def run(self, fn: Callable[..., Any], *args, coalesce: bool = True, **kwargs) -> Any:
+        loop = asyncio.get_running_loop()
+        call = functools.partial(fn, *args, **kwargs)
+        if not coalesce:
+            self.calls += 1
+            return await loop.run_in_executor(self._executor(), call)
+
+        key = (id(loop), fn, args, tuple(sorted(kwargs.items())))
+        future = self._inflight.get(key)
+        if future is not None:
+            self.coalesced += 1
+        else:
+            self.calls += 1
+            future = loop.run_in_executor(self._executor(), call)
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # A disconnecting client must not cancel the computation others wait on
+        return await asyncio.shield(future)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "max_workers": self.max_workers,
+            "in_flight": len(self._inflight),
+            "calls": self.calls,
+            "coalesced": self.coalesced,
+        }
+
+    def _executor(self) -> ThreadPoolExecutor:
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="dashboard-loader")
+            return self._pool
+
+    def shutdown(self) -> None:
+        """Release the worker threads; a later run() starts a fresh pool."""
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False)
+
+
+class ValidationRefresher:
+    """
+    Runs the pre-dashboard-refresh validation on a background thread and
+    publishes the latest summary per market.
+
+    Requests only note which markets are being viewed. A market is validated
+    when first seen and then at most once per TTL, and only if it was
+    requested since its last run, so an idle dashboard does no validation.
+    """
+
+    def __init__(self, runner, ttl_seconds: float = 60.0, source: str = "src.dashboard.backend.app"):
+        self.runner = runner
+        self.ttl_seconds = ttl_seconds
+        self.source = source
+
+        self._lock = threading.Lock()
+        self._requested_at: Dict[str, float] = {}
+        self._validated_at: Dict[str, float] = {}
+        self._results: Dict[str, Dict[str, Any]] = {}
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def note_request(self, market: str) -> None:
+        """Record a request for market; never blocks on validation."""
+        now = time.monotonic()
+        with self._lock:
+            first_seen = market not in self._validated_at and market not in self._requested_at
+            self._requested_at[market] = now
+        if first_seen:
+            self._wake.set()
+
+    def due_markets(self, now: Optional[float] = None) -> List[str]:
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            return [
+                market for market, requested in self._requested_at.items()
+                if market not in self._validated_at
+                or (requested > self._validated_at[market] and now - self._validated_at[market] >= self.ttl_seconds)
+            ]
+
+    def refresh_due(self) -> List[str]:
+        """Validate every due market now. Returns the markets refreshed."""
+        refreshed = []
+        for market in self.due_markets():
+            started = time.monotonic()
+            try:
+                summary = self.runner.run_pre_dashboard_refresh({"market": market, "source": self.source})
+                result = {"status": "OK", "summary": summary}
+            except Exception as e:
+                logger.exception(f"Dashboard validation failed for {market}: {e}")
+                result = {"status": "ERROR", "error": str(e)}
+            result["market"] = market
+            result["completed_at"] = datetime.now().isoformat()
+            result["duration_seconds"] = round(time.monotonic() - started, 3)
+            with self._lock:
+                self._validated_at[market] = started
+                self._results[market] = result
+            refreshed.append(market)
+        return refreshed
+
+    def status(self, market: str) -> Dict[str, Any]:
+        """Latest published validation result for market."""
+        with self._lock:
+            result = self._results.get(market)
+        if result is None:
+            return {"market": market, "status": "PENDING"}
+        return result
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self.refresh_due()
+            self._wake.wait(self.ttl_seconds)
+            self._wake.clear()
+
+    def start(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="dashboard-validation", daemon=True)
+        self._thread.start()
+        logger.info("Dashboard validation refresher started")
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop.set()
+        self._wake.set()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+        logger.info("Dashboard validation refresher stopped")
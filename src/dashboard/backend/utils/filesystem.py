@@ -1,8 +1,11 @@
 from pathlib import Path
-import json
-import os
+import copy
 from typing import Dict, Any, Optional
 
+# Tick index and JSON cache are shared with portfolio refresh and EV-TICK
+from src.evolution.tick_store import JSON_CACHE, JsonFileCache, TickIndex, TickStore
+from src.evolution.tick_store import get_tick_store as _get_tick_store
+
 # --- Configuration & Paths ---
 PROJECT_ROOT = Path(__file__).parent.parent.parent.parent.parent # c:\GIT\TraderFund, assumes file is in src/dashboard/backend/utils
 DOCS_DIR = PROJECT_ROOT / "docs"
@@ -11,27 +14,36 @@ TICKS_DIR = EV_DIR / "ticks"
 LEDGER_DIR = DOCS_DIR / "epistemic" / "ledger"
 META_DIR = EV_DIR / "meta_analysis"
 
+
+def get_tick_store(root: Optional[Path] = None) -> TickStore:
+    return _get_tick_store(root if root is not None else TICKS_DIR)
+
+
+def get_tick_index(root: Optional[Path] = None) -> TickIndex:
+    return get_tick_store(root).index
+
+
 def get_latest_tick_dir() -> Optional[Path]:
-    if not TICKS_DIR.exists():
-        return None
-    dirs = sorted([d for d in TICKS_DIR.iterdir() if d.is_dir()], key=lambda x: x.name, reverse=True)
+    dirs = get_tick_index().latest(1)
     if not dirs:
         return None
     return dirs[0]
 
 def get_ticks_history(limit: int = 10) -> list[Path]:
-    if not TICKS_DIR.exists():
-        return []
-    return sorted([d for d in TICKS_DIR.iterdir() if d.is_dir()], key=lambda x: x.name, reverse=True)[:limit]
+    return get_tick_index().latest(limit)
+
+
+def read_json_cached(path: Path) -> Dict[str, Any]:
+    """Like read_json_safe but returns the shared cached object; callers must not mutate it."""
+    data = JSON_CACHE.get(path)
+    return data if data is not None else {}
 
 def read_json_safe(path: Path) -> Dict[str, Any]:
-    if not path.exists():
-        return {}
-    try:
-        with open(path, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except Exception:
+    data = JSON_CACHE.get(path)
+    if data is None:
         return {}
+    # Loaders decorate their payloads (attach_provenance), so hand out a copy
+    return copy.deepcopy(data)
 
 def read_markdown_safe(path: Path) -> str:
     if not path.exists():
@@ -0,0 +1,88 @@
+import asyncio
+import math
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Sequence
+
+import httpx
+
+DEFAULT_PATHS = [
+    "/api/market/snapshot?market=US",
+    "/api/watchers/timeline?market=US",
+    "/api/strategies/eligibility?market=US",
+    "/api/system/status?market=US",
+    "/api/intelligence/snapshot?market=US",
+]
+
+
+@asynccontextmanager
+async def in_process_client(app, timeout: float = 30.0) -> AsyncIterator[httpx.AsyncClient]:
+    """
+    Client for an ASGI app without a server. ASGITransport does not send
+    lifespan events, so the app's lifespan (background validation, loader
+    pool) is entered here around the client.
+    """
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://dashboard", timeout=timeout) as client:
+            yield client
+
+
+def percentile(sorted_values: Sequence[float], q: float) -> float:
+    """Nearest-rank percentile of an ascending sequence (q in 0-100)."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(q / 100.0 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def summarize(latencies_ms: List[float], errors: int, elapsed_s: float) -> Dict[str, Any]:
+    values = sorted(latencies_ms)
+    return {
+        "requests": len(values) + errors,
+        "errors": errors,
+        "p50_ms": round(percentile(values, 50), 2),
+        "p99_ms": round(percentile(values, 99), 2),
+        "max_ms": round(values[-1], 2) if values else 0.0,
+        "throughput_rps": round((len(values) + errors) / elapsed_s, 1) if elapsed_s > 0 else 0.0,
+    }
+
+
+async def run_load_test(
+    client: httpx.AsyncClient,
+    paths: Sequence[str] = tuple(DEFAULT_PATHS),
+    concurrency: int = 32,
+    total_requests: int = 500
+) -> Dict[str, Any]:
+    """
+    Issue total_requests GETs round-robin over paths with `concurrency`
+    requests in flight, and report p50/p99 latency per path and overall.
+    """
+    latencies: Dict[str, List[float]] = {p: [] for p in paths}
+    errors: Dict[str, int] = {p: 0 for p in paths}
+    counter = iter(range(total_requests))
+
+    async def worker():
+        for i in counter:
+            path = paths[i % len(paths)]
+            start = time.perf_counter()
+            try:
+                response = await client.get(path)
+                ok = response.status_code < 500
+            except httpx.HTTPError:
+                ok = False
+            if ok:
+                latencies[path].append((time.perf_counter() - start) * 1000.0)
+            else:
+                errors[path] += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    return {
+        "concurrency": concurrency,
+        "elapsed_s": round(elapsed, 3),
+        "overall": summarize([v for vs in latencies.values() for v in vs], sum(errors.values()), elapsed),
+        "paths": {p: summarize(latencies[p], errors[p], elapsed) for p in paths},
+    }
@@ -0,0 +1,152 @@
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+# (payload, view) -> value; view(name) resolves another view of the same snapshot
+ViewBuilder = Callable[[Dict[str, Any], Callable[[str], Any]], Any]
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    key: Tuple
+    stamp: Optional[Hashable]
+    content_hash: str
+    payload: Dict[str, Any]
+    built_at: float
+    # name -> (value, built_at); shared by snapshots re-stamped with identical content
+    views: Dict[str, Tuple[Any, float]] = field(default_factory=dict, compare=False, repr=False)
+    view_locks: Dict[str, threading.Lock] = field(default_factory=dict, compare=False, repr=False)
+
+
+class SnapshotCache:
+    """
+    Versioned, content-hash keyed cache of stored payloads and their derived views.
+
+    A snapshot (the stored payload) is reused while the source stamp (e.g.
+    file mtime/size) is unchanged; when the stamp moves the payload is
+    re-read and hashed, and its derived views are only dropped if the content
+    hash (which covers `version`, the key and the payload) actually changed.
+
+    Derived views are built lazily and cached independently, so an endpoint
+    only pays for the views it reads, and a failing view builder fails only
+    the endpoints that need it (failures are not cached). Concurrent requests
+    for the same snapshot or view wait for a single build. Views that also
+    read inputs outside the payload (e.g. a news feed) can be given a max age
+    in view_max_age to force a periodic rebuild.
+    """
+
+    def __init__(
+        self,
+        views: Dict[str, ViewBuilder],
+        version: int = 1,
+        max_entries: int = 64,
+        view_max_age: Optional[Dict[str, float]] = None
+    ):
+        self.views = views
+        self.version = version
+        self.max_entries = max_entries
+        self.view_max_age = view_max_age or {}
+        self._entries: "OrderedDict[Tuple, Snapshot]" = OrderedDict()
+        self._key_locks: Dict[Tuple, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.loads = 0
+        self.view_hits = 0
+        self.builds = 0
+
+    def content_hash(self, key: Tuple, payload: Dict[str, Any]) -> str:
+        blob = json.dumps({"version": self.version, "key": list(key), "payload": payload}, sort_keys=True, default=str)
+        return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+    def _fresh(self, entry: Optional[Snapshot], stamp: Optional[Hashable]) -> bool:
+        return entry is not None and stamp is not None and entry.stamp == stamp
+
+    def _expired(self, name: str, built_at: float) -> bool:
+        max_age = self.view_max_age.get(name)
+        return max_age is not None and time.monotonic() - built_at >= max_age
+
+    def get(self, key: Tuple, stamp: Optional[Hashable], load: Callable[[], Dict[str, Any]]) -> Snapshot:
+        """Snapshot for key, loading the payload via load() only when stamp changed (or is None)."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if self._fresh(entry, stamp):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            with self._lock:
+                entry = self._entries.get(key)
+            if self._fresh(entry, stamp):
+                # Built by a concurrent request while we waited
+                with self._lock:
+                    self.hits += 1
+                return entry
+
+            payload = load()
+            content_hash = self.content_hash(key, payload)
+            if entry is not None and entry.content_hash == content_hash:
+                # Same content: keep the payload object and every built view
+                snapshot = replace(entry, stamp=stamp)
+                with self._lock:
+                    self.hits += 1
+            else:
+                snapshot = Snapshot(key, stamp, content_hash, payload, time.monotonic())
+                with self._lock:
+                    self.loads += 1
+
+            with self._lock:
+                self._entries[key] = snapshot
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    evicted, _ = self._entries.popitem(last=False)
+                    self._key_locks.pop(evicted, None)
+            return snapshot
+
+    def view(self, snapshot: Snapshot, name: str) -> Any:
+        """Derived view `name` of snapshot, built on first use and cached with it."""
+        cached = snapshot.views.get(name)
+        if cached is not None and not self._expired(name, cached[1]):
+            with self._lock:
+                self.view_hits += 1
+            return cached[0]
+
+        with self._lock:
+            view_lock = snapshot.view_locks.setdefault(name, threading.Lock())
+        with view_lock:
+            cached = snapshot.views.get(name)
+            if cached is not None and not self._expired(name, cached[1]):
+                with self._lock:
+                    self.view_hits += 1
+                return cached[0]
+            value = self.views[name](snapshot.payload, lambda other: self.view(snapshot, other))
+            snapshot.views[name] = (value, time.monotonic())
+            with self._lock:
+                self.builds += 1
+            return value
+
+    def invalidate(self, *key_prefix) -> int:
+        """Drop snapshots whose key starts with key_prefix (all if empty). Returns the count dropped."""
+        n = len(key_prefix)
+        with self._lock:
+            stale = [key for key in self._entries if key[:n] == key_prefix]
+            for key in stale:
+                del self._entries[key]
+        return len(stale)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "loads": self.loads,
+                "view_hits": self.view_hits,
+                "builds": self.builds,
+                "version": self.version,
+            }
@@ -88,6 +88,7 @@ from governance.canonical_partiality import (
 )
 from governance.suppression_state import compute_suppression_for_market
 from governance.narrative_guard import compute_narrative_for_market
+from src.evolution.tick_store import get_tick_store
 
 class EvTickOrchestrator:
     def __init__(self, output_dir: Path):
@@ -158,6 +159,10 @@ class EvTickOrchestrator:
         
         # Final guard check: ensure no evolution was invoked
         assert_evolution_not_invoked()
+
+        # In-process readers (portfolio refresh, dashboard) resolve ticks via
+        # the shared TickStore; publish the finished tick's artifacts to it.
+        get_tick_store(self.output_dir.parent).invalidate(self.output_dir.name)
         
         print(f"[{self.timestamp}] EV-TICK Complete.")
         
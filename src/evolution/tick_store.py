@@ -0,0 +1,296 @@
+"""
+Shared Tick Store.
+
+Resolves artifacts inside the EV-TICK output tree
+(``docs/evolution/ticks/tick_<epoch>/<MARKET>/<artifact>.json``) without
+listing and sorting the whole tree on every lookup.
+
+- ``TickIndex`` keeps the sorted tick-directory names and only rescans the
+  root when its mtime changes (a tick was created or removed).
+- ``TickStore`` adds, per market, the artifact names each tick contains and
+  an inverted index artifact -> sorted tick names, so "latest tick containing
+  X for market M" is the tail of one list. New ticks are merged with
+  ``bisect.insort`` (O(log n) search per tick).
+- ``JsonFileCache`` holds parsed payloads keyed by path and validated by
+  (mtime_ns, size), so a rewritten file is re-read on the next access.
+
+Only the newest ``HOT_TICKS`` ticks are re-checked on every lookup (one
+stat() of the market directory each, plus a rescan while its mtime is
+within ``RACY_WINDOW_NS`` of now); EV-TICK only ever writes into the newest
+tick. Older ticks are scanned once when they leave the hot window and
+are then trusted, so anything that edits an old tick in place should call
+``TickStore.invalidate``. A resolved artifact that has since been deleted is
+detected (its stat fails) and the lookup falls back to the next older tick.
+"""
+import bisect
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+TICKS_DIR = PROJECT_ROOT / "docs" / "evolution" / "ticks"
+
+JSON_CACHE_SIZE = 4096
+HOT_TICKS = 2
+RACY_WINDOW_NS = 2_000_000_000
+
+
+class TickIndex:
+    """
+    In-process, sorted index of tick directories under one ticks root.
+
+    The root's mtime changes whenever a tick dir is created or removed, so a
+    refresh is a single stat() unless something changed; only then is the
+    directory rescanned and the difference merged into the sorted name list.
+    """
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self._names: List[str] = []   # ascending
+        self._mtime_ns: Optional[int] = None
+        self._lock = threading.Lock()
+        self.generation = 0           # bumped whenever the tick set changes
+
+    def refresh(self) -> None:
+        try:
+            mtime_ns = os.stat(self.root).st_mtime_ns
+        except OSError:
+            mtime_ns = None
+        if mtime_ns == self._mtime_ns:
+            return
+
+        with self._lock:
+            if mtime_ns == self._mtime_ns:
+                return
+            if mtime_ns is None:
+                current = set()
+            else:
+                with os.scandir(self.root) as entries:
+                    current = {e.name for e in entries if e.is_dir()}
+
+            known = set(self._names)
+            added, removed = current - known, known - current
+            # Swap in a new list so readers never see a half-updated one
+            if removed or len(added) > 64:
+                self._names = sorted(current)
+            elif added:
+                # Common case: a few new ticks appended at the end
+                names = list(self._names)
+                for name in sorted(added):
+                    bisect.insort(names, name)
+                self._names = names
+            if added or removed:
+                self.generation += 1
+            self._mtime_ns = mtime_ns
+
+    def names(self) -> List[str]:
+        """All tick names, oldest first."""
+        self.refresh()
+        return self._names
+
+    def snapshot(self) -> Tuple[int, List[str]]:
+        """(generation, names) read consistently; the list is never mutated in place."""
+        self.refresh()
+        with self._lock:
+            return self.generation, self._names
+
+    def latest(self, limit: int) -> List[Path]:
+        """Newest `limit` tick dirs, newest first."""
+        names = self.names()
+        if limit <= 0:
+            return []
+        return [self.root / name for name in reversed(names[-limit:])]
+
+
+class JsonFileCache:
+    """
+    LRU cache of parsed JSON files keyed by path and validated by
+    (mtime_ns, size), so a rewritten file is re-read on the next access.
+    Missing or unparseable files are not cached.
+    """
+
+    def __init__(self, max_entries: int = JSON_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[Tuple[int, int], Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, path: Path) -> Optional[Any]:
+        """Parsed content (shared, do not mutate) or None if missing/invalid."""
+        key = os.fspath(path)
+        try:
+            st = os.stat(key)
+        except OSError:
+            return None
+        stamp = (st.st_mtime_ns, st.st_size)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == stamp:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+
+        try:
+            with open(key, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except Exception:
+            return None
+
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = (stamp, data)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return data
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+JSON_CACHE = JsonFileCache()
+
+
+class _MarketArtifacts:
+    """Artifact index of one market across all ticks."""
+
+    def __init__(self):
+        self.generation = -1
+        self.hot: List[str] = []
+        # tick -> (market dir mtime_ns or None, artifact names)
+        self.contents: Dict[str, Tuple[Optional[int], FrozenSet[str]]] = {}
+        # artifact -> tick names containing it, ascending
+        self.postings: Dict[str, List[str]] = {}
+
+
+class TickStore:
+    """Latest-tick artifact resolver over one ticks root."""
+
+    def __init__(self, root: Path, json_cache: Optional[JsonFileCache] = None):
+        self.root = Path(root)
+        self.index = TickIndex(self.root)
+        self.json_cache = json_cache if json_cache is not None else JSON_CACHE
+        self._markets: Dict[str, _MarketArtifacts] = {}
+        self._lock = threading.RLock()
+        self.scans = 0
+
+    def latest_tick(self) -> Optional[Path]:
+        dirs = self.index.latest(1)
+        return dirs[0] if dirs else None
+
+    def latest_containing(self, market: str, artifact: str) -> Optional[Path]:
+        """Path of `artifact` in the newest tick whose `market` dir has it."""
+        with self._lock:
+            m = self._sync(market)
+            ticks = m.postings.get(artifact)
+            while ticks:
+                tick = ticks[-1]
+                path = self.root / tick / market / artifact
+                if os.path.isfile(path):
+                    return path
+                # Removed behind our back: rescan that tick and fall back
+                self._scan(m, tick, market, force=True)
+                ticks = m.postings.get(artifact)
+                if ticks and ticks[-1] == tick:
+                    break
+            return None
+
+    def load_json(self, market: str, artifact: str) -> Tuple[Optional[Path], Optional[Any]]:
+        """(path, parsed payload) of the latest `artifact`; the payload is shared, do not mutate."""
+        path = self.latest_containing(market, artifact)
+        if path is None:
+            return None, None
+        return path, self.json_cache.get(path)
+
+    def invalidate(self, tick: Optional[str] = None) -> None:
+        """Forget cached contents of one tick (by name), or of every tick if None."""
+        with self._lock:
+            if tick is None:
+                self._markets.clear()
+                return
+            for market, m in self._markets.items():
+                if tick in m.contents:
+                    self._scan(m, tick, market, force=True)
+
+    def _sync(self, market: str) -> _MarketArtifacts:
+        m = self._markets.get(market)
+        if m is None:
+            m = self._markets[market] = _MarketArtifacts()
+
+        generation, names = self.index.snapshot()
+        hot = names[-HOT_TICKS:]
+        if generation != m.generation:
+            current = set(names)
+            for tick in [t for t in m.contents if t not in current]:
+                self._drop(m, tick)
+            # New ticks, plus ticks that just left the hot window get a final look
+            for tick in set(t for t in names if t not in m.contents) | set(m.hot):
+                if tick in current:
+                    self._scan(m, tick, market)
+            m.generation = generation
+            m.hot = hot
+        for tick in hot:
+            self._scan(m, tick, market)
+        return m
+
+    def _scan(self, m: _MarketArtifacts, tick: str, market: str, force: bool = False) -> None:
+        market_dir = os.path.join(self.root, tick, market)
+        try:
+            mtime_ns = os.stat(market_dir).st_mtime_ns
+        except OSError:
+            mtime_ns = None
+        cached = m.contents.get(tick)
+        if cached is not None and cached[0] == mtime_ns and not force:
+            # A dir modified within the timestamp granularity may change again
+            # without its mtime moving ("racy" entry), so only trust older ones
+            if mtime_ns is None or time.time_ns() - mtime_ns > RACY_WINDOW_NS:
+                return
+
+        if mtime_ns is None:
+            artifacts = frozenset()
+        else:
+            try:
+                with os.scandir(market_dir) as entries:
+                    artifacts = frozenset(e.name for e in entries if e.is_file())
+            except OSError:
+                artifacts = frozenset()
+        self.scans += 1
+
+        previous = cached[1] if cached is not None else frozenset()
+        for name in previous - artifacts:
+            ticks = m.postings[name]
+            del ticks[bisect.bisect_left(ticks, tick)]
+            if not ticks:
+                del m.postings[name]
+        for name in artifacts - previous:
+            bisect.insort(m.postings.setdefault(name, []), tick)
+        m.contents[tick] = (mtime_ns, artifacts)
+
+    def _drop(self, m: _MarketArtifacts, tick: str) -> None:
+        _, artifacts = m.contents.pop(tick)
+        for name in artifacts:
+            ticks = m.postings[name]
+            del ticks[bisect.bisect_left(ticks, tick)]
+            if not ticks:
+                del m.postings[name]
+
+
+_TICK_STORES: Dict[Path, TickStore] = {}
+_TICK_STORES_LOCK = threading.Lock()
+
+
+def get_tick_store(root: Optional[Path] = None) -> TickStore:
+    """Process-wide TickStore for a ticks root (default docs/evolution/ticks)."""
+    root = Path(root) if root is not None else TICKS_DIR
+    store = _TICK_STORES.get(root)
+    if store is None:
+        with _TICK_STORES_LOCK:
+            store = _TICK_STORES.setdefault(root, TickStore(root))
+    return store
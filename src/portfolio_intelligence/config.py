@@ -88,6 +88,14 @@ class PortfolioIntelligenceConfig:
     def analytics_dir(self) -> Path:
         return self.base_dir / "analytics"
 
+    @property
+    def history_dir(self) -> Path:
+        return self.base_dir / "history"
+
+    @property
+    def history_blob_dir(self) -> Path:
+        return self.base_dir / "history_blobs"
+
     @property
     def registry_path(self) -> Path:
         return self.base_dir / "registry" / "portfolio_registry.json"
@@ -108,7 +116,7 @@ class PortfolioIntelligenceConfig:
             self.analytics_dir,
             self.fund_metadata_dir,
             self.benchmark_metadata_dir,
-            self.base_dir / "history",
+            self.history_dir,
             self.base_dir / "registry",
         ):
             path.mkdir(parents=True, exist_ok=True)
@@ -1,12 +1,28 @@
 from __future__ import annotations
 
+import copy
 import json
 import re
-from typing import Any, Dict, List, Tuple
+import threading
+import warnings
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
+import numpy as np
 import pandas as pd
+import pyarrow.parquet as pq
 import requests
 
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover - orjson is optional
+    _json_loads = json.loads
+
+from src.evolution.tick_store import get_tick_store
+
 from .config import PROJECT_ROOT, PortfolioIntelligenceConfig
 from .normalization import INDIA_SECTOR_MAP, US_SECTOR_MAP
 
@@ -22,11 +38,16 @@ def enrich_portfolio(
     fund_metadata_catalog = _load_fund_metadata_catalog(market)
     curated_benchmark_map = _load_curated_fund_benchmark_map(market)
 
+    holdings = normalized_payload.get("holdings", [])
+    panel = _load_close_panel([(holding["ticker"], market) for holding in holdings])
+    technicals_batch = _compute_technicals_batch(panel)
+    pe_table = _load_india_pe_table() if market == "INDIA" else {}
+
     enriched_holdings: List[Dict[str, Any]] = []
-    for holding in normalized_payload.get("holdings", []):
-        price_frame, price_provenance = _load_price_history(holding["ticker"], market)
-        pe_ratio = _lookup_india_pe(holding["ticker"]) if market == "INDIA" else None
-        technicals = _compute_technicals(price_frame)
+    for i, holding in enumerate(holdings):
+        price_provenance = panel.provenance[i]
+        pe_ratio = pe_table.get(holding["ticker"].upper()) if market == "INDIA" else None
+        technicals = technicals_batch[i]
         exposures = _compute_factor_exposure(technicals, pe_ratio, holding["sector"], factor_context)
         coverage = _coverage_status(pe_ratio, technicals)
 
@@ -54,7 +75,7 @@ def enrich_portfolio(
         enriched["factor_exposure"] = exposures
         enriched["enrichment"] = {
             "coverage_status": coverage,
-            "price_history_points": int(len(price_frame)),
+            "price_history_points": int(panel.points[i]),
             "price_provenance": price_provenance,
             "macro_source": _context_source(market, "macro_context.json"),
             "factor_source": _context_source(market, "factor_context.json"),
@@ -142,96 +163,223 @@ def _enrich_mutual_fund_holding(
 
 
 def _load_latest_context(market: str, filename: str) -> Dict[str, Any]:
-    ticks_root = PROJECT_ROOT / "docs" / "evolution" / "ticks"
-    if not ticks_root.exists():
+    _, payload = get_tick_store(PROJECT_ROOT / "docs" / "evolution" / "ticks").load_json(market, filename)
+    if payload is None:
         return {}
-    tick_dirs = sorted([item for item in ticks_root.iterdir() if item.is_dir()], key=lambda item: item.name, reverse=True)
-    for tick_dir in tick_dirs:
-        path = tick_dir / market / filename
-        if path.exists():
-            with open(path, "r", encoding="utf-8") as handle:
-                payload = json.load(handle)
-            if filename == "factor_context.json":
-                return payload.get("factor_context", {})
-            return payload
-    return {}
+    if filename == "factor_context.json":
+        return copy.deepcopy(payload.get("factor_context", {}))
+    return copy.deepcopy(payload)
 
 
 def _context_source(market: str, filename: str) -> str:
-    ticks_root = PROJECT_ROOT / "docs" / "evolution" / "ticks"
-    if not ticks_root.exists():
+    path = get_tick_store(PROJECT_ROOT / "docs" / "evolution" / "ticks").latest_containing(market, filename)
+    if path is None:
         return "UNAVAILABLE"
-    tick_dirs = sorted([item for item in ticks_root.iterdir() if item.is_dir()], key=lambda item: item.name, reverse=True)
-    for tick_dir in tick_dirs:
-        path = tick_dir / market / filename
-        if path.exists():
-            return str(path.relative_to(PROJECT_ROOT))
-    return "UNAVAILABLE"
+    return str(path.relative_to(PROJECT_ROOT))
+
+
+# Technicals only look at the last 50 closes (SMA50; 20-day return and
+# volatility need 21), so the panel keeps that many per holding.
+PANEL_WINDOW = 50
+
+_CACHE_LOCK = threading.Lock()
+# path -> ((mtime_ns, size), closes or None, row count)
+_CLOSE_SERIES_CACHE: Dict[Path, Tuple[Tuple[int, int], Optional[np.ndarray], int]] = {}
+# path -> ((mtime_ns, size), {SYMBOL: adjusted P/E})
+_PE_TABLE_CACHE: Dict[Path, Tuple[Tuple[int, int], Dict[str, Optional[float]]]] = {}
+
 
+@dataclass
+class _ClosePanel:
+    """Right-aligned close matrix: row i ends with holding i's latest closes, in file order."""
 
-def _load_price_history(symbol: str, market: str) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+    closes: np.ndarray
+    lengths: np.ndarray
+    points: List[int]
+    provenance: List[Dict[str, Any]]
+
+
+def _price_history_path(symbol: str, market: str) -> Path:
     if market == "US":
-        path = PROJECT_ROOT / "data" / "analytics" / "us" / "prices" / "daily" / f"{symbol.upper()}.parquet"
-        if path.exists():
-            frame = pd.read_parquet(path)
-            frame = frame.rename(columns=str.lower)
-            return frame, {"source": str(path.relative_to(PROJECT_ROOT)), "stale": False}
-        return pd.DataFrame(), {"source": "UNAVAILABLE", "stale": True}
-
-    path = PROJECT_ROOT / "data" / "raw" / "api_based" / "angel" / "historical" / f"NSE_{symbol.upper()}_1d.jsonl"
-    if not path.exists():
-        return pd.DataFrame(), {"source": "UNAVAILABLE", "stale": True}
-    rows = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines() if line.strip()]
-    frame = pd.DataFrame(rows)
-    frame = frame.rename(columns=str.lower)
-    return frame, {"source": str(path.relative_to(PROJECT_ROOT)), "stale": False}
+        return PROJECT_ROOT / "data" / "analytics" / "us" / "prices" / "daily" / f"{symbol.upper()}.parquet"
+    return PROJECT_ROOT / "data" / "raw" / "api_based" / "angel" / "historical" / f"NSE_{symbol.upper()}_1d.jsonl"
 
 
-def _lookup_india_pe(symbol: str) -> float | None:
-    path = PROJECT_ROOT / "data" / "input" / "daily" / "Equities" / "PE_260625.csv"
-    if not path.exists():
-        return None
-    table = pd.read_csv(path)
-    row = table.loc[table["SYMBOL"].astype(str).str.upper() == symbol.upper()]
-    if row.empty:
-        return None
+def _file_stamp(path: Path) -> Optional[Tuple[int, int]]:
     try:
-        return float(row.iloc[0]["ADJUSTED P/E"])
-    except Exception:
+        stat = path.stat()
+    except OSError:
         return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _read_close_series(path: Path) -> Tuple[Optional[np.ndarray], int]:
+    if path.suffix == ".parquet":
+        parquet = pq.ParquetFile(path)
+        close_column = next((name for name in parquet.schema_arrow.names if name.lower() == "close"), None)
+        rows = parquet.metadata.num_rows
+        if close_column is None:
+            return None, rows
+        return parquet.read(columns=[close_column]).column(0).to_numpy().astype(float), rows
+
+    closes: List[float] = []
+    has_close = False
+    for line in path.read_bytes().splitlines():
+        if not line.strip():
+            continue
+        row = _json_loads(line)
+        value = row.get("close")
+        if value is None:
+            value = next((v for k, v in row.items() if k.lower() == "close"), None)
+        has_close = has_close or value is not None
+        closes.append(np.nan if value is None else value)
+    return (np.asarray(closes, dtype=float) if has_close else None), len(closes)
+
+
+def _load_close_series(path: Path) -> Tuple[Optional[np.ndarray], int]:
+    stamp = _file_stamp(path)
+    with _CACHE_LOCK:
+        cached = _CLOSE_SERIES_CACHE.get(path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1], cached[2]
+    closes, rows = _read_close_series(path)
+    with _CACHE_LOCK:
+        _CLOSE_SERIES_CACHE[path] = (stamp, closes, rows)
+    return closes, rows
+
+
+def _load_close_panel(symbols: Sequence[Tuple[str, str]]) -> _ClosePanel:
+    """Read each (symbol, market) price history once, cached by file stamp, into one close matrix."""
+    closes = np.full((len(symbols), PANEL_WINDOW), np.nan)
+    lengths = np.zeros(len(symbols), dtype=np.int64)
+    points: List[int] = []
+    provenance: List[Dict[str, Any]] = []
+    for i, (symbol, market) in enumerate(symbols):
+        path = _price_history_path(symbol, market)
+        if _file_stamp(path) is None:
+            points.append(0)
+            provenance.append({"source": "UNAVAILABLE", "stale": True})
+            continue
+        series, rows = _load_close_series(path)
+        points.append(rows)
+        provenance.append({"source": str(path.relative_to(PROJECT_ROOT)), "stale": False})
+        if series is not None and len(series):
+            tail = series[-PANEL_WINDOW:]
+            closes[i, PANEL_WINDOW - len(tail):] = tail
+            lengths[i] = len(series)
+    return _ClosePanel(closes=closes, lengths=lengths, points=points, provenance=provenance)
 
 
-def _compute_technicals(frame: pd.DataFrame) -> Dict[str, Any]:
-    if frame.empty or "close" not in frame:
-        return {
-            "trend_regime": "UNAVAILABLE",
-            "momentum_score": None,
-            "volatility_regime": "UNAVAILABLE",
-            "support": None,
-            "resistance": None,
-            "return_20d": None,
-        }
+def _load_india_pe_table() -> Dict[str, Optional[float]]:
+    path = PROJECT_ROOT / "data" / "input" / "daily" / "Equities" / "PE_260625.csv"
+    stamp = _file_stamp(path)
+    if stamp is None:
+        return {}
+    with _CACHE_LOCK:
+        cached = _PE_TABLE_CACHE.get(path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
 
-    closes = frame["close"].astype(float)
-    latest = float(closes.iloc[-1])
-    sma20 = float(closes.tail(20).mean()) if len(closes) >= 20 else float(closes.mean())
-    sma50 = float(closes.tail(50).mean()) if len(closes) >= 50 else float(closes.mean())
-    returns = closes.pct_change().dropna()
-    momentum_20d = float(closes.iloc[-1] / closes.iloc[-21] - 1.0) if len(closes) > 21 else float(returns.tail(5).mean()) if not returns.empty else 0.0
-    volatility = float(returns.tail(20).std() * (252 ** 0.5)) if len(returns) >= 5 else 0.0
-    trend = "BULLISH" if latest >= sma20 >= sma50 else "BEARISH" if latest <= sma20 <= sma50 else "TRANSITION"
-    vol_regime = "HIGH" if volatility >= 0.35 else "MEDIUM" if volatility >= 0.2 else "LOW"
-    support = float(closes.tail(20).min())
-    resistance = float(closes.tail(20).max())
-    return {
-        "trend_regime": trend,
-        "momentum_score": round(max(min(momentum_20d * 5 + 0.5, 1.0), 0.0), 4),
-        "volatility_regime": vol_regime,
-        "support": round(support, 4),
-        "resistance": round(resistance, 4),
-        "return_20d": round(momentum_20d, 4),
-        "annualized_volatility": round(volatility, 4),
-    }
+    table = pd.read_csv(path)
+    values = table["ADJUSTED P/E"] if "ADJUSTED P/E" in table else [None] * len(table)
+    mapping: Dict[str, Optional[float]] = {}
+    for symbol, value in zip(table["SYMBOL"].astype(str).str.upper(), values):
+        if symbol not in mapping:
+            try:
+                mapping[symbol] = float(value)
+            except Exception:
+                mapping[symbol] = None
+    with _CACHE_LOCK:
+        _PE_TABLE_CACHE[path] = (stamp, mapping)
+    return mapping
+
+
+_UNAVAILABLE_TECHNICALS = {
+    "trend_regime": "UNAVAILABLE",
+    "momentum_score": None,
+    "volatility_regime": "UNAVAILABLE",
+    "support": None,
+    "resistance": None,
+    "return_20d": None,
+}
+
+
+def _tail_reduce(values: np.ndarray, counts: np.ndarray, reducer) -> np.ndarray:
+    """Reduce each row's last `counts[i]` values with a NaN-skipping reducer.
+
+    Rows are grouped by count so each group reduces a contiguous slice,
+    summing in the same order as the per-series pandas reductions. An
+    all-NaN slice gives NaN, as in pandas.
+    """
+    out = np.full(len(values), np.nan)
+    for k in np.unique(counts[counts > 0]):
+        rows = counts == k
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            out[rows] = reducer(values[rows, values.shape[1] - k:], axis=1)
+    return out
+
+
+def _valid_returns(closes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Row-wise closes.pct_change().dropna(), right-aligned, and the count per row.
+
+    Like pct_change's default padding, a missing close is carried forward
+    from the last valid one; leading gaps give no return.
+    """
+    columns = np.arange(closes.shape[1])
+    last_valid = np.maximum.accumulate(np.where(np.isnan(closes), 0, columns), axis=1)
+    filled = np.take_along_axis(closes, last_valid, axis=1)
+    returns = filled[:, 1:] / filled[:, :-1] - 1.0
+    valid = ~np.isnan(returns)
+    # Stable sort moves each row's valid returns to the end, in order
+    order = np.argsort(valid, axis=1, kind="stable")
+    return np.take_along_axis(returns, order, axis=1), valid.sum(axis=1)
+
+
+def _compute_technicals_batch(panel: _ClosePanel) -> List[Dict[str, Any]]:
+    """Trend, momentum, volatility and range technicals for every row of the panel at once."""
+    closes, n = panel.closes, panel.lengths
+    if not len(n):
+        return []
+    with np.errstate(invalid="ignore", divide="ignore"):
+        latest = closes[:, -1]
+        sma20 = _tail_reduce(closes, np.minimum(n, 20), np.nanmean)
+        sma50 = _tail_reduce(closes, np.minimum(n, 50), np.nanmean)
+        returns, n_returns = _valid_returns(closes)
+        momentum_20d = np.where(
+            n > 21,
+            closes[:, -1] / closes[:, -21] - 1.0,
+            np.where(n_returns > 0, _tail_reduce(returns, np.minimum(n_returns, 5), np.nanmean), 0.0),
+        )
+        volatility = np.where(
+            n_returns >= 5,
+            _tail_reduce(returns, np.where(n_returns >= 5, np.minimum(n_returns, 20), 0), lambda a, axis: np.nanstd(a, axis=axis, ddof=1)) * (252 ** 0.5),
+            0.0,
+        )
+        support = _tail_reduce(closes, np.minimum(n, 20), np.nanmin)
+        resistance = _tail_reduce(closes, np.minimum(n, 20), np.nanmax)
+    trend = np.where(
+        (latest >= sma20) & (sma20 >= sma50), "BULLISH",
+        np.where((latest <= sma20) & (sma20 <= sma50), "BEARISH", "TRANSITION"),
+    )
+    vol_regime = np.where(volatility >= 0.35, "HIGH", np.where(volatility >= 0.2, "MEDIUM", "LOW"))
+    momentum_score = np.clip(momentum_20d * 5 + 0.5, 0.0, 1.0)
+
+    results: List[Dict[str, Any]] = []
+    for i in range(len(n)):
+        if n[i] == 0:
+            results.append(dict(_UNAVAILABLE_TECHNICALS))
+            continue
+        results.append({
+            "trend_regime": str(trend[i]),
+            "momentum_score": round(float(momentum_score[i]), 4),
+            "volatility_regime": str(vol_regime[i]),
+            "support": round(float(support[i]), 4),
+            "resistance": round(float(resistance[i]), 4),
+            "return_20d": round(float(momentum_20d[i]), 4),
+            "annualized_volatility": round(float(volatility[i]), 4),
+        })
+    return results
 
 
 def _compute_factor_exposure(
@@ -543,6 +691,8 @@ def _materialize_underlying_holdings(
     factor_context: Dict[str, Any],
 ) -> List[Dict[str, Any]]:
     materialized: List[Dict[str, Any]] = []
+    # (position, symbol, price market) of underlyings whose factor profile is computed here
+    pending: List[Tuple[int, str, str]] = []
     sector_map = INDIA_SECTOR_MAP if market == "INDIA" else US_SECTOR_MAP
     for item in underlying_holdings:
         ticker = str(item.get("underlying_ticker") or item.get("ticker") or "").upper().strip()
@@ -550,10 +700,7 @@ def _materialize_underlying_holdings(
         geography = item.get("geography") or ("US" if ticker.endswith(".US") or market == "US" else market)
         factor_profile = item.get("factor_profile") or item.get("factor_exposure")
         if not factor_profile:
-            price_frame, _ = _load_price_history(ticker.replace(".NS", ""), market if geography not in {"US", "GLOBAL", "CHINA"} else "US" if geography == "US" else market)
-            pe_ratio = _lookup_india_pe(ticker.replace(".NS", "")) if market == "INDIA" else None
-            technicals = _compute_technicals(price_frame)
-            factor_profile = _compute_factor_exposure(technicals, pe_ratio, sector, factor_context)
+            pending.append((len(materialized), ticker.replace(".NS", ""), "US" if geography == "US" else market))
         materialized.append(
             {
                 **item,
@@ -564,6 +711,14 @@ def _materialize_underlying_holdings(
                 "factor_profile": factor_profile,
             }
         )
+
+    if pending:
+        panel = _load_close_panel([(symbol, price_market) for _, symbol, price_market in pending])
+        pe_table = _load_india_pe_table() if market == "INDIA" else {}
+        for (position, symbol, _), technicals in zip(pending, _compute_technicals_batch(panel)):
+            item = materialized[position]
+            pe_ratio = pe_table.get(symbol.upper()) if market == "INDIA" else None
+            item["factor_profile"] = _compute_factor_exposure(technicals, pe_ratio, item["sector"], factor_context)
     return materialized
 
 
@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+    import msvcrt
+
+# Analytics history is kept in two parts:
+#   history/<market>/<portfolio_id>/trend.parquet - one row per snapshot with
+#       only the scalars trend charts need (a few hundred bytes per snapshot);
+#   history_blobs/<aa>/<sha256>.json.gz - the full analytics payload,
+#       gzip-compressed and addressed by the SHA-256 of its JSON, so identical
+#       refreshes share one blob.
+# Legacy per-snapshot <stamp>.json files in a history directory are folded
+# into the table (and blob store) the first time that history is read; the
+# JSON files themselves are left in place.
+# The dashboard and scripts/portfolio_tracker_refresh.py may write the same
+# table, so each read-merge-replace runs under a lock file next to it.
+
+logger = logging.getLogger(__name__)
+
+TREND_TABLE = "trend.parquet"
+LOCK_FILE = "trend.lock"
+
+TREND_SCHEMA = pa.schema(
+    [
+        ("stamp", pa.string()),
+        ("digest", pa.string()),
+        ("data_as_of", pa.string()),
+        ("portfolio_refresh_timestamp", pa.string()),
+        ("resilience_score", pa.float64()),
+        ("resilience_classification", pa.string()),
+        ("total_value", pa.float64()),
+        ("mutual_fund_allocation_pct", pa.float64()),
+        ("mutual_fund_support", pa.float64()),
+        ("equity_sleeve_resilience", pa.float64()),
+        ("mutual_fund_sleeve_resilience", pa.float64()),
+    ]
+)
+
+
+def _optional_float(value: Any) -> Optional[float]:
+    return float(value) if value is not None else None
+
+
+def trend_row(stamp: str, digest: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Scalar trend columns of one analytics payload."""
+    resilience = payload.get("resilience") or {}
+    components = resilience.get("components") or {}
+    return {
+        "stamp": stamp,
+        "digest": digest,
+        "data_as_of": payload.get("data_as_of"),
+        "portfolio_refresh_timestamp": payload.get("portfolio_refresh_timestamp"),
+        "resilience_score": float(resilience.get("overall_score") or 0.0),
+        "resilience_classification": resilience.get("classification"),
+        "total_value": float((payload.get("overview") or {}).get("total_value") or 0.0),
+        "mutual_fund_allocation_pct": _optional_float((payload.get("mutual_fund_summary") or {}).get("allocation_pct", 0.0)),
+        "mutual_fund_support": _optional_float(components.get("mutual_fund_support")),
+        "equity_sleeve_resilience": _optional_float(components.get("equity_sleeve_resilience")),
+        "mutual_fund_sleeve_resilience": _optional_float(components.get("mutual_fund_sleeve_resilience")),
+    }
+
+
+@contextmanager
+def _file_lock(path: Path) -> Iterator[None]:
+    """Exclusive lock held across processes on `path` (created if missing)."""
+    with open(path, "a+b") as handle:
+        if fcntl is not None:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+        else:
+            handle.seek(0)
+            msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+            else:
+                handle.seek(0)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+class BlobStore:
+    """Compressed, content-addressed store for full analytics payloads."""
+
+    def __init__(self, root: Path) -> None:
+        self.root = Path(root)
+
+    def path_for(self, digest: str) -> Path:
+        return self.root / digest[:2] / f"{digest}.json.gz"
+
+    def put(self, payload: Dict[str, Any], default: Optional[Callable[[Any], Any]] = None) -> str:
+        data = json.dumps(payload, default=default, separators=(",", ":")).encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        path = self.path_for(digest)
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            # mtime=0 keeps the compressed bytes a pure function of the content
+            with gzip.GzipFile(tmp, "wb", mtime=0) as handle:
+                handle.write(data)
+            os.replace(tmp, path)
+        return digest
+
+    def get(self, digest: str) -> Dict[str, Any]:
+        path = self.path_for(digest)
+        if not path.exists():
+            return {}
+        with gzip.open(path, "rb") as handle:
+            return json.loads(handle.read())
+
+
+class PortfolioHistoryStore:
+    """Per-(market, portfolio_id) trend table backed by a blob store."""
+
+    def __init__(self, history_dir: Path, blob_dir: Path) -> None:
+        self.history_dir = Path(history_dir)
+        self.blobs = BlobStore(blob_dir)
+        self._lock = threading.Lock()
+        # Legacy files that yield no row (empty or unreadable), keyed by
+        # (path, mtime_ns) so they are not re-parsed on every read but are
+        # retried once rewritten
+        self._skipped_legacy: Set[Tuple[Path, int]] = set()
+
+    def portfolio_dir(self, market: str, portfolio_id: str) -> Path:
+        return self.history_dir / market / portfolio_id
+
+    def append(
+        self,
+        market: str,
+        portfolio_id: str,
+        stamp: str,
+        payload: Dict[str, Any],
+        default: Optional[Callable[[Any], Any]] = None,
+    ) -> str:
+        """Record one snapshot; a repeated stamp replaces the earlier row. Returns the blob digest."""
+        digest = self.blobs.put(payload, default=default)
+        with self._lock:
+            self._merge_rows(self.portfolio_dir(market, portfolio_id), [trend_row(stamp, digest, payload)])
+        return digest
+
+    def read_trend(self, market: str, portfolio_id: str, *, limit: int = 20) -> List[Dict[str, Any]]:
+        """Trend rows of the last `limit` snapshots, oldest first."""
+        table = self._load_table(market, portfolio_id)
+        if table is None or limit <= 0:
+            return []
+        return table.slice(max(table.num_rows - limit, 0)).to_pylist()
+
+    def read_payloads(self, market: str, portfolio_id: str, *, limit: int = 20) -> List[Dict[str, Any]]:
+        """Full payloads of the last `limit` snapshots, oldest first."""
+        payloads: List[Dict[str, Any]] = []
+        for row in self.read_trend(market, portfolio_id, limit=limit):
+            payload = self.blobs.get(row["digest"])
+            if payload:
+                payloads.append(payload)
+        return payloads
+
+    def _load_table(self, market: str, portfolio_id: str) -> Optional[pa.Table]:
+        directory = self.portfolio_dir(market, portfolio_id)
+        if not directory.exists():
+            return None
+        path = directory / TREND_TABLE
+        table = pq.read_table(path) if path.exists() else None
+        legacy = [item for item in directory.iterdir() if item.is_file() and item.suffix == ".json"]
+        if legacy:
+            known = set(table.column("stamp").to_pylist()) if table is not None else set()
+            pending = [
+                item for item in legacy
+                if item.stem not in known and (item, item.stat().st_mtime_ns) not in self._skipped_legacy
+            ]
+            if pending:
+                with self._lock:
+                    self._import_legacy(directory, pending)
+                table = pq.read_table(path) if path.exists() else None
+        return table
+
+    def _import_legacy(self, directory: Path, files: List[Path]) -> None:
+        rows: List[Dict[str, Any]] = []
+        for path in sorted(files, key=lambda item: item.name):
+            try:
+                stamp = path.stat().st_mtime_ns
+            except OSError:
+                continue  # removed since it was listed
+            try:
+                with open(path, "r", encoding="utf-8") as handle:
+                    payload = json.load(handle)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Skipping unreadable legacy history file {path}: {e}")
+                payload = None
+            if not isinstance(payload, dict) or not payload:
+                self._skipped_legacy.add((path, stamp))
+                continue
+            rows.append(trend_row(path.stem, self.blobs.put(payload), payload))
+        self._merge_rows(directory, rows, prefer_existing=True)
+
+    def _merge_rows(self, directory: Path, rows: List[Dict[str, Any]], *, prefer_existing: bool = False) -> None:
+        if not rows:
+            return
+        path = directory / TREND_TABLE
+        directory.mkdir(parents=True, exist_ok=True)
+        with _file_lock(directory / LOCK_FILE):
+            existing = pq.read_table(path).to_pylist() if path.exists() else []
+            merged: Dict[str, Dict[str, Any]] = {}
+            for row in (rows + existing) if prefer_existing else (existing + rows):
+                merged[row["stamp"]] = row
+            table = pa.Table.from_pylist([merged[stamp] for stamp in sorted(merged)], schema=TREND_SCHEMA)
+            tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            pq.write_table(table, tmp)
+            os.replace(tmp, path)
@@ -297,23 +297,23 @@ class PortfolioIntelligenceService:
         }
 
     def load_portfolio_trend(self, market: str, portfolio_id: str, *, limit: int = 20) -> Dict[str, Any]:
-        history = self.store.list_portfolio_history(market, portfolio_id, limit=limit)
+        history = self.store.list_portfolio_trend(market, portfolio_id, limit=limit)
         points: List[Dict[str, Any]] = []
         previous_resilience = None
         previous_value = None
-        for payload in history:
-            resilience = float(((payload.get("resilience") or {}).get("overall_score") or 0.0))
-            total_value = float(((payload.get("overview") or {}).get("total_value") or 0.0))
+        for row in history:
+            resilience = row["resilience_score"]
+            total_value = row["total_value"]
             point = {
-                "data_as_of": payload.get("data_as_of"),
-                "portfolio_refresh_timestamp": payload.get("portfolio_refresh_timestamp"),
+                "data_as_of": row["data_as_of"],
+                "portfolio_refresh_timestamp": row["portfolio_refresh_timestamp"],
                 "resilience_score": resilience,
-                "resilience_classification": ((payload.get("resilience") or {}).get("classification")),
+                "resilience_classification": row["resilience_classification"],
                 "total_value": total_value,
-                "mutual_fund_allocation_pct": ((payload.get("mutual_fund_summary") or {}).get("allocation_pct", 0.0)),
-                "mutual_fund_support": (((payload.get("resilience") or {}).get("components") or {}).get("mutual_fund_support")),
-                "equity_sleeve_resilience": (((payload.get("resilience") or {}).get("components") or {}).get("equity_sleeve_resilience")),
-                "mutual_fund_sleeve_resilience": (((payload.get("resilience") or {}).get("components") or {}).get("mutual_fund_sleeve_resilience")),
+                "mutual_fund_allocation_pct": row["mutual_fund_allocation_pct"],
+                "mutual_fund_support": row["mutual_fund_support"],
+                "equity_sleeve_resilience": row["equity_sleeve_resilience"],
+                "mutual_fund_sleeve_resilience": row["mutual_fund_sleeve_resilience"],
                 "resilience_delta": round(resilience - previous_resilience, 4) if previous_resilience is not None else None,
                 "value_delta": round(total_value - previous_value, 2) if previous_value is not None else None,
             }
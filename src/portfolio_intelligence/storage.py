@@ -7,6 +7,7 @@ from pathlib import Path
 from typing import Any, Dict, List
 
 from .config import PortfolioIntelligenceConfig
+from .history_store import PortfolioHistoryStore
 
 
 def _json_default(value: Any) -> Any:
@@ -21,6 +22,7 @@ class PortfolioArtifactStore:
     def __init__(self, config: PortfolioIntelligenceConfig) -> None:
         self.config = config
         self.config.ensure_directories()
+        self.history = PortfolioHistoryStore(self.config.history_dir, self.config.history_blob_dir)
 
     def load_registry(self) -> Dict[str, Any]:
         if not self.config.registry_path.exists():
@@ -54,23 +56,18 @@ class PortfolioArtifactStore:
         path = self.config.analytics_dir / market / portfolio_id / f"{stamp}.json"
         self._write_json(path, payload)
         self._write_json(self.config.analytics_dir / market / portfolio_id / "latest.json", payload)
-        self._write_json(self.config.base_dir / "history" / market / portfolio_id / f"{stamp}.json", payload)
+        self.history.append(market, portfolio_id, stamp, payload, default=_json_default)
         return path
 
     def load_latest_analytics(self, market: str, portfolio_id: str) -> Dict[str, Any]:
         return self._read_json(self.config.analytics_dir / market / portfolio_id / "latest.json")
 
     def list_portfolio_history(self, market: str, portfolio_id: str, *, limit: int = 20) -> List[Dict[str, Any]]:
-        history_dir = self.config.base_dir / "history" / market / portfolio_id
-        if not history_dir.exists():
-            return []
-        payloads: List[Dict[str, Any]] = []
-        files = sorted([item for item in history_dir.iterdir() if item.is_file() and item.suffix == ".json"], key=lambda item: item.name)
-        for path in files[-limit:]:
-            payload = self._read_json(path)
-            if payload:
-                payloads.append(payload)
-        return payloads
+        return self.history.read_payloads(market, portfolio_id, limit=limit)
+
+    def list_portfolio_trend(self, market: str, portfolio_id: str, *, limit: int = 20) -> List[Dict[str, Any]]:
+        """Scalar trend rows (see history_store.TREND_SCHEMA) of the last `limit` snapshots."""
+        return self.history.read_trend(market, portfolio_id, limit=limit)
 
     def list_market_analytics(self, market: str) -> List[Dict[str, Any]]:
         market_dir = self.config.analytics_dir / market
@@ -0,0 +1,124 @@
+"""Tests for the combined Alpha Vantage normalize + curate pipeline."""
+
+import json
+
+import pandas as pd
+import pytest
+
+from ingestion.api_ingestion.alpha_vantage import daily_pipeline
+from ingestion.api_ingestion.alpha_vantage.daily_pipeline import DailyPipeline
+from ingestion.api_ingestion.alpha_vantage.normalizer import build_staged_frame, parse_daily_series
+from ingestion.core.daily_bar_store import DailyBarStore
+
+
+def _payload(symbol, days=30, start="2025-01-01", bad_volume=False):
+    dates = pd.bdate_range(start, periods=days)
+    series = {}
+    # Alpha Vantage lists newest first
+    for i, d in enumerate(reversed(dates)):
+        series[d.strftime("%Y-%m-%d")] = {
+            "1. open": f"{100 + i:.4f}",
+            "2. high": f"{101 + i:.4f}",
+            "3. low": f"{99 + i:.4f}",
+            "4. close": f"{100.5 + i:.4f}",
+            "5. volume": "" if bad_volume and i == 0 else str(1000 + i),
+        }
+    return {"Meta Data": {"2. Symbol": symbol}, "Time Series (Daily)": series}
+
+
+def _legacy_parse(data):
+    """The previous from_dict(orient='index') implementation, for parity checks."""
+    df = pd.DataFrame.from_dict(data["Time Series (Daily)"], orient="index")
+    df.rename(columns={"1. open": "open", "2. high": "high", "3. low": "low", "4. close": "close", "5. volume": "volume"}, inplace=True)
+    for col in ["open", "high", "low", "close"]:
+        df[col] = pd.to_numeric(df[col], errors="coerce")
+    df["volume"] = pd.to_numeric(df["volume"], errors="coerce").fillna(0).astype("int64")
+    df.index = pd.to_datetime(df.index)
+    df.index.name = "timestamp"
+    df.sort_index(inplace=True)
+    df.index = df.index.tz_localize("UTC")
+    return df
+
+
+def _write_raw(raw_dir, symbol, payload):
+    raw_dir.mkdir(parents=True, exist_ok=True)
+    path = raw_dir / f"{symbol}_daily.json"
+    path.write_text(json.dumps(payload))
+    return path
+
+
+@pytest.fixture
+def dirs(tmp_path):
+    return tmp_path / "raw", tmp_path / "staging", tmp_path / "analytics"
+
+
+class TestParseDailySeries:
+    """Test suite for parse_daily_series."""
+
+    @pytest.mark.parametrize("bad_volume", [False, True])
+    def test_matches_legacy_parser(self, bad_volume):
+        payload = _payload("AAPL", bad_volume=bad_volume)
+        pd.testing.assert_frame_equal(parse_daily_series(payload), _legacy_parse(payload), check_like=True)
+
+    def test_staged_schema(self):
+        df = build_staged_frame("AAPL", _payload("AAPL"))
+        assert list(df.columns) == ["symbol", "open", "high", "low", "close", "volume"]
+        assert df.index.is_monotonic_increasing
+        assert str(df.index.tz) == "UTC"
+
+    def test_missing_series_raises(self):
+        with pytest.raises(ValueError):
+            parse_daily_series({"Note": "throttled"})
+
+
+class TestDailyPipeline:
+    """Test suite for DailyPipeline."""
+
+    def test_normalizes_and_curates_in_one_pass(self, dirs):
+        raw, staging, analytics = dirs
+        files = [_write_raw(raw, s, _payload(s)) for s in ("AAPL", "MSFT")]
+        files.append(_write_raw(raw, "BAD", {"Error Message": "Invalid"}))
+
+        stats = DailyPipeline(staging, analytics, workers=1).run_files(files)
+
+        assert stats == {"total": 3, "ok": 2, "skipped": 0, "failed": 1}
+        staged = pd.read_parquet(staging / "AAPL.parquet")
+        curated = pd.read_parquet(analytics / "AAPL.parquet")
+        pd.testing.assert_frame_equal(staged, curated)
+        assert len(curated) == 30
+
+    def test_skips_unchanged_inputs(self, dirs):
+        raw, staging, analytics = dirs
+        files = [_write_raw(raw, s, _payload(s)) for s in ("AAPL", "MSFT")]
+        pipeline = DailyPipeline(staging, analytics, workers=1)
+        pipeline.run_files(files)
+
+        assert pipeline.run_files(files) == {"total": 2, "ok": 0, "skipped": 2, "failed": 0}
+
+        _write_raw(raw, "MSFT", _payload("MSFT", days=31))
+        assert pipeline.run_files(files)["ok"] == 1
+        assert len(pd.read_parquet(analytics / "MSFT.parquet")) == 31
+        assert pipeline.run_files(files, force=True)["ok"] == 2
+
+    def test_includes_appended_bars_in_analytics(self, dirs):
+        raw, staging, analytics = dirs
+        files = [_write_raw(raw, "AAPL", _payload("AAPL", days=5, start="2025-01-01"))]
+        pipeline = DailyPipeline(staging, analytics, workers=1)
+        pipeline.run_files(files)
+
+        later = build_staged_frame("AAPL", _payload("AAPL", days=2, start="2025-02-03"))
+        DailyBarStore(staging).append("AAPL", later)
+        assert pipeline.run_files(files)["ok"] == 1
+        assert len(pd.read_parquet(analytics / "AAPL.parquet")) == 7
+
+    def test_process_pool(self, dirs, monkeypatch):
+        raw, staging, analytics = dirs
+        monkeypatch.setattr(daily_pipeline, "MIN_FILES_FOR_POOL", 2)
+        files = [_write_raw(raw, f"S{i:03d}", _payload(f"S{i:03d}", days=10)) for i in range(12)]
+
+        stats = DailyPipeline(staging, analytics, workers=2).run_files(files)
+
+        assert stats["ok"] == 12
+        assert len(list(analytics.glob("*.parquet"))) == 12
+        manifest = json.loads((staging / daily_pipeline.MANIFEST_NAME).read_text())
+        assert set(manifest) == {f"S{i:03d}" for i in range(12)}
@@ -0,0 +1,206 @@
+"""Tests for the concurrent Alpha Vantage fetch scheduler against a local stub server."""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pandas as pd
+import pytest
+
+from ingestion.api_ingestion.alpha_vantage.fetch_scheduler import AlphaVantageFetchScheduler, KeyBucket
+from ingestion.api_ingestion.alpha_vantage.key_pool import KeyPoolManager
+from ingestion.core.daily_bar_store import read_staged_daily
+from ingestion.incremental_update import config as update_config
+from ingestion.incremental_update.updater import IncrementalUpdater
+
+
+class _StubAlphaVantage:
+    """Minimal /query endpoint: daily series, error symbols and throttle Notes."""
+
+    def __init__(self):
+        self.requests = []
+        self.throttle_remaining = {}  # apikey -> Note responses still to send
+        self.lock = threading.Lock()
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                query = {k: v[0] for k, v in parse_qs(urlparse(self.path).query).items()}
+                body = stub.respond(query)
+                payload = json.dumps(body).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/query"
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def respond(self, query):
+        key, symbol = query.get("apikey"), query.get("symbol")
+        with self.lock:
+            self.requests.append((key, symbol))
+            if self.throttle_remaining.get(key, 0) > 0:
+                self.throttle_remaining[key] -= 1
+                return {"Note": "Thank you for using Alpha Vantage! Our standard API call frequency is 5 calls per minute."}
+        if symbol == "BAD":
+            return {"Error Message": "Invalid API call."}
+        if symbol == "LIST":
+            return ["not", "an", "object"]
+        return {
+            "Meta Data": {"2. Symbol": symbol},
+            "Time Series (Daily)": {"2026-01-05": {"1. open": "1", "2. high": "2", "3. low": "0.5", "4. close": "1.5", "5. volume": "100"}},
+        }
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def stub():
+    with _StubAlphaVantage() as server:
+        yield server
+
+
+def _elapsed_for(stub, n_keys, n_symbols=24, rate_per_minute=1200):
+    keys = [f"KEY{i:04d}" for i in range(n_keys)]
+    with AlphaVantageFetchScheduler(keys=keys, base_url=stub.url, calls_per_minute=rate_per_minute, burst=1) as scheduler:
+        start = time.perf_counter()
+        results = scheduler.fetch_daily([f"SYM{i}" for i in range(n_symbols)])
+        elapsed = time.perf_counter() - start
+    assert all(r.success for r in results.values())
+    return elapsed
+
+
+class TestKeyBucket:
+    """Test suite for KeyBucket."""
+
+    def test_paces_to_rate_and_backs_off(self):
+        bucket = KeyBucket("K", calls_per_minute=60, burst=2)
+        now = bucket.updated
+        bucket.take(now)
+        bucket.take(now)
+        assert bucket.wait_time(now) == pytest.approx(1.0)
+        assert bucket.wait_time(now + 1.0) == pytest.approx(0.0)
+
+        assert bucket.throttle(now, base_seconds=5, max_seconds=30) == 5
+        assert bucket.throttle(now, base_seconds=5, max_seconds=30) == 10
+        assert bucket.wait_time(now + 2.0) == pytest.approx(8.0)
+        bucket.succeeded()
+        assert bucket.throttle(now, base_seconds=5, max_seconds=30) == 5
+
+
+class TestFetchScheduler:
+    """Test suite for AlphaVantageFetchScheduler."""
+
+    def test_fetches_every_symbol_across_keys(self, stub):
+        keys = ["KEYAAAA", "KEYBBBB", "KEYCCCC"]
+        with AlphaVantageFetchScheduler(keys=keys, base_url=stub.url, calls_per_minute=6000, burst=1) as scheduler:
+            results = scheduler.fetch_daily(["AAPL", "MSFT", "NVDA", "BAD"] + [f"S{i}" for i in range(8)])
+
+        assert results["AAPL"].success and "Time Series (Daily)" in results["AAPL"].data
+        assert results["BAD"].status == "API_ERROR"
+        assert len(stub.requests) == 12
+        # Work is spread over the pool, each key using its own session
+        assert {key for key, _ in stub.requests} == set(keys)
+        assert len(scheduler.sessions) == 3
+
+    def test_throughput_scales_with_keys(self, stub):
+        one = _elapsed_for(stub, 1)
+        four = _elapsed_for(stub, 4)
+        # 24 calls at 20/s per key: ~1.2s on one key, ~0.3s on four
+        assert one > 0.9
+        assert one / four > 2.5
+
+    def test_note_triggers_backoff_and_retry_on_another_key(self, stub):
+        stub.throttle_remaining["KEYAAAA"] = 1
+        keys = ["KEYAAAA", "KEYBBBB"]
+        with AlphaVantageFetchScheduler(keys=keys, base_url=stub.url, calls_per_minute=6000, burst=1,
+                                        note_backoff_seconds=30) as scheduler:
+            results = scheduler.fetch_daily(["AAPL", "MSFT", "NVDA", "AMZN"])
+            stats = scheduler.get_stats()
+
+        assert all(r.success for r in results.values())
+        assert stats["throttled"] == 1
+        assert scheduler.buckets["KEYAAAA"].cooldown_until > time.monotonic()
+        # After the Note the cooled-down key made no further calls
+        assert [k for k, _ in stub.requests].count("KEYAAAA") == 1
+        assert max(r.attempts for r in results.values()) == 2
+
+    def test_non_object_body_resolves_as_api_error(self, stub):
+        with AlphaVantageFetchScheduler(keys=["KEYAAAA"], base_url=stub.url, calls_per_minute=6000, burst=1) as scheduler:
+            results = scheduler.fetch_daily(["LIST", "AAPL"])
+            assert all(t.is_alive() for t in scheduler._threads)
+
+        assert results["LIST"].status == "API_ERROR"
+        assert "list" in results["LIST"].msg
+        assert results["AAPL"].success
+
+    def test_gives_up_after_max_attempts(self, stub):
+        stub.throttle_remaining["KEYAAAA"] = 10
+        with AlphaVantageFetchScheduler(keys=["KEYAAAA"], base_url=stub.url, calls_per_minute=6000, burst=1,
+                                        note_backoff_seconds=0.01, max_attempts=2) as scheduler:
+            result = scheduler.fetch_daily(["AAPL"])["AAPL"]
+
+        assert result.status == "RATE_LIMIT"
+        assert result.attempts == 2
+
+    def test_priority_order_on_single_key(self, stub):
+        with AlphaVantageFetchScheduler(keys=["KEYAAAA"], base_url=stub.url, calls_per_minute=600, burst=1) as scheduler:
+            # Occupy the only token so the rest queue up before any is served
+            first = scheduler.submit_daily("FIRST")
+            low = [scheduler.submit_daily(f"LOW{i}", priority=5) for i in range(2)]
+            high = [scheduler.submit_daily(f"HIGH{i}", priority=0) for i in range(2)]
+            for f in [first] + low + high:
+                f.result(timeout=10)
+
+        assert [s for _, s in stub.requests] == ["FIRST", "HIGH0", "HIGH1", "LOW0", "LOW1"]
+
+    def test_respects_key_pool_daily_quota(self, stub, monkeypatch):
+        monkeypatch.setenv("ALPHA_VANTAGE_KEYS", "KEYAAAA")
+        monkeypatch.setenv("ALPHA_VANTAGE_API_KEY", "")
+        pool = KeyPoolManager()
+        pool.usage_stats["KEYAAAA"]["day_calls"] = KeyPoolManager.MAX_CALLS_PER_DAY - 2
+
+        with AlphaVantageFetchScheduler(key_pool=pool, base_url=stub.url, calls_per_minute=6000, burst=1) as scheduler:
+            results = scheduler.fetch_daily(["A", "B", "C", "D"])
+
+        assert sum(r.success for r in results.values()) == 2
+        assert sorted(r.status for r in results.values()) == ["OK", "OK", "QUOTA_EXHAUSTED", "QUOTA_EXHAUSTED"]
+        assert pool.day_calls_remaining("KEYAAAA") == 0
+
+    def test_requires_keys(self):
+        with pytest.raises(ValueError):
+            AlphaVantageFetchScheduler(keys=[])
+
+
+class TestIncrementalUpdaterScheduling:
+    """Test suite for IncrementalUpdater.update_symbols."""
+
+    def test_updates_symbols_through_scheduler(self, stub, tmp_path, monkeypatch):
+        monkeypatch.setattr(update_config, "STAGING_PATH", tmp_path)
+        monkeypatch.setattr(update_config, "UPDATE_TRACKER", tmp_path / "tracker.parquet")
+        for symbol, last in (("AAPL", "2026-01-02"), ("MSFT", "2026-01-05")):
+            pd.DataFrame({"open": [1.0], "high": [2.0], "low": [0.5], "close": [1.5], "volume": [100]},
+                         index=pd.to_datetime([last], utc=True)).to_parquet(tmp_path / f"{symbol}.parquet")
+
+        updater = IncrementalUpdater()
+        with AlphaVantageFetchScheduler(keys=["KEYAAAA", "KEYBBBB"], base_url=stub.url, calls_per_minute=6000, burst=1) as scheduler:
+            statuses = {s.symbol: s.status for s in updater.update_symbols(["AAPL", "MSFT", "BAD"], scheduler=scheduler)}
+
+        assert statuses == {"AAPL": "success", "MSFT": "up_to_date", "BAD": "failed"}
+        assert len(read_staged_daily(tmp_path / "AAPL.parquet")) == 2
+        updater.checkpoint()
+        assert set(pd.read_parquet(tmp_path / "tracker.parquet")["symbol"]) == {"AAPL", "MSFT", "BAD"}
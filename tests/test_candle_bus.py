@@ -0,0 +1,219 @@
+"""Tests for the in-memory candle bus, background persister and their consumers."""
+
+import threading
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ingestion.india_ingestion.candle_aggregator import CandleAggregator
+from ingestion.india_ingestion.candle_bus import CandleBus, CandlePersister, CandleRing
+from ingestion.india_ingestion.candle_store import CandleStore
+from observations.signal_validator import SignalValidator
+from src.core_modules.momentum_engine.momentum_engine import MomentumEngine
+from tests.test_momentum_incremental import _as_dicts, _synthetic_candles
+
+
+def _no_disk_reads(monkeypatch):
+    def _fail(*args, **kwargs):
+        raise AssertionError("unexpected parquet read")
+    monkeypatch.setattr(pd, "read_parquet", _fail)
+
+
+class TestCandleRing:
+    """Test suite for CandleRing."""
+
+    def test_view_is_latest_window_across_wraps(self):
+        df = _synthetic_candles(days=1, minutes=100)
+        ring = CandleRing("TEST", capacity=30)
+        for candle in df.to_dict("records"):
+            ring.append(candle)
+
+        assert len(ring) == 30
+        view = ring.view()
+        np.testing.assert_array_equal(view.close, df["close"].to_numpy()[-30:])
+        np.testing.assert_array_equal(view.timestamp, df["timestamp"].to_numpy()[-30:])
+        assert len(ring.view(5)) == 5
+        pd.testing.assert_frame_equal(
+            ring.frame(),
+            df.iloc[-30:].reset_index(drop=True).astype({"volume": float}),
+        )
+
+    def test_views_are_zero_copy_and_read_only(self):
+        ring = CandleRing("TEST", capacity=50)
+        ring.extend_from_frame(_synthetic_candles(days=1, minutes=20))
+        a, b = ring.view(), ring.view(10)
+
+        assert np.shares_memory(a.close, b.close)
+        assert np.shares_memory(a.close, ring._cols["close"])
+        with pytest.raises(ValueError):
+            a.close[0] = 0.0
+
+    def test_duplicate_minute_overwrites_and_stale_dropped(self):
+        candles = _synthetic_candles(days=1, minutes=3).to_dict("records")
+        ring = CandleRing("TEST")
+        for candle in candles:
+            ring.append(candle)
+
+        assert ring.append({**candles[-1], "close": 1.0})
+        assert not ring.append(candles[0])
+        assert len(ring) == 3
+        assert ring.view(1).close[0] == 1.0
+
+    def test_tz_aware_round_trip(self):
+        df = _synthetic_candles(days=1, minutes=10)
+        df["timestamp"] = df["timestamp"].dt.tz_localize("Asia/Kolkata")
+        ring = CandleRing("TEST")
+        ring.extend_from_frame(df)
+
+        frame = ring.frame()
+        assert str(frame["timestamp"].dt.tz) == "Asia/Kolkata"
+        assert frame["timestamp"].tolist() == df["timestamp"].tolist()
+        assert ring.last_timestamp == df["timestamp"].iloc[-1]
+
+
+class TestCandlePersister:
+    """Test suite for CandlePersister."""
+
+    def test_writes_in_background_and_runs_tasks_in_order(self, tmp_path):
+        store = CandleStore(str(tmp_path), compact_threshold=0)
+        persister = CandlePersister(store)
+        persister.start()
+        seen = []
+
+        candles = _synthetic_candles(days=1, minutes=5).to_dict("records")
+        persister.submit(candles[:3])
+        persister.submit_task(lambda: seen.append(len(store.read("TEST"))))
+        persister.submit(candles[3:])
+        persister.stop()
+
+        assert seen == [3]
+        assert store.read("TEST")["close"].tolist() == [c["close"] for c in candles]
+        assert persister.get_stats()["candles_written"] == 5
+
+
+class TestAggregatorWithBus:
+    """The minute boundary publishes to the bus and reads nothing from disk."""
+
+    def test_finalize_does_no_file_reads(self, tmp_path, monkeypatch):
+        bus = CandleBus()
+        store = CandleStore(str(tmp_path))
+        persister = CandlePersister(store)
+        engine = MomentumEngine(processed_data_path=str(tmp_path), incremental=True, candle_bus=bus)
+        signals = []
+
+        def callback(candles):
+            engine.update_candles(candles)
+            signals.extend(engine.run_on_all(["RELIANCE"]))
+
+        aggregator = CandleAggregator(
+            processed_base_path=str(tmp_path),
+            on_candle_callback=callback,
+            candle_store=store,
+            candle_bus=bus,
+            persister=persister,
+        )
+        aggregator.add_symbol("RELIANCE")
+
+        writers = []
+        store_append = store.append
+
+        def append(*args, **kwargs):
+            writers.append(threading.current_thread().name)
+            return store_append(*args, **kwargs)
+
+        store.append = append
+        with monkeypatch.context() as m:
+            _no_disk_reads(m)
+            for minute in range(3):
+                aggregator.update_tick("RELIANCE", 100.0 + minute, 100, datetime(2026, 1, 14, 9, 15 + minute, 10))
+                aggregator.finalize_candles()
+            assert bus.view("RELIANCE").close.tolist() == [100.0, 101.0, 102.0]
+            assert engine._states["RELIANCE"].candle_count == 3
+
+        aggregator.stop()
+        assert set(writers) == {"candle-persister"}
+        assert store.read("RELIANCE")["close"].tolist() == [100.0, 101.0, 102.0]
+        assert store.list_segments("RELIANCE") == []
+
+
+class TestBusConsumerParity:
+    """Consumers reading the bus see the same data as reading the store."""
+
+    def test_engine_matches_store_path(self, tmp_path, monkeypatch):
+        df = _synthetic_candles(days=2)
+        history, live = df.iloc[:120], df.iloc[120:]
+        store = CandleStore(str(tmp_path), compact_threshold=0)
+        store.append("TEST", history.to_dict("records"))
+
+        bus = CandleBus()
+        bus.warm_up(store, ["TEST"])
+        disk_engine = MomentumEngine(processed_data_path=str(tmp_path))
+        bus_engine = MomentumEngine(processed_data_path=str(tmp_path), incremental=True, candle_bus=bus)
+
+        expected, actual = [], []
+        for candle in live.to_dict("records"):
+            store.append("TEST", [candle])
+            expected.append(_as_dicts(disk_engine.generate_signals("TEST")))
+
+        with monkeypatch.context() as m:
+            _no_disk_reads(m)
+            for candle in live.to_dict("records"):
+                bus.publish([candle])
+                bus_engine.update_candles([candle])
+                actual.append(_as_dicts(bus_engine.generate_signals("TEST")))
+
+        assert actual == expected
+        assert any(expected)
+
+    def test_validator_lookup_matches_store(self, tmp_path, monkeypatch):
+        df = _synthetic_candles(days=1, minutes=60)
+        df["timestamp"] = df["timestamp"].dt.tz_localize("Asia/Kolkata")
+        store = CandleStore(str(tmp_path), compact_threshold=0)
+        store.append("RELIANCE", df.assign(symbol="RELIANCE").to_dict("records"))
+        bus = CandleBus()
+        bus.warm_up(store, ["RELIANCE"])
+
+        disk = SignalValidator(review_dir=str(tmp_path))
+        disk.candle_store = store
+        live = SignalValidator(review_dir=str(tmp_path), candle_bus=bus)
+        live.candle_store = store
+
+        queries = [("2026-01-05 09:20:00", 5), ("2026-01-05T09:30:30+05:30", 15), ("2026-01-05 10:14:00", 5)]
+        expected = [disk._get_price_at_timestamp("RELIANCE", ts, off) for ts, off in queries]
+        with monkeypatch.context() as m:
+            _no_disk_reads(m)
+            actual = [live._get_price_at_timestamp("RELIANCE", ts, off) for ts, off in queries]
+
+        assert actual == expected
+        assert expected[0] is not None and expected[-1] is None
+
+
+class TestReviewFileSharing:
+    """In-process validation and signal logging share the review CSV."""
+
+    def test_rewrite_does_not_drop_rows_logged_meanwhile(self, tmp_path):
+        from observations.signal_logger import ObservationLogger
+
+        obs_logger = ObservationLogger(base_dir=str(tmp_path))
+        obs_logger.log_signal({"timestamp": "2026-01-14 09:20:00", "symbol": "RELIANCE", "price_t0": 100.0})
+        validator = SignalValidator(review_dir=str(obs_logger.review_dir))
+        labelling = threading.Event()
+
+        def slow_label(df, now=None):
+            labelling.set()
+            threading.Event().wait(0.2)
+            df.loc[0, "price_t5"] = 101.0
+            return 1
+
+        validator.labeller.label = slow_label
+        worker = threading.Thread(target=validator.validate_signals)
+        worker.start()
+        labelling.wait(5)
+        obs_logger.log_signal({"timestamp": "2026-01-14 09:21:00", "symbol": "TCS", "price_t0": 200.0})
+        worker.join()
+
+        review = pd.read_csv(obs_logger._get_review_file())
+        assert review["symbol"].tolist() == ["RELIANCE", "TCS"]
+        assert review.loc[0, "price_t5"] == 101.0
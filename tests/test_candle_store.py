@@ -0,0 +1,145 @@
+"""Unit tests for the append-only CandleStore and its use by CandleAggregator."""
+
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+from ingestion.india_ingestion.candle_aggregator import CandleAggregator
+from ingestion.india_ingestion.candle_store import CandleStore
+
+
+def _candle(minute: int, close: float = 100.0, volume: int = 1000, symbol: str = "RELIANCE") -> dict:
+    return {
+        "symbol": symbol,
+        "exchange": "NSE",
+        "timestamp": datetime(2026, 1, 14, 9, 15) + timedelta(minutes=minute),
+        "open": close,
+        "high": close + 1,
+        "low": close - 1,
+        "close": close,
+        "volume": volume,
+    }
+
+
+class TestCandleStore:
+    """Test suite for CandleStore."""
+
+    def test_append_writes_segment_not_base(self, tmp_path):
+        store = CandleStore(str(tmp_path), compact_threshold=0)
+        store.append("RELIANCE", [_candle(0)])
+        store.append("RELIANCE", [_candle(1)])
+
+        assert not store.base_file("RELIANCE").exists()
+        assert len(store.list_segments("RELIANCE")) == 2
+        assert store.exists("RELIANCE")
+        assert not store.exists("TCS")
+
+    def test_read_merges_base_and_segments(self, tmp_path):
+        store = CandleStore(str(tmp_path), compact_threshold=0)
+        store.append("RELIANCE", [_candle(0), _candle(1)])
+        store.compact("RELIANCE")
+        store.append("RELIANCE", [_candle(2)])
+
+        df = store.read("RELIANCE")
+
+        assert len(df) == 3
+        assert df["timestamp"].is_monotonic_increasing
+        assert pd.api.types.is_datetime64_any_dtype(df["timestamp"])
+
+    def test_read_keeps_latest_write_for_duplicates(self, tmp_path):
+        store = CandleStore(str(tmp_path), compact_threshold=0)
+        store.append("RELIANCE", [_candle(0, close=100.0)])
+        store.compact("RELIANCE")
+        store.append("RELIANCE", [_candle(0, close=105.0)])
+        store.append("RELIANCE", [_candle(0, close=110.0)])
+
+        df = store.read("RELIANCE")
+
+        assert len(df) == 1
+        assert df.iloc[0]["close"] == 110.0
+
+    def test_compact_folds_segments_into_base(self, tmp_path):
+        store = CandleStore(str(tmp_path), compact_threshold=0)
+        for minute in range(5):
+            store.append("RELIANCE", [_candle(minute)])
+        before = store.read("RELIANCE")
+
+        assert store.compact("RELIANCE") == 5
+        assert store.list_segments("RELIANCE") == []
+        assert not store.segment_dir("RELIANCE").exists()
+
+        after = pd.read_parquet(store.base_file("RELIANCE"))
+        pd.testing.assert_frame_equal(before, after)
+
+    def test_auto_compaction_threshold(self, tmp_path):
+        store = CandleStore(str(tmp_path), compact_threshold=3)
+        for minute in range(3):
+            store.append("RELIANCE", [_candle(minute)])
+
+        assert store.list_segments("RELIANCE") == []
+        assert len(pd.read_parquet(store.base_file("RELIANCE"))) == 3
+
+    def test_compact_all(self, tmp_path):
+        store = CandleStore(str(tmp_path), compact_threshold=0)
+        store.append("RELIANCE", [_candle(0)])
+        store.append("TCS", [_candle(0, symbol="TCS")])
+
+        assert store.compact_all() == {"NSE_RELIANCE": 1, "NSE_TCS": 1}
+        assert store.base_file("TCS").exists()
+
+    def test_read_missing_symbol_is_empty(self, tmp_path):
+        assert CandleStore(str(tmp_path)).read("NOPE").empty
+
+
+    def test_read_projection_without_timestamp(self, tmp_path):
+        store = CandleStore(str(tmp_path), compact_threshold=0)
+        store.append("RELIANCE", [_candle(0, close=100.0), _candle(1, close=101.0)])
+        segmented = store.read("RELIANCE", columns=["close", "volume"])
+        store.compact("RELIANCE")
+        compacted = store.read("RELIANCE", columns=["close", "volume"])
+
+        assert list(compacted.columns) == ["close", "volume"]
+        pd.testing.assert_frame_equal(compacted, segmented)
+        assert compacted["close"].tolist() == [100.0, 101.0]
+
+    def test_read_retries_when_segments_are_compacted_underneath(self, tmp_path, monkeypatch):
+        store = CandleStore(str(tmp_path), compact_threshold=0)
+        store.append("RELIANCE", [_candle(0)])
+        store.append("RELIANCE", [_candle(1)])
+
+        # Another process compacts between the reader's listing and its reads
+        list_segments = store.list_segments
+
+        def list_then_compact(symbol, exchange="NSE"):
+            segments = list_segments(symbol, exchange)
+            if segments:
+                CandleStore(str(tmp_path), compact_threshold=0).compact(symbol, exchange)
+            return segments
+
+        monkeypatch.setattr(store, "list_segments", list_then_compact)
+
+        df = store.read("RELIANCE")
+        assert len(df) == 2
+
+
+class TestCandleAggregatorPersistence:
+    """CandleAggregator persists through the append-only store."""
+
+    def test_finalize_appends_and_stop_compacts(self, tmp_path):
+        aggregator = CandleAggregator(processed_base_path=str(tmp_path))
+        aggregator.add_symbol("RELIANCE")
+        store = aggregator.candle_store
+
+        for minute in range(3):
+            ts = datetime(2026, 1, 14, 9, 15 + minute, 10)
+            aggregator.update_tick("RELIANCE", 100.0 + minute, 100, ts)
+            aggregator.finalize_candles()
+
+        assert len(store.list_segments("RELIANCE")) == 3
+        assert len(store.read("RELIANCE")) == 3
+
+        aggregator.stop()
+
+        assert store.list_segments("RELIANCE") == []
+        df = pd.read_parquet(store.base_file("RELIANCE"))
+        assert df["close"].tolist() == [100.0, 101.0, 102.0]
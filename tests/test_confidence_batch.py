@@ -0,0 +1,138 @@
+"""Unit tests for the columnar confidence scoring and decay path."""
+
+from dataclasses import replace
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from signals.confidence_engine.decay import DecayCalculator
+from signals.confidence_engine.inputs import ConfidenceContext
+from signals.confidence_engine.scorer import ConfidenceScorer
+from signals.confidence_jobs.updater import ConfidenceUpdaterJob
+from signals.core.enums import Market, SignalCategory, SignalDirection, SignalState
+from signals.core.models import Signal
+from signals.repository.parquet_repo import ParquetSignalRepository
+
+NOW = datetime(2026, 1, 9, 12, 0)
+HORIZONS = ["1H", "4H", "1D", "2D", "1W", "3M"]
+DIRECTIONS = [SignalDirection.BULLISH, SignalDirection.BEARISH, SignalDirection.NEUTRAL]
+
+
+class SeededContextProvider:
+    """Deterministic context per asset so both job modes see the same inputs."""
+
+    def get_context(self, signal: Signal) -> ConfidenceContext:
+        rng = np.random.default_rng(int(signal.asset_id[1:]))
+        return ConfidenceContext(
+            volume_ratio=float(rng.uniform(0.8, 2.5)),
+            volatility_z_score=float(rng.uniform(-1.0, 5.0)),
+            indicator_agreement_count=int(rng.integers(0, 5)),
+            market_trend_score=float(rng.uniform(-1.0, 1.0)),
+        )
+
+
+class FlakyContextProvider(SeededContextProvider):
+    """Fails for every fifth asset."""
+
+    def get_context(self, signal: Signal) -> ConfidenceContext:
+        if int(signal.asset_id[1:]) % 5 == 3:
+            raise RuntimeError("indicator feed unavailable")
+        return super().get_context(signal)
+
+
+def _active_signals(n: int):
+    signals = []
+    for i in range(n):
+        sig = Signal.create(
+            name="breakout",
+            market=Market.US,
+            asset=f"A{i}",
+            category=SignalCategory.MOMENTUM,
+            direction=DIRECTIONS[i % 3],
+            trigger_time=NOW - timedelta(minutes=37 * i - 60),
+            horizon=HORIZONS[i % len(HORIZONS)],
+            expiry_time=NOW + timedelta(days=5),
+            strength=0.5,
+            explanation={},
+            confidence=None if i % 4 == 0 else float(i % 100),
+        )
+        signals.append(replace(sig, created_at=datetime(2026, 1, 5 + i % 3)).transition_to(SignalState.ACTIVE))
+    return signals
+
+
+def _run(tmp_path, name, signals, batch: bool, provider=None):
+    repo = ParquetSignalRepository(tmp_path / name, compact_threshold=0)
+    job = ConfidenceUpdaterJob(repo, batch=batch)
+    job.context_provider = provider or SeededContextProvider()
+    updated = job.run_batch(signals, NOW) if batch else job.run_per_signal(signals, NOW)
+    latest = {s.signal_id: repo.get_latest_signal(s.signal_id) for s in signals}
+    return updated, latest
+
+
+class TestBatchConfidence:
+    """Columnar paths match the scalar ones exactly."""
+
+    def test_decay_matches_scalar(self):
+        decay = DecayCalculator()
+        initial = np.array([80.0, 0.0, -5.0, 55.5, 100.0, 42.0])
+        elapsed = np.array([3600.0, 100.0, 50.0, -30.0, 1e6, 12345.678])
+
+        batch = decay.calculate_decayed_scores(initial, elapsed, HORIZONS)
+        for i, horizon in enumerate(HORIZONS):
+            expected = decay.calculate_decayed_score(
+                initial[i], NOW, NOW + timedelta(seconds=elapsed[i]), horizon
+            )
+            assert batch[i] == pytest.approx(expected, rel=1e-12, abs=0.0)
+
+    def test_scores_match_scalar(self):
+        scorer = ConfidenceScorer()
+        provider = SeededContextProvider()
+        signals = _active_signals(30)
+        contexts = [provider.get_context(s) for s in signals]
+
+        scores, adjustments = scorer.compute_scores(
+            np.array([s.direction.value for s in signals]),
+            np.array([c.volume_ratio for c in contexts]),
+            np.array([c.volatility_z_score for c in contexts]),
+            np.array([c.indicator_agreement_count for c in contexts]),
+            np.array([c.market_trend_score for c in contexts]),
+        )
+        for i, (sig, ctx) in enumerate(zip(signals, contexts)):
+            expected, breakdown = scorer.compute_score(sig, ctx)
+            assert scores[i] == expected
+            row = {k: float(v[i]) for k, v in adjustments.items()}
+            assert scorer.build_explanation(float(scores[i]), row, ctx) == breakdown
+
+    def test_job_modes_write_identical_versions(self, tmp_path):
+        signals = _active_signals(60)
+        batch_count, batch_latest = _run(tmp_path, "batch", signals, batch=True)
+        loop_count, loop_latest = _run(tmp_path, "loop", signals, batch=False)
+
+        assert batch_count == loop_count > 0
+        for signal_id, loop_sig in loop_latest.items():
+            batch_sig = batch_latest[signal_id]
+            assert batch_sig.version == loop_sig.version
+            assert batch_sig.confidence_score == pytest.approx(loop_sig.confidence_score, rel=1e-12)
+            assert batch_sig.explainability_payload.keys() == loop_sig.explainability_payload.keys()
+            assert batch_sig.explainability_payload["raw_confidence"] == loop_sig.explainability_payload["raw_confidence"]
+
+    def test_batch_writes_one_segment_per_partition(self, tmp_path):
+        _run(tmp_path, "batch", _active_signals(60), batch=True)
+        # Three created_at days -> three day partitions, one segment each
+        assert len(list((tmp_path / "batch" / "US").glob("*/*.parquet"))) == 3
+
+    def test_bad_rows_are_skipped_like_per_signal(self, tmp_path):
+        signals = _active_signals(40)
+        signals[7] = replace(signals[7], trigger_timestamp=None)
+        batch_count, batch_latest = _run(tmp_path, "batch", signals, batch=True, provider=FlakyContextProvider())
+        loop_count, loop_latest = _run(tmp_path, "loop", signals, batch=False, provider=FlakyContextProvider())
+
+        assert batch_count == loop_count > 0
+        assert batch_latest.keys() == loop_latest.keys()
+        for signal_id, loop_sig in loop_latest.items():
+            batch_sig = batch_latest[signal_id]
+            assert (batch_sig and batch_sig.version) == (loop_sig and loop_sig.version)
+        # No new version was written for the failing rows
+        assert batch_latest[signals[3].signal_id] is None
+        assert batch_latest[signals[7].signal_id] is None
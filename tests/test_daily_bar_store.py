@@ -0,0 +1,130 @@
+"""Tests for footer-based last-date lookup and append-only staged daily bars."""
+
+import pandas as pd
+import pyarrow.parquet as pq
+
+from ingestion.core.daily_bar_store import DailyBarStore, footer_last_date, read_staged_daily
+from ingestion.incremental_update import config as update_config
+from ingestion.incremental_update.updater import IncrementalUpdater
+
+
+def _bars(symbol, dates, close=1.0):
+    index = pd.DatetimeIndex(pd.to_datetime(dates, utc=True), name="timestamp")
+    return pd.DataFrame(
+        {"symbol": symbol, "open": close, "high": close, "low": close, "close": close, "volume": 100},
+        index=index,
+    )
+
+
+def _response(dates):
+    bar = {"1. open": "10", "2. high": "11", "3. low": "9", "4. close": "10.5", "5. volume": "1000"}
+    return {"Time Series (Daily)": {d: dict(bar) for d in dates}}
+
+
+class TestFooterLastDate:
+    """Test suite for footer_last_date."""
+
+    def test_reads_statistics_across_row_groups(self, tmp_path):
+        path = tmp_path / "AAPL.parquet"
+        df = _bars("AAPL", pd.bdate_range("2024-01-01", periods=300).strftime("%Y-%m-%d"))
+        df.to_parquet(path, row_group_size=50)
+
+        assert pq.ParquetFile(path).metadata.num_row_groups == 6
+        assert footer_last_date(path) == str(df.index.max().date())
+
+    def test_unnamed_index(self, tmp_path):
+        path = tmp_path / "MSFT.parquet"
+        df = _bars("MSFT", ["2025-01-02", "2025-01-03"])
+        df.index.name = None
+        df.to_parquet(path)
+
+        assert footer_last_date(path) == "2025-01-03"
+
+
+class TestDailyBarStore:
+    """Test suite for DailyBarStore."""
+
+    def test_append_writes_parts_not_base(self, tmp_path):
+        store = DailyBarStore(tmp_path, compact_every=100)
+        _bars("AAPL", ["2025-01-02", "2025-01-03"]).to_parquet(store.base_path("AAPL"))
+        base_stamp = store.base_path("AAPL").stat().st_mtime_ns
+
+        assert store.append("AAPL", _bars("AAPL", ["2025-01-03", "2025-01-06"], close=2.0)) == 1
+        assert store.append("AAPL", _bars("AAPL", ["2025-01-06"])) == 0
+        assert store.append("AAPL", _bars("AAPL", ["2025-01-07"], close=3.0)) == 1
+
+        assert store.base_path("AAPL").stat().st_mtime_ns == base_stamp
+        assert store.last_date("AAPL") == "2025-01-07"
+        df = read_staged_daily(store.base_path("AAPL"))
+        assert [str(d.date()) for d in df.index] == ["2025-01-02", "2025-01-03", "2025-01-06", "2025-01-07"]
+        assert df["close"].tolist() == [1.0, 1.0, 2.0, 3.0]
+        assert df.index.name == "timestamp"
+
+    def test_compaction_folds_parts_into_base(self, tmp_path):
+        store = DailyBarStore(tmp_path, compact_every=3)
+        _bars("AAPL", ["2025-01-02"]).to_parquet(store.base_path("AAPL"))
+        for day in ("2025-01-03", "2025-01-06", "2025-01-07"):
+            store.append("AAPL", _bars("AAPL", [day]))
+
+        assert not store.append_dir("AAPL").exists()
+        assert len(pd.read_parquet(store.base_path("AAPL"))) == 4
+        assert store.last_date("AAPL") == "2025-01-07"
+
+    def test_rewritten_base_supersedes_covered_parts(self, tmp_path):
+        store = DailyBarStore(tmp_path, compact_every=100)
+        _bars("AAPL", ["2025-01-02"]).to_parquet(store.base_path("AAPL"))
+        store.append("AAPL", _bars("AAPL", ["2025-01-03"], close=5.0))
+
+        # Normalizer re-stages a fresh full history
+        _bars("AAPL", ["2025-01-02", "2025-01-03", "2025-01-06"], close=7.0).to_parquet(store.base_path("AAPL"))
+
+        assert store.last_date("AAPL") == "2025-01-06"
+        df = read_staged_daily(store.base_path("AAPL"))
+        assert df["close"].tolist() == [7.0, 7.0, 7.0]
+        assert list(store.append_dir("AAPL").glob("part-*.parquet")) == []
+
+
+class TestIncrementalUpdaterAppend:
+    """IncrementalUpdater appends only new bars."""
+
+    def test_apply_daily_response_appends_new_bars(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(update_config, "STAGING_PATH", tmp_path)
+        monkeypatch.setattr(update_config, "UPDATE_TRACKER", tmp_path / "tracker.parquet")
+        _bars("AAPL", ["2025-01-02", "2025-01-03"]).to_parquet(tmp_path / "AAPL.parquet")
+
+        updater = IncrementalUpdater()
+        assert updater.get_last_stored_date("AAPL") == "2025-01-03"
+        assert updater.apply_daily_response("AAPL", _response(["2025-01-02", "2025-01-03", "2025-01-06", "2025-01-07"])) == (True, "Updated to 2025-01-07")
+        assert updater.apply_daily_response("AAPL", _response(["2025-01-07"])) == (True, "Up to date (2025-01-07)")
+
+        df = read_staged_daily(tmp_path / "AAPL.parquet")
+        assert len(df) == 4
+        assert df["symbol"].tolist() == ["AAPL"] * 4
+        assert len(pd.read_parquet(tmp_path / "AAPL.parquet")) == 2
+
+
+class TestStagedDailyReaders:
+    """Downstream readers see appended bars."""
+
+    def test_discovery_scans_appended_bars(self, tmp_path, monkeypatch):
+        from signals.discovery import runner
+
+        staging = tmp_path / "data" / "staging" / "us" / "daily"
+        staging.mkdir(parents=True)
+        store = DailyBarStore(staging, compact_every=100)
+        _bars("AAPL", pd.bdate_range("2025-01-01", periods=25).strftime("%Y-%m-%d")).to_parquet(store.base_path("AAPL"))
+        store.append("AAPL", _bars("AAPL", ["2025-02-14"], close=2.0))
+
+        seen = {}
+
+        def detect(self, symbol, df, market):
+            seen[symbol] = df
+            return []
+
+        monkeypatch.setattr(runner.MomentumDetector, "detect", detect)
+        monkeypatch.setattr(runner, "ParquetSignalRepository", lambda path: None)
+        monkeypatch.chdir(tmp_path)
+        runner.run_discovery("US")
+
+        assert len(seen["AAPL"]) == 26
+        assert str(seen["AAPL"].index[-1].date()) == "2025-02-14"
@@ -0,0 +1,225 @@
+"""Unit tests for dashboard loader offload, request coalescing and background validation."""
+
+import asyncio
+import os
+import sys
+import threading
+import time
+from contextlib import asynccontextmanager
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+import httpx
+from fastapi import FastAPI
+
+from dashboard.backend.utils.concurrency import CoalescingExecutor, ValidationRefresher
+from dashboard.backend.utils.load_test import in_process_client, percentile, run_load_test
+
+
+class _SlowLoader:
+    def __init__(self, delay: float = 0.2):
+        self.delay = delay
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, market: str = "US"):
+        with self._lock:
+            self.calls += 1
+        time.sleep(self.delay)
+        return {"market": market}
+
+
+class _Runner:
+    def __init__(self, fail: bool = False):
+        self.calls = []
+        self.fail = fail
+
+    def run_pre_dashboard_refresh(self, metadata):
+        self.calls.append(metadata["market"])
+        if self.fail:
+            raise RuntimeError("validator crashed")
+        return {"phase": "dashboard", "has_failures": False}
+
+
+def _app(executor: CoalescingExecutor, loader: _SlowLoader) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/api/slow")
+    async def slow(market: str = "US"):
+        return await executor.run(loader, market)
+
+    @app.get("/api/ping")
+    async def ping():
+        return {"ok": True}
+
+    return app
+
+
+async def _client_gather(app: FastAPI, paths):
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://dashboard") as client:
+        return await asyncio.gather(*(client.get(p) for p in paths))
+
+
+class TestCoalescingExecutor:
+    """Test suite for CoalescingExecutor."""
+
+    def test_runs_again_after_shutdown(self):
+        executor = CoalescingExecutor(max_workers=2)
+        loader = _SlowLoader(delay=0.01)
+        assert asyncio.run(executor.run(loader, "US")) == {"market": "US"}
+        executor.shutdown()
+        assert asyncio.run(executor.run(loader, "IN")) == {"market": "IN"}
+        executor.shutdown()
+
+    def test_identical_requests_share_one_call(self):
+        executor = CoalescingExecutor(max_workers=4)
+        loader = _SlowLoader()
+        responses = asyncio.run(_client_gather(_app(executor, loader), ["/api/slow?market=US"] * 10 + ["/api/slow?market=INDIA"]))
+
+        assert [r.json()["market"] for r in responses] == ["US"] * 10 + ["INDIA"]
+        assert loader.calls == 2
+        assert executor.get_stats()["coalesced"] == 9
+        assert executor.get_stats()["in_flight"] == 0
+
+        # Once finished, the next request computes again
+        asyncio.run(_client_gather(_app(executor, loader), ["/api/slow?market=US"]))
+        assert loader.calls == 3
+
+    def test_slow_loader_does_not_block_event_loop(self):
+        executor = CoalescingExecutor(max_workers=2)
+        app = _app(executor, _SlowLoader(delay=0.5))
+
+        async def scenario():
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://dashboard") as client:
+                slow = asyncio.ensure_future(client.get("/api/slow"))
+                await asyncio.sleep(0.05)
+                start = time.perf_counter()
+                await client.get("/api/ping")
+                ping_elapsed = time.perf_counter() - start
+                await slow
+                return ping_elapsed
+
+        assert asyncio.run(scenario()) < 0.25
+
+    def test_uncoalesced_calls_run_separately(self):
+        executor = CoalescingExecutor(max_workers=4)
+        loader = _SlowLoader(delay=0.05)
+
+        async def scenario():
+            return await asyncio.gather(*(executor.run(loader, "US", coalesce=False) for _ in range(3)))
+
+        asyncio.run(scenario())
+        assert loader.calls == 3
+
+    def test_errors_reach_every_waiter(self):
+        executor = CoalescingExecutor(max_workers=2)
+
+        def broken(market):
+            time.sleep(0.05)
+            raise ValueError(market)
+
+        async def scenario():
+            return await asyncio.gather(*(executor.run(broken, "US") for _ in range(3)), return_exceptions=True)
+
+        results = asyncio.run(scenario())
+        assert all(isinstance(r, ValueError) for r in results)
+        assert executor.get_stats()["calls"] == 1
+
+
+class TestValidationRefresher:
+    """Test suite for ValidationRefresher."""
+
+    def test_validates_requested_markets_once_per_ttl(self):
+        runner = _Runner()
+        refresher = ValidationRefresher(runner, ttl_seconds=3600)
+        assert refresher.status("US") == {"market": "US", "status": "PENDING"}
+
+        refresher.note_request("US")
+        assert refresher.refresh_due() == ["US"]
+        refresher.note_request("US")
+        assert refresher.refresh_due() == []
+
+        status = refresher.status("US")
+        assert status["status"] == "OK"
+        assert status["summary"]["phase"] == "dashboard"
+        assert runner.calls == ["US"]
+
+    def test_idle_market_is_not_revalidated(self):
+        runner = _Runner()
+        refresher = ValidationRefresher(runner, ttl_seconds=0)
+        refresher.note_request("INDIA")
+        refresher.refresh_due()
+
+        assert refresher.refresh_due() == []
+        refresher.note_request("INDIA")
+        assert refresher.refresh_due() == ["INDIA"]
+
+    def test_failures_are_published(self):
+        refresher = ValidationRefresher(_Runner(fail=True))
+        refresher.note_request("US")
+        refresher.refresh_due()
+
+        status = refresher.status("US")
+        assert status["status"] == "ERROR"
+        assert "validator crashed" in status["error"]
+
+    def test_background_thread_picks_up_new_market(self):
+        runner = _Runner()
+        refresher = ValidationRefresher(runner, ttl_seconds=3600)
+        refresher.start()
+        try:
+            refresher.note_request("US")
+            deadline = time.monotonic() + 5
+            while refresher.status("US")["status"] == "PENDING" and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            refresher.stop()
+        assert refresher.status("US")["status"] == "OK"
+
+
+class TestLoadTest:
+    """Test suite for the load test harness."""
+
+    def test_percentile_nearest_rank(self):
+        values = list(range(1, 101))
+        assert percentile(values, 50) == 50
+        assert percentile(values, 99) == 99
+        assert percentile([], 99) == 0.0
+
+    def test_reports_p50_p99_per_path(self):
+        executor = CoalescingExecutor(max_workers=4)
+        app = _app(executor, _SlowLoader(delay=0.01))
+
+        async def scenario():
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://dashboard") as client:
+                return await run_load_test(client, ["/api/slow", "/api/ping", "/api/missing"], concurrency=8, total_requests=60)
+
+        report = asyncio.run(scenario())
+        assert report["overall"]["requests"] == 60
+        assert report["overall"]["errors"] == 0
+        assert report["paths"]["/api/slow"]["p99_ms"] >= report["paths"]["/api/slow"]["p50_ms"] > 0
+
+    def test_in_process_client_runs_app_lifespan(self):
+        events = []
+
+        @asynccontextmanager
+        async def lifespan(app):
+            events.append("startup")
+            yield
+            events.append("shutdown")
+
+        app = FastAPI(lifespan=lifespan)
+
+        @app.get("/api/ping")
+        async def ping():
+            return {"started": events == ["startup"]}
+
+        async def scenario():
+            async with in_process_client(app) as client:
+                return (await client.get("/api/ping")).json()
+
+        assert asyncio.run(scenario()) == {"started": True}
+        assert events == ["startup", "shutdown"]
@@ -0,0 +1,166 @@
+"""Unit tests for the dashboard tick index, JSON cache and state-run durations."""
+
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+import pytest
+
+from dashboard.backend.utils import filesystem
+from dashboard.backend.utils.filesystem import JsonFileCache, TickIndex
+from dashboard.backend.loaders import market_snapshot
+from dashboard.backend.loaders.market_snapshot import FactorRunIndex
+
+
+def _write_tick(root, epoch, momentum, regime="BULLISH", market="US"):
+    market_d = root / f"tick_{epoch}" / market
+    market_d.mkdir(parents=True)
+    payloads = {
+        "regime_context": {"regime": regime, "canonical_state": "CANONICAL_COMPLETE"},
+        "liquidity_compression": {"state": "NEUTRAL"},
+        "momentum_emergence": {"state": momentum},
+        "dispersion_breakout": {"state": "NONE"},
+        "expansion_transition": {"state": "NONE"},
+    }
+    for key, payload in payloads.items():
+        (market_d / f"{key}.json").write_text(json.dumps({key: payload}))
+
+
+def _reference_durations(root, current_states, market="US", lookback=50):
+    """The original scan: walk back from the newest tick until the state changes."""
+    history = sorted((d for d in root.iterdir() if d.is_dir()), key=lambda d: d.name, reverse=True)[:lookback]
+    out = {}
+    for factor, current in current_states.items():
+        count = 0
+        for d in history:
+            if market_snapshot._factor_state(d / market, factor) != current:
+                break
+            count += 1
+        out[factor] = count
+    return out
+
+
+@pytest.fixture
+def ticks_dir(tmp_path, monkeypatch):
+    root = tmp_path / "ticks"
+    root.mkdir()
+    monkeypatch.setattr(filesystem, "TICKS_DIR", root)
+    return root
+
+
+class TestTickIndex:
+    """Test suite for TickIndex."""
+
+    def test_incremental_updates(self, tmp_path):
+        root = tmp_path / "ticks"
+        index = TickIndex(root)
+        assert index.latest(5) == []
+
+        for epoch in (100, 300, 200):
+            (root / f"tick_{epoch}").mkdir(parents=True)
+        assert [p.name for p in index.latest(2)] == ["tick_300", "tick_200"]
+
+        generation = index.generation
+        index.refresh()
+        assert index.generation == generation
+
+        (root / "tick_400").mkdir()
+        (root / "notes.txt").write_text("not a tick")
+        (root / "tick_100").rmdir()
+        assert index.names() == ["tick_200", "tick_300", "tick_400"]
+        assert index.generation > generation
+
+    def test_module_helpers_follow_ticks_dir(self, ticks_dir):
+        assert filesystem.get_latest_tick_dir() is None
+        _write_tick(ticks_dir, 1000, "NONE")
+        _write_tick(ticks_dir, 2000, "NONE")
+
+        assert filesystem.get_latest_tick_dir() == ticks_dir / "tick_2000"
+        assert filesystem.get_ticks_history(10) == [ticks_dir / "tick_2000", ticks_dir / "tick_1000"]
+
+
+class TestJsonFileCache:
+    """Test suite for JsonFileCache."""
+
+    def test_hits_until_file_changes(self, tmp_path):
+        cache = JsonFileCache(max_entries=2)
+        path = tmp_path / "a.json"
+        path.write_text(json.dumps({"v": 1}))
+
+        assert cache.get(path) == {"v": 1}
+        assert cache.get(path) == {"v": 1}
+        assert (cache.hits, cache.misses) == (1, 1)
+
+        path.write_text(json.dumps({"v": 22}))
+        assert cache.get(path) == {"v": 22}
+        assert cache.get(tmp_path / "missing.json") is None
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        cache = JsonFileCache(max_entries=2)
+        paths = []
+        for i in range(3):
+            paths.append(tmp_path / f"{i}.json")
+            paths[-1].write_text(json.dumps({"i": i}))
+            cache.get(paths[-1])
+
+        assert len(cache._entries) == 2
+        assert os.fspath(paths[0]) not in cache._entries
+
+    def test_read_json_safe_returns_private_copies(self, tmp_path):
+        path = tmp_path / "payload.json"
+        path.write_text(json.dumps({"nested": {"a": 1}}))
+
+        first = filesystem.read_json_safe(path)
+        first["nested"]["a"] = 99
+        assert filesystem.read_json_safe(path) == {"nested": {"a": 1}}
+        assert filesystem.read_json_safe(tmp_path / "broken.json") == {}
+
+
+class TestStateDurations:
+    """Precomputed runs match the original history scan."""
+
+    def test_matches_reference_scan(self, ticks_dir):
+        states = ["NONE"] * 5 + ["EMERGING"] * 8 + ["NONE"] * 3 + ["EMERGING"] * 4
+        for i, state in enumerate(states):
+            _write_tick(ticks_dir, 1000 + i, state)
+
+        current = {"Momentum": "EMERGING", "Regime": "BULLISH", "Liquidity": "NEUTRAL", "Expansion": "SQUEEZE"}
+        latest_ts = market_snapshot._parse_timestamp("tick_1019")
+        durations = market_snapshot._calculate_state_durations(current, latest_ts, "US")
+        expected = _reference_durations(ticks_dir, current)
+
+        assert {f.capitalize(): d["ticks"] for f, d in durations.items()} == expected
+        assert durations["MOMENTUM"]["ticks"] == 4
+        assert durations["MOMENTUM"]["since"] == market_snapshot._parse_timestamp("tick_1016").isoformat()
+        assert durations["REGIME"]["ticks"] == 20
+        assert durations["EXPANSION"] == {"ticks": 0, "duration": "0 ticks", "since": latest_ts.isoformat()}
+
+    def test_incremental_and_capped_at_lookback(self, ticks_dir):
+        run_index = FactorRunIndex(filesystem.get_tick_index(), "US", lookback=10)
+        for i in range(25):
+            _write_tick(ticks_dir, 1000 + i, "NONE")
+        run_index.update()
+        assert run_index.duration("Momentum", "NONE") == (10, "tick_1015")
+
+        for i in range(25, 60):
+            _write_tick(ticks_dir, 1000 + i, "EMERGING" if i >= 57 else "NONE")
+            run_index.update()
+        assert run_index.duration("Momentum", "EMERGING") == (3, "tick_1057")
+        assert run_index.duration("Momentum", "NONE") == (0, None)
+        assert len(run_index.states["Momentum"]) <= 2 * run_index.lookback
+
+    def test_rereads_newest_tick_written_late(self, ticks_dir):
+        for i in range(3):
+            _write_tick(ticks_dir, 1000 + i, "NONE")
+        (ticks_dir / "tick_1003" / "US").mkdir(parents=True)
+
+        run_index = FactorRunIndex(filesystem.get_tick_index(), "US")
+        run_index.update()
+        assert run_index.duration("Momentum", "UNKNOWN") == (1, "tick_1003")
+
+        (ticks_dir / "tick_1003" / "US" / "momentum_emergence.json").write_text(
+            json.dumps({"momentum_emergence": {"state": "NONE"}}))
+        run_index.update()
+        assert run_index.duration("Momentum", "NONE") == (4, "tick_1000")
@@ -0,0 +1,115 @@
+"""Unit tests for the sort-merge LeadLagDetector."""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from alpha_discovery.patterns.lead_lag import LeadLagDetector
+from signals.core.enums import Market, SignalCategory, SignalDirection
+from signals.core.models import Signal
+
+START = datetime(2026, 1, 5)
+CATEGORIES = [SignalCategory.MOMENTUM, SignalCategory.TREND]
+DIRECTIONS = [SignalDirection.BULLISH, SignalDirection.BEARISH]
+
+
+def _signal(market: Market, asset: str, trigger: datetime,
+            category=SignalCategory.MOMENTUM, direction=SignalDirection.BULLISH) -> Signal:
+    return Signal.create(
+        name="test", market=market, asset=asset, category=category, direction=direction,
+        trigger_time=trigger, horizon="1D", expiry_time=trigger + timedelta(days=1),
+        strength=0.5, explanation={},
+    )
+
+
+def _random_signals(n: int, seed: int = 3):
+    rng = np.random.default_rng(seed)
+    signals = []
+    for _ in range(n):
+        market = Market.US if rng.random() < 0.5 else Market.INDIA
+        # Whole-hour offsets so some lags land exactly on the window edges
+        trigger = START + timedelta(hours=int(rng.integers(0, 24 * 10)), minutes=int(rng.choice([0, 0, 17])))
+        signals.append(_signal(
+            market, f"{market.value}{rng.integers(0, 4)}", trigger,
+            CATEGORIES[rng.integers(0, 2)], DIRECTIONS[rng.integers(0, 2)],
+        ))
+    return signals
+
+
+def _brute_force(signals):
+    """Reference all-pairs comparison."""
+    pairs = []
+    for i, us in enumerate(signals):
+        if us.market != Market.US:
+            continue
+        for j, ind in enumerate(signals):
+            if ind.market != Market.INDIA:
+                continue
+            delta = ind.trigger_timestamp - us.trigger_timestamp
+            if (timedelta(hours=4) <= delta <= timedelta(hours=24)
+                    and us.signal_category == ind.signal_category and us.direction == ind.direction):
+                pairs.append((i, j, delta.total_seconds() / 3600))
+    return pairs
+
+
+class TestLeadLagDetector:
+    """Sort-merge join matches the all-pairs reference."""
+
+    def test_matches_brute_force(self):
+        signals = _random_signals(400)
+        matches = LeadLagDetector().match(signals)
+
+        expected = _brute_force(signals)
+        assert len(expected) > 0
+        assert list(zip(matches.us_index.tolist(), matches.in_index.tolist(), matches.lag_hours.tolist())) == expected
+
+    def test_window_edges_are_inclusive(self):
+        signals = [
+            _signal(Market.US, "SPY", START),
+            _signal(Market.INDIA, "NIFTY", START + timedelta(hours=4)),
+            _signal(Market.INDIA, "NIFTY", START + timedelta(hours=24)),
+            _signal(Market.INDIA, "NIFTY", START + timedelta(hours=24, microseconds=1)),
+            _signal(Market.INDIA, "NIFTY", START + timedelta(hours=3, minutes=59)),
+            _signal(Market.INDIA, "NIFTY", START + timedelta(hours=6), direction=SignalDirection.BEARISH),
+        ]
+        matches = LeadLagDetector().match(signals)
+        assert matches.in_index.tolist() == [1, 2]
+        assert matches.lag_hours.tolist() == [4.0, 24.0]
+
+    def test_pair_hypotheses_match_reference(self):
+        signals = _random_signals(120, seed=11)
+        hypotheses = LeadLagDetector().detect(signals)
+
+        expected = _brute_force(signals)
+        assert len(hypotheses) == len(expected)
+        for hyp, (i, j, lag) in zip(hypotheses, expected):
+            assert hyp.related_assets == [signals[i].asset_id, signals[j].asset_id]
+            assert hyp.evidence_payload["time_lag_hours"] == lag
+            assert hyp.evidence_payload["trigger_in"] == signals[j].trigger_timestamp.isoformat()
+
+    def test_lag_statistics_histogram(self):
+        signals = [_signal(Market.US, "SPY", START + timedelta(days=d)) for d in range(3)]
+        signals += [_signal(Market.INDIA, "NIFTY", START + timedelta(days=d, hours=h)) for d, h in [(0, 6.5), (1, 6.2), (2, 20)]]
+
+        detector = LeadLagDetector()
+        stats = detector.lag_statistics(signals)
+        assert len(stats) == 1
+        row = stats.iloc[0]
+        assert row["evidence_count"] == 3
+        assert row["lag_hours_median"] == 6.5
+        counts = np.asarray(row["lag_histogram"])
+        assert counts.sum() == 3
+        assert counts[2] == 2 and counts[16] == 1  # bins [6, 7) and [20, 21)
+
+        hypotheses = LeadLagDetector(aggregate=True).detect(signals)
+        assert len(hypotheses) == 1
+        evidence = hypotheses[0].evidence_payload
+        assert evidence["evidence_count"] == 3
+        assert evidence["lag_histogram"]["counts"] == counts.tolist()
+        assert len(evidence["lag_histogram"]["bin_edges"]) == 21
+
+    def test_no_matches(self):
+        signals = [_signal(Market.US, "SPY", START)]
+        assert len(LeadLagDetector().match(signals)) == 0
+        assert LeadLagDetector(aggregate=True).detect(signals) == []
+        assert LeadLagDetector().match([]).us_index.size == 0
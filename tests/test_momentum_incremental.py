@@ -0,0 +1,111 @@
+"""Parity tests for MomentumEngine incremental mode vs the batch path."""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+from ingestion.india_ingestion.candle_store import CandleStore
+from src.core_modules.momentum_engine.indicator_state import SymbolIndicatorState
+from src.core_modules.momentum_engine.momentum_engine import MomentumEngine
+
+
+def _synthetic_candles(symbol: str = "TEST", days: int = 2, minutes: int = 90, seed: int = 7) -> pd.DataFrame:
+    """Random-walk candles with occasional volume bursts across several days."""
+    rng = np.random.default_rng(seed)
+    rows = []
+    price = 100.0
+    for day in range(days):
+        start = datetime(2026, 1, 5 + day, 9, 15)
+        for i in range(minutes):
+            price = max(1.0, price + rng.normal(0.05, 0.4))
+            high = price + abs(rng.normal(0, 0.2))
+            low = price - abs(rng.normal(0, 0.2))
+            volume = int(rng.integers(800, 1200))
+            if rng.random() < 0.15:
+                volume *= int(rng.integers(2, 5))
+            rows.append({
+                "symbol": symbol,
+                "exchange": "NSE",
+                "timestamp": start + timedelta(minutes=i),
+                "open": round(price, 2),
+                "high": round(high, 2),
+                "low": round(low, 2),
+                "close": round(price, 2),
+                "volume": volume,
+            })
+    df = pd.DataFrame(rows)
+    df["timestamp"] = pd.to_datetime(df["timestamp"])
+    return df
+
+
+def _as_dicts(signals):
+    return [s.to_dict() for s in signals]
+
+
+class TestIncrementalParity:
+    """Incremental evaluation must emit exactly the batch signals."""
+
+    def test_state_matches_batch_indicators(self):
+        engine = MomentumEngine(vol_ma_window=20)
+        df = _synthetic_candles()
+        batch = engine._compute_indicators(df)
+
+        state = SymbolIndicatorState(symbol="TEST", vol_ma_window=20)
+        for i, candle in enumerate(df.to_dict("records")):
+            state.update(candle)
+            row = batch.iloc[i]
+            assert state.vwap == row["vwap"]
+            assert state.hod == row["hod"]
+            if state.ready:
+                assert state.rel_vol == row["rel_vol"]
+
+    def test_signals_match_batch_at_every_candle(self):
+        df = _synthetic_candles()
+        batch_engine = MomentumEngine(hod_proximity_pct=0.5, vol_multiplier=2.0)
+        live_engine = MomentumEngine(hod_proximity_pct=0.5, vol_multiplier=2.0, incremental=True)
+        live_engine._states["TEST"] = SymbolIndicatorState(symbol="TEST", vol_ma_window=20)
+
+        total = 0
+        for i, candle in enumerate(df.to_dict("records")):
+            live_engine.update_candles([candle])
+            expected = batch_engine.generate_signals_from_df(df.iloc[: i + 1], "TEST")
+            actual = live_engine.generate_signals("TEST")
+            assert _as_dicts(actual) == _as_dicts(expected)
+            total += len(expected)
+
+        # Fixture must actually exercise the signal branch
+        assert total > 0
+
+    def test_warm_up_from_store_then_stream(self, tmp_path):
+        df = _synthetic_candles(days=2)
+        history, live = df.iloc[:120], df.iloc[120:]
+
+        store = CandleStore(str(tmp_path), compact_threshold=0)
+        store.append("TEST", history.to_dict("records"))
+
+        batch_engine = MomentumEngine(processed_data_path=str(tmp_path))
+        live_engine = MomentumEngine(processed_data_path=str(tmp_path), incremental=True)
+
+        for candle in live.to_dict("records"):
+            # Aggregator persists before invoking the callback
+            store.append("TEST", [candle])
+            live_engine.update_candles([candle])
+            assert _as_dicts(live_engine.generate_signals("TEST")) == _as_dicts(batch_engine.generate_signals("TEST"))
+
+    def test_stale_candles_are_ignored(self):
+        df = _synthetic_candles(days=1, minutes=5)
+        state = SymbolIndicatorState(symbol="TEST")
+        candles = df.to_dict("records")
+        for candle in candles:
+            assert state.update(candle)
+
+        assert not state.update(candles[-1])
+        assert state.candle_count == 5
+
+    def test_not_ready_before_window(self):
+        engine = MomentumEngine(vol_ma_window=20, incremental=True)
+        engine._states["TEST"] = SymbolIndicatorState(symbol="TEST", vol_ma_window=20)
+        engine.update_candles(_synthetic_candles(days=1, minutes=19).to_dict("records"))
+
+        assert engine.generate_signals("TEST") == []
@@ -0,0 +1,142 @@
+"""Tests for the batched forward-outcome labeller used by SignalValidator."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ingestion.india_ingestion.candle_store import CandleStore
+from observations.outcome_labeller import OutcomeLabeller, candle_arrays, lookup_forward
+from observations.signal_logger import ObservationLogger
+from observations.signal_validator import SignalValidator, parse_horizons
+from tests.test_momentum_incremental import _synthetic_candles
+
+NOW = pd.Timestamp("2026-01-07 00:00:00")
+
+
+def _scan(df, target):
+    """The per-row lookup the labeller replaces: first candle at or after target."""
+    matches = df[df["timestamp"] >= target]
+    return None if matches.empty else (float(matches.iloc[0]["close"]), float(matches.iloc[0]["volume"]))
+
+
+def _review_frame(candles, symbol, positions):
+    rows = []
+    for pos in positions:
+        c = candles.iloc[pos]
+        rows.append({
+            "timestamp": c["timestamp"].isoformat(), "symbol": symbol, "price_t0": c["close"],
+            "price_t5": "", "price_t15": "", "volume_t0": c["volume"],
+            "volume_t5_change": "", "volume_continuation": "", "outcome": "", "classification": "",
+        })
+    return pd.DataFrame(rows)
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = CandleStore(str(tmp_path / "candles"), compact_threshold=0)
+    for i, symbol in enumerate(("RELIANCE", "TCS")):
+        store.append(symbol, _synthetic_candles(symbol, days=2, seed=i).to_dict("records"))
+    return store
+
+
+class TestLookupForward:
+    """Test suite for lookup_forward."""
+
+    def test_matches_scan_for_every_horizon(self):
+        df = _synthetic_candles(days=2)
+        # Gaps so that "at or after" differs from "exactly at"
+        df = df.drop(index=df.index[10::7]).reset_index(drop=True)
+        candle_ts, close, volume, _ = candle_arrays(df)
+        bases = df["timestamp"].iloc[::5]
+        horizons = list(range(1, 61))
+
+        pos = lookup_forward(candle_ts, bases.to_numpy().view(np.int64), horizons)
+
+        for i, base in enumerate(bases):
+            for j, h in enumerate(horizons):
+                expected = _scan(df, base + pd.Timedelta(minutes=h))
+                actual = None if pos[i, j] == len(candle_ts) else (close[pos[i, j]], volume[pos[i, j]])
+                assert actual == expected
+
+
+class TestSignalValidator:
+    """Test suite for batched SignalValidator labelling."""
+
+    def test_labels_default_horizons_like_per_row_lookup(self, tmp_path, store):
+        review = _review_frame(store.read("RELIANCE"), "RELIANCE", [5, 30, 100, 172])
+        review = pd.concat([review, _review_frame(store.read("TCS"), "TCS", [40])], ignore_index=True)
+        validator = SignalValidator(review_dir=str(tmp_path))
+        validator.candle_store = store
+
+        loads = []
+        load = validator._load_candles
+        validator.labeller.load_candles = lambda *a: loads.append(a[0]) or load(*a)
+        filled = validator.labeller.label(review, now=NOW)
+
+        assert sorted(loads) == ["RELIANCE", "TCS"]
+        # Last RELIANCE signal has no T+15 candle yet (end of data)
+        assert filled == 9
+        for _, row in review.iterrows():
+            for h in (5, 15):
+                expected = validator._get_price_at_timestamp(row["symbol"], row["timestamp"], h)
+                if expected is None:
+                    assert row[f"price_t{h}"] == ""
+                else:
+                    assert row[f"price_t{h}"] == expected[0]
+
+        first = review.iloc[0]
+        v5 = validator._get_price_at_timestamp("RELIANCE", first["timestamp"], 5)[1]
+        assert first["volume_t5_change"] == round((v5 - first["volume_t0"]) / first["volume_t0"] * 100, 2)
+        change = (first["price_t15"] - first["price_t0"]) / first["price_t0"] * 100
+        assert first["outcome"] == ("Clean" if change > 0.3 else "False" if change < -0.1 else "Choppy")
+        assert first["volume_continuation"] == ("Surge" if first["volume_t5_change"] > 50 else "Steady")
+
+    def test_only_due_horizons_are_filled(self, tmp_path, store):
+        candles = store.read("RELIANCE")
+        review = _review_frame(candles, "RELIANCE", [10])
+        validator = SignalValidator(review_dir=str(tmp_path))
+        validator.candle_store = store
+
+        now = candles["timestamp"].iloc[10] + pd.Timedelta(minutes=7)
+        assert validator.labeller.label(review, now=now) == 1
+        assert pd.notna(review.loc[0, "price_t5"]) and review.loc[0, "price_t15"] == ""
+        assert review.loc[0, "outcome"] == ""
+
+        assert validator.labeller.label(review, now=NOW) == 1
+        assert review.loc[0, "outcome"] in {"Clean", "False", "Choppy"}
+
+    def test_validate_signals_writes_arbitrary_horizons_once(self, tmp_path, store):
+        obs = ObservationLogger(base_dir=str(tmp_path))
+        candles = store.read("TCS")
+        for pos in (3, 60, 110):
+            c = candles.iloc[pos]
+            obs.log_signal({"timestamp": c["timestamp"].isoformat(), "symbol": "TCS",
+                            "price_t0": c["close"], "volume_t0": c["volume"]})
+        path = obs._get_review_file()
+        date_str = path.stem.rsplit("_", 1)[-1]
+
+        validator = SignalValidator(review_dir=str(obs.review_dir), horizons=parse_horizons("1-60"))
+        validator.candle_store = store
+        validator.validate_signals(date_str=date_str, now=NOW)
+
+        labelled = pd.read_csv(path)
+        assert {f"price_t{h}" for h in range(1, 61)} <= set(labelled.columns)
+        assert labelled[[f"price_t{h}" for h in range(1, 61)]].notna().all().all()
+        assert labelled["outcome"].notna().all()
+
+    def test_parse_horizons(self):
+        assert parse_horizons("5,15") == [5, 15]
+        assert parse_horizons("1-3,10") == [1, 2, 3, 10]
+
+
+class TestOutcomeLabeller:
+    """Test suite for OutcomeLabeller at end-of-day scale."""
+
+    def test_labels_thousands_of_signals(self):
+        df = _synthetic_candles(days=5, minutes=375)
+        arrays = candle_arrays(df)
+        labeller = OutcomeLabeller(lambda symbol, first: arrays, horizons=range(1, 61))
+        review = _review_frame(df, "TEST", np.arange(0, len(df) - 61).repeat(2))
+
+        assert len(review) > 3000
+        assert labeller.label(review, now=pd.Timestamp("2027-01-01")) == len(review) * 60
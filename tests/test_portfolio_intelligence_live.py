@@ -1,7 +1,18 @@
+import json
+import os
+import threading
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.portfolio_intelligence import enrichment
 from src.portfolio_intelligence.analytics import analyze_portfolio
 from src.portfolio_intelligence.config import PortfolioIntelligenceConfig
 from src.portfolio_intelligence.connectors.base import BrokerConnector
 from src.portfolio_intelligence.enrichment import enrich_portfolio
+from src.portfolio_intelligence.history_store import PortfolioHistoryStore
 from src.portfolio_intelligence.models import (
     BrokerAuthResult,
     InstrumentRecord,
@@ -11,6 +22,7 @@ from src.portfolio_intelligence.models import (
 )
 from src.portfolio_intelligence.normalization import normalize_portfolio
 from src.portfolio_intelligence.service import PortfolioIntelligenceService, PortfolioRefreshService
+from src.portfolio_intelligence.storage import PortfolioArtifactStore
 from src.portfolio_intelligence.validation import PortfolioSystemValidator
 
 
@@ -291,3 +303,225 @@ def test_portfolio_pipeline_computes_india_holding_analytics():
     assert analytics["holdings"][0]["sector"] == "Energy"
     assert analytics["holdings"][0]["conviction_score"] >= 0.0
     assert analytics["diversification"]["sector_allocation"]["Energy"] == 100.0
+
+
+def _write_angel_history(root, symbol, closes):
+    path = root / "data" / "raw" / "api_based" / "angel" / "historical" / f"NSE_{symbol}_1d.jsonl"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as handle:
+        for i, close in enumerate(closes):
+            value = None if close is None else round(float(close), 2)
+            handle.write(json.dumps({"symbol": symbol, "date": f"2025-01-{i % 28 + 1:02d}", "close": value}) + "\n")
+    return path
+
+
+def _reference_technicals(frame):
+    """Per-series pandas computation that _compute_technicals_batch must reproduce."""
+    if frame.empty or "close" not in frame:
+        return dict(enrichment._UNAVAILABLE_TECHNICALS)
+
+    closes = frame["close"].astype(float)
+    latest = float(closes.iloc[-1])
+    sma20 = float(closes.tail(20).mean()) if len(closes) >= 20 else float(closes.mean())
+    sma50 = float(closes.tail(50).mean()) if len(closes) >= 50 else float(closes.mean())
+    returns = closes.pct_change().dropna()
+    momentum_20d = float(closes.iloc[-1] / closes.iloc[-21] - 1.0) if len(closes) > 21 else float(returns.tail(5).mean()) if not returns.empty else 0.0
+    volatility = float(returns.tail(20).std() * (252 ** 0.5)) if len(returns) >= 5 else 0.0
+    trend = "BULLISH" if latest >= sma20 >= sma50 else "BEARISH" if latest <= sma20 <= sma50 else "TRANSITION"
+    vol_regime = "HIGH" if volatility >= 0.35 else "MEDIUM" if volatility >= 0.2 else "LOW"
+    return {
+        "trend_regime": trend,
+        "momentum_score": round(max(min(momentum_20d * 5 + 0.5, 1.0), 0.0), 4),
+        "volatility_regime": vol_regime,
+        "support": round(float(closes.tail(20).min()), 4),
+        "resistance": round(float(closes.tail(20).max()), 4),
+        "return_20d": round(momentum_20d, 4),
+        "annualized_volatility": round(volatility, 4),
+    }
+
+
+def test_batch_technicals_match_per_holding_computation(tmp_path, monkeypatch):
+    monkeypatch.setattr(enrichment, "PROJECT_ROOT", tmp_path)
+    rng = np.random.default_rng(3)
+    symbols = []
+    for i, length in enumerate([0, 1, 2, 6, 20, 21, 22, 49, 50, 51, 260]):
+        symbol = f"SYM{i}"
+        symbols.append(symbol)
+        _write_angel_history(tmp_path, symbol, 100 * np.exp(np.cumsum(rng.normal(0, 0.02, length))))
+    symbols.append("MISSING")
+
+    panel = enrichment._load_close_panel([(symbol, "INDIA") for symbol in symbols])
+    batch = enrichment._compute_technicals_batch(panel)
+
+    for symbol, technicals, points in zip(symbols, batch, panel.points):
+        path = tmp_path / "data" / "raw" / "api_based" / "angel" / "historical" / f"NSE_{symbol}_1d.jsonl"
+        frame = pd.read_json(path, lines=True) if path.exists() else pd.DataFrame()
+        assert technicals == _reference_technicals(frame)
+        assert points == len(frame)
+    assert panel.provenance[-1] == {"source": "UNAVAILABLE", "stale": True}
+
+
+def test_batch_technicals_skip_missing_closes(tmp_path, monkeypatch):
+    monkeypatch.setattr(enrichment, "PROJECT_ROOT", tmp_path)
+    rng = np.random.default_rng(5)
+    gaps = {"ONE": [45], "LEADING": [0, 1], "LATEST": [59], "RUN": [40, 41, 42, 50], "SHORT": [2]}
+    for symbol, positions in gaps.items():
+        length = 8 if symbol == "SHORT" else 60
+        closes = list(100 * np.exp(np.cumsum(rng.normal(0, 0.02, length))))
+        for position in positions:
+            closes[position] = None
+        _write_angel_history(tmp_path, symbol, closes)
+
+    panel = enrichment._load_close_panel([(symbol, "INDIA") for symbol in gaps])
+    batch = enrichment._compute_technicals_batch(panel)
+
+    for symbol, technicals in zip(gaps, batch):
+        path = tmp_path / "data" / "raw" / "api_based" / "angel" / "historical" / f"NSE_{symbol}_1d.jsonl"
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", FutureWarning)  # pct_change fill_method
+            expected = _reference_technicals(pd.read_json(path, lines=True))
+        # json.dumps renders NaN, so a missing latest close compares equal too
+        assert json.dumps(technicals) == json.dumps(expected), symbol
+    assert not np.isnan(batch[0]["support"])
+    assert not np.isnan(batch[0]["annualized_volatility"])
+
+
+def test_price_and_pe_tables_are_cached_by_mtime(tmp_path, monkeypatch):
+    monkeypatch.setattr(enrichment, "PROJECT_ROOT", tmp_path)
+    path = _write_angel_history(tmp_path, "RELIANCE", [100.0, 101.0])
+    pe_path = tmp_path / "data" / "input" / "daily" / "Equities" / "PE_260625.csv"
+    pe_path.parent.mkdir(parents=True)
+    pe_path.write_text("SYMBOL,SYMBOL P/E,ADJUSTED P/E\nreliance,25.0,24.5\nRELIANCE,1.0,1.0\nTCS,30,-\n", encoding="utf-8")
+
+    assert enrichment._load_close_panel([("RELIANCE", "INDIA")]).points == [2]
+    pe_table = enrichment._load_india_pe_table()
+    assert pe_table.get("RELIANCE") == 24.5
+    assert pe_table.get("TCS") is None
+    assert pe_table.get("INFY") is None
+
+    reads = []
+    monkeypatch.setattr(pd, "read_csv", lambda *a, **k: reads.append(a) or pytest.fail("PE table re-read"))
+    read_close_series = enrichment._read_close_series
+    monkeypatch.setattr(enrichment, "_read_close_series", lambda p: reads.append(p) or read_close_series(p))
+    enrichment._load_close_panel([("RELIANCE", "INDIA")] * 3)
+    assert enrichment._load_india_pe_table() is pe_table
+    assert reads == []
+
+    _write_angel_history(tmp_path, "RELIANCE", [100.0, 101.0, 102.0])
+    assert enrichment._load_close_panel([("RELIANCE", "INDIA")]).points == [3]
+    assert reads == [path]
+
+
+def _analytics_snapshot(i):
+    return {
+        "portfolio_id": "zerodha_primary",
+        "market": "INDIA",
+        "data_as_of": f"2026-03-13T{10 + i:02d}:00:00+00:00",
+        "portfolio_refresh_timestamp": f"2026-03-13T{10 + i:02d}:00:00+00:00",
+        "overview": {"total_value": 100.0 + 25 * i},
+        "mutual_fund_summary": {"allocation_pct": 40.0 + i} if i % 3 else {},
+        "resilience": {
+            "overall_score": 0.4 + 0.05 * i,
+            "classification": "ADEQUATE",
+            "components": {"mutual_fund_support": 0.2, "equity_sleeve_resilience": 0.5 + i / 100} if i % 2 else {},
+        },
+        "holdings": [{"symbol": f"SYM{j}", "market_value": float(j)} for j in range(50)],
+    }
+
+
+def test_trend_reads_columnar_history_and_keeps_full_payloads(tmp_path):
+    config = PortfolioIntelligenceConfig(base_dir=tmp_path / "portfolio_intel")
+    service = PortfolioIntelligenceService(config=config)
+    store = service.store
+    history_dir = config.history_dir / "INDIA" / "zerodha_primary"
+    history_dir.mkdir(parents=True)
+    # Legacy per-snapshot JSON is folded into the table on first read
+    snapshots = [_analytics_snapshot(i) for i in range(6)]
+    for i, payload in enumerate(snapshots[:4]):
+        (history_dir / f"20260313T{10 + i:02d}0000Z.json").write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    assert len(store.list_portfolio_trend("INDIA", "zerodha_primary", limit=100)) == 4
+
+    for i, payload in enumerate(snapshots[4:], start=4):
+        store.history.append("INDIA", "zerodha_primary", f"20260313T{10 + i:02d}0000Z", payload)
+    # Same content, new stamp: one more row, no new blob
+    store.history.append("INDIA", "zerodha_primary", "20260313T160000Z", snapshots[-1])
+    snapshots.append(snapshots[-1])
+    assert len(list(config.history_blob_dir.rglob("*.json.gz"))) == 6
+
+    assert store.list_portfolio_history("INDIA", "zerodha_primary", limit=3) == snapshots[-3:]
+    trend = service.load_portfolio_trend("INDIA", "zerodha_primary", limit=5)
+    expected = []
+    for payload in snapshots[-5:]:
+        resilience = payload["resilience"]
+        expected.append({
+            "total_value": payload["overview"]["total_value"],
+            "resilience_score": resilience["overall_score"],
+            "mutual_fund_allocation_pct": payload["mutual_fund_summary"].get("allocation_pct", 0.0),
+            "mutual_fund_support": resilience["components"].get("mutual_fund_support"),
+            "equity_sleeve_resilience": resilience["components"].get("equity_sleeve_resilience"),
+            "mutual_fund_sleeve_resilience": None,
+            "data_as_of": payload["data_as_of"],
+        })
+    assert [{key: point[key] for key in expected[0]} for point in trend["history"]] == expected
+    assert trend["drift"] == {"resilience_change": 0.0, "value_change": 0.0, "observation_count": 5}
+    assert trend["history"][1]["value_delta"] == 25.0
+
+    trend_bytes = (history_dir / "trend.parquet").stat().st_size
+    legacy_bytes = sum(path.stat().st_size for path in history_dir.glob("*.json"))
+    assert trend_bytes < legacy_bytes
+
+
+def test_write_analytics_appends_to_history_table(tmp_path):
+    store = PortfolioArtifactStore(PortfolioIntelligenceConfig(base_dir=tmp_path / "portfolio_intel"))
+    payload = _analytics_snapshot(1)
+    store.write_analytics("INDIA", "zerodha_primary", payload)
+
+    assert store.load_latest_analytics("INDIA", "zerodha_primary") == payload
+    assert store.list_portfolio_history("INDIA", "zerodha_primary") == [payload]
+    assert not list((store.config.history_dir / "INDIA" / "zerodha_primary").glob("*.json"))
+    [row] = store.list_portfolio_trend("INDIA", "zerodha_primary")
+    assert row["total_value"] == 125.0 and row["mutual_fund_allocation_pct"] == 41.0
+
+
+def test_history_appends_from_separate_stores_are_not_lost(tmp_path):
+    config = PortfolioIntelligenceConfig(base_dir=tmp_path / "portfolio_intel")
+    # Separate instances share no in-process lock, like the dashboard and the refresh script
+    stores = [PortfolioHistoryStore(config.history_dir, config.history_blob_dir) for _ in range(4)]
+
+    def writer(w, store):
+        for i in range(10):
+            store.append("INDIA", "zerodha_primary", f"20260313T{w:02d}{i:02d}00Z", _analytics_snapshot(i))
+
+    threads = [threading.Thread(target=writer, args=(w, store)) for w, store in enumerate(stores)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(stores[0].read_trend("INDIA", "zerodha_primary", limit=100)) == 40
+    history_dir = config.history_dir / "INDIA" / "zerodha_primary"
+    assert not list(history_dir.glob("*.tmp"))
+
+
+def test_unusable_legacy_history_is_skipped_once(tmp_path, monkeypatch):
+    config = PortfolioIntelligenceConfig(base_dir=tmp_path / "portfolio_intel")
+    store = PortfolioHistoryStore(config.history_dir, config.history_blob_dir)
+    history_dir = config.history_dir / "INDIA" / "zerodha_primary"
+    history_dir.mkdir(parents=True)
+    (history_dir / "20260313T100000Z.json").write_text(json.dumps(_analytics_snapshot(0)), encoding="utf-8")
+    (history_dir / "20260313T110000Z.json").write_text("{}", encoding="utf-8")
+    corrupt = history_dir / "20260313T120000Z.json"
+    corrupt.write_text('{"overview": {"total_va', encoding="utf-8")
+
+    assert [row["stamp"] for row in store.read_trend("INDIA", "zerodha_primary")] == ["20260313T100000Z"]
+
+    import_legacy = store._import_legacy
+    monkeypatch.setattr(store, "_import_legacy", lambda *a: pytest.fail("legacy files re-parsed"))
+    assert len(store.read_trend("INDIA", "zerodha_primary")) == 1
+
+    # A repaired file is picked up on the next read
+    monkeypatch.setattr(store, "_import_legacy", import_legacy)
+    corrupt.write_text(json.dumps(_analytics_snapshot(2)), encoding="utf-8")
+    os.utime(corrupt, ns=(corrupt.stat().st_mtime_ns + 10**9,) * 2)
+    assert [row["stamp"] for row in store.read_trend("INDIA", "zerodha_primary")] == [
+        "20260313T100000Z", "20260313T120000Z"]
@@ -0,0 +1,173 @@
+"""Unit tests for the dashboard portfolio analytics SnapshotCache."""
+
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+from dashboard.backend.utils.snapshot_cache import SnapshotCache
+
+
+class _Builder:
+    def __init__(self, delay: float = 0.0, fail: bool = False):
+        self.delay = delay
+        self.fail = fail
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, payload, view):
+        with self._lock:
+            self.calls += 1
+        time.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("news feed down")
+        return {"holdings": len(payload["holdings"]), "truth_epoch": payload["truth_epoch"]}
+
+
+def _payload(holdings=("INFY", "TCS"), truth_epoch="TE-1"):
+    return {"portfolio_id": "p1", "market": "INDIA", "truth_epoch": truth_epoch, "holdings": list(holdings)}
+
+
+def _cache(**kwargs):
+    builder = _Builder()
+    return builder, SnapshotCache({"exposure": builder}, **kwargs)
+
+
+class TestSnapshotCache:
+    """Test suite for SnapshotCache."""
+
+    def test_one_load_and_build_serves_every_endpoint(self):
+        builder, cache = _cache()
+        loads = []
+
+        def load():
+            loads.append(1)
+            return _payload()
+
+        snapshots = [cache.get(("INDIA", "p1"), (1, 100), load) for _ in range(12)]
+        assert len(loads) == 1
+        assert all(s is snapshots[0] for s in snapshots)
+        assert cache.get_stats()["hits"] == 11
+        # Payload-only endpoints never build a view
+        assert builder.calls == 0
+
+        views = [cache.view(s, "exposure") for s in snapshots]
+        assert builder.calls == 1
+        assert views[0] == {"holdings": 2, "truth_epoch": "TE-1"}
+        assert cache.get_stats()["view_hits"] == 11
+
+    def test_views_are_built_lazily_and_independently(self):
+        calls = []
+
+        def exposure(payload, view):
+            calls.append("exposure")
+            return len(payload["holdings"])
+
+        def intelligence(payload, view):
+            calls.append("intelligence")
+            return {"exposure": view("exposure")}
+
+        failing = _Builder(fail=True)
+        cache = SnapshotCache({"exposure": exposure, "intelligence": intelligence, "events": failing})
+        snapshot = cache.get(("INDIA", "p1"), (1, 100), _payload)
+
+        assert cache.view(snapshot, "intelligence") == {"exposure": 2}
+        assert cache.view(snapshot, "exposure") == 2
+        assert calls == ["intelligence", "exposure"]
+
+        # A failing view fails only its own endpoints and is retried next time
+        for _ in range(2):
+            with pytest.raises(RuntimeError):
+                cache.view(snapshot, "events")
+        assert failing.calls == 2
+        assert cache.view(snapshot, "exposure") == 2
+
+    def test_rebuilds_only_when_content_changes(self):
+        builder, cache = _cache()
+        key = ("INDIA", "p1")
+
+        first = cache.get(key, (1, 100), _payload)
+        cache.view(first, "exposure")
+        # File rewritten with identical content: re-hash, views kept
+        touched = cache.get(key, (2, 100), _payload)
+        assert cache.view(touched, "exposure") == {"holdings": 2, "truth_epoch": "TE-1"}
+        assert builder.calls == 1
+        assert touched.content_hash == first.content_hash
+        assert touched.stamp == (2, 100)
+
+        changed = cache.get(key, (3, 120), lambda: _payload(holdings=("INFY", "TCS", "HDFC")))
+        assert cache.view(changed, "exposure")["holdings"] == 3
+        assert builder.calls == 2
+
+        epoch = cache.get(key, (4, 120), lambda: _payload(holdings=("INFY", "TCS", "HDFC"), truth_epoch="TE-2"))
+        assert epoch.content_hash != changed.content_hash
+        assert cache.view(epoch, "exposure")["truth_epoch"] == "TE-2"
+
+    def test_version_and_key_are_part_of_the_hash(self):
+        v1, v2 = SnapshotCache({}, version=1), SnapshotCache({}, version=2)
+        payload = _payload()
+
+        assert v1.content_hash(("INDIA", "p1"), payload) != v2.content_hash(("INDIA", "p1"), payload)
+        assert v1.content_hash(("INDIA", "p1"), payload) != v1.content_hash(("US", "p1"), payload)
+
+    def test_concurrent_requests_share_one_build(self):
+        builder = _Builder(delay=0.1)
+        cache = SnapshotCache({"exposure": builder})
+        results = []
+
+        def worker():
+            snapshot = cache.get(("INDIA", "p1"), (1, 100), _payload)
+            results.append((snapshot, cache.view(snapshot, "exposure")))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert builder.calls == 1
+        assert len({id(s) for s, _ in results}) == 1
+        assert len({id(v) for _, v in results}) == 1
+
+    def test_invalidate_and_missing_source(self):
+        builder, cache = _cache()
+        for key in (("INDIA", "p1"), ("INDIA", "p2"), ("US", "p1")):
+            cache.get(key, (1, 100), _payload)
+
+        assert cache.invalidate("INDIA", "p1") == 1
+        cache.get(("INDIA", "p1"), (1, 100), _payload)
+        assert cache.get_stats()["loads"] == 4
+        assert cache.invalidate("INDIA") == 2
+
+        # No stamp (no stored file): payload re-read each time, views reused while unchanged
+        loads = []
+        for _ in range(3):
+            snapshot = cache.get(("US", "p9"), None, lambda: loads.append(1) or _payload())
+            cache.view(snapshot, "exposure")
+        assert len(loads) == 3
+        assert builder.calls == 1
+
+    def test_view_max_age_forces_rebuild_of_that_view_only(self):
+        events, exposure = _Builder(), _Builder()
+        cache = SnapshotCache({"events": events, "exposure": exposure}, view_max_age={"events": 0.05})
+        snapshot = cache.get(("INDIA", "p1"), (1, 100), _payload)
+        for _ in range(2):
+            cache.view(snapshot, "events")
+            cache.view(snapshot, "exposure")
+        time.sleep(0.06)
+        cache.view(snapshot, "events")
+        cache.view(snapshot, "exposure")
+
+        assert (events.calls, exposure.calls) == (2, 1)
+
+    def test_evicts_least_recently_used(self):
+        _, cache = _cache(max_entries=2)
+        for pid in ("p1", "p2", "p3"):
+            cache.get(("INDIA", pid), (1, 1), _payload)
+
+        assert cache.get_stats()["entries"] == 2
+        assert ("INDIA", "p1") not in cache._entries
@@ -0,0 +1,113 @@
+"""Tests for the parallel multi-symbol, multi-day replay executor."""
+
+import argparse
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from historical_replay.momentum_intraday.batch_executor import run_parallel_batch_replay
+from historical_replay.momentum_intraday.cli import worker_count
+from historical_replay.momentum_intraday.replay_controller import ReplayController
+from ingestion.india_ingestion.candle_store import CandleStore
+
+SYMBOLS = ["AAA", "BBB", "CCC"]
+DATES = ["2026-01-05", "2026-01-06"]
+
+
+def _write_history(data_dir, seed: int = 3) -> None:
+    rng = np.random.default_rng(seed)
+    store = CandleStore(str(data_dir), compact_threshold=0)
+    for symbol in SYMBOLS:
+        rows = []
+        price = float(rng.integers(100, 500))
+        for day in DATES:
+            start = datetime.fromisoformat(day).replace(hour=9, minute=15)
+            for i in range(120):
+                price = max(1.0, price + rng.normal(0.1, 0.5))
+                volume = int(rng.integers(900, 1100)) * (int(rng.integers(2, 5)) if rng.random() < 0.2 else 1)
+                rows.append({
+                    "symbol": symbol,
+                    "exchange": "NSE",
+                    "timestamp": start + timedelta(minutes=i),
+                    "open": round(price, 2),
+                    "high": round(price + abs(rng.normal(0, 0.3)), 2),
+                    "low": round(price - abs(rng.normal(0, 0.3)), 2),
+                    "close": round(price, 2),
+                    "volume": volume,
+                })
+        store.append(symbol, rows)
+    store.compact_all()
+
+
+class TestParallelBatchReplay:
+    """Parallel batch replay matches a sequential replay and is deterministic."""
+
+    def test_matches_sequential_and_is_deterministic(self, tmp_path):
+        data_dir = tmp_path / "data"
+        _write_history(data_dir)
+
+        seq_dir = tmp_path / "sequential"
+        for day in DATES:
+            for symbol in SYMBOLS:
+                ReplayController(
+                    symbol, day, processed_data_path=str(data_dir), output_base_dir=str(seq_dir)
+                ).run()
+
+        outputs = []
+        for run in ("parallel_a", "parallel_b"):
+            summary = run_parallel_batch_replay(
+                SYMBOLS,
+                DATES,
+                max_workers=2,
+                vectorized=True,
+                processed_data_path=str(data_dir),
+                base_dir=str(tmp_path / run)
+            )
+            assert summary["dates_processed"] == 2
+            assert [(r["date"], r["symbol"]) for r in summary["results"]] == [
+                (d, s) for d in DATES for s in SYMBOLS
+            ]
+            assert all("error" not in r for r in summary["results"])
+            assert not list((tmp_path / run).glob(".batch_staging_*"))
+            outputs.append(summary)
+
+        assert outputs[0]["total_signals"] > 0
+        for day in DATES:
+            name = f"{day}/signals_for_review_{day}.csv"
+            parallel_a = (tmp_path / "parallel_a" / name).read_bytes()
+            parallel_b = (tmp_path / "parallel_b" / name).read_bytes()
+            assert parallel_a == parallel_b
+
+            expected = pd.read_csv(seq_dir / name)
+            actual = pd.read_csv(tmp_path / "parallel_a" / name)
+            pd.testing.assert_frame_equal(actual, expected, check_dtype=False)
+            assert (tmp_path / "parallel_a" / day / f"eod_report_{day}.md").exists()
+
+    def test_missing_symbol_reports_error(self, tmp_path):
+        data_dir = tmp_path / "data"
+        _write_history(data_dir)
+
+        summary = run_parallel_batch_replay(
+            ["AAA", "MISSING"],
+            DATES[:1],
+            max_workers=2,
+            run_sanity_checks=False,
+            processed_data_path=str(data_dir),
+            base_dir=str(tmp_path / "out")
+        )
+
+        errors = [r for r in summary["results"] if "error" in r]
+        assert [r["symbol"] for r in errors] == ["MISSING"]
+
+
+class TestWorkerCount:
+    """Test suite for the replay CLI's --workers argument type."""
+
+    def test_rejects_non_positive_values(self):
+        assert worker_count("4") == 4
+        assert worker_count("all") is None
+        for value in ("0", "-2", "many"):
+            with pytest.raises(argparse.ArgumentTypeError):
+                worker_count(value)
@@ -0,0 +1,111 @@
+"""Tests for the single-pass vectorized historical replay mode."""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from historical_replay.momentum_intraday.candle_cursor import CandleCursor
+from historical_replay.momentum_intraday.replay_controller import ReplayController
+from ingestion.india_ingestion.candle_store import CandleStore
+from src.core_modules.momentum_engine.momentum_engine import MomentumEngine
+
+REPLAY_DATE = "2026-01-06"
+
+
+def _day_candles(seed: int = 11, minutes: int = 180) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    start = datetime(2026, 1, 6, 9, 15)
+    price = 250.0
+    rows = []
+    for i in range(minutes):
+        price = max(1.0, price + rng.normal(0.08, 0.5))
+        volume = int(rng.integers(900, 1100)) * (int(rng.integers(2, 5)) if rng.random() < 0.2 else 1)
+        rows.append({
+            "symbol": "TEST",
+            "exchange": "NSE",
+            "timestamp": start + timedelta(minutes=i),
+            "open": round(price, 2),
+            "high": round(price + abs(rng.normal(0, 0.3)), 2),
+            "low": round(price - abs(rng.normal(0, 0.3)), 2),
+            "close": round(price, 2),
+            "volume": volume,
+        })
+    return pd.DataFrame(rows)
+
+
+def _replay(tmp_path, monkeypatch, run_dir: str, **kwargs) -> bytes:
+    data_dir = tmp_path / "data"
+    if not data_dir.exists():
+        CandleStore(str(data_dir), compact_threshold=0).append("TEST", _day_candles().to_dict("records"))
+
+    work_dir = tmp_path / run_dir
+    work_dir.mkdir()
+    monkeypatch.chdir(work_dir)
+    controller = ReplayController("TEST", REPLAY_DATE, processed_data_path=str(data_dir), **kwargs)
+    results = controller.run()
+    return (work_dir / results["output_file"]).read_bytes()
+
+
+class TestVectorizedReplay:
+    """Vectorized mode must reproduce the stepwise signal log byte for byte."""
+
+    @pytest.mark.parametrize("interval", [1, 5])
+    def test_signal_log_is_byte_identical(self, tmp_path, monkeypatch, interval):
+        stepwise = _replay(tmp_path, monkeypatch, "stepwise", interval_minutes=interval)
+        vectorized = _replay(tmp_path, monkeypatch, "vectorized", interval_minutes=interval, vectorized=True)
+
+        assert stepwise.count(b"\n") > 1
+        assert vectorized == stepwise
+
+    def test_series_matches_prefix_evaluation(self):
+        df = _day_candles()
+        df["timestamp"] = pd.to_datetime(df["timestamp"])
+        engine = MomentumEngine()
+
+        expected = []
+        for i in range(len(df)):
+            expected.extend(engine.generate_signals_from_df(df.iloc[: i + 1], "TEST"))
+
+        actual = engine.generate_signal_series(df, "TEST")
+        assert [s.to_dict() for s in actual] == [s.to_dict() for s in expected]
+
+    def test_future_candles_do_not_change_past_signals(self):
+        df = _day_candles()
+        cutoff = 120
+        engine = MomentumEngine()
+
+        baseline = engine.generate_signal_series(df, "TEST", positions=np.arange(cutoff))
+
+        # Rewrite the future: huge volume spikes and a price collapse
+        tampered = df.copy()
+        tampered.loc[cutoff:, "volume"] *= 50
+        tampered.loc[cutoff:, ["open", "high", "low", "close"]] *= 0.5
+        after = engine.generate_signal_series(tampered, "TEST", positions=np.arange(cutoff))
+
+        assert [s.to_dict() for s in after] == [s.to_dict() for s in baseline]
+
+    def test_rejects_out_of_range_positions(self):
+        df = _day_candles(minutes=30)
+        engine = MomentumEngine()
+
+        # -1 would wrap to the last (future) row
+        for positions in ([0, -1], [len(df)]):
+            with pytest.raises(ValueError):
+                engine.generate_signal_series(df, "TEST", positions=np.array(positions))
+        assert engine.generate_signal_series(df, "TEST", positions=np.array([], dtype=np.int64)) == []
+
+
+class TestCandleCursorPrefixPositions:
+    """Prefix positions use the same boundary as get_candles_up_to."""
+
+    def test_positions_match_get_candles_up_to(self):
+        cursor = CandleCursor(_day_candles(minutes=30))
+        timestamps = cursor.get_all_timestamps()
+        probes = timestamps + [timestamps[0] - pd.Timedelta(minutes=1), timestamps[3] + pd.Timedelta(seconds=30)]
+
+        positions = cursor.get_prefix_end_positions(probes)
+
+        for ts, pos in zip(probes, positions):
+            assert pos + 1 == len(cursor.get_candles_up_to(ts))
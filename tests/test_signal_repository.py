@@ -0,0 +1,126 @@
+"""Unit tests for the log-structured ParquetSignalRepository."""
+
+import json
+from dataclasses import replace
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+from signals.core.enums import Market, SignalCategory, SignalDirection, SignalState
+from signals.core.models import Signal
+from signals.repository.parquet_repo import ParquetSignalRepository
+
+
+def _signal(asset: str, market: Market = Market.US, day: int = 5) -> Signal:
+    sig = Signal.create(
+        name=f"{asset} breakout",
+        market=market,
+        asset=asset,
+        category=SignalCategory.MOMENTUM,
+        direction=SignalDirection.BULLISH,
+        trigger_time=datetime(2026, 1, day, 15, 30),
+        horizon="SHORT",
+        expiry_time=datetime(2026, 1, day, 15, 30) + timedelta(days=5),
+        strength=0.7,
+        explanation={"reason": "volume expansion"},
+    )
+    # Pin created_at so segments land in a known day partition
+    return replace(sig, created_at=datetime(2026, 1, day, 16, 0))
+
+
+def _legacy_save(base_dir, signal: Signal) -> None:
+    """One single-row file per version, as the previous layout wrote it."""
+    path = base_dir / signal.market.value / signal.created_at.strftime('%Y-%m-%d')
+    path.mkdir(parents=True, exist_ok=True)
+    data = signal.to_dict()
+    data['explainability_payload'] = json.dumps(data['explainability_payload'])
+    pd.DataFrame([data]).to_parquet(path / f"{signal.signal_id}_v{signal.version}_legacy.parquet", index=False)
+
+
+def _lifecycle(repo: ParquetSignalRepository, market: Market = Market.US):
+    """Three signals: one active, one expired, one active with a rescore."""
+    a, b, c = _signal("AAPL", market), _signal("MSFT", market), _signal("NVDA", market, day=6)
+    a2 = a.transition_to(SignalState.ACTIVE)
+    b2 = b.transition_to(SignalState.ACTIVE)
+    b3 = b2.transition_to(SignalState.EXPIRED)
+    c2 = c.transition_to(SignalState.ACTIVE)
+    c3 = c2.update_confidence(81.5, {"score": 81.5})
+    for sig in (a, b, c, a2, b2, b3, c2, c3):
+        repo.save_signal(sig)
+    return a2, b3, c3
+
+
+class TestParquetSignalRepository:
+    """Test suite for ParquetSignalRepository."""
+
+    def test_history_latest_and_active(self, tmp_path):
+        repo = ParquetSignalRepository(tmp_path, compact_threshold=0)
+        a2, b3, c3 = _lifecycle(repo)
+
+        assert [s.version for s in repo.get_signal_history(c3.signal_id)] == [1, 2, 3]
+        assert repo.get_latest_signal(b3.signal_id) == b3
+        assert repo.get_latest_signal("missing") is None
+        assert {s.signal_id: s for s in repo.get_active_signals(Market.US)} == {
+            a2.signal_id: a2, c3.signal_id: c3
+        }
+        assert repo.get_active_signals(Market.INDIA) == []
+
+    def test_compaction_preserves_queries(self, tmp_path):
+        repo = ParquetSignalRepository(tmp_path, compact_threshold=0)
+        a2, b3, c3 = _lifecycle(repo)
+        before = sorted(repo.get_active_signals(Market.US), key=lambda s: s.signal_id)
+
+        assert repo.compact() == 8
+        # One file per day partition, everything folded into the index
+        assert len(list((tmp_path / "US").glob("*/*.parquet"))) == 2
+
+        for r in (repo, ParquetSignalRepository(tmp_path, compact_threshold=0)):
+            assert sorted(r.get_active_signals(Market.US), key=lambda s: s.signal_id) == before
+            assert [s.version for s in r.get_signal_history(b3.signal_id)] == [1, 2, 3]
+            assert r.get_latest_signal(c3.signal_id) == c3
+
+    def test_tail_overrides_latest_view(self, tmp_path):
+        repo = ParquetSignalRepository(tmp_path, compact_threshold=0)
+        a2, _, c3 = _lifecycle(repo)
+        repo.compact()
+
+        a3 = a2.transition_to(SignalState.INVALIDATED, reason="gap down")
+        repo.save_signal(a3)
+
+        assert [s.signal_id for s in repo.get_active_signals(Market.US)] == [c3.signal_id]
+        assert repo.get_latest_signal(a2.signal_id) == a3
+        assert [s.version for s in repo.get_signal_history(a2.signal_id)] == [1, 2, 3]
+
+    def test_batch_writes_one_segment_per_day(self, tmp_path):
+        repo = ParquetSignalRepository(tmp_path, compact_threshold=0)
+        with repo.batch():
+            _lifecycle(repo)
+            assert not (tmp_path / "US").exists()
+
+        assert len(list((tmp_path / "US").glob("*/*.parquet"))) == 2
+        assert len(repo.get_active_signals(Market.US)) == 2
+
+    def test_reads_and_compacts_legacy_files(self, tmp_path):
+        a = _signal("INFY", Market.INDIA)
+        a2 = a.transition_to(SignalState.ACTIVE)
+        a3 = a2.update_confidence(64.0, {"score": 64.0})
+        for sig in (a, a2, a3):
+            _legacy_save(tmp_path, sig)
+
+        repo = ParquetSignalRepository(tmp_path, compact_threshold=0)
+        assert repo.get_active_signals(Market.INDIA) == [a3]
+
+        repo.compact()
+        reopened = ParquetSignalRepository(tmp_path, compact_threshold=0)
+        assert reopened.get_active_signals(Market.INDIA) == [a3]
+        assert [s.version for s in reopened.get_signal_history(a.signal_id)] == [1, 2, 3]
+        assert reopened.get_signal_history(a.signal_id)[0].confidence_score is None
+
+    def test_background_compaction_triggers_at_threshold(self, tmp_path):
+        repo = ParquetSignalRepository(tmp_path, compact_threshold=4)
+        a2, b3, c3 = _lifecycle(repo)
+        repo.wait_for_compaction(timeout=10)
+
+        assert (tmp_path / "_index" / "manifest.json").exists()
+        assert {s.signal_id for s in repo.get_active_signals(Market.US)} == {a2.signal_id, c3.signal_id}
+        assert repo.get_latest_signal(b3.signal_id) == b3
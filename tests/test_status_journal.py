@@ -0,0 +1,106 @@
+"""Tests for the append-only tracker journal and its use by BackfillQueue / IncrementalUpdater."""
+
+import pandas as pd
+
+from ingestion.core.status_journal import StatusJournal, journal_path_for, read_tracker
+from ingestion.historical_backfill import config as backfill_config
+from ingestion.historical_backfill.queue import BackfillQueue
+from ingestion.incremental_update import config as update_config
+from ingestion.incremental_update.updater import IncrementalUpdater
+
+
+def _rec(symbol, status="success", depth=100):
+    return {"symbol": symbol, "status": status, "history_depth_days": depth, "error_reason": None}
+
+
+class TestStatusJournal:
+    """Test suite for StatusJournal."""
+
+    def test_appends_without_rewriting_snapshot(self, tmp_path):
+        path = tmp_path / "tracker.parquet"
+        journal = StatusJournal(path, checkpoint_every=1000)
+        journal.load()
+        for i in range(50):
+            journal.append(_rec(f"S{i}"))
+
+        assert not path.exists()
+        assert len(journal_path_for(path).read_text().splitlines()) == 50
+
+        journal.checkpoint()
+        assert len(pd.read_parquet(path)) == 50
+        assert not journal_path_for(path).exists()
+
+    def test_checkpoints_periodically(self, tmp_path):
+        path = tmp_path / "tracker.parquet"
+        journal = StatusJournal(path, checkpoint_every=10)
+        journal.load()
+        for i in range(25):
+            journal.append(_rec(f"S{i}"))
+
+        assert len(pd.read_parquet(path)) == 20
+        assert len(journal_path_for(path).read_text().splitlines()) == 5
+
+    def test_replays_journal_after_crash(self, tmp_path):
+        path = tmp_path / "tracker.parquet"
+        journal = StatusJournal(path, checkpoint_every=3)
+        journal.load()
+        for i in range(4):
+            journal.append(_rec(f"S{i}"))
+        journal.append(_rec("S0", status="failed", depth=0))
+        # Simulate a kill mid-write: torn final line, no checkpoint
+        with open(journal_path_for(path), "a") as f:
+            f.write('{"symbol": "S9", "sta')
+
+        recovered = StatusJournal(path, checkpoint_every=3)
+        records = recovered.load()
+        assert set(records) == {"S0", "S1", "S2", "S3"}
+        assert records["S0"]["status"] == "failed"
+        assert records["S1"]["error_reason"] is None
+
+        # Appending after recovery keeps the journal readable
+        recovered.append(_rec("S4"))
+        assert set(StatusJournal(path).load()) == {"S0", "S1", "S2", "S3", "S4"}
+
+    def test_read_tracker(self, tmp_path):
+        path = tmp_path / "tracker.parquet"
+        assert read_tracker(path) is None
+
+        journal = StatusJournal(path)
+        journal.load()
+        journal.append(_rec("AAPL"))
+        df = read_tracker(path)
+        assert df["symbol"].tolist() == ["AAPL"]
+
+
+class TestTrackerRecovery:
+    """BackfillQueue / IncrementalUpdater resume from the journal."""
+
+    def test_backfill_queue_resumes_after_kill(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(backfill_config, "TRACKER_PATH", tmp_path / "backfill_tracker.parquet")
+
+        queue = BackfillQueue(checkpoint_every=100)
+        queue.mark_success("AAPL", 100, "2025-01-01", "2025-06-01")
+        queue.mark_failed("MSFT", "RATE_LIMIT")
+        # No checkpoint: the process "dies" here
+
+        resumed = BackfillQueue()
+        assert resumed.tracker["AAPL"].status == "success"
+        assert resumed.tracker["AAPL"].history_depth_days == 100
+        assert resumed.tracker["MSFT"].error_reason == "RATE_LIMIT"
+        assert resumed.get_stats() == {"pending": 0, "success": 1, "failed": 1, "total": 2}
+
+    def test_updater_sees_journaled_backfill(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(backfill_config, "TRACKER_PATH", tmp_path / "backfill_tracker.parquet")
+        monkeypatch.setattr(update_config, "BACKFILL_TRACKER", tmp_path / "backfill_tracker.parquet")
+        monkeypatch.setattr(update_config, "UPDATE_TRACKER", tmp_path / "update_tracker.parquet")
+
+        queue = BackfillQueue()
+        for symbol in ("AAPL", "MSFT", "NVDA"):
+            queue.mark_success(symbol, 100, "2025-01-01", "2025-06-01")
+
+        updater = IncrementalUpdater()
+        assert updater.get_eligible_symbols() == ["AAPL", "MSFT", "NVDA"]
+
+        updater._record("AAPL", True, "Updated to 2025-06-02")
+        # Killed before checkpoint: today's attempt is still remembered
+        assert IncrementalUpdater().get_eligible_symbols() == ["MSFT", "NVDA"]
@@ -0,0 +1,180 @@
+"""Unit tests for the binary tick decoder and batched tick dispatch."""
+
+import struct
+import time
+from datetime import datetime, timedelta
+
+from ingestion.india_ingestion.candle_aggregator import CandleAggregator
+from ingestion.india_ingestion.tick_pipeline import StageLatency, TickBatchQueue, TickDecoder
+
+
+def _frame(token: str, ltp: float, volume: int, pad: int = 0) -> bytes:
+    header = struct.pack(">B25sq", 1, token.encode(), 7)
+    return header + struct.pack(">dQ", ltp, volume) + bytes(pad)
+
+
+def _ticks(n: int):
+    start = datetime(2026, 1, 14, 9, 15, 0)
+    symbols = ["RELIANCE", "TCS", "INFY"]
+    return [
+        (symbols[i % 3], 100.0 + (i * 7 % 13), 10 + i % 5, start + timedelta(seconds=i * 2))
+        for i in range(n)
+    ]
+
+
+class TestTickDecoder:
+    """Test suite for TickDecoder."""
+
+    def test_decodes_registered_token(self):
+        decoder = TickDecoder()
+        decoder.register("2885", "RELIANCE")
+
+        assert decoder.decode(_frame("2885", 2950.5, 1234)) == ("RELIANCE", 2950.5, 1234)
+        # Longer (quote / snap quote) frames share the header
+        assert decoder.decode(_frame("2885", 2951.0, 99, pad=400)) == ("RELIANCE", 2951.0, 99)
+
+    def test_accepts_writable_buffers(self):
+        decoder = TickDecoder()
+        decoder.register("11536", "TCS")
+
+        assert decoder.decode(bytearray(_frame("11536", 4100.25, 5))) == ("TCS", 4100.25, 5)
+
+    def test_rejects_unknown_and_short_frames(self):
+        decoder = TickDecoder()
+        decoder.register("2885", "RELIANCE")
+
+        assert decoder.decode(_frame("1594", 1500.0, 1)) is None
+        assert decoder.decode(b"\x01" * 20) is None
+        assert decoder.unknown_tokens == 1
+        assert decoder.short_messages == 1
+
+        decoder.unregister("2885")
+        assert decoder.decode(_frame("2885", 2950.5, 1)) is None
+
+
+class TestBatchDispatch:
+    """Batched aggregation matches per-tick aggregation."""
+
+    def test_update_ticks_matches_update_tick(self, tmp_path):
+        ticks = _ticks(90)
+        single = CandleAggregator(processed_base_path=str(tmp_path / "a"))
+        batched = CandleAggregator(processed_base_path=str(tmp_path / "b"))
+        for agg in (single, batched):
+            for symbol in ("RELIANCE", "TCS", "INFY"):
+                agg.add_symbol(symbol)
+
+        for tick in ticks:
+            single.update_tick(*tick)
+        applied = batched.update_ticks(ticks + [("UNKNOWN", 1.0, 1, ticks[-1][3])])
+
+        assert applied == len(ticks)
+        assert batched.total_ticks_received == single.total_ticks_received
+        for symbol in ("RELIANCE", "TCS", "INFY"):
+            assert batched.states[symbol] == single.states[symbol]
+
+    def test_queue_drains_in_batches(self):
+        received = []
+        queue = TickBatchQueue(received.append, max_batch=16)
+        ticks = _ticks(40)
+        for tick in ticks:
+            queue.put(*tick)
+
+        assert queue.drain() == 40
+        assert [len(b) for b in received] == [16, 16, 8]
+        assert [t for b in received for t in b] == ticks
+        assert queue.get_stats()["depth_high_water"] == 40
+        assert queue.dispatch.count == 40
+
+    def test_threaded_queue_flushes_on_stop(self, tmp_path):
+        aggregator = CandleAggregator(processed_base_path=str(tmp_path))
+        for symbol in ("RELIANCE", "TCS", "INFY"):
+            aggregator.add_symbol(symbol)
+        queue = TickBatchQueue(aggregator.update_ticks)
+        queue.start()
+
+        for tick in _ticks(3000):
+            queue.put(*tick)
+        queue.stop()
+
+        assert queue.ticks_dispatched == 3000
+        assert aggregator.total_ticks_received == 3000
+        assert queue.depth() == 0
+
+    def test_timer_applies_queued_ticks_before_finalizing(self, tmp_path):
+        aggregator = CandleAggregator(processed_base_path=str(tmp_path))
+        aggregator.add_symbol("RELIANCE")
+        queue = TickBatchQueue(aggregator.update_ticks, max_batch=2)
+        aggregator.pre_finalize = queue.drain_until
+
+        start = datetime(2026, 1, 14, 9, 15, 0)
+        minute_m = [(100.0, 5, 1), (103.0, 7, 20), (99.0, 11, 40), (101.0, 13, 59)]
+        for price, volume, sec in minute_m:
+            queue.put("RELIANCE", price, volume, start + timedelta(seconds=sec))
+        # First tick of the next minute is already queued when the timer fires
+        queue.put("RELIANCE", 104.0, 17, start + timedelta(minutes=1, seconds=1))
+
+        aggregator._on_timer_tick(start + timedelta(minutes=1))
+        [candle] = aggregator.candle_store.read("RELIANCE").to_dict("records")
+        assert (candle["open"], candle["high"], candle["low"], candle["close"], candle["volume"]) == (
+            100.0, 103.0, 99.0, 101.0, 36)
+        assert queue.depth() == 1
+
+        aggregator._on_timer_tick(start + timedelta(minutes=2))
+        closes = aggregator.candle_store.read("RELIANCE")
+        assert closes["close"].tolist() == [101.0, 104.0]
+        assert closes["volume"].tolist() == [36, 17]
+
+    def test_drain_thread_holds_ticks_past_pending_boundary(self, tmp_path):
+        aggregator = CandleAggregator(processed_base_path=str(tmp_path))
+        aggregator.add_symbol("RELIANCE")
+        queue = TickBatchQueue(aggregator.update_ticks, poll_interval=0.001)
+        aggregator.pre_finalize = queue.drain_until
+        aggregator.on_boundary_scheduled = queue.hold_from
+
+        start = datetime(2026, 1, 14, 9, 15, 0)
+        boundary = start + timedelta(minutes=1)
+        # What the aggregator announces when it sets the timer for `boundary`
+        queue.hold_from(boundary)
+        queue.start()
+        try:
+            queue.put("RELIANCE", 100.0, 5, start + timedelta(seconds=10))
+            queue.put("RELIANCE", 102.0, 7, start + timedelta(seconds=58))
+            # The next minute's first tick arrives before the timer fires
+            queue.put("RELIANCE", 104.0, 17, boundary + timedelta(seconds=1))
+            deadline = time.monotonic() + 5
+            while queue.ticks_dispatched < 2 and time.monotonic() < deadline:
+                time.sleep(0.005)
+            time.sleep(0.05)
+            assert queue.ticks_dispatched == 2
+            assert queue.depth() == 1
+
+            aggregator._running = True
+            aggregator._on_timer_tick(boundary)
+            aggregator._running = False
+            aggregator._timer.cancel()
+            # Rescheduling moved the hold forward and released the held tick
+            assert queue._pending_boundary > boundary
+            deadline = time.monotonic() + 5
+            while queue.depth() and time.monotonic() < deadline:
+                time.sleep(0.005)
+        finally:
+            queue.stop()
+
+        aggregator.finalize_candles()
+        candles = aggregator.candle_store.read("RELIANCE")
+        assert candles["close"].tolist() == [102.0, 104.0]
+        assert candles["volume"].tolist() == [12, 17]
+
+
+class TestStageLatency:
+    """Test suite for StageLatency counters."""
+
+    def test_record_tracks_mean_and_max(self):
+        latency = StageLatency()
+        latency.record(2000)
+        latency.record(6000, n=2)
+
+        stats = latency.to_dict()
+        assert stats["count"] == 3
+        assert stats["max_us"] == 6.0
+        assert abs(stats["mean_us"] - 8000 / 3 / 1000) < 1e-3
@@ -0,0 +1,124 @@
+"""Unit tests for the shared TickStore latest-artifact resolver."""
+
+import json
+import os
+import random
+
+import pytest
+
+from src.evolution.tick_store import JsonFileCache, TickStore, get_tick_store
+
+ARTIFACTS = ("macro_context.json", "factor_context.json", "regime_context.json")
+
+
+def _write(root, tick, market, artifact, payload):
+    market_d = root / tick / market
+    market_d.mkdir(parents=True, exist_ok=True)
+    path = market_d / artifact
+    path.write_text(json.dumps(payload))
+    return path
+
+
+def _reference_latest(root, market, artifact):
+    """The original scan: sort every tick dir newest first and probe for the file."""
+    if not root.exists():
+        return None
+    for tick_dir in sorted((d for d in root.iterdir() if d.is_dir()), key=lambda d: d.name, reverse=True):
+        path = tick_dir / market / artifact
+        if path.exists():
+            return path
+    return None
+
+
+@pytest.fixture
+def root(tmp_path):
+    return tmp_path / "ticks"
+
+
+class TestTickStore:
+    """Test suite for TickStore."""
+
+    def test_matches_reference_scan_as_ticks_evolve(self, root):
+        rng = random.Random(7)
+        store = TickStore(root, json_cache=JsonFileCache())
+        assert store.latest_containing("US", "macro_context.json") is None
+
+        for i in range(60):
+            tick = f"tick_{1000 + i}"
+            for market in ("US", "INDIA"):
+                for artifact in ARTIFACTS:
+                    if rng.random() < 0.4:
+                        _write(root, tick, market, artifact, {"tick": tick})
+            (root / tick).mkdir(parents=True, exist_ok=True)
+            if i % 9 == 5:
+                # Old artifacts removed or a tick pruned outside the store
+                victims = list(root.glob("tick_*/US/macro_context.json"))
+                if victims:
+                    os.remove(victims[0])
+                for old in sorted(root.iterdir())[:1]:
+                    if i % 2:
+                        for path in sorted(old.rglob("*"), reverse=True):
+                            path.unlink() if path.is_file() else path.rmdir()
+                        old.rmdir()
+
+            for market in ("US", "INDIA", "EU"):
+                for artifact in ARTIFACTS:
+                    assert store.latest_containing(market, artifact) == _reference_latest(root, market, artifact)
+
+    def test_newest_tick_written_incrementally(self, root):
+        store = TickStore(root, json_cache=JsonFileCache())
+        _write(root, "tick_1000", "US", "factor_context.json", {"v": 1})
+        (root / "tick_1001" / "US").mkdir(parents=True)
+        assert store.latest_containing("US", "factor_context.json") == root / "tick_1000" / "US" / "factor_context.json"
+
+        # EV-TICK fills the newest tick after the store has already indexed it
+        _write(root, "tick_1001", "US", "factor_context.json", {"v": 2})
+        assert store.load_json("US", "factor_context.json") == (
+            root / "tick_1001" / "US" / "factor_context.json", {"v": 2})
+
+    def test_lookups_do_not_rescan_settled_ticks(self, root):
+        for i in range(50):
+            path = _write(root, f"tick_{1000 + i}", "US", "macro_context.json", {"i": i})
+            # Settled: older than the racy window
+            os.utime(path.parent, ns=(10**18, 10**18))
+        store = TickStore(root, json_cache=JsonFileCache())
+        store.latest_containing("US", "macro_context.json")
+        scans = store.scans
+
+        for _ in range(20):
+            store.latest_containing("US", "macro_context.json")
+            store.latest_containing("US", "missing.json")
+        assert store.scans == scans
+
+        _write(root, "tick_2000", "US", "macro_context.json", {"i": 50})
+        assert store.load_json("US", "macro_context.json")[1] == {"i": 50}
+        assert store.scans - scans <= 3
+
+    def test_payload_cache_follows_mtime(self, root):
+        cache = JsonFileCache()
+        store = TickStore(root, json_cache=cache)
+        path = _write(root, "tick_1000", "INDIA", "macro_context.json", {"v": 1})
+
+        assert store.load_json("INDIA", "macro_context.json")[1] == {"v": 1}
+        assert store.load_json("INDIA", "macro_context.json")[1] == {"v": 1}
+        assert (cache.hits, cache.misses) == (1, 1)
+
+        path.write_text(json.dumps({"v": 22}))
+        assert store.load_json("INDIA", "macro_context.json")[1] == {"v": 22}
+
+    def test_invalidate_picks_up_edits_to_old_ticks(self, root):
+        for i in range(5):
+            _write(root, f"tick_{1000 + i}", "US", "regime_context.json", {"i": i})
+        store = TickStore(root, json_cache=JsonFileCache())
+        assert store.latest_containing("US", "narrative_state.json") is None
+
+        _write(root, "tick_1001", "US", "narrative_state.json", {"late": True})
+        store.invalidate("tick_1001")
+        assert store.load_json("US", "narrative_state.json") == (
+            root / "tick_1001" / "US" / "narrative_state.json", {"late": True})
+
+    def test_registry_shares_one_store_per_root(self, root):
+        assert get_tick_store(root) is get_tick_store(str(root))
+        assert get_tick_store(root).latest_tick() is None
+        (root / "tick_5").mkdir(parents=True)
+        assert get_tick_store(root).latest_tick() == root / "tick_5"
@@ -0,0 +1,325 @@
+"""
+Batched cross-symbol regime evaluation.
+
+Evaluates a whole universe at once from (symbol, time) panels: provider
+factors are computed column-wise over the panel, the calculator decision
+tree runs as array selects over every cell, and the hysteresis state
+machine advances all symbols together one bar at a time. Results come back
+as a columnar table instead of per-call pydantic objects.
+"""
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from traderfund.regime.types import BIAS_CODES, MarketBehavior
+from traderfund.regime.calculator import RegimeCalculator
+from traderfund.regime.gate import GateAction, StrategyClass, StrategyCompatibilityMap
+from traderfund.regime.providers.base import bar_counts
+from traderfund.regime.providers.trend import ADXTrendStrengthProvider
+from traderfund.regime.providers.volatility import ATRVolatilityProvider
+from traderfund.regime.providers.liquidity import RVOLLiquidityProvider
+from traderfund.regime.providers.event import CalendarEventProvider
+
+try:
+    from automation.invariants.layer_integrations import gate_l1_regime as _gate_l1
+except ImportError:  # pragma: no cover
+    import logging as _logging
+    _logging.getLogger(__name__).critical(
+        "CATASTROPHIC FIREWALL UNAVAILABLE — L1 invariant gate disabled"
+    )
+    raise
+
+# Lookup tables indexed by MarketBehavior.id (index 0 unused)
+BEHAVIOR_NAMES = np.array([""] + [b.value for b in sorted(MarketBehavior, key=lambda b: b.id)], dtype=object)
+BIAS_NAMES = np.array([b.value for b in BIAS_CODES], dtype=object)
+
+_UNDEFINED = MarketBehavior.UNDEFINED.id
+_EVENT_LOCK = MarketBehavior.EVENT_LOCK.id
+_COOLDOWN_OVERRIDDEN = [MarketBehavior.TRENDING_NORMAL_VOL.id, MarketBehavior.MEAN_REVERTING_LOW_VOL.id]
+
+
+def gate_multiplier_table() -> Dict[StrategyClass, np.ndarray]:
+    """
+    StrategyGate.evaluate() as lookup tables: size multiplier by behavior id.
+    """
+    multipliers = {GateAction.ALLOW: 1.0, GateAction.REDUCE: 0.5, GateAction.BLOCK: 0.0}
+    table = {}
+    for strat in StrategyClass:
+        lut = np.zeros(len(BEHAVIOR_NAMES))
+        for behavior in MarketBehavior:
+            if behavior in (MarketBehavior.EVENT_LOCK, MarketBehavior.UNDEFINED):
+                continue  # Global kill switches
+            lut[behavior.id] = multipliers[StrategyCompatibilityMap.get_action(strat, behavior)]
+        table[strat] = lut
+    return table
+
+
+class BatchStateManager:
+    """
+    StateManager for many symbols at once. Holds one slot per symbol and
+    applies the same hysteresis, cooldown and confidence rules with array
+    operations; only symbols selected by the 'active' mask advance.
+    """
+    def __init__(
+        self,
+        n_symbols: int,
+        hysteresis_risk_on: int = 5,
+        hysteresis_risk_off: int = 1,
+        hysteresis_default: int = 3,
+        cooldown_bars: int = 30
+    ):
+        self.cooldown_bars = cooldown_bars
+
+        self.required = np.full(len(BEHAVIOR_NAMES), hysteresis_default)
+        for behavior in (MarketBehavior.EVENT_LOCK, MarketBehavior.TRENDING_HIGH_VOL,
+                         MarketBehavior.MEAN_REVERTING_HIGH_VOL, MarketBehavior.UNDEFINED):
+            self.required[behavior.id] = hysteresis_risk_off
+        self.required[MarketBehavior.TRENDING_NORMAL_VOL.id] = hysteresis_risk_on
+
+        self.current_behavior = np.full(n_symbols, _UNDEFINED)
+        self.current_bias = np.zeros(n_symbols, dtype=int)
+        self.pending_behavior = np.zeros(n_symbols, dtype=int)  # 0 = none
+        self.pending_counter = np.zeros(n_symbols, dtype=int)
+        self.persistence_counter = np.zeros(n_symbols, dtype=int)
+        self.cooldown_timer = np.zeros(n_symbols, dtype=int)
+
+    def update(
+        self,
+        active: np.ndarray,
+        raw_behavior: np.ndarray,
+        raw_bias: np.ndarray,
+        trend_strength: np.ndarray,
+        volatility_ratio: np.ndarray
+    ) -> Dict[str, np.ndarray]:
+        """
+        Advances the active symbols by one bar. Returns the confidence
+        components for every slot (meaningful where active).
+        """
+        raw_behavior = raw_behavior.copy()
+        raw_bias = raw_bias.copy()
+
+        # 0. Cooldown Management
+        cooling = active & (self.cooldown_timer > 0)
+        self.cooldown_timer[cooling] -= 1
+        overridden = cooling & np.isin(raw_behavior, _COOLDOWN_OVERRIDDEN)
+        raw_behavior[overridden] = _UNDEFINED
+        raw_bias[overridden] = 0
+
+        # 1. Start Cooldown Trigger
+        is_lock = raw_behavior == _EVENT_LOCK
+        self.cooldown_timer[active & is_lock] = 0
+        leaving_lock = active & ~is_lock & (self.current_behavior == _EVENT_LOCK) & (self.cooldown_timer == 0)
+        self.cooldown_timer[leaving_lock] = self.cooldown_bars
+
+        # 2. Hysteresis Logic
+        same = active & (raw_behavior == self.current_behavior)
+        self.persistence_counter[same] += 1
+        self.pending_behavior[same] = 0
+        self.pending_counter[same] = 0
+        self.current_bias[same] = raw_bias[same]
+
+        candidate = active & ~same
+        repeat = candidate & (raw_behavior == self.pending_behavior)
+        self.pending_counter[repeat] += 1
+        fresh = candidate & ~repeat
+        self.pending_behavior[fresh] = raw_behavior[fresh]
+        self.pending_counter[fresh] = 1
+
+        switch = candidate & (self.pending_counter >= self.required[raw_behavior])
+        self.current_behavior[switch] = raw_behavior[switch]
+        self.current_bias[switch] = raw_bias[switch]
+        self.persistence_counter[switch] = 0
+        self.pending_behavior[switch] = 0
+        self.pending_counter[switch] = 0
+
+        # 3. Confidence Calculation (same arithmetic as StateManager._calculate_confidence)
+        persistence = self.persistence_counter / 50.0
+        persistence = np.where(persistence < 1.0, persistence, 1.0)
+
+        with np.errstate(invalid='ignore'):
+            vol_term = (volatility_ratio - 1.0) / 0.5
+            vol_term = np.where(vol_term < 1.0, vol_term, 1.0)
+            intensity = np.where(
+                (volatility_ratio > 1.0) & (vol_term > trend_strength), vol_term, trend_strength
+            )
+        confluence = np.where(raw_behavior == self.current_behavior, 1.0, 0.5)
+
+        return {
+            "confluence": confluence,
+            "persistence": persistence,
+            "intensity": intensity,
+            "total_confidence": confluence * 0.4 + persistence * 0.4 + intensity * 0.2,
+            "is_stable": self.persistence_counter > 5,
+        }
+
+
+@dataclass
+class RegimeBatchResult:
+    """
+    Columnar regime output. Every array in 'columns' is shaped
+    (n_symbols, n_times); 'evaluated' marks cells the state machine scored.
+    """
+    symbols: List[str]
+    timestamps: pd.DatetimeIndex
+    columns: Dict[str, np.ndarray] = field(default_factory=dict)
+
+    def to_frame(self, latest_only: bool = False) -> pd.DataFrame:
+        """
+        Long table with one row per evaluated (symbol, timestamp), ordered by
+        timestamp then symbol. latest_only keeps each symbol's last evaluated bar.
+        """
+        evaluated = self.columns["evaluated"]
+        if latest_only:
+            mask = np.zeros_like(evaluated)
+            has_any = evaluated.any(axis=1)
+            last = evaluated.shape[1] - 1 - np.argmax(evaluated[:, ::-1], axis=1)
+            mask[np.flatnonzero(has_any), last[has_any]] = True
+        else:
+            mask = evaluated
+
+        # Transpose so rows come out time-major
+        t_idx, s_idx = np.nonzero(mask.T)
+        frame = {
+            "timestamp": self.timestamps[t_idx],
+            "symbol": np.asarray(self.symbols, dtype=object)[s_idx],
+            "behavior": BEHAVIOR_NAMES[self.columns["behavior_id"][s_idx, t_idx]],
+            "bias": BIAS_NAMES[self.columns["bias_code"][s_idx, t_idx]],
+            "regime_id": self.columns["behavior_id"][s_idx, t_idx],
+            "raw_behavior": BEHAVIOR_NAMES[self.columns["raw_behavior_id"][s_idx, t_idx]],
+        }
+        for name in ("total_confidence", "confluence", "persistence", "intensity", "is_stable",
+                     "trend_strength", "volatility_ratio", "liquidity_score", "event_pressure",
+                     "event_locked"):
+            frame[name] = self.columns[name][s_idx, t_idx]
+        frame["trend_alignment"] = BIAS_NAMES[self.columns["trend_alignment"][s_idx, t_idx]]
+        for strat, lut in gate_multiplier_table().items():
+            frame[f"gate_{strat.value.lower()}"] = lut[self.columns["behavior_id"][s_idx, t_idx]]
+        return pd.DataFrame(frame)
+
+
+class BatchRegimeEngine:
+    """
+    Universe-wide regime evaluation over (symbol, time) panels.
+    Per-symbol results match SymbolRegimeRunner.replay_history() when
+    the symbol's bars are contiguous in the panel.
+    """
+    def __init__(
+        self,
+        calc: Optional[RegimeCalculator] = None,
+        trend: Optional[ADXTrendStrengthProvider] = None,
+        vol: Optional[ATRVolatilityProvider] = None,
+        liq: Optional[RVOLLiquidityProvider] = None,
+        event: Optional[CalendarEventProvider] = None,
+        warmup_bars: int = 50,
+        state_params: Optional[Dict[str, int]] = None
+    ):
+        self.calc = calc or RegimeCalculator()
+        self.trend = trend or ADXTrendStrengthProvider()
+        self.vol = vol or ATRVolatilityProvider()
+        self.liq = liq or RVOLLiquidityProvider()
+        self.event = event or CalendarEventProvider()
+        self.warmup_bars = warmup_bars
+        self.state_params = state_params or {}
+
+    def evaluate(
+        self,
+        symbols: Sequence[str],
+        timestamps: Sequence[Any],
+        high: np.ndarray,
+        low: np.ndarray,
+        close: np.ndarray,
+        volume: np.ndarray,
+        events: Optional[List[Dict[str, Any]]] = None
+    ) -> RegimeBatchResult:
+        """
+        Args:
+            symbols: Row labels of the panels.
+            timestamps: Column labels of the panels (ascending).
+            high, low, close, volume: Arrays shaped (n_symbols, n_times); NaN
+                where a symbol has no bar (e.g. before its history starts).
+            events: Market-wide calendar events ({'time', 'impact'}) applied to every symbol.
+        """
+        timestamps = pd.DatetimeIndex(pd.to_datetime(list(timestamps)))
+        # Providers work column-wise on (time, symbol) arrays
+        h, l, c, v = (np.asarray(a, dtype=float).T for a in (high, low, close, volume))
+        n_times, n_symbols = c.shape
+
+        trend_strength = self.trend.trend_strength_panel(h, l, c)
+        alignment = self.trend.alignment_panel(c)
+        vol_ratio = self.vol.volatility_ratio_panel(h, l, c)
+        liq_score = self.liq.liquidity_score_panel(v)
+
+        clock = pd.DataFrame({'timestamp': timestamps})
+        clock.attrs['events'] = events or []
+        pressure_frame = self.event.pressure_series(clock)
+        pressure = np.broadcast_to(pressure_frame['pressure'].to_numpy()[:, None], c.shape)
+        locked = np.broadcast_to(pressure_frame['is_lock_window'].to_numpy()[:, None], c.shape)
+
+        raw_behavior, raw_bias = self.calc.calculate_batch(
+            trend_strength, alignment, vol_ratio, liq_score, pressure, locked
+        )
+
+        evaluated = (bar_counts(c) > self.warmup_bars) & ~np.isnan(c)
+        manager = BatchStateManager(n_symbols, **self.state_params)
+
+        out = {
+            "behavior_id": np.full(c.shape, _UNDEFINED),
+            "bias_code": np.zeros(c.shape, dtype=int),
+            "raw_behavior_id": np.full(c.shape, _UNDEFINED),
+            "total_confidence": np.full(c.shape, np.nan),
+            "confluence": np.full(c.shape, np.nan),
+            "persistence": np.full(c.shape, np.nan),
+            "intensity": np.full(c.shape, np.nan),
+            "is_stable": np.zeros(c.shape, dtype=bool),
+        }
+        for t in range(n_times):
+            active = evaluated[t]
+            if not active.any():
+                continue
+            step = manager.update(active, raw_behavior[t], raw_bias[t], trend_strength[t], vol_ratio[t])
+            out["behavior_id"][t, active] = manager.current_behavior[active]
+            out["bias_code"][t, active] = manager.current_bias[active]
+            out["raw_behavior_id"][t, active] = raw_behavior[t, active]
+            for name in ("total_confidence", "confluence", "persistence", "intensity", "is_stable"):
+                out[name][t, active] = step[name][active]
+
+        # ── L1 Catastrophic Invariant Gate (once per distinct final behavior) ──
+        for behavior_id in np.unique(manager.current_behavior):
+            _gate_l1({"behavior": BEHAVIOR_NAMES[behavior_id]})
+
+        out.update({
+            "trend_strength": trend_strength,
+            "trend_alignment": alignment,
+            "volatility_ratio": vol_ratio,
+            "liquidity_score": liq_score,
+            "event_pressure": np.array(pressure),
+            "event_locked": np.array(locked),
+            "evaluated": evaluated,
+        })
+        return RegimeBatchResult(
+            symbols=list(symbols),
+            timestamps=timestamps,
+            columns={name: np.ascontiguousarray(values.T) for name, values in out.items()},
+        )
+
+    def evaluate_frame(self, candles: pd.DataFrame, events: Optional[List[Dict[str, Any]]] = None) -> RegimeBatchResult:
+        """
+        Convenience wrapper: pivots a long candle frame (timestamp, symbol,
+        high, low, close, volume) into panels and evaluates it.
+        """
+        panels = {
+            col: candles.pivot_table(index='symbol', columns='timestamp', values=col, aggfunc='last')
+            for col in ('high', 'low', 'close', 'volume')
+        }
+        close = panels['close']
+        return self.evaluate(
+            symbols=list(close.index),
+            timestamps=list(close.columns),
+            high=panels['high'].reindex_like(close).to_numpy(dtype=float),
+            low=panels['low'].reindex_like(close).to_numpy(dtype=float),
+            close=close.to_numpy(dtype=float),
+            volume=panels['volume'].reindex_like(close).to_numpy(dtype=float),
+            events=events,
+        )
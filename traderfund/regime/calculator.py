@@ -1,5 +1,7 @@
 
-from typing import NamedTuple, Optional
+from typing import NamedTuple, Optional, Tuple
+
+import numpy as np
 from pydantic import BaseModel
 
 from traderfund.regime.types import MarketBehavior, DirectionalBias
@@ -97,3 +99,40 @@ class RegimeCalculator:
             bias=trend_bias,
             event_state_description="NONE"
         )
+
+    def calculate_batch(
+        self,
+        trend_strength: np.ndarray,
+        trend_bias: np.ndarray,
+        volatility_ratio: np.ndarray,
+        liquidity_score: np.ndarray,
+        event_pressure: np.ndarray,
+        is_event_locked: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Array form of calculate() for any number of (symbol, bar) cells.
+        trend_bias holds BIAS_CODES indices.
+
+        Returns:
+            (behavior_ids, bias_codes): MarketBehavior.id and BIAS_CODES index per cell.
+        """
+        is_trending = trend_strength >= self.trend_threshold
+        is_high_vol = volatility_ratio >= self.high_vol_ratio
+
+        technical = np.where(
+            is_trending,
+            np.where(is_high_vol, MarketBehavior.TRENDING_HIGH_VOL.id, MarketBehavior.TRENDING_NORMAL_VOL.id),
+            np.where(is_high_vol, MarketBehavior.MEAN_REVERTING_HIGH_VOL.id, MarketBehavior.MEAN_REVERTING_LOW_VOL.id),
+        )
+        is_locked = is_event_locked.astype(bool)
+        is_dry = ~is_locked & (liquidity_score < self.liquidity_min)
+        is_dominant = ~is_locked & ~is_dry & (event_pressure >= self.event_pressure_dominant)
+
+        # Same order of precedence as calculate()
+        behavior_ids = np.select(
+            [is_locked, is_dry, is_dominant],
+            [MarketBehavior.EVENT_LOCK.id, MarketBehavior.UNDEFINED.id, MarketBehavior.EVENT_DOMINANT.id],
+            default=technical,
+        )
+        bias_codes = np.where(is_locked | is_dry, 0, trend_bias)
+        return behavior_ids, bias_codes
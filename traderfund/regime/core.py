@@ -8,7 +8,7 @@ _TRADERFUND_PROJECT_ROOT = _os.path.abspath(
 if _TRADERFUND_PROJECT_ROOT not in _sys.path:
     _sys.path.insert(0, _TRADERFUND_PROJECT_ROOT)
 
-from typing import Optional
+from typing import Any, Dict, Optional
 from traderfund.regime.types import (
     MarketBehavior, DirectionalBias, RegimeState, ConfidenceComponents,
     RegimeOutput, RegimeFactors
@@ -124,6 +124,35 @@ class StateManager:
         _gate_l1(regime_state)
         return regime_state
 
+    def checkpoint(self) -> Dict[str, Any]:
+        """
+        JSON-serializable snapshot of the state machine (see restore()).
+        """
+        return {
+            "current_behavior": self.current_behavior.value,
+            "current_bias": self.current_bias.value,
+            "pending_behavior": self.pending_behavior.value if self.pending_behavior else None,
+            "pending_counter": self.pending_counter,
+            "persistence_counter": self.persistence_counter,
+            "cooldown_timer": self.cooldown_timer,
+            "confluence": self.confluence,
+            "intensity": self.intensity,
+        }
+
+    def restore(self, state: Dict[str, Any]) -> None:
+        """
+        Restores state saved by checkpoint(). Thresholds are kept from __init__.
+        """
+        self.current_behavior = MarketBehavior(state["current_behavior"])
+        self.current_bias = DirectionalBias(state["current_bias"])
+        pending = state.get("pending_behavior")
+        self.pending_behavior = MarketBehavior(pending) if pending else None
+        self.pending_counter = state["pending_counter"]
+        self.persistence_counter = state["persistence_counter"]
+        self.cooldown_timer = state["cooldown_timer"]
+        self.confluence = state.get("confluence", 0.5)
+        self.intensity = state.get("intensity", 0.5)
+
     def _switch_state(self, new_behavior: MarketBehavior, new_bias: DirectionalBias):
         self.current_behavior = new_behavior
         self.current_bias = new_bias
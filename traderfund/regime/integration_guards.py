@@ -16,6 +16,8 @@ from traderfund.regime.providers.trend import ADXTrendStrengthProvider
 from traderfund.regime.providers.volatility import ATRVolatilityProvider
 from traderfund.regime.providers.liquidity import RVOLLiquidityProvider
 from traderfund.regime.providers.event import CalendarEventProvider
+from ingestion.india_ingestion.candle_bus import CandleBus
+from ingestion.india_ingestion.candle_store import CandleStore
 
 logger = logging.getLogger(__name__)
 telemetry_logger = logging.getLogger("RegimeTelemetry")
@@ -41,8 +43,11 @@ class MomentumRegimeGuard:
     """
     Hard Gate integrating Regime Engine with Momentum Strategy.
     """
-    def __init__(self, data_path: str = "data/processed/candles/intraday"):
+    def __init__(self, data_path: str = "data/processed/candles/intraday", candle_bus: Optional[CandleBus] = None):
         self.data_path = Path(data_path)
+        self.candle_store = CandleStore(data_path)
+        # Live runner shares the aggregator's bus so checks skip disk reads
+        self.candle_bus = candle_bus
         
         # Initialize Core Components
         self.calc = RegimeCalculator()
@@ -63,18 +68,17 @@ class MomentumRegimeGuard:
     def _load_data(self, symbol: str, exchange: str = "NSE") -> pd.DataFrame:
         """
         Loads same data as Momentum Strategy to ensure consistency.
-        Phase 7 simplification: Reads from disk.
+        Reads the in-memory candle bus when it holds the symbol, else disk.
         """
-        file_path = self.data_path / f"{exchange}_{symbol}_1m.parquet"
-        if not file_path.exists():
+        if self.candle_bus is not None and self.candle_bus.has(symbol, exchange):
+            return self.candle_bus.frame(symbol, exchange)
+
+        if not self.candle_store.exists(symbol, exchange):
             return pd.DataFrame()
         
         try:
-            df = pd.read_parquet(file_path)
-            # Ensure proper timestamp column
-            if 'timestamp' in df.columns:
-                df['timestamp'] = pd.to_datetime(df['timestamp'])
-            return df
+            # Base file + pending segments, timestamps already parsed
+            return self.candle_store.read(symbol, exchange)
         except Exception as e:
             logger.error(f"Error loading data for regime check: {e}")
             return pd.DataFrame()
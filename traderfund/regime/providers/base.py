@@ -1,6 +1,9 @@
 from abc import ABC, abstractmethod
 from typing import Any, Dict
 from enum import Enum
+
+import numpy as np
+import pandas as pd
 from traderfund.regime.types import DirectionalBias
 
 class ITrendStrengthProvider(ABC):
@@ -52,3 +55,35 @@ class IEventPressureProvider(ABC):
         Returns: {'pressure': float, 'is_lock_window': bool}
         """
         pass
+
+
+# ---------------------------------------------------------------------------
+# Panel helpers: 2-D float arrays shaped (time, symbol), one column per symbol.
+# ---------------------------------------------------------------------------
+def shift_panel(values: np.ndarray) -> np.ndarray:
+    """Equivalent of DataFrame.shift(1) along the time axis."""
+    out = np.empty_like(values, dtype=float)
+    out[0] = np.nan
+    out[1:] = values[:-1]
+    return out
+
+
+def ewm_panel(values: np.ndarray, alpha: float = None, span: float = None) -> np.ndarray:
+    """Column-wise ewm(alpha=... or span=..., adjust=False).mean()."""
+    return pd.DataFrame(values).ewm(alpha=alpha, span=span, adjust=False).mean().to_numpy()
+
+
+def rolling_mean_panel(values: np.ndarray, window: int) -> np.ndarray:
+    """Column-wise rolling(window).mean()."""
+    return pd.DataFrame(values).rolling(window=window).mean().to_numpy()
+
+
+def bar_counts(values: np.ndarray) -> np.ndarray:
+    """Bars of history per symbol up to each row (leading NaN rows are not counted)."""
+    return np.cumsum(~np.isnan(values), axis=0)
+
+
+def true_range_panel(high: np.ndarray, low: np.ndarray, close: np.ndarray) -> np.ndarray:
+    """max(high-low, |high-prev_close|, |low-prev_close|), NaN-skipping like DataFrame.max(axis=1)."""
+    prev_close = shift_panel(close)
+    return np.fmax(np.fmax(high - low, np.abs(high - prev_close)), np.abs(low - prev_close))
@@ -1,6 +1,7 @@
 
+import numpy as np
 import pandas as pd
-from typing import Any, Dict
+from typing import Any, Dict, List
 from datetime import datetime, timedelta
 
 from traderfund.regime.providers.base import IEventPressureProvider
@@ -40,8 +41,15 @@ class CalendarEventProvider(IEventPressureProvider):
             if hasattr(data, 'attrs') and 'events' in data.attrs:
                 events = data.attrs['events']
         
+        return self.pressure_at(current_time, events)
+
+    def pressure_at(self, current_time: Any, events: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Pressure for a single point in time (used by streaming callers that hold no DataFrame).
+        """
         if current_time is None:
             return {'pressure': 0.0, 'is_lock_window': False}
+        current_time = pd.to_datetime(current_time)
 
         max_pressure = 0.0
         is_locked = False
@@ -69,3 +77,38 @@ class CalendarEventProvider(IEventPressureProvider):
             'pressure': float(max_pressure),
             'is_lock_window': is_locked
         }
+
+    def pressure_series(self, data: pd.DataFrame) -> pd.DataFrame:
+        """
+        get_pressure() evaluated at every row in one pass.
+        Returns a frame aligned with data with 'pressure' and 'is_lock_window' columns.
+        """
+        n = len(data)
+        pressure = np.zeros(n)
+        locked = np.zeros(n, dtype=bool)
+
+        current_time = None
+        if 'timestamp' in data.columns:
+            current_time = pd.to_datetime(data['timestamp'])
+        elif isinstance(data.index, pd.DatetimeIndex):
+            current_time = pd.Series(data.index, index=data.index)
+
+        events = data.attrs.get('events', []) if hasattr(data, 'attrs') else []
+        if current_time is not None:
+            range_span = self.max_lookahead_minutes - self.lock_window_minutes
+            for event in events:
+                event_time = pd.to_datetime(event['time'])
+                impact = event.get('impact', 1.0)
+                delta = np.array([
+                    (event_time - t).total_seconds() / 60.0 for t in current_time
+                ])
+
+                in_lock = (delta >= 0) & (delta <= self.lock_window_minutes)
+                in_range = ~in_lock & (delta > 0) & (delta <= self.max_lookahead_minutes)
+                normalized = np.clip((1.0 - (delta - self.lock_window_minutes) / range_span) * impact, 0.0, 1.0)
+
+                pressure = np.where(in_range, np.maximum(pressure, normalized), pressure)
+                locked |= in_lock
+            pressure[locked] = 1.0
+
+        return pd.DataFrame({'pressure': pressure, 'is_lock_window': locked}, index=data.index)
@@ -3,7 +3,7 @@ import numpy as np
 import pandas as pd
 from typing import Any
 
-from traderfund.regime.providers.base import ILiquidityProvider
+from traderfund.regime.providers.base import ILiquidityProvider, bar_counts, rolling_mean_panel
 
 class RVOLLiquidityProvider(ILiquidityProvider):
     """
@@ -46,6 +46,30 @@ class RVOLLiquidityProvider(ILiquidityProvider):
         # Normalize: Cap at 1.0 (Liquidity can't be "better than liquid" for our risk model)
         return float(min(1.0, max(0.0, rvol)))
 
+    def liquidity_score_series(self, data: pd.DataFrame) -> np.ndarray:
+        """
+        get_liquidity_score() evaluated at every row in one pass.
+        Element i equals get_liquidity_score(data.iloc[:i+1]).
+        """
+        self._validate_input(data)
+        return self.liquidity_score_panel(data['volume'].to_numpy(dtype=float)[:, None])[:, 0]
+
+    def liquidity_score_panel(self, volume: np.ndarray) -> np.ndarray:
+        """
+        Liquidity score for a (time, symbol) volume panel; column j matches
+        liquidity_score_series() on symbol j's bars.
+        """
+        avg_vol = rolling_mean_panel(volume, self.window)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rvol = volume / avg_vol
+        # Same clamping order as min(1.0, max(0.0, rvol))
+        score = np.where(rvol > 0.0, rvol, 0.0)
+        score = np.where(score < 1.0, score, 1.0)
+        score[avg_vol == 0] = 0.0
+        score[bar_counts(volume) < self.window] = 1.0
+        return score
+
     def _validate_input(self, data: pd.DataFrame):
         if not isinstance(data, pd.DataFrame):
             raise ValueError("Input data must be a pandas DataFrame")
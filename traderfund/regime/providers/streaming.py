@@ -0,0 +1,417 @@
+from collections import deque
+from math import copysign, isnan
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+import pandas as pd
+
+from traderfund.regime.types import DirectionalBias
+from traderfund.regime.providers.base import (
+    ITrendStrengthProvider, ITrendAlignmentProvider, IVolatilityRatioProvider, ILiquidityProvider
+)
+
+
+class EWMState:
+    """
+    O(1) exponentially weighted mean, equivalent to Series.ewm(alpha=..., adjust=False).mean().
+    Mirrors the pandas recursion step for step (including the normalising
+    division and the constant-series shortcut) so values match bit for bit.
+    """
+    def __init__(self, alpha: float):
+        self.alpha = alpha
+        self.value = float('nan')
+        self._old_wt = 1.0
+
+    # pandas converts every decay spec to a centre of mass and back,
+    # so the effective alpha can differ from the requested one in the last ulp.
+    @classmethod
+    def from_alpha(cls, alpha: float) -> "EWMState":
+        return cls(1.0 / (1.0 + (1.0 - alpha) / alpha))
+
+    @classmethod
+    def from_span(cls, span: float) -> "EWMState":
+        return cls(1.0 / (1.0 + (span - 1) / 2))
+
+    def update(self, x: float) -> float:
+        old_wt_factor = 1.0 - self.alpha
+        is_observation = not isnan(x)
+        if not isnan(self.value):
+            self._old_wt *= old_wt_factor
+            if is_observation:
+                if self.value != x:
+                    self.value = (self._old_wt * self.value + self.alpha * x) / (self._old_wt + self.alpha)
+                self._old_wt = 1.0
+        elif is_observation:
+            self.value = x
+        return self.value
+
+    def checkpoint(self) -> Dict[str, Any]:
+        return {'alpha': self.alpha, 'value': self.value, 'old_wt': self._old_wt}
+
+    @classmethod
+    def restore(cls, state: Mapping[str, Any]) -> "EWMState":
+        obj = cls(state['alpha'])
+        obj.value = state['value']
+        obj._old_wt = state['old_wt']
+        return obj
+
+
+class RollingMeanState:
+    """
+    O(1) trailing mean, equivalent to Series.rolling(window).mean().
+    Uses the same compensated add/remove bookkeeping as pandas so values
+    match bit for bit.
+    """
+    def __init__(self, window: int):
+        self.window = window
+        self.values: deque = deque()
+        self._reset()
+
+    def _reset(self):
+        self.sum_x = 0.0
+        self.comp_add = 0.0
+        self.comp_remove = 0.0
+        self.nobs = 0
+        self.neg_ct = 0
+        self.same_count = 0
+        self.prev_value = 0.0
+
+    def _add(self, val: float):
+        if isnan(val):
+            return
+        self.nobs += 1
+        y = val - self.comp_add
+        t = self.sum_x + y
+        self.comp_add = t - self.sum_x - y
+        self.sum_x = t
+        if _signbit(val):
+            self.neg_ct += 1
+        if val == self.prev_value:
+            self.same_count += 1
+        else:
+            self.same_count = 1
+        self.prev_value = val
+
+    def _remove(self, val: float):
+        if isnan(val):
+            return
+        self.nobs -= 1
+        y = -val - self.comp_remove
+        t = self.sum_x + y
+        self.comp_remove = t - self.sum_x - y
+        self.sum_x = t
+        if _signbit(val):
+            self.neg_ct -= 1
+
+    def update(self, x: float) -> float:
+        x = float(x)
+        if not self.values or self.window <= 1:
+            # pandas re-seeds the window when it does not overlap the previous one
+            self._reset()
+            self.values.clear()
+            self.prev_value = x
+            self.same_count = 0
+        if len(self.values) == self.window:
+            self._remove(self.values.popleft())
+        self.values.append(x)
+        self._add(x)
+        return self.value
+
+    @property
+    def value(self) -> float:
+        if self.nobs < self.window or self.nobs == 0:
+            return float('nan')
+        result = self.sum_x / self.nobs
+        if self.same_count >= self.nobs:
+            return self.prev_value
+        if self.neg_ct == 0 and result < 0:
+            return 0.0
+        if self.neg_ct == self.nobs and result > 0:
+            return 0.0
+        return result
+
+    def checkpoint(self) -> Dict[str, Any]:
+        return {
+            'window': self.window, 'values': list(self.values),
+            'sum_x': self.sum_x, 'comp_add': self.comp_add, 'comp_remove': self.comp_remove,
+            'nobs': self.nobs, 'neg_ct': self.neg_ct,
+            'same_count': self.same_count, 'prev_value': self.prev_value,
+        }
+
+    @classmethod
+    def restore(cls, state: Mapping[str, Any]) -> "RollingMeanState":
+        obj = cls(state['window'])
+        obj.values = deque(state['values'])
+        for key in ('sum_x', 'comp_add', 'comp_remove', 'nobs', 'neg_ct', 'same_count', 'prev_value'):
+            setattr(obj, key, state[key])
+        return obj
+
+
+def _signbit(val: float) -> bool:
+    return copysign(1.0, val) < 0
+
+
+def _true_range(high: float, low: float, prev_close: Optional[float]) -> float:
+    if prev_close is None:
+        return high - low
+    return max(high - low, abs(high - prev_close), abs(low - prev_close))
+
+
+class StreamingADXProvider(ITrendStrengthProvider, ITrendAlignmentProvider):
+    """
+    Stateful counterpart of ADXTrendStrengthProvider.
+    Each update() consumes one bar in O(1); get_trend_strength() and
+    get_alignment() return the values the stateless provider would compute
+    on the full history seen so far.
+    """
+    def __init__(self,
+                 adx_period: int = 14,
+                 ema_fast: int = 20,
+                 ema_slow: int = 50,
+                 ema_trend: int = 200):
+        self.adx_period = adx_period
+        self.ema_fast = ema_fast
+        self.ema_slow = ema_slow
+        self.ema_trend = ema_trend
+
+        alpha = 1.0 / adx_period
+        self.tr_s = EWMState.from_alpha(alpha)
+        self.plus_dm_s = EWMState.from_alpha(alpha)
+        self.minus_dm_s = EWMState.from_alpha(alpha)
+        self.adx_s = EWMState.from_alpha(alpha)
+        self.ema_f = EWMState.from_span(ema_fast)
+        self.ema_s = EWMState.from_span(ema_slow)
+
+        self.bars = 0
+        self.prev_high: Optional[float] = None
+        self.prev_low: Optional[float] = None
+        self.prev_close: Optional[float] = None
+        self.last_close = float('nan')
+
+    def update(self, high: float, low: float, close: float):
+        high, low, close = float(high), float(low), float(close)
+        tr = _true_range(high, low, self.prev_close)
+
+        plus_dm = minus_dm = 0.0
+        if self.prev_high is not None:
+            up_move = high - self.prev_high
+            down_move = self.prev_low - low
+            if up_move > down_move and up_move > 0:
+                plus_dm = up_move
+            if down_move > up_move and down_move > 0:
+                minus_dm = down_move
+
+        tr_s = self.tr_s.update(tr)
+        plus_dm_s = self.plus_dm_s.update(plus_dm)
+        minus_dm_s = self.minus_dm_s.update(minus_dm)
+        if tr_s == 0:
+            tr_s = 1e-9
+
+        plus_di = 100 * (plus_dm_s / tr_s)
+        minus_di = 100 * (minus_dm_s / tr_s)
+        dx = 100 * abs(plus_di - minus_di) / (plus_di + minus_di + 1e-9)
+        self.adx_s.update(dx)
+
+        self.ema_f.update(close)
+        self.ema_s.update(close)
+
+        self.prev_high, self.prev_low, self.prev_close = high, low, close
+        self.last_close = close
+        self.bars += 1
+
+    def get_trend_strength(self, data: Any = None) -> float:
+        if self.bars < self.adx_period * 2:
+            return 0.0
+        adx = self.adx_s.value
+        if isnan(adx):
+            return 0.0
+        return max(0.0, min(1.0, adx / 100.0))
+
+    def get_alignment(self, data: Any = None) -> DirectionalBias:
+        if self.bars < self.ema_trend:
+            return DirectionalBias.NEUTRAL
+        price, ema_f, ema_s = self.last_close, self.ema_f.value, self.ema_s.value
+        if price > ema_f > ema_s:
+            return DirectionalBias.BULLISH
+        elif price < ema_f < ema_s:
+            return DirectionalBias.BEARISH
+        return DirectionalBias.NEUTRAL
+
+    def checkpoint(self) -> Dict[str, Any]:
+        return {
+            'params': [self.adx_period, self.ema_fast, self.ema_slow, self.ema_trend],
+            'ewm': {name: getattr(self, name).checkpoint()
+                    for name in ('tr_s', 'plus_dm_s', 'minus_dm_s', 'adx_s', 'ema_f', 'ema_s')},
+            'bars': self.bars,
+            'prev': [self.prev_high, self.prev_low, self.prev_close],
+            'last_close': self.last_close,
+        }
+
+    @classmethod
+    def restore(cls, state: Mapping[str, Any]) -> "StreamingADXProvider":
+        obj = cls(*state['params'])
+        for name, ewm in state['ewm'].items():
+            setattr(obj, name, EWMState.restore(ewm))
+        obj.bars = state['bars']
+        obj.prev_high, obj.prev_low, obj.prev_close = state['prev']
+        obj.last_close = state['last_close']
+        return obj
+
+
+class StreamingATRVolatilityProvider(IVolatilityRatioProvider):
+    """
+    Stateful counterpart of ATRVolatilityProvider: ATR(14) / SMA(ATR, 20), O(1) per bar.
+    """
+    def __init__(self, atr_period: int = 14, baseline_period: int = 20):
+        self.atr_period = atr_period
+        self.baseline_period = baseline_period
+        self.atr = EWMState.from_alpha(1.0 / atr_period)
+        self.baseline = RollingMeanState(baseline_period)
+        self.bars = 0
+        self.prev_close: Optional[float] = None
+
+    def update(self, high: float, low: float, close: float):
+        high, low, close = float(high), float(low), float(close)
+        atr = self.atr.update(_true_range(high, low, self.prev_close))
+        self.baseline.update(atr)
+        self.prev_close = close
+        self.bars += 1
+
+    def get_volatility_ratio(self, data: Any = None) -> float:
+        if self.bars < self.atr_period + self.baseline_period:
+            return 1.0
+        baseline_atr = self.baseline.value
+        if baseline_atr == 0:
+            return 1.0
+        return self.atr.value / baseline_atr
+
+    def checkpoint(self) -> Dict[str, Any]:
+        return {
+            'params': [self.atr_period, self.baseline_period],
+            'atr': self.atr.checkpoint(),
+            'baseline': self.baseline.checkpoint(),
+            'bars': self.bars,
+            'prev_close': self.prev_close,
+        }
+
+    @classmethod
+    def restore(cls, state: Mapping[str, Any]) -> "StreamingATRVolatilityProvider":
+        obj = cls(*state['params'])
+        obj.atr = EWMState.restore(state['atr'])
+        obj.baseline = RollingMeanState.restore(state['baseline'])
+        obj.bars = state['bars']
+        obj.prev_close = state['prev_close']
+        return obj
+
+
+class StreamingRVOLLiquidityProvider(ILiquidityProvider):
+    """
+    Stateful counterpart of RVOLLiquidityProvider: min(1.0, volume / SMA(volume, 20)), O(1) per bar.
+    """
+    def __init__(self, window: int = 20):
+        self.window = window
+        self.avg = RollingMeanState(window)
+        self.bars = 0
+        self.last_volume = float('nan')
+
+    def update(self, volume: float):
+        self.last_volume = float(volume)
+        self.avg.update(self.last_volume)
+        self.bars += 1
+
+    def get_liquidity_score(self, data: Any = None) -> float:
+        if self.bars < self.window:
+            return 1.0
+        avg_vol = self.avg.value
+        if avg_vol == 0:
+            return 0.0
+        rvol = self.last_volume / avg_vol
+        return float(min(1.0, max(0.0, rvol)))
+
+    def checkpoint(self) -> Dict[str, Any]:
+        return {
+            'window': self.window,
+            'avg': self.avg.checkpoint(),
+            'bars': self.bars,
+            'last_volume': self.last_volume,
+        }
+
+    @classmethod
+    def restore(cls, state: Mapping[str, Any]) -> "StreamingRVOLLiquidityProvider":
+        obj = cls(state['window'])
+        obj.avg = RollingMeanState.restore(state['avg'])
+        obj.bars = state['bars']
+        obj.last_volume = state['last_volume']
+        return obj
+
+
+class StreamingProviderSet:
+    """
+    Per-symbol bundle of streaming providers fed from one bar stream.
+    Bars at or before the last seen timestamp are ignored, so a caller may
+    pass overlapping windows of history.
+    """
+    def __init__(self,
+                 trend: Optional[StreamingADXProvider] = None,
+                 vol: Optional[StreamingATRVolatilityProvider] = None,
+                 liq: Optional[StreamingRVOLLiquidityProvider] = None):
+        self.trend = trend or StreamingADXProvider()
+        self.vol = vol or StreamingATRVolatilityProvider()
+        self.liq = liq or StreamingRVOLLiquidityProvider()
+        self.last_timestamp: Optional[pd.Timestamp] = None
+
+    def update(self, bar: Mapping[str, Any]) -> bool:
+        """
+        Consumes one bar (high, low, close, volume, optional timestamp).
+        Returns False if the bar was already seen.
+        """
+        ts = bar.get('timestamp')
+        if ts is not None:
+            ts = pd.Timestamp(ts)
+            if self.last_timestamp is not None and ts <= self.last_timestamp:
+                return False
+            self.last_timestamp = ts
+
+        self.trend.update(bar['high'], bar['low'], bar['close'])
+        self.vol.update(bar['high'], bar['low'], bar['close'])
+        self.liq.update(bar['volume'])
+        return True
+
+    def update_frame(self, data: pd.DataFrame) -> int:
+        """
+        Consumes the rows of data newer than the last seen bar. Returns the number consumed.
+        """
+        if self.last_timestamp is not None and 'timestamp' in data.columns:
+            data = data[pd.to_datetime(data['timestamp']) > self.last_timestamp]
+        columns = [c for c in ('timestamp', 'high', 'low', 'close', 'volume') if c in data.columns]
+        consumed = 0
+        for row in data[columns].itertuples(index=False):
+            consumed += self.update(row._asdict())
+        return consumed
+
+    def factors(self) -> Tuple[float, DirectionalBias, float, float]:
+        """(trend_strength, alignment, volatility_ratio, liquidity_score) for the latest bar."""
+        return (
+            self.trend.get_trend_strength(),
+            self.trend.get_alignment(),
+            self.vol.get_volatility_ratio(),
+            self.liq.get_liquidity_score(),
+        )
+
+    def checkpoint(self) -> Dict[str, Any]:
+        return {
+            'trend': self.trend.checkpoint(),
+            'vol': self.vol.checkpoint(),
+            'liq': self.liq.checkpoint(),
+            'last_timestamp': self.last_timestamp.isoformat() if self.last_timestamp is not None else None,
+        }
+
+    @classmethod
+    def restore(cls, state: Mapping[str, Any]) -> "StreamingProviderSet":
+        obj = cls(
+            trend=StreamingADXProvider.restore(state['trend']),
+            vol=StreamingATRVolatilityProvider.restore(state['vol']),
+            liq=StreamingRVOLLiquidityProvider.restore(state['liq']),
+        )
+        if state['last_timestamp'] is not None:
+            obj.last_timestamp = pd.Timestamp(state['last_timestamp'])
+        return obj
@@ -4,8 +4,11 @@ import pandas as pd
 from typing import Any, Tuple, Optional
 from datetime import datetime
 
-from traderfund.regime.types import DirectionalBias
-from traderfund.regime.providers.base import ITrendStrengthProvider, ITrendAlignmentProvider
+from traderfund.regime.types import BIAS_CODES, DirectionalBias
+from traderfund.regime.providers.base import (
+    ITrendStrengthProvider, ITrendAlignmentProvider,
+    bar_counts, ewm_panel, shift_panel, true_range_panel
+)
 
 class ADXTrendStrengthProvider(ITrendStrengthProvider, ITrendAlignmentProvider):
     """
@@ -39,6 +42,30 @@ class ADXTrendStrengthProvider(ITrendStrengthProvider, ITrendAlignmentProvider):
             
         return max(0.0, min(1.0, adx / 100.0))
 
+    def trend_strength_series(self, data: pd.DataFrame) -> np.ndarray:
+        """
+        get_trend_strength() evaluated at every row in one pass.
+        Element i equals get_trend_strength(data.iloc[:i+1]): Wilder smoothing
+        is a causal recursion, so the full-history series carries every prefix value.
+        """
+        self._validate_input(data, required_columns=['high', 'low', 'close'])
+        high, low, close = (data[c].to_numpy(dtype=float)[:, None] for c in ('high', 'low', 'close'))
+        return self.trend_strength_panel(high, low, close)[:, 0]
+
+    def trend_strength_panel(self, high: np.ndarray, low: np.ndarray, close: np.ndarray) -> np.ndarray:
+        """
+        Trend strength for (time, symbol) panels; column j matches
+        trend_strength_series() on symbol j's bars.
+        """
+        adx = self._adx_panel(high, low, close, self.adx_period)
+        norm = adx / 100.0
+        # Same clamping order as max(0.0, min(1.0, x))
+        norm = np.where(norm < 1.0, norm, 1.0)
+        norm = np.where(norm > 0.0, norm, 0.0)
+        norm[np.isnan(adx)] = 0.0
+        norm[bar_counts(close) < self.adx_period * 2] = 0.0
+        return norm
+
     def get_alignment(self, data: pd.DataFrame) -> DirectionalBias:
         """
         Determines directional bias using EMA alignment.
@@ -60,6 +87,51 @@ class ADXTrendStrengthProvider(ITrendStrengthProvider, ITrendAlignmentProvider):
         else:
             return DirectionalBias.NEUTRAL
 
+    def alignment_series(self, data: pd.DataFrame) -> np.ndarray:
+        """
+        get_alignment() evaluated at every row in one pass (object array of DirectionalBias).
+        """
+        self._validate_input(data, required_columns=['close'])
+        codes = self.alignment_panel(data['close'].to_numpy(dtype=float)[:, None])[:, 0]
+        choices = np.empty(len(BIAS_CODES), dtype=object)
+        choices[:] = BIAS_CODES
+        return choices[codes]
+
+    def alignment_panel(self, close: np.ndarray) -> np.ndarray:
+        """
+        EMA alignment for a (time, symbol) close panel as BIAS_CODES indices.
+        """
+        ema_f = ewm_panel(close, span=self.ema_fast)
+        ema_s = ewm_panel(close, span=self.ema_slow)
+
+        bullish = (close > ema_f) & (ema_f > ema_s)
+        bearish = (close < ema_f) & (ema_f < ema_s)
+        codes = np.where(bullish, 1, np.where(bearish, 2, 0))
+        codes[bar_counts(close) < self.ema_trend] = 0
+        return codes
+
+    def _adx_panel(self, high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int) -> np.ndarray:
+        """
+        Wilder's ADX for (time, symbol) panels, same arithmetic as _adx_series.
+        """
+        tr = true_range_panel(high, low, close)
+        up_move = high - shift_panel(high)
+        down_move = shift_panel(low) - low
+        plus_dm = np.where((up_move > down_move) & (up_move > 0), up_move, 0.0)
+        minus_dm = np.where((down_move > up_move) & (down_move > 0), down_move, 0.0)
+
+        alpha = 1.0 / period
+        tr_s = ewm_panel(tr, alpha)
+        plus_dm_s = ewm_panel(plus_dm, alpha)
+        minus_dm_s = ewm_panel(minus_dm, alpha)
+        tr_s = np.where(tr_s == 0, 1e-9, tr_s)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            plus_di = 100 * (plus_dm_s / tr_s)
+            minus_di = 100 * (minus_dm_s / tr_s)
+            dx = 100 * np.abs(plus_di - minus_di) / (plus_di + minus_di + 1e-9)
+        return ewm_panel(dx, alpha)
+
     def _validate_input(self, data: pd.DataFrame, required_columns: list):
         if not isinstance(data, pd.DataFrame):
             raise ValueError("Input data must be a pandas DataFrame")
@@ -73,6 +145,12 @@ class ADXTrendStrengthProvider(ITrendStrengthProvider, ITrendAlignmentProvider):
         """
         Standard Wilder's ADX calculation.
         """
+        return self._adx_series(high, low, close, period).iloc[-1]
+
+    def _adx_series(self, high: pd.Series, low: pd.Series, close: pd.Series, period: int) -> pd.Series:
+        """
+        Wilder's ADX for every row of the input.
+        """
         # Calculate TR
         # TR = max(high-low, abs(high-prev_close), abs(low-prev_close))
         # Using vectorization
@@ -111,4 +189,4 @@ class ADXTrendStrengthProvider(ITrendStrengthProvider, ITrendAlignmentProvider):
         # ADX is smoothed DX
         adx = dx.ewm(alpha=alpha, adjust=False).mean()
         
-        return adx.iloc[-1]
+        return adx
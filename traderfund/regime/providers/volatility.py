@@ -3,7 +3,9 @@ import numpy as np
 import pandas as pd
 from typing import Any
 
-from traderfund.regime.providers.base import IVolatilityRatioProvider
+from traderfund.regime.providers.base import (
+    IVolatilityRatioProvider, bar_counts, ewm_panel, rolling_mean_panel, true_range_panel
+)
 
 class ATRVolatilityProvider(IVolatilityRatioProvider):
     """
@@ -25,20 +27,7 @@ class ATRVolatilityProvider(IVolatilityRatioProvider):
         if len(data) < required_len:
             return 1.0 # Insufficient data, assume baseline
             
-        high = data['high']
-        low = data['low']
-        close = data['close']
-        
-        # Calculate ATR Series
-        prev_close = close.shift(1)
-        tr1 = high - low
-        tr2 = (high - prev_close).abs()
-        tr3 = (low - prev_close).abs()
-        tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-        
-        # Smooth TR (Wilder's Smoothing / EMA)
-        alpha = 1.0 / self.atr_period
-        atr_series = tr.ewm(alpha=alpha, adjust=False).mean()
+        atr_series = self._atr_series(data)
         
         current_atr = atr_series.iloc[-1]
         
@@ -50,6 +39,45 @@ class ATRVolatilityProvider(IVolatilityRatioProvider):
             
         return current_atr / baseline_atr
 
+    def volatility_ratio_series(self, data: pd.DataFrame) -> np.ndarray:
+        """
+        get_volatility_ratio() evaluated at every row in one pass.
+        Element i equals get_volatility_ratio(data.iloc[:i+1]).
+        """
+        self._validate_input(data)
+        high, low, close = (data[c].to_numpy(dtype=float)[:, None] for c in ('high', 'low', 'close'))
+        return self.volatility_ratio_panel(high, low, close)[:, 0]
+
+    def volatility_ratio_panel(self, high: np.ndarray, low: np.ndarray, close: np.ndarray) -> np.ndarray:
+        """
+        Volatility ratio for (time, symbol) panels; column j matches
+        volatility_ratio_series() on symbol j's bars.
+        """
+        current_atr = ewm_panel(true_range_panel(high, low, close), 1.0 / self.atr_period)
+        baseline_atr = rolling_mean_panel(current_atr, self.baseline_period)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ratio = current_atr / baseline_atr
+        ratio[baseline_atr == 0] = 1.0
+        ratio[bar_counts(close) < self.atr_period + self.baseline_period] = 1.0
+        return ratio
+
+    def _atr_series(self, data: pd.DataFrame) -> pd.Series:
+        """Wilder-smoothed ATR for every row."""
+        high = data['high']
+        low = data['low']
+        close = data['close']
+
+        prev_close = close.shift(1)
+        tr1 = high - low
+        tr2 = (high - prev_close).abs()
+        tr3 = (low - prev_close).abs()
+        tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
+
+        # Smooth TR (Wilder's Smoothing / EMA)
+        alpha = 1.0 / self.atr_period
+        return tr.ewm(alpha=alpha, adjust=False).mean()
+
     def _validate_input(self, data: pd.DataFrame):
         if not isinstance(data, pd.DataFrame):
             raise ValueError("Input data must be a pandas DataFrame")
@@ -3,7 +3,7 @@ import json
 import logging
 import os
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Mapping, Optional
 import pandas as pd
 
 from traderfund.regime.types import RegimeState, RegimeFactors, MarketBehavior
@@ -15,6 +15,7 @@ from traderfund.regime.providers.trend import ADXTrendStrengthProvider
 from traderfund.regime.providers.volatility import ATRVolatilityProvider
 from traderfund.regime.providers.liquidity import RVOLLiquidityProvider
 from traderfund.regime.providers.event import CalendarEventProvider
+from traderfund.regime.providers.streaming import StreamingProviderSet
 
 class ShadowRegimeRunner:
     """
@@ -25,15 +26,27 @@ class ShadowRegimeRunner:
     def __init__(
         self, 
         log_file_path: str = "regime_shadow.jsonl",
-        enabled: bool = True
+        enabled: bool = True,
+        streaming: bool = True
     ):
+        """
+        Args:
+            log_file_path: Telemetry output (JSONL).
+            enabled: Master switch; when False on_tick/on_bar are no-ops.
+            streaming: Keep per-symbol incremental indicator state so each new
+                       bar costs O(1) instead of a full-history recompute.
+        """
         self.enabled = enabled
         self.log_file_path = log_file_path
+        self.streaming = streaming
         
         # Initialize Core Components
         self.calc = RegimeCalculator()
-        self.manager = StateManager()
         self.gate = StrategyGate()
+
+        # Per-symbol state: hysteresis and streaming indicators
+        self.managers: Dict[str, StateManager] = {}
+        self.streams: Dict[str, StreamingProviderSet] = {}
         
         # Initialize Providers (Default params, can be injected in real app)
         self.trend_provider = ADXTrendStrengthProvider()
@@ -64,17 +77,68 @@ class ShadowRegimeRunner:
         Process a new market update in shadow mode.
         Returns the RegimeState for inspection (e.g. by unit tests),
         but primarily logs it to disk.
+
+        In streaming mode only rows newer than the last bar seen for the
+        symbol are consumed, so passing the growing history each tick is cheap.
         """
         if not self.enabled:
             return None
 
         # 1. Compute Provider Outputs
-        trend_strength = self.trend_provider.get_trend_strength(market_data)
-        alignment = self.trend_provider.get_alignment(market_data)
-        vol_ratio = self.vol_provider.get_volatility_ratio(market_data)
-        liq_score = self.liq_provider.get_liquidity_score(market_data)
+        if self.streaming and 'timestamp' in market_data.columns:
+            stream = self._stream_for(symbol)
+            stream.update_frame(market_data)
+            trend_strength, alignment, vol_ratio, liq_score = stream.factors()
+        else:
+            trend_strength = self.trend_provider.get_trend_strength(market_data)
+            alignment = self.trend_provider.get_alignment(market_data)
+            vol_ratio = self.vol_provider.get_volatility_ratio(market_data)
+            liq_score = self.liq_provider.get_liquidity_score(market_data)
         event_data = self.event_provider.get_pressure(market_data)
-        
+
+        return self._score(symbol, trend_strength, alignment, vol_ratio, liq_score, event_data)
+
+    def on_bar(
+        self,
+        symbol: str,
+        bar: Mapping[str, Any],
+        events: Optional[List[Dict[str, Any]]] = None
+    ) -> Optional[RegimeState]:
+        """
+        Process one new bar (timestamp, high, low, close, volume) in O(1).
+        Bars at or before the last bar seen for the symbol are ignored.
+        """
+        if not self.enabled:
+            return None
+
+        stream = self._stream_for(symbol)
+        if not stream.update(bar):
+            return None
+
+        trend_strength, alignment, vol_ratio, liq_score = stream.factors()
+        event_data = self.event_provider.pressure_at(bar.get('timestamp'), events or [])
+
+        return self._score(symbol, trend_strength, alignment, vol_ratio, liq_score, event_data)
+
+    def _stream_for(self, symbol: str) -> StreamingProviderSet:
+        if symbol not in self.streams:
+            self.streams[symbol] = StreamingProviderSet()
+        return self.streams[symbol]
+
+    def _manager_for(self, symbol: str) -> StateManager:
+        if symbol not in self.managers:
+            self.managers[symbol] = StateManager()
+        return self.managers[symbol]
+
+    def _score(
+        self,
+        symbol: str,
+        trend_strength: float,
+        alignment,
+        vol_ratio: float,
+        liq_score: float,
+        event_data: Dict[str, Any]
+    ) -> RegimeState:
         event_pressure = event_data['pressure']
         is_locked = event_data['is_lock_window']
 
@@ -96,7 +160,8 @@ class ShadowRegimeRunner:
             event_pressure_norm=event_pressure
         )
         
-        state = self.manager.update(raw_regime, factors)
+        manager = self._manager_for(symbol)
+        state = manager.update(raw_regime, factors)
 
         # 4. Compute Hypothetical Gates
         blocked_strats = []
@@ -115,13 +180,47 @@ class ShadowRegimeRunner:
         telemetry_record['shadow'] = {
             "would_block": blocked_strats,
             "would_throttle": throttled_strats,
-            "cooldown_active": self.manager.cooldown_timer > 0
+            "cooldown_active": manager.cooldown_timer > 0
         }
         
         self.logger.info(json.dumps(telemetry_record))
         
         return state
 
+    def checkpoint(self, path: str) -> None:
+        """
+        Saves per-symbol indicator and state-machine state so a restarted
+        runner resumes without replaying history.
+        """
+        payload = {
+            "saved_at": datetime.utcnow().isoformat(),
+            "symbols": {
+                symbol: {
+                    "providers": self.streams[symbol].checkpoint() if symbol in self.streams else None,
+                    "manager": self.managers[symbol].checkpoint() if symbol in self.managers else None,
+                }
+                for symbol in sorted(set(self.streams) | set(self.managers))
+            }
+        }
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(payload, f)
+        os.replace(tmp_path, path)
+
+    def restore(self, path: str) -> int:
+        """
+        Loads a checkpoint written by checkpoint(). Returns the number of symbols restored.
+        """
+        with open(path, 'r') as f:
+            payload = json.load(f)
+
+        for symbol, state in payload.get("symbols", {}).items():
+            if state.get("providers"):
+                self.streams[symbol] = StreamingProviderSet.restore(state["providers"])
+            if state.get("manager"):
+                self._manager_for(symbol).restore(state["manager"])
+        return len(payload.get("symbols", {}))
+
     def close(self):
         """Release file handlers"""
         for handler in self.logger.handlers:
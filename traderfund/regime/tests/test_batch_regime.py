@@ -0,0 +1,94 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from traderfund.regime.batch import BatchRegimeEngine
+from traderfund.regime.calculator import RegimeCalculator
+from traderfund.regime.types import BIAS_CODES, MarketBehavior
+from traderfund.regime.us_market.run_symbol_regime import SymbolRegimeRunner
+
+
+def _symbol_history(seed: int, n: int, start: str) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    drift = np.where(np.arange(n) < n // 2, 0.5, -0.2)
+    noise = rng.normal(0, 1.0, n)
+    noise[n // 2: n // 2 + 15] *= 5
+    close = 100 + np.cumsum(drift + noise)
+    spread = np.abs(rng.normal(1.0, 0.3, n))
+    volume = rng.integers(800_000, 1_200_000, n).astype(float)
+    volume[n - 40: n - 35] = 10_000
+    return pd.DataFrame({
+        'timestamp': pd.date_range(start, periods=n, freq="D"),
+        'open': close,
+        'high': close + spread,
+        'low': close - spread,
+        'close': close,
+        'volume': volume,
+    })
+
+
+@pytest.fixture
+def universe():
+    """Three symbols on one calendar; LATE lists 80 days after the others."""
+    return {
+        "AAA": _symbol_history(1, 300, "2024-01-01"),
+        "BBB": _symbol_history(2, 300, "2024-01-01"),
+        "LATE": _symbol_history(3, 220, "2024-03-21"),
+    }
+
+
+class TestCalculateBatch:
+    def test_matches_scalar_decision_tree(self):
+        rng = np.random.default_rng(0)
+        n = 2000
+        strength = rng.uniform(0, 0.5, n)
+        bias = rng.integers(0, 3, n)
+        vol = rng.uniform(0.5, 2.5, n)
+        liq = rng.uniform(0, 1, n)
+        pressure = rng.uniform(0, 1, n)
+        locked = rng.random(n) < 0.1
+
+        calc = RegimeCalculator()
+        behavior_ids, bias_codes = calc.calculate_batch(strength, bias, vol, liq, pressure, locked)
+
+        for i in range(n):
+            raw = calc.calculate(strength[i], BIAS_CODES[bias[i]], vol[i], liq[i], pressure[i], bool(locked[i]))
+            assert behavior_ids[i] == raw.behavior.id
+            assert BIAS_CODES[bias_codes[i]] == raw.bias
+
+
+class TestBatchRegimeEngine:
+    def test_matches_per_symbol_replay(self, universe):
+        candles = pd.concat([df.assign(symbol=sym) for sym, df in universe.items()], ignore_index=True)
+        table = BatchRegimeEngine().evaluate_frame(candles).to_frame()
+
+        runner = SymbolRegimeRunner()
+        for symbol, df in universe.items():
+            expected, _, _ = runner.replay_history(df)
+            actual = table[table['symbol'] == symbol].reset_index(drop=True)[list(expected.columns)]
+            assert actual['behavior'].nunique() > 1
+            pd.testing.assert_frame_equal(actual, expected, check_dtype=False)
+
+    def test_latest_only_returns_one_row_per_symbol(self, universe):
+        candles = pd.concat([df.assign(symbol=sym) for sym, df in universe.items()], ignore_index=True)
+        result = BatchRegimeEngine().evaluate_frame(candles)
+
+        latest = result.to_frame(latest_only=True)
+        full = result.to_frame()
+
+        assert list(latest['symbol']) == ["AAA", "BBB", "LATE"]
+        for row in latest.to_dict('records'):
+            last = full[full['symbol'] == row['symbol']].iloc[-1].to_dict()
+            assert row == last
+        assert set(latest['gate_momentum']) <= {0.0, 0.5, 1.0}
+
+    def test_event_lock_applies_to_every_symbol(self, universe):
+        candles = pd.concat([df.assign(symbol=sym) for sym, df in universe.items()], ignore_index=True)
+        lock_time = universe["AAA"]['timestamp'].iloc[250] + pd.Timedelta(minutes=10)
+
+        table = BatchRegimeEngine().evaluate_frame(candles, events=[{'time': lock_time}]).to_frame()
+
+        at_lock = table[table['timestamp'] == universe["AAA"]['timestamp'].iloc[250]]
+        assert len(at_lock) == 3
+        assert (at_lock['behavior'] == MarketBehavior.EVENT_LOCK.value).all()
+        assert (at_lock['gate_momentum'] == 0.0).all()
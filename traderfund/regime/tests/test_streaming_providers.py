@@ -0,0 +1,128 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from traderfund.regime.providers.liquidity import RVOLLiquidityProvider
+from traderfund.regime.providers.streaming import (
+    EWMState, RollingMeanState, StreamingProviderSet
+)
+from traderfund.regime.providers.trend import ADXTrendStrengthProvider
+from traderfund.regime.providers.volatility import ATRVolatilityProvider
+from traderfund.regime.shadow import ShadowRegimeRunner
+
+
+@pytest.fixture
+def minute_bars():
+    """260 one-minute bars with a trend leg, a flat-volume stretch and a volume gap."""
+    rng = np.random.default_rng(9)
+    n = 260
+    close = 100 + np.cumsum(np.concatenate([np.full(100, 0.15), np.zeros(160)]) + rng.normal(0, 0.4, n))
+    spread = np.abs(rng.normal(0.3, 0.1, n))
+    volume = rng.integers(1, 6, n) * 1000.0
+    volume[120:150] = 2000.0
+    volume[200:205] = 0.0
+    return pd.DataFrame({
+        'timestamp': pd.date_range("2024-03-01 09:30", periods=n, freq="1min"),
+        'open': close,
+        'high': close + spread,
+        'low': close - spread,
+        'close': close,
+        'volume': volume,
+    })
+
+
+class TestStreamingPrimitives:
+    def test_ewm_matches_pandas(self, minute_bars):
+        values = minute_bars['close']
+        state = EWMState.from_span(20)
+        streamed = [state.update(v) for v in values]
+        assert streamed == values.ewm(span=20, adjust=False).mean().tolist()
+
+    def test_rolling_mean_matches_pandas(self, minute_bars):
+        values = minute_bars['volume']
+        state = RollingMeanState(20)
+        streamed = np.array([state.update(v) for v in values])
+        expected = values.rolling(window=20).mean().to_numpy()
+        np.testing.assert_array_equal(streamed, expected)
+
+
+class TestStreamingProviders:
+    def test_matches_stateless_providers(self, minute_bars):
+        trend = ADXTrendStrengthProvider()
+        vol = ATRVolatilityProvider()
+        liq = RVOLLiquidityProvider()
+        stream = StreamingProviderSet()
+
+        for i, bar in enumerate(minute_bars.to_dict('records')):
+            stream.update(bar)
+            window = minute_bars.iloc[:i + 1]
+            assert stream.factors() == (
+                trend.get_trend_strength(window),
+                trend.get_alignment(window),
+                vol.get_volatility_ratio(window),
+                liq.get_liquidity_score(window),
+            )
+
+    def test_checkpoint_restore_resumes_exactly(self, minute_bars):
+        bars = minute_bars.to_dict('records')
+        uninterrupted = StreamingProviderSet()
+        for bar in bars:
+            uninterrupted.update(bar)
+
+        first = StreamingProviderSet()
+        for bar in bars[:130]:
+            first.update(bar)
+        resumed = StreamingProviderSet.restore(json.loads(json.dumps(first.checkpoint())))
+        for bar in bars[130:]:
+            resumed.update(bar)
+
+        assert resumed.factors() == uninterrupted.factors()
+        assert resumed.checkpoint() == uninterrupted.checkpoint()
+
+    def test_old_bars_are_ignored(self, minute_bars):
+        stream = StreamingProviderSet()
+        assert stream.update_frame(minute_bars.iloc[:100]) == 100
+        assert stream.update_frame(minute_bars.iloc[50:120]) == 20
+        assert not stream.update(minute_bars.iloc[10].to_dict())
+        assert stream.trend.bars == 120
+
+
+class TestShadowStreaming:
+    def _states(self, runner, minute_bars, feed):
+        states = []
+        for i in range(60, len(minute_bars)):
+            states.append(feed(runner, minute_bars, i))
+        runner.close()
+        return states
+
+    def test_streaming_matches_full_recompute(self, minute_bars, tmp_path):
+        expected = self._states(
+            ShadowRegimeRunner(log_file_path=str(tmp_path / "a.jsonl"), streaming=False),
+            minute_bars, lambda r, df, i: r.on_tick(df.iloc[:i + 1], "TEST"),
+        )
+        by_tick = self._states(
+            ShadowRegimeRunner(log_file_path=str(tmp_path / "b.jsonl")),
+            minute_bars, lambda r, df, i: r.on_tick(df.iloc[:i + 1], "TEST"),
+        )
+        assert by_tick == expected
+
+    def test_checkpoint_restore_continues_scoring(self, minute_bars, tmp_path):
+        bars = minute_bars.to_dict('records')
+        reference = ShadowRegimeRunner(log_file_path=str(tmp_path / "ref.jsonl"))
+        expected = [reference.on_bar("TEST", bar) for bar in bars]
+        reference.close()
+
+        first = ShadowRegimeRunner(log_file_path=str(tmp_path / "first.jsonl"))
+        states = [first.on_bar("TEST", bar) for bar in bars[:150]]
+        first.checkpoint(str(tmp_path / "shadow_state.json"))
+        first.close()
+
+        second = ShadowRegimeRunner(log_file_path=str(tmp_path / "second.jsonl"))
+        assert second.restore(str(tmp_path / "shadow_state.json")) == 1
+        assert second.on_bar("TEST", bars[149]) is None
+        states += [second.on_bar("TEST", bar) for bar in bars[150:]]
+        second.close()
+
+        assert states == expected
@@ -0,0 +1,82 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from traderfund.regime.providers.event import CalendarEventProvider
+from traderfund.regime.providers.liquidity import RVOLLiquidityProvider
+from traderfund.regime.providers.trend import ADXTrendStrengthProvider
+from traderfund.regime.providers.volatility import ATRVolatilityProvider
+from traderfund.regime.us_market.run_symbol_regime import SymbolRegimeRunner
+
+
+@pytest.fixture
+def daily_history():
+    """300 daily bars: trend, chop, a volatility burst and a volume drought."""
+    rng = np.random.default_rng(5)
+    n = 300
+    drift = np.concatenate([np.full(120, 0.6), np.zeros(100), np.full(80, -0.4)])
+    noise = rng.normal(0, 1.0, n)
+    noise[220:240] *= 6
+    close = 100 + np.cumsum(drift + noise)
+    spread = np.abs(rng.normal(1.0, 0.3, n))
+    volume = rng.integers(800_000, 1_200_000, n).astype(float)
+    volume[260:270] = 50_000
+
+    return pd.DataFrame({
+        'timestamp': pd.date_range("2024-01-01", periods=n, freq="D"),
+        'open': close,
+        'high': close + spread,
+        'low': close - spread,
+        'close': close,
+        'volume': volume,
+    })
+
+
+class TestProviderSeries:
+    """Each *_series method matches the scalar provider on every prefix."""
+
+    def test_series_match_prefix_calls(self, daily_history):
+        trend = ADXTrendStrengthProvider()
+        vol = ATRVolatilityProvider()
+        liq = RVOLLiquidityProvider()
+        event = CalendarEventProvider()
+        daily_history.attrs['events'] = [{'time': daily_history['timestamp'].iloc[150] + pd.Timedelta(minutes=30)}]
+
+        strength = trend.trend_strength_series(daily_history)
+        alignment = trend.alignment_series(daily_history)
+        ratio = vol.volatility_ratio_series(daily_history)
+        score = liq.liquidity_score_series(daily_history)
+        pressure = event.pressure_series(daily_history)
+
+        for i in range(len(daily_history)):
+            window = daily_history.iloc[:i + 1]
+            assert strength[i] == trend.get_trend_strength(window)
+            assert alignment[i] == trend.get_alignment(window)
+            assert ratio[i] == vol.get_volatility_ratio(window)
+            assert score[i] == liq.get_liquidity_score(window)
+            expected = event.get_pressure(window)
+            assert pressure['pressure'].iloc[i] == expected['pressure']
+            assert pressure['is_lock_window'].iloc[i] == expected['is_lock_window']
+
+
+class TestRegimeHistoryReplay:
+    """The vectorized replay reproduces the prefix replay bar for bar."""
+
+    def test_vectorized_history_matches_stepwise(self, daily_history):
+        expected, expected_state, _ = SymbolRegimeRunner(vectorized=False).replay_history(daily_history)
+        actual, actual_state, _ = SymbolRegimeRunner(vectorized=True).replay_history(daily_history)
+
+        assert len(actual) == len(daily_history) - SymbolRegimeRunner.WARMUP_BARS
+        assert actual['behavior'].nunique() > 1
+        pd.testing.assert_frame_equal(actual, expected)
+        assert actual_state == expected_state
+
+    def test_history_is_persisted(self, daily_history, tmp_path):
+        runner = SymbolRegimeRunner(output_dir=str(tmp_path))
+        history, _, _ = runner.replay_history(daily_history)
+
+        path = runner._save_history("SPY", history)
+
+        assert path == tmp_path / "SPY_regime_history.parquet"
+        pd.testing.assert_frame_equal(pd.read_parquet(path), history)
+        assert not list(tmp_path.glob(".*.tmp"))
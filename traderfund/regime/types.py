@@ -36,6 +36,9 @@ class DirectionalBias(str, Enum):
     BEARISH = "BEARISH"
     NEUTRAL = "NEUTRAL"
 
+# Integer encoding of DirectionalBias used by the panel/batch APIs (index = code)
+BIAS_CODES = (DirectionalBias.NEUTRAL, DirectionalBias.BULLISH, DirectionalBias.BEARISH)
+
 class ConfidenceComponents(BaseModel):
     """
     Breakdown of the confidence score.
@@ -1,9 +1,10 @@
 
 import json
 import logging
+import os
 import pandas as pd
 from pathlib import Path
-from typing import Dict, Any
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from traderfund.regime.calculator import RegimeCalculator
 from traderfund.regime.core import StateManager
@@ -11,7 +12,7 @@ from traderfund.regime.providers.trend import ADXTrendStrengthProvider
 from traderfund.regime.providers.volatility import ATRVolatilityProvider
 from traderfund.regime.providers.liquidity import RVOLLiquidityProvider
 from traderfund.regime.providers.event import CalendarEventProvider
-from traderfund.regime.types import RegimeFactors, RegimeState
+from traderfund.regime.types import DirectionalBias, RegimeFactors, RegimeState
 from traderfund.regime.observability import RegimeFormatter
 from src.structural.proxy_adapter import ProxyAdapter # ADDED
 
@@ -20,8 +21,24 @@ logger = logging.getLogger("USSymbolRegime")
 class SymbolRegimeRunner:
     # Deprecated: Path is now managed by ProxyAdapter
     # DATA_DIR = Path("data/us_market")
-    
-    def __init__(self):
+
+    WARMUP_BARS = 50
+    HISTORY_COLUMNS = (
+        "timestamp", "behavior", "bias", "regime_id", "total_confidence",
+        "confluence", "persistence", "intensity", "is_stable", "raw_behavior",
+        "trend_strength", "trend_alignment", "volatility_ratio", "liquidity_score",
+        "event_pressure", "event_locked",
+    )
+
+    def __init__(self, vectorized: bool = True, output_dir: str = "data/us_market"):
+        """
+        Args:
+            vectorized: Compute provider series once over the full history
+                        instead of re-running every provider on each prefix.
+            output_dir: Directory for the regime snapshot and history files.
+        """
+        self.vectorized = vectorized
+        self.output_dir = Path(output_dir)
         self.calc = RegimeCalculator()
         self.trend = ADXTrendStrengthProvider()
         self.vol = ATRVolatilityProvider()
@@ -55,7 +72,7 @@ class SymbolRegimeRunner:
                 df = pd.read_csv(file_path)
             
             df['timestamp'] = pd.to_datetime(df['timestamp'])
-            df = df.sort_values('timestamp')
+            df = df.sort_values('timestamp').reset_index(drop=True)
             
             # Standardize columns for providers (Low, High, Close, Volume)
             df.columns = [c.lower() for c in df.columns]
@@ -63,59 +80,115 @@ class SymbolRegimeRunner:
             logger.error(f"Read error {symbol}: {e}")
             return {}
 
-        if len(df) < 50:
+        if len(df) < self.WARMUP_BARS:
             logger.warning(f"Insufficient history for {symbol} ({len(df)})")
             return {}
 
         # Replay History for State Stateability
         # We need to simulate the state evolution to get correct 'persistence' and 'confidence'.
-        # We'll run the last N bars (e.g. 100) or full history if short.
-        # Running full history is safer for "StableRegime" but slower.
-        # Given daily data, full history is fast.
-        
+        # Full history is replayed; every bar's state is kept as the regime time series.
+        history, last_state, last_factors = self.replay_history(df)
+
+        if last_state:
+            # Save Snapshot
+            snapshot = RegimeFormatter.to_dict(last_state, last_factors, symbol)
+            # Save to analytics side? For now keep in us_market legacy for dashboard compat
+            out_path = self.output_dir / f"{symbol}_regime.json"
+            out_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(out_path, 'w') as f:
+                json.dump(snapshot, f, indent=2)
+
+            self._save_history(symbol, history)
+            return snapshot
+        return {}
+
+    def replay_history(self, df: pd.DataFrame) -> Tuple[pd.DataFrame, Optional[RegimeState], Optional[RegimeFactors]]:
+        """
+        Replays the regime state machine over every bar after warmup.
+
+        Returns:
+            (history, last_state, last_factors) where history holds one row per
+            replayed bar (factors, raw regime and smoothed regime state).
+        """
         manager = StateManager()
         last_state = None
         last_factors = None
-        
-        # Optimization: Calculate indicators vectorized first
-        # But our providers take 'df' window. 
-        # Iterating daily bars is fast enough.
-        
-        # Start from index 50 (warmup)
-        for i in range(50, len(df)):
-            window = df.iloc[:i+1]
-            
-            # Providers
-            t_str = self.trend.get_trend_strength(window)
-            t_aln = self.trend.get_alignment(window)
-            v_rat = self.vol.get_volatility_ratio(window)
-            l_scr = self.liq.get_liquidity_score(window)
-            e_dat = self.event.get_pressure(window)
-            
+        columns: Dict[str, List[Any]] = {name: [] for name in self.HISTORY_COLUMNS}
+
+        timestamps = df['timestamp'].tolist() if 'timestamp' in df.columns else list(df.index)
+        inputs = self._vectorized_inputs(df) if self.vectorized else self._stepwise_inputs(df)
+
+        for i, (t_str, t_aln, v_rat, l_scr, e_dat) in zip(range(self.WARMUP_BARS, len(df)), inputs):
             # Calculator
             raw = self.calc.calculate(t_str, t_aln, v_rat, l_scr, e_dat['pressure'], e_dat['is_lock_window'])
-            
+
             factors = RegimeFactors(
-                trend_strength_norm=t_str, 
-                volatility_ratio=v_rat, 
-                liquidity_status="NORMAL" if l_scr > 0.5 else "DRY", 
+                trend_strength_norm=t_str,
+                volatility_ratio=v_rat,
+                liquidity_status="NORMAL" if l_scr > 0.5 else "DRY",
                 event_pressure_norm=e_dat['pressure']
             )
-            
+
             last_state = manager.update(raw, factors)
             last_factors = factors
 
-        if last_state:
-            # Save Snapshot
-            snapshot = RegimeFormatter.to_dict(last_state, last_factors, symbol)
-            # Save to analytics side? For now keep in us_market legacy for dashboard compat
-            out_path = Path("data/us_market") / f"{symbol}_regime.json"
-            out_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(out_path, 'w') as f:
-                json.dump(snapshot, f, indent=2)
-            
-            return snapshot
-        return {}
+            confidence = last_state.confidence_components
+            for name, value in (
+                ("timestamp", timestamps[i]),
+                ("behavior", last_state.behavior.value),
+                ("bias", last_state.bias.value),
+                ("regime_id", last_state.id),
+                ("total_confidence", last_state.total_confidence),
+                ("confluence", confidence.confluence_score),
+                ("persistence", confidence.persistence_score),
+                ("intensity", confidence.intensity_score),
+                ("is_stable", last_state.is_stable),
+                ("raw_behavior", raw.behavior.value),
+                ("trend_strength", float(t_str)),
+                ("trend_alignment", t_aln.value),
+                ("volatility_ratio", float(v_rat)),
+                ("liquidity_score", float(l_scr)),
+                ("event_pressure", float(e_dat['pressure'])),
+                ("event_locked", bool(e_dat['is_lock_window'])),
+            ):
+                columns[name].append(value)
+
+        return pd.DataFrame(columns), last_state, last_factors
+
+    def _stepwise_inputs(self, df: pd.DataFrame) -> Iterator[Tuple[float, DirectionalBias, float, float, Dict[str, Any]]]:
+        """Provider outputs per bar, recomputed over each growing prefix (reference path)."""
+        for i in range(self.WARMUP_BARS, len(df)):
+            window = df.iloc[:i+1]
+            yield (
+                self.trend.get_trend_strength(window),
+                self.trend.get_alignment(window),
+                self.vol.get_volatility_ratio(window),
+                self.liq.get_liquidity_score(window),
+                self.event.get_pressure(window),
+            )
+
+    def _vectorized_inputs(self, df: pd.DataFrame) -> Iterator[Tuple[float, DirectionalBias, float, float, Dict[str, Any]]]:
+        """Provider outputs per bar from series computed once over the full history."""
+        start = self.WARMUP_BARS
+        t_str = self.trend.trend_strength_series(df)[start:].tolist()
+        t_aln = self.trend.alignment_series(df)[start:].tolist()
+        v_rat = self.vol.volatility_ratio_series(df)[start:].tolist()
+        l_scr = self.liq.liquidity_score_series(df)[start:].tolist()
+        events = self.event.pressure_series(df).iloc[start:]
+        e_dat = [
+            {'pressure': p, 'is_lock_window': l}
+            for p, l in zip(events['pressure'].tolist(), events['is_lock_window'].tolist())
+        ]
+        return zip(t_str, t_aln, v_rat, l_scr, e_dat)
+
+    def _save_history(self, symbol: str, history: pd.DataFrame) -> Path:
+        """Persists the full regime time series next to the snapshot."""
+        out_path = self.output_dir / f"{symbol}_regime_history.parquet"
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = out_path.with_name(f".{out_path.name}.tmp")
+        history.to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, out_path)
+        return out_path
 
 def run_all(symbols=["SPY", "QQQ", "IWM"]):
     runner = SymbolRegimeRunner()